@@ -0,0 +1,83 @@
+"""
+Micro-benchmark of the acknowledgment subsystem.
+
+Counts the acknowledgment objects that are created per batch when running
+
+    rxbp.range(n, batch_size=...).pipe(map, filter, zip)
+
+An object is counted, whenever an `__init__` method or a class body defined in the
+`rxbp.acknowledgement` package is executed. Afterwards, the elapsed time per batch
+is measured without profiling.
+
+Run it from the repository root with
+
+    python -m benchmarks.ackallocations
+"""
+
+import os
+import sys
+import time
+
+import rxbp
+import rxbp.acknowledgement
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+ACK_PACKAGE_PATH = os.path.dirname(rxbp.acknowledgement.__file__)
+
+
+def create_flowable(n_elements: int, batch_size: int):
+    return rxbp.range(n_elements, batch_size=batch_size).pipe(
+        rxbp.op.map(lambda v: v + 1),
+        rxbp.op.filter(lambda v: v % 2 == 0),
+        rxbp.op.zip(rxbp.range(n_elements, batch_size=batch_size)),
+    )
+
+
+def count_ack_allocations(n_elements: int, batch_size: int) -> int:
+    counter = [0]
+
+    def profile(frame, event, _):
+        if event != 'call':
+            return
+
+        code = frame.f_code
+        if code.co_filename.startswith(ACK_PACKAGE_PATH):
+            # either a constructor call or a class definition
+            if code.co_name in ('__init__', '__new__') or code.co_name[:1].isupper():
+                counter[0] += 1
+
+    flowable = create_flowable(n_elements=n_elements, batch_size=batch_size)
+
+    sys.setprofile(profile)
+    try:
+        flowable.run(scheduler=TrampolineScheduler())
+    finally:
+        sys.setprofile(None)
+
+    return counter[0]
+
+
+def measure_time(n_elements: int, batch_size: int) -> float:
+    flowable = create_flowable(n_elements=n_elements, batch_size=batch_size)
+
+    start = time.perf_counter()
+    flowable.run(scheduler=TrampolineScheduler())
+    return time.perf_counter() - start
+
+
+def main():
+    n_elements = 100000
+
+    print(f'{"batch size":>10} {"ack objects/batch":>18} {"us/batch":>10}')
+
+    for batch_size in (1, 10, 100, 1000):
+        n_batches = n_elements // batch_size
+
+        n_allocations = count_ack_allocations(n_elements=n_elements, batch_size=batch_size)
+        elapsed = measure_time(n_elements=n_elements, batch_size=batch_size)
+
+        print(f'{batch_size:>10} {n_allocations / n_batches:>18.2f} {1e6 * elapsed / n_batches:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
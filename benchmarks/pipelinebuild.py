@@ -0,0 +1,60 @@
+"""
+Micro-benchmark of the pipeline build time for each stack capture mode.
+
+Operators like `zip`, `controlled_zip`, `share` and `match` capture the stack of
+the caller when they are created. This benchmark measures the time needed to
+build (not to subscribe) small pipelines using those operators.
+
+Run it from the repository root with
+
+    python -m benchmarks.pipelinebuild
+"""
+
+import time
+
+import rxbp
+from rxbp import config
+
+
+def build_pipeline():
+    source = rxbp.range(10)
+
+    return source.pipe(
+        rxbp.op.zip(rxbp.range(10)),
+        rxbp.op.controlled_zip(rxbp.range(10)),
+        rxbp.op.concat(rxbp.range(10)),
+    )
+
+
+def measure_time(n_pipelines: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n_pipelines):
+        build_pipeline()
+    return time.perf_counter() - start
+
+
+def main():
+    n_pipelines = 10000
+
+    print(f'{"stack capture":>14} {"us/pipeline":>12}')
+
+    prev_mode = config.get_stack_capture()
+
+    try:
+        for mode in (
+                config.STACK_CAPTURE_FULL,
+                config.STACK_CAPTURE_LAZY,
+                config.STACK_CAPTURE_CALLER,
+                config.STACK_CAPTURE_OFF,
+        ):
+            config.set_stack_capture(mode)
+            elapsed = measure_time(n_pipelines=n_pipelines)
+
+            print(f'{mode:>14} {1e6 * elapsed / n_pipelines:>12.2f}')
+
+    finally:
+        config.set_stack_capture(prev_mode)
+
+
+if __name__ == '__main__':
+    main()
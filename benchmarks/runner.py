@@ -0,0 +1,148 @@
+"""
+Utilities to run a benchmark case and report elements/sec, mean time per batch
+and peak memory.
+
+A benchmark case is a function that returns a Flowable. It takes no arguments,
+unless the case comes with a scheduler factory; then, a new scheduler is created
+for each run, passed to the function and disposed once the run completed. The
+Flowable is subscribed with a counting observer, which iterates over every received
+batch such that all cases consume their elements in the same way. The elapsed time
+is measured without memory tracing; the peak memory is measured in a second run
+using `tracemalloc`.
+
+The time per batch is the elapsed time divided by the number of batches received
+by the sink; it is not the time a single batch takes from its emission to its
+acknowledgment.
+"""
+
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rx.core.typing import Disposable
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+from rxbp.typing import ElementType
+
+
+class CountingObserver(Observer):
+    def __init__(self):
+        self.n_elements = 0
+        self.n_batches = 0
+        self.exception = None
+        self.is_done = threading.Event()
+
+    def on_next(self, elem: ElementType):
+        self.n_batches += 1
+
+        # iterate every batch such that lazy batches (e.g. the `range` batches of
+        # `from_range`) are consumed in pass-through cases as well
+        n_elements = 0
+        for _ in elem:
+            n_elements += 1
+
+        self.n_elements += n_elements
+
+        return continue_ack
+
+    def on_error(self, exc):
+        self.exception = exc
+        self.is_done.set()
+
+    def on_completed(self):
+        self.is_done.set()
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    n_elements: int
+    n_batches: int
+    elapsed: float
+    peak_memory: int
+
+    @property
+    def elements_per_sec(self) -> float:
+        return self.n_elements / self.elapsed if self.elapsed else float('inf')
+
+    @property
+    def time_per_batch(self) -> float:
+        return self.elapsed / self.n_batches if self.n_batches else 0.0
+
+    def to_row(self) -> str:
+        return f'{self.name:<44} {self.elements_per_sec:>14,.0f} {1e6 * self.time_per_batch:>12.2f}' \
+               f' {self.peak_memory / 1024:>12,.1f}'
+
+
+HEADER = f'{"case":<44} {"elements/sec":>14} {"us/batch":>12} {"peak KiB":>12}'
+
+
+def run_flowable(
+        create_flowable: Callable[..., Any],
+        create_scheduler: Callable[[], Scheduler] = None,
+        timeout: float = 60.0,
+) -> CountingObserver:
+    if create_scheduler is None:
+        scheduler = None
+        flowable = create_flowable()
+    else:
+        scheduler = create_scheduler()
+        flowable = create_flowable(scheduler)
+
+    observer = CountingObserver()
+    subscribe_scheduler = TrampolineScheduler()
+
+    try:
+        flowable.subscribe(
+            observer=observer,
+            scheduler=subscribe_scheduler,
+            subscribe_scheduler=subscribe_scheduler,
+        )
+
+        is_done = observer.is_done.wait(timeout)
+    finally:
+        # stops the threads started by the scheduler
+        if isinstance(scheduler, Disposable):
+            scheduler.dispose()
+
+    if not is_done:
+        raise TimeoutError('benchmark case did not complete in time')
+
+    if observer.exception is not None:
+        raise observer.exception
+
+    return observer
+
+
+def run_case(
+        name: str,
+        create_flowable: Callable[..., Any],
+        create_scheduler: Callable[[], Scheduler] = None,
+        measure_memory: bool = True,
+) -> BenchmarkResult:
+    start = time.perf_counter()
+    observer = run_flowable(create_flowable, create_scheduler=create_scheduler)
+    elapsed = time.perf_counter() - start
+
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            run_flowable(create_flowable, create_scheduler=create_scheduler)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    else:
+        peak_memory = 0
+
+    return BenchmarkResult(
+        name=name,
+        n_elements=observer.n_elements,
+        n_batches=observer.n_batches,
+        elapsed=elapsed,
+        peak_memory=peak_memory,
+    )
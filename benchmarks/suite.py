@@ -0,0 +1,148 @@
+"""
+Benchmark suite for Flowable operators and schedulers.
+
+Each case reports the elements per second and the mean time per batch received
+by the sink, as well as the peak memory allocated during the run.
+
+Run it from the repository root with
+
+    python -m benchmarks.suite
+
+or select cases by a substring of their names
+
+    python -m benchmarks.suite zip merge
+"""
+
+import sys
+from typing import Callable, List, Tuple
+
+import rxbp
+from benchmarks.runner import run_case, HEADER
+from rxbp.scheduler import Scheduler
+from rxbp.schedulers.asyncioscheduler import AsyncIOScheduler
+from rxbp.schedulers.eventloopscheduler import EventLoopScheduler
+from rxbp.schedulers.threadpoolscheduler import ThreadPoolScheduler
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+N_ELEMENTS = 100000
+BATCH_SIZES = (1, 100, 10000)
+
+
+def source_cases(batch_size: int):
+    yield 'from_range', lambda: rxbp.range(N_ELEMENTS, batch_size=batch_size)
+    yield 'from_list', lambda: rxbp.from_list(list(range(N_ELEMENTS)), batch_size=batch_size)
+
+
+def operator_cases(batch_size: int):
+    def source():
+        return rxbp.range(N_ELEMENTS, batch_size=batch_size)
+
+    yield 'map_filter', lambda: source().pipe(
+        rxbp.op.map(lambda v: v + 1),
+        rxbp.op.filter(lambda v: v % 2 == 0),
+        rxbp.op.map(lambda v: v * 2),
+    )
+
+    yield 'zip', lambda: source().pipe(
+        rxbp.op.zip(source()),
+    )
+
+    yield 'merge', lambda: source().pipe(
+        rxbp.op.merge(source()),
+    )
+
+    yield 'flat_map', lambda: rxbp.range(N_ELEMENTS // 100, batch_size=max(1, batch_size // 100)).pipe(
+        rxbp.op.flat_map(lambda _: rxbp.range(100, batch_size=min(batch_size, 100))),
+    )
+
+    yield 'controlled_zip', lambda: source().pipe(
+        rxbp.op.controlled_zip(
+            right=source(),
+            request_left=lambda l, r: l <= r,
+            request_right=lambda l, r: r <= l,
+            match_func=lambda l, r: l == r,
+        ),
+    )
+
+    # fan-out of a shared Flowable through `CacheServeFirstObservableSubject`
+    yield 'share', lambda: rxbp.multicast.return_value(source().share()).pipe(
+        rxbp.multicast.op.map(lambda shared: shared.pipe(
+            rxbp.op.zip(shared.pipe(
+                rxbp.op.map(lambda v: v + 1),
+            )),
+        )),
+    ).to_flowable()
+
+    yield 'indexed_match', lambda: rxbp.indexed.range(N_ELEMENTS, batch_size=batch_size).pipe(
+        rxbp.indexed.op.match(rxbp.indexed.range(N_ELEMENTS, batch_size=batch_size).pipe(
+            rxbp.op.filter(lambda v: v % 2 == 0),
+        )),
+    )
+
+    yield 'buffer', lambda: source().pipe(
+        rxbp.op.buffer(1000),
+    )
+
+    yield 'rolling_mean', lambda: source().pipe(
+        rxbp.op.rolling('mean', n=100),
+    )
+
+    yield 'rolling_max', lambda: source().pipe(
+        rxbp.op.rolling('max', n=100),
+    )
+
+    yield 'window_count', lambda: source().pipe(
+        rxbp.op.window_count(100, step=10),
+    )
+
+
+def scheduler_cases() -> List[Tuple[str, Callable[[], Scheduler]]]:
+    return [
+        ('trampoline', TrampolineScheduler),
+        ('event_loop', EventLoopScheduler),
+        ('thread_pool', lambda: ThreadPoolScheduler('benchmark')),
+        ('asyncio', AsyncIOScheduler),
+    ]
+
+
+def gen_cases():
+    for batch_size in BATCH_SIZES:
+        for name, create_flowable in source_cases(batch_size):
+            yield f'{name}[batch_size={batch_size}]', create_flowable, None
+
+    for batch_size in BATCH_SIZES:
+        for name, create_flowable in operator_cases(batch_size):
+            yield f'{name}[batch_size={batch_size}]', create_flowable, None
+
+    for scheduler_name, create_scheduler in scheduler_cases():
+        for batch_size in BATCH_SIZES[1:]:
+            def create_flowable(scheduler: Scheduler, batch_size=batch_size):
+                return rxbp.range(N_ELEMENTS, batch_size=batch_size).pipe(
+                    rxbp.op.observe_on(scheduler),
+                )
+
+            yield f'observe_on[{scheduler_name},batch_size={batch_size}]', create_flowable, create_scheduler
+
+
+def main(selected: List[str] = None):
+    print(HEADER)
+
+    for name, create_flowable, create_scheduler in gen_cases():
+        if selected and not any(s in name for s in selected):
+            continue
+
+        try:
+            result = run_case(
+                name=name,
+                create_flowable=create_flowable,
+                create_scheduler=create_scheduler,
+            )
+        except Exception as exc:
+            print(f'{name:<44} failed: {exc!r}')
+            continue
+
+        print(result.to_row())
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
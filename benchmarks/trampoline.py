@@ -0,0 +1,160 @@
+"""
+Micro-benchmark of the `TrampolineScheduler`.
+
+Compares the current trampoline, which keeps immediate actions in a FIFO queue,
+with the previous implementation, which scheduled every action with a `datetime`
+duetime on a priority queue. The following cases are measured:
+
+- idle: each action is scheduled on the idle trampoline, which runs it immediately
+- nested: each action schedules the next action from within the trampoline
+- pipeline: subscribes `rxbp.range(...).pipe(map, filter)` with the trampoline
+
+Run it from the repository root with
+
+    python -m benchmarks.trampoline
+"""
+
+import datetime
+import threading
+import time
+import traceback
+from typing import Optional
+
+from rx.core import typing
+from rx.internal import PriorityQueue
+from rx.scheduler.scheduleditem import ScheduledItem
+from rx.scheduler.scheduler import Scheduler
+
+import rxbp
+from rxbp.scheduler import SchedulerBase as RxBPSchedulerBase
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+class PriorityQueueTrampolineScheduler(RxBPSchedulerBase, Scheduler):
+    """ the previous trampoline implementation used as reference """
+
+    def __init__(self):
+        super().__init__()
+
+        self._idle = True
+        self.queue = PriorityQueue()
+
+        self.lock = threading.RLock()
+
+    @property
+    def idle(self) -> bool:
+        return self._idle
+
+    @property
+    def is_order_guaranteed(self) -> bool:
+        return True
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def schedule(self, action: typing.ScheduledAction, state: Optional[typing.TState] = None):
+        return self.schedule_absolute(self.now, action, state=state)
+
+    def schedule_relative(self, duetime: typing.RelativeTime, action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None):
+        duetime = self.to_timedelta(duetime)
+        return self.schedule_absolute(self.now + duetime, action, state=state)
+
+    def schedule_absolute(self, duetime: typing.AbsoluteTime, action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None):
+        duetime = self.to_datetime(duetime)
+
+        si = ScheduledItem(self, state, action, duetime)
+
+        with self.lock:
+            self.queue.enqueue(si)
+
+            if self._idle:
+                self._idle = False
+                start_trampoline = True
+            else:
+                start_trampoline = False
+
+        if start_trampoline:
+            while True:
+                try:
+                    while self.queue:
+                        item: ScheduledItem = self.queue.peek()
+
+                        if item.is_cancelled():
+                            with self.lock:
+                                self.queue.dequeue()
+
+                        else:
+                            diff = item.duetime - item.scheduler.now
+                            if diff <= datetime.timedelta(0):
+                                item.invoke()
+                                with self.lock:
+                                    self.queue.dequeue()
+                            else:
+                                time.sleep(diff.total_seconds())
+
+                except:
+                    traceback.print_exc()
+                finally:
+                    with self.lock:
+                        if not self.queue:
+                            self._idle = True
+                            break
+
+        return si.disposable
+
+
+def measure_idle(scheduler: Scheduler, n_actions: int) -> float:
+    def action(_, __):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(n_actions):
+        scheduler.schedule(action)
+    return time.perf_counter() - start
+
+
+def measure_nested(scheduler: Scheduler, n_actions: int) -> float:
+    counter = [n_actions]
+
+    def action(_, __):
+        counter[0] -= 1
+        if 0 < counter[0]:
+            scheduler.schedule(action)
+
+    start = time.perf_counter()
+    scheduler.schedule(action)
+    return time.perf_counter() - start
+
+
+def measure_pipeline(scheduler: Scheduler, n_actions: int) -> float:
+    flowable = rxbp.range(n_actions, batch_size=1).pipe(
+        rxbp.op.map(lambda v: v + 1),
+        rxbp.op.filter(lambda v: v % 2 == 0),
+    )
+
+    start = time.perf_counter()
+    flowable.run(scheduler=scheduler)
+    return time.perf_counter() - start
+
+
+def main():
+    n_actions = 100000
+
+    print(f'{"case":>10} {"priority queue us/action":>25} {"fifo us/action":>15} {"speedup":>8}')
+
+    for name, measure in (
+            ('idle', measure_idle),
+            ('nested', measure_nested),
+            ('pipeline', measure_pipeline),
+    ):
+        elapsed_prev = measure(PriorityQueueTrampolineScheduler(), n_actions)
+        elapsed = measure(TrampolineScheduler(), n_actions)
+
+        print(f'{name:>10} {1e6 * elapsed_prev / n_actions:>25.2f} {1e6 * elapsed / n_actions:>15.2f} '
+              f'{elapsed_prev / elapsed:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
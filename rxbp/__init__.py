@@ -1,9 +1,11 @@
+from . import config
 from . import imperative
 from . import indexed
 from . import multicast
 from . import op
 from .source import from_iterable, from_range, from_list, return_value, from_rx, concat, zip, \
-    merge, empty, create, interval
+    merge, empty, create, interval, from_async_iterable
+from .toiterator import to_iterator, to_async_iterator
 
 from_ = from_iterable
 range = from_range
@@ -4,4 +4,4 @@ from rxbp.acknowledgement.mixins.ackmixin import AckMixin
 
 
 class Ack(AckMixin, ABC):
-    pass
+    __slots__ = ()
@@ -9,26 +9,48 @@ from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.operators.mergeack import merge_ack
 from rxbp.acknowledgement.single import Single
 
+# shared by all AckSubjects, as a subscription is almost never disposed
+_empty_disposable = Disposable()
+
 
 class AckSubject(AckMergeMixin, Ack, Single):
-    def __init__(self) -> None:
-        super().__init__()
+    """
+    A single-assignment acknowledgment.
+
+    In most cases, an AckSubject is subscribed by exactly one Single. This Single is
+    stored in a dedicated slot, such that no list needs to be allocated. The lock
+    is only held to swap the state; the Singles are called outside of the lock.
+    """
 
-        self._lock = threading.RLock()
+    __slots__ = ('_lock', 'is_disposed', '_single', '_singles', 'exception', '_has_value', '_value')
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
 
         self.is_disposed = False
-        self.singles: List[Single] = []
+        self._single: Optional[Single] = None
+        self._singles: Optional[List[Single]] = None
         self.exception: Optional[Exception] = None
 
-        self._value = (False, None)
+        self._has_value = False
+        self._value = None
 
     @property
     def has_value(self):
-        return self._value[0]
+        return self._has_value
 
     @property
     def value(self):
-        return self._value[1]
+        return self._value
+
+    @property
+    def singles(self) -> List[Single]:
+        if self._single is None:
+            return []
+        elif self._singles is None:
+            return [self._single]
+        else:
+            return [self._single] + self._singles
 
     def check_disposed(self) -> None:
         if self.is_disposed:
@@ -39,38 +61,38 @@ class AckSubject(AckMergeMixin, Ack, Single):
 
         with self._lock:
             self.check_disposed()
-            self.singles.append(single)
 
-            # ex = self.exception
-            has_value, value = self._value
+            has_value = self._has_value
+
+            if not has_value:
+                if self._single is None:
+                    self._single = single
+                elif self._singles is None:
+                    self._singles = [single]
+                else:
+                    self._singles.append(single)
 
-        # if ex:
-        #     single.on_error(ex)
         if has_value:
-            single.on_next(value)
+            single.on_next(self._value)
 
-        return Disposable()
+        return _empty_disposable
 
     def on_next(self, value: Any) -> None:
 
         with self._lock:
-            singles = self.singles.copy()
-            self.singles.clear()
-            self._value = (True, value)
-
-        for single in singles:
+            single = self._single
+            singles = self._singles
+            self._single = None
+            self._singles = None
+            self._value = value
+            self._has_value = True
+
+        if single is not None:
             single.on_next(value)
 
-    # def on_error(self, error: Exception) -> None:
-    #
-    #     with self._lock:
-    #         self.check_disposed()
-    #         singles = self.singles.copy()
-    #         self.singles.clear()
-    #         self.exception = error
-    #
-    #     for single in singles:
-    #         single.on_error(error)
+            if singles is not None:
+                for single in singles:
+                    single.on_next(value)
 
     def merge(self, other: Ack):
         return merge_ack(self, other)
@@ -79,7 +101,9 @@ class AckSubject(AckMergeMixin, Ack, Single):
 
         with self._lock:
             self.is_disposed = True
-            self.singles = []
+            self._single = None
+            self._singles = None
             self.exception = None
 
-            self._value = (False, None)
+            self._has_value = False
+            self._value = None
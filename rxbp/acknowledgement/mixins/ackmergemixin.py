@@ -4,6 +4,8 @@ from rxbp.acknowledgement.ack import Ack
 
 
 class AckMergeMixin(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def merge(self, other: Ack):
         ...
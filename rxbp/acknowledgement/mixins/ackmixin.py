@@ -14,6 +14,8 @@ class AckMixin(ABC):
     method defined.
     """
 
+    __slots__ = ()
+
     # a synchronous acknowledgment (compared to a asynchronous) is one that is
     # immediate, e.g. without back-pressure.
     is_sync = False
@@ -21,3 +23,12 @@ class AckMixin(ABC):
     @abstractmethod
     def subscribe(self, single: Single) -> Disposable:
         ...
+
+    def __await__(self):
+        """ an acknowledgment can be awaited within the current event loop, e.g.
+        `ack = await observer.on_next(batch)`
+        """
+
+        from rxbp.acknowledgement.operators.tofuture import to_future
+
+        return to_future(self).__await__()
@@ -1,23 +1,40 @@
+from typing import Callable, Any
+
 from rx.disposable import Disposable
 
 from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.single import Single
 
 
+class MapSingle(Single):
+    __slots__ = ('func', 'single')
+
+    def __init__(self, func: Callable[[Any], Any], single: Single):
+        self.func = func
+        self.single = single
+
+    def on_next(self, value):
+        # try:
+        result = self.func(value)
+        # except Exception as err:
+        #     single.on_error(err)
+        # else:
+        self.single.on_next(result)
+
+    def on_error(self, exc: Exception):
+        self.single.on_error(exc)
+
+
+class MapAck(Ack):
+    __slots__ = ('source', 'func')
+
+    def __init__(self, source: Ack, func: Callable[[Any], Any]):
+        self.source = source
+        self.func = func
+
+    def subscribe(self, single: Single) -> Disposable:
+        return self.source.subscribe(MapSingle(func=self.func, single=single))
+
+
 def _map(source: Ack, func) -> Ack:
-    class MapAck(Ack):
-        def subscribe(self, single: Single) -> Disposable:
-            class MapSingle(Single):
-                def on_next(self, value):
-                    # try:
-                    result = func(value)
-                    # except Exception as err:
-                    #     single.on_error(err)
-                    # else:
-                    single.on_next(result)
-
-                def on_error(self, exc: Exception):
-                    single.on_error(exc)
-
-            return source.subscribe(MapSingle())
-    return MapAck()
+    return MapAck(source=source, func=func)
@@ -1,24 +1,27 @@
-from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.acknowledgement.continueack import continue_ack
 from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.operators.map import _map
 from rxbp.acknowledgement.operators.zip import _zip
-from rxbp.acknowledgement.stopack import StopAck
+from rxbp.acknowledgement.stopack import stop_ack
 
 
 def merge_ack(self, ack2: Ack) -> Ack:
-    if isinstance(ack2, ContinueAck) or isinstance(self, StopAck):
+    if ack2 is continue_ack or self is stop_ack:
         return_ack = self
 
-    elif isinstance(ack2, StopAck) or isinstance(self, ContinueAck):
+    elif ack2 is stop_ack or self is continue_ack:
         return_ack = ack2
 
     else:
-        def _(v1, v2):
-            if isinstance(v1, StopAck) or isinstance(v2, StopAck):
-                return StopAck()
-            else:
-                return ContinueAck()
-
-        return_ack = _map(source=_zip(self, ack2), func=lambda t2: _(*t2))
+        return_ack = _map(source=_zip(self, ack2), func=_merge_pair)
 
     return return_ack
+
+
+def _merge_pair(t2):
+    v1, v2 = t2
+
+    if v1 is stop_ack or v2 is stop_ack:
+        return stop_ack
+    else:
+        return continue_ack
@@ -1,35 +1,40 @@
-import threading
-
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
 
 from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.single import Single
 
 
-def _merge_all(source: Ack):
-    class MergeAllAck(Ack):
-        def subscribe(self, single: Single):
-            group = CompositeDisposable()
-            m = SingleAssignmentDisposable()
-            group.add(m)
-            lock = threading.RLock()
+class MergeAllSingle(Single):
+    __slots__ = ('single', 'group')
+
+    def __init__(self, single: Single, group: CompositeDisposable):
+        self.single = single
+        self.group = group
+
+    # def on_error(self, exc: Exception):
+    #     single.on_error(exc)
 
-            class MergeAllSingle(Single):
-                # def on_error(self, exc: Exception):
-                #     single.on_error(exc)
+    def on_next(self, inner_source: Ack):
+        # the inner acknowledgment is directly subscribed by the outer single; there
+        # is no need to wrap it in an additional single
+        disposable = inner_source.subscribe(self.single)
+        self.group.add(disposable)
 
-                def on_next(_, inner_source: Ack):
-                    class ResultSingle(Single):
-                        def on_next(self, elem):
-                            single.on_next(elem)
 
-                        # def on_error(self, exc: Exception):
-                        #     single.on_error(exc)
+class MergeAllAck(Ack):
+    __slots__ = ('source',)
 
-                    disposable = inner_source.subscribe(ResultSingle())
-                    group.add(disposable)
+    def __init__(self, source: Ack):
+        self.source = source
 
-            m.disposable = source.subscribe(MergeAllSingle())
-            return group
+    def subscribe(self, single: Single):
+        group = CompositeDisposable()
+        m = SingleAssignmentDisposable()
+        group.add(m)
 
-    return MergeAllAck()
\ No newline at end of file
+        m.disposable = self.source.subscribe(MergeAllSingle(single=single, group=group))
+        return group
+
+
+def _merge_all(source: Ack):
+    return MergeAllAck(source=source)
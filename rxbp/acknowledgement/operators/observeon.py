@@ -1,13 +1,40 @@
 from rx.core.typing import Scheduler
 
 from rxbp.acknowledgement.ack import Ack
-from rxbp.acknowledgement.scheduledsingle import ScheduledSingle
 from rxbp.acknowledgement.single import Single
 
 
-def _observe_on(source: Ack, scheduler: Scheduler) -> Ack:
-    class ObserveOnSingle(Ack):
-        def subscribe(self, single: Single):
-            return source.subscribe(ScheduledSingle(scheduler=scheduler, single=single))
+class ObserveOnSingle(Single):
+    """
+    An acknowledgment emits a single value only. Therefore, there is no need for a
+    queue (see `ScheduledSingle`), the value is simply stored and sent on the scheduler.
+    """
+
+    __slots__ = ('scheduler', 'single', 'value')
+
+    def __init__(self, scheduler: Scheduler, single: Single):
+        self.scheduler = scheduler
+        self.single = single
+        self.value = None
+
+    def on_next(self, value):
+        self.value = value
+        self.scheduler.schedule(self._run)
+
+    def _run(self, _, __):
+        self.single.on_next(self.value)
+
 
-    return ObserveOnSingle()
+class ObserveOnAck(Ack):
+    __slots__ = ('source', 'scheduler')
+
+    def __init__(self, source: Ack, scheduler: Scheduler):
+        self.source = source
+        self.scheduler = scheduler
+
+    def subscribe(self, single: Single):
+        return self.source.subscribe(ObserveOnSingle(scheduler=self.scheduler, single=single))
+
+
+def _observe_on(source: Ack, scheduler: Scheduler) -> Ack:
+    return ObserveOnAck(source=source, scheduler=scheduler)
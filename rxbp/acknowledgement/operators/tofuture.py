@@ -0,0 +1,63 @@
+import asyncio
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.single import Single
+
+
+def _set_result(future: asyncio.Future, value):
+    # the future could have been cancelled in the meantime
+    if not future.done():
+        future.set_result(value)
+
+
+class _SyncSingle(Single):
+    __slots__ = ('future',)
+
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+
+    def on_next(self, value):
+        _set_result(self.future, value)
+
+
+class ToFutureSingle(Single):
+    """
+    Resolves the asyncio future on its event loop, as the acknowledgment could be
+    received on any thread.
+    """
+
+    __slots__ = ('future', 'loop')
+
+    def __init__(self, future: asyncio.Future, loop: asyncio.AbstractEventLoop):
+        self.future = future
+        self.loop = loop
+
+    def on_next(self, value):
+        self.loop.call_soon_threadsafe(_set_result, self.future, value)
+
+
+def to_future(source: Ack, loop: asyncio.AbstractEventLoop = None) -> asyncio.Future:
+    """
+    Converts an acknowledgment to an asyncio future, which resolves to either `continue_ack`
+    or `stop_ack`, e.g.
+
+    ::
+
+        ack = observer.on_next(batch)
+        if isinstance(await to_future(ack), StopAck):
+            ...
+
+    :param source: the acknowledgment
+    :param loop: the event loop of the future (default: the current event loop)
+    """
+
+    loop = loop or asyncio.get_event_loop()
+    future = loop.create_future()
+
+    # synchronous acknowledgments resolve the future without a round trip over the event loop
+    if source.is_sync:
+        source.subscribe(_SyncSingle(future))
+    else:
+        source.subscribe(ToFutureSingle(future=future, loop=loop))
+
+    return future
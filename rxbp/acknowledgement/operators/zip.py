@@ -1,56 +1,55 @@
 import threading
-from dataclasses import dataclass
 from typing import List
 
-from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+from rx.disposable import CompositeDisposable
 
 from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.single import Single
 
 
-def _zip(*args: Ack) -> Ack:
-    sources = list(args)
+class ZipSingle(Single):
+    __slots__ = ('idx', 'queues', 'lock', 'single')
+
+    def __init__(self, idx: int, queues: List[List], lock: threading.Lock, single: Single):
+        self.idx = idx
+        self.queues = queues
+        self.lock = lock
+        self.single = single
 
-    class ZipAck(Ack):
-        def subscribe(self, single: Single):
+    def on_next(self, elem):
+        with self.lock:
+            self.queues[self.idx].append(elem)
+            send_values = all(self.queues)
 
-            @dataclass
-            class ZipSinlge(Single):
-                idx: int
-                queues: List[List]
-                lock: threading.RLock
+            if send_values:
+                queued_values = tuple(x.pop(0) for x in self.queues)
 
-                def on_next(self, elem):
-                    with self.lock:
-                        self.queues[self.idx].append(elem)
-                        send_values = all([len(q) for q in self.queues])
+        if send_values:
+            self.single.on_next(queued_values)
 
-                    if send_values:
-                        # try:
-                        queued_values = [x.pop(0) for x in self.queues]
-                        res = tuple(queued_values)
-                        # except Exception as ex:
-                        #     single.on_error(ex)
-                        #     return
+    # def on_error(self, exc: Exception):
+    #     single.on_error(exc)
 
-                        single.on_next(res)
 
-                # def on_error(self, exc: Exception):
-                #     single.on_error(exc)
+class ZipAck(Ack):
+    __slots__ = ('sources',)
 
-            queues: List[List] = [[] for _ in sources]
-            lock = threading.RLock()
+    def __init__(self, sources: List[Ack]):
+        self.sources = sources
 
-            def gen_subscriptions():
-                for idx, source in enumerate(sources):
-                    yield source.subscribe(ZipSinlge(
-                        idx=idx,
-                        queues=queues,
-                        lock=lock,
-                    ))
+    def subscribe(self, single: Single):
+        queues: List[List] = [[] for _ in self.sources]
+        lock = threading.Lock()
 
-            subscriptions = list(gen_subscriptions())
+        subscriptions = [source.subscribe(ZipSingle(
+            idx=idx,
+            queues=queues,
+            lock=lock,
+            single=single,
+        )) for idx, source in enumerate(self.sources)]
 
-            return CompositeDisposable(subscriptions)
+        return CompositeDisposable(subscriptions)
 
-    return ZipAck()
+
+def _zip(*args: Ack) -> Ack:
+    return ZipAck(sources=list(args))
@@ -7,6 +7,8 @@ class Single(ABC):
     no on_complete method needed.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def on_next(self, elem):
         ...
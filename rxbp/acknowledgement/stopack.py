@@ -6,14 +6,26 @@ from rxbp.acknowledgement.mixins.ackmergemixin import AckMergeMixin
 from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.single import Single
 
+_empty_disposable = Disposable()
+
 
 @dataclass(frozen=True)
 class StopAck(AckMergeMixin, Ack):
+    __slots__ = ()
+
     is_sync = True
 
+    # there is only one instance, which allows to compare acknowledgments by identity
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def subscribe(self, single: Single) -> Disposable:
         single.on_next(stop_ack)
-        return Disposable()
+        return _empty_disposable
 
     def merge(self, other: Ack):
         return self
@@ -0,0 +1,56 @@
+"""
+Global configuration of rxbp.
+
+The operator fusion configuration is read when a Flowable is subscribed, the stack
+capture configuration when an operator is created.
+"""
+
+_operator_fusion = True
+
+
+def set_operator_fusion(val: bool):
+    """
+    Enable or disable operator fusion.
+
+    If enabled (default), consecutive stateless and synchronous operators like `map`,
+    `filter`, `zip_with_index` and `map_to_iterator` are fused into a single
+    observer at subscribe time.
+    """
+
+    global _operator_fusion
+    _operator_fusion = val
+
+
+def is_operator_fusion_enabled() -> bool:
+    return _operator_fusion
+
+
+STACK_CAPTURE_FULL = 'full'
+STACK_CAPTURE_LAZY = 'lazy'
+STACK_CAPTURE_CALLER = 'caller'
+STACK_CAPTURE_OFF = 'off'
+
+_stack_capture = STACK_CAPTURE_LAZY
+
+
+def set_stack_capture(mode: str):
+    """
+    Select how the stack is captured when an operator is created. The stack is
+    used to report where an operator was created, if an operator raises an exception.
+
+    - 'lazy' (default): captures the code objects and line numbers of all frames, the
+      source lines are looked up only when an exception message gets created
+    - 'caller': captures only the file and line of the caller
+    - 'full': extracts the complete stack including source lines right away
+    - 'off': does not capture the stack
+    """
+
+    assert mode in (STACK_CAPTURE_FULL, STACK_CAPTURE_LAZY, STACK_CAPTURE_CALLER, STACK_CAPTURE_OFF), \
+        f'unknown stack capture mode "{mode}"'
+
+    global _stack_capture
+    _stack_capture = mode
+
+
+def get_stack_capture() -> str:
+    return _stack_capture
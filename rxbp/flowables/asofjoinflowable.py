@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.asofjoinobservable import AsofJoinObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class AsofJoinFlowable(FlowableMixin):
+    source: FlowableMixin
+    other: FlowableMixin
+    key: Optional[Callable[[Any], Any]]
+    tolerance: Any
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        left_subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+        right_subscription = self.other.unsafe_subscribe(subscriber=subscriber)
+
+        return left_subscription.copy(
+            observable=AsofJoinObservable(
+                left=left_subscription.observable,
+                right=right_subscription.observable,
+                key=self.key,
+                tolerance=self.tolerance,
+            ),
+        )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Callable, List, Any, Optional
 
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.bufferobservable import BufferObservable
@@ -9,7 +10,9 @@ from rxbp.subscription import Subscription
 @dataclass
 class BufferFlowable(FlowableMixin):
     source: FlowableMixin
-    buffer_size: int
+    buffer_size: Optional[int]
+    low_watermark: Optional[int] = None
+    size_func: Callable[[List[Any]], int] = None
 
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         subscription = self.source.unsafe_subscribe(subscriber=subscriber)
@@ -17,6 +20,8 @@ class BufferFlowable(FlowableMixin):
         observable = BufferObservable(
             subscription.observable,
             buffer_size=self.buffer_size,
+            low_watermark=self.low_watermark,
+            size_func=self.size_func,
             scheduler=subscriber.scheduler,
             subscribe_scheduler=subscriber.subscribe_scheduler,
         )
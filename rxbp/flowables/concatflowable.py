@@ -1,18 +1,92 @@
 from typing import List
 
+from rxbp.flowables.filterflowable import FilterFlowable
+from rxbp.flowables.filtermaskflowable import FilterMaskFlowable
+from rxbp.flowables.fromadaptiveiterableflowable import FromAdaptiveIterableFlowable
+from rxbp.flowables.fromemptyflowable import FromEmptyFlowable
+from rxbp.flowables.fromiterableflowable import FromIterableFlowable
+from rxbp.flowables.fromsingleelementflowable import FromSingleElementFlowable
+from rxbp.flowables.mapbatchflowable import MapBatchFlowable
+from rxbp.flowables.mapflowable import MapFlowable
+from rxbp.flowables.maptoiteratorflowable import MapToIteratorFlowable
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.concatobservable import ConcatObservable
+from rxbp.observables.lazyconcatobservable import LazyConcatObservable
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 
 
 class ConcatFlowable(FlowableMixin):
-    def __init__(self, sources: List[FlowableMixin]):
+    def __init__(self, sources: List[FlowableMixin], lazy: bool = None):
+        """
+        :param sources: the Flowables that get concatenated
+        :param lazy: if set to True, a source is subscribed only after the previous source
+            completed, which only works for cold sources; if None, the sources are subscribed
+            lazily only if they are known to be cold
+        """
+
         super().__init__()
 
+        if lazy is None:
+            # the first source is subscribed immediately in any case
+            lazy = all(self._is_cold(source) for source in sources[1:])
+
         self._sources = sources
+        self._lazy = lazy
+
+    @staticmethod
+    def _is_cold(source: FlowableMixin) -> bool:
+        """ returns True if the source is created by `from_list`, `from_range`, `from_iterable`,
+        `return_value` or `empty`, possibly followed by stateless operators like `map` or
+        `filter`, which only emit elements once they are observed
+        """
+
+        while True:
+            # unwrap Flowable created by `init_flowable`
+            source = getattr(source, 'underlying', source)
+
+            # a stateless operator with a single source is cold if its source is cold
+            if isinstance(source, (
+                MapFlowable,
+                MapBatchFlowable,
+                MapToIteratorFlowable,
+                FilterFlowable,
+                FilterMaskFlowable,
+            )):
+                source = source.source
+
+            else:
+                break
+
+        return isinstance(source, (
+            FromIterableFlowable,
+            FromAdaptiveIterableFlowable,
+            FromSingleElementFlowable,
+            FromEmptyFlowable,
+        ))
 
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        if self._lazy:
+            first_subscription = self._sources[0].unsafe_subscribe(subscriber)
+
+            def gen_observable_factories():
+                yield lambda: first_subscription.observable
+
+                for source in self._sources[1:]:
+                    def get_observable(source=source):
+                        return source.unsafe_subscribe(subscriber).observable
+
+                    yield get_observable
+
+            observable = LazyConcatObservable(
+                sources=list(gen_observable_factories()),
+                subscribe_scheduler=subscriber.subscribe_scheduler,
+            )
+
+            return first_subscription.copy(
+                observable=observable,
+            )
+
         def gen_subscriptions():
             for source in self._sources:
                 subscription = source.unsafe_subscribe(subscriber)
@@ -3,6 +3,8 @@ from typing import Callable, Any
 
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.filterobservable import FilterObservable
+from rxbp.observables.fusedobservable import fuse_observable
+from rxbp.observers.fusedobserver import FusedStage
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 
@@ -15,9 +17,15 @@ class FilterFlowable(FlowableMixin):
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         subscription = self.source.unsafe_subscribe(subscriber)
 
-        observable = FilterObservable(
+        observable = fuse_observable(
             source=subscription.observable,
-            predicate=self.predicate,
+            stage=FusedStage(kind=FusedStage.FILTER, func=self.predicate),
         )
 
+        if observable is None:
+            observable = FilterObservable(
+                source=subscription.observable,
+                predicate=self.predicate,
+            )
+
         return subscription.copy(observable=observable)
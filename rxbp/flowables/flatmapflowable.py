@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from traceback import FrameSummary
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional
 
 from rxbp.init.initsubscription import init_subscription
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.mixins.sharedflowablemixin import SharedFlowableMixin
+from rxbp.observables.concurrentflatmapobservable import ConcurrentFlatMapObservable
 from rxbp.observables.flatmapobservable import FlatMapObservable
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
@@ -16,6 +17,8 @@ class FlatMapFlowable(FlowableMixin):
     source: FlowableMixin
     func: Callable[[Any], FlowableMixin]
     stack: List[FrameSummary]
+    max_concurrent: Optional[int] = None
+    ordered: bool = True
 
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         subscription = self.source.unsafe_subscribe(subscriber=subscriber)
@@ -32,11 +35,22 @@ class FlatMapFlowable(FlowableMixin):
             subscription = flowable.unsafe_subscribe(subscriber=subscriber)
             return subscription.observable
 
-        return subscription.copy(
-            observable=FlatMapObservable(
+        # unordered output requires to observe the inner observables concurrently
+        if self.max_concurrent is None and self.ordered:
+            observable = FlatMapObservable(
                 source=subscription.observable,
                 func=observable_selector,
                 scheduler=subscriber.scheduler,
                 subscribe_scheduler=subscriber.subscribe_scheduler,
             )
-        )
\ No newline at end of file
+
+        else:
+            observable = ConcurrentFlatMapObservable(
+                source=subscription.observable,
+                func=observable_selector,
+                max_concurrent=self.max_concurrent,
+                ordered=self.ordered,
+                subscribe_scheduler=subscriber.subscribe_scheduler,
+            )
+
+        return subscription.copy(observable=observable)
\ No newline at end of file
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Iterable, Callable, Optional
+
+from rxbp.init.initsubscription import init_subscription
+from rxbp.internal.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.adaptivebatchobservable import AdaptiveBatchObservable
+from rxbp.observables.fromiteratorobservable import FromIteratorObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+from rxbp.typing import ElementType
+
+
+@dataclass
+class FromAdaptiveIterableFlowable(FlowableMixin):
+    """ Emits the batches of an iterable whose batch size adapts to the
+    acknowledgment latency of the downstream
+    """
+
+    # creates an iterable over batches; the size of the next batch is read from the argument
+    lazy_iterable: Callable[[AdaptiveBatchSize], Iterable[ElementType]]
+    target_latency: float
+    initial_size: Optional[int] = None
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        batch_size = AdaptiveBatchSize(
+            target_latency=self.target_latency,
+            initial_size=self.initial_size,
+        )
+
+        iterator = iter(self.lazy_iterable(batch_size))
+
+        return init_subscription(
+            observable=AdaptiveBatchObservable(
+                source=FromIteratorObservable(
+                    iterator=iterator,
+                    subscribe_scheduler=subscriber.subscribe_scheduler,
+                    scheduler=subscriber.scheduler,
+                ),
+                batch_size=batch_size,
+            ),
+        )
@@ -0,0 +1,28 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterable, Any, Optional
+
+from rxbp.init.initsubscription import init_subscription
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.fromasynciterableobservable import FromAsyncIterableObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class FromAsyncIterableFlowable(FlowableMixin):
+    async_iterable: AsyncIterable[Any]
+    batch_size: int
+    is_batched: bool
+    loop: Optional[asyncio.AbstractEventLoop]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        return init_subscription(
+            observable=FromAsyncIterableObservable(
+                async_iterable=self.async_iterable,
+                batch_size=self.batch_size,
+                is_batched=self.is_batched,
+                scheduler=subscriber.scheduler,
+                loop=self.loop,
+            ),
+        )
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.groupbyobservable import GroupByObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class GroupByFlowable(FlowableMixin):
+    source: FlowableMixin
+    key_func: Callable[[Any], Any]
+    max_groups: Optional[int]
+    group_buffer: Optional[int]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(
+            observable=GroupByObservable(
+                source=subscription.observable,
+                key_func=self.key_func,
+                max_groups=self.max_groups,
+                group_buffer=self.group_buffer,
+                scheduler=subscriber.scheduler,
+                subscribe_scheduler=subscriber.subscribe_scheduler,
+            ),
+        )
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.mapbatchobservable import MapBatchObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class MapBatchFlowable(FlowableMixin):
+    source: FlowableMixin
+    func: Callable[[Any], Any]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+        return subscription.copy(
+            observable=MapBatchObservable(
+                source=subscription.observable,
+                func=self.func,
+            ),
+        )
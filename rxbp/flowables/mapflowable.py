@@ -3,7 +3,9 @@ from traceback import FrameSummary
 from typing import Callable, Any, List
 
 from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.fusedobservable import fuse_observable
 from rxbp.observables.mapobservable import MapObservable
+from rxbp.observers.fusedobserver import FusedStage
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 from rxbp.typing import ValueType
@@ -19,12 +21,19 @@ class MapFlowable(FlowableMixin):
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         # try:
         subscription = self.source.unsafe_subscribe(subscriber=subscriber)
-        return subscription.copy(
-            observable=MapObservable(
+
+        observable = fuse_observable(
+            source=subscription.observable,
+            stage=FusedStage(kind=FusedStage.MAP, func=self.func),
+        )
+
+        if observable is None:
+            observable = MapObservable(
                 source=subscription.observable,
                 func=self.func,
-            ),
-        )
+            )
+
+        return subscription.copy(observable=observable)
 
         # except AttributeError:
         #     raise Exception(to_operator_exception(
@@ -1,7 +1,9 @@
 from typing import Callable, Iterator
 
 from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.fusedobservable import fuse_observable
 from rxbp.observables.maptoiteratorobservable import MapToIteratorObservable
+from rxbp.observers.fusedobserver import FusedStage
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 from rxbp.typing import ValueType
@@ -18,7 +20,18 @@ class MapToIteratorFlowable(FlowableMixin):
         self._source = source
         self._func = func
 
+    @property
+    def source(self) -> FlowableMixin:
+        return self._source
+
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         subscription = self._source.unsafe_subscribe(subscriber=subscriber)
-        observable = MapToIteratorObservable(source=subscription.observable, func=self._func)
+        observable = fuse_observable(
+            source=subscription.observable,
+            stage=FusedStage(kind=FusedStage.MAP_TO_ITERATOR, func=self._func),
+        )
+
+        if observable is None:
+            observable = MapToIteratorObservable(source=subscription.observable, func=self._func)
+
         return subscription.copy(observable=observable)
\ No newline at end of file
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import List
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.mergenobservable import MergeNObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class MergeNFlowable(FlowableMixin):
+    sources: List[FlowableMixin]
+    prioritized: bool = False
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscriptions = [source.unsafe_subscribe(subscriber=subscriber) for source in self.sources]
+
+        return subscriptions[0].copy(
+            observable=MergeNObservable(
+                sources=[subscription.observable for subscription in subscriptions],
+                prioritized=self.prioritized,
+            ),
+        )
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.parallelmapobservable import ParallelMapObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+from rxbp.typing import ValueType
+
+
+@dataclass
+class ParallelMapFlowable(FlowableMixin):
+    source: FlowableMixin
+    func: Callable[[ValueType], Any]
+    max_workers: Optional[int]
+    ordered: bool
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(observable=ParallelMapObservable(
+            source=subscription.observable,
+            func=self.func,
+            scheduler=subscriber.scheduler,
+            max_workers=self.max_workers,
+            ordered=self.ordered,
+        ))
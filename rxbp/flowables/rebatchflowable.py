@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.rebatchobservable import RebatchObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class RebatchFlowable(FlowableMixin):
+    source: FlowableMixin
+    batch_size: Optional[int]
+    target_latency: Optional[float]
+    timespan: Optional[float] = None
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(observable=RebatchObservable(
+            source=subscription.observable,
+            batch_size=self.batch_size,
+            target_latency=self.target_latency,
+            timespan=self.timespan,
+            scheduler=subscriber.scheduler,
+        ))
@@ -1,7 +1,7 @@
 import threading
 from dataclasses import dataclass
 from traceback import FrameSummary
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.refcountobservable import RefCountObservable
@@ -21,9 +21,10 @@ class RefCountFlowable(FlowableMixin):
             source: FlowableMixin,
             stack: List[FrameSummary],
             subject_gen: Callable[[Scheduler], ObservableSubjectBase] = None,
+            buffer_size: Optional[int] = None,
     ):
         def default_subject_gen(scheduler: Scheduler):
-            return CacheServeFirstObservableSubject(scheduler=scheduler)
+            return CacheServeFirstObservableSubject(scheduler=scheduler, buffer_size=buffer_size)
 
         self.source = source
         self.stack = stack
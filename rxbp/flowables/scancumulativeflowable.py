@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.scancumulativeobservable import ScanCumulativeObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class ScanCumulativeFlowable(FlowableMixin):
+    source: FlowableMixin
+    func: Callable[[Any, Any], Any]
+    initial: Any
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+        return subscription.copy(
+            observable=ScanCumulativeObservable(
+                source=subscription.observable,
+                func=self.func,
+                initial=self.initial,
+            ),
+        )
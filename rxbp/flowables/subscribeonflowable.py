@@ -21,6 +21,7 @@ class SubscribeOnFlowable(FlowableMixin):
         updated_subscriber = init_subscriber(
             scheduler=subscriber.scheduler,
             subscribe_scheduler=scheduler,
+            selector_cache=subscriber.selector_cache,
         )
 
         subscription = self._source.unsafe_subscribe(updated_subscriber)
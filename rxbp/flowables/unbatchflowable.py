@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.unbatchobservable import UnbatchObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class UnbatchFlowable(FlowableMixin):
+    source: FlowableMixin
+    batch_size: int
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(observable=UnbatchObservable(
+            source=subscription.observable,
+            batch_size=self.batch_size,
+        ))
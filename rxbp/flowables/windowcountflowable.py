@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.windowcountobservable import WindowCountObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class WindowCountFlowable(FlowableMixin):
+    source: FlowableMixin
+    n: int
+    step: int
+    accumulator_factory: Optional[Callable[[], Any]]
+    value_selector: Optional[Callable[[Any], Any]]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(observable=WindowCountObservable(
+            source=subscription.observable,
+            n=self.n,
+            step=self.step,
+            accumulator_factory=self.accumulator_factory,
+            value_selector=self.value_selector,
+        ))
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.windowtimeobservable import WindowTimeObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class WindowTimeFlowable(FlowableMixin):
+    source: FlowableMixin
+    span: float
+    step: float
+    timestamp: Optional[Callable[[Any], float]]
+    accumulator_factory: Optional[Callable[[], Any]]
+    value_selector: Optional[Callable[[Any], Any]]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(observable=WindowTimeObservable(
+            source=subscription.observable,
+            span=self.span,
+            step=self.step,
+            timestamp=self.timestamp,
+            accumulator_factory=self.accumulator_factory,
+            value_selector=self.value_selector,
+            scheduler=subscriber.scheduler,
+        ))
@@ -1,7 +1,9 @@
 from typing import Callable, Any
 
 from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.fusedobservable import fuse_observable
 from rxbp.observables.zipwithindexobservable import ZipWithIndexObservable
+from rxbp.observers.fusedobserver import FusedStage
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 from rxbp.typing import ValueType
@@ -17,4 +19,13 @@ class ZipWithIndexFlowable(FlowableMixin):
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         subscription = self._source.unsafe_subscribe(subscriber=subscriber)
         observable = ZipWithIndexObservable(source=subscription.observable, selector=self._selector)
+
+        fused_observable = fuse_observable(
+            source=subscription.observable,
+            stage=FusedStage(kind=FusedStage.ZIP_WITH_INDEX, func=observable.selector),
+        )
+
+        if fused_observable is not None:
+            observable = fused_observable
+
         return subscription.copy(observable=observable)
\ No newline at end of file
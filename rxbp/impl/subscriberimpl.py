@@ -2,6 +2,7 @@ from dataclasses import replace
 
 from dataclass_abc import dataclass_abc
 
+from rxbp.internal.selectorcache import SelectorCache
 from rxbp.scheduler import Scheduler
 from rxbp.subscriber import Subscriber
 
@@ -10,6 +11,7 @@ from rxbp.subscriber import Subscriber
 class SubscriberImpl(Subscriber):
     scheduler: Scheduler
     subscribe_scheduler: Scheduler
+    selector_cache: SelectorCache
 
     def copy(self, **kwargs):
         return replace(self, **kwargs)
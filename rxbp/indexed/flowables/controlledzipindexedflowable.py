@@ -50,7 +50,8 @@ class ControlledZipIndexedFlowable(IndexedFlowableMixin):
                         selector,
                         current_selector,
                         subscribe_scheduler=subscriber.scheduler,
-                        stack=self.stack
+                        stack=self.stack,
+                        selector_cache=subscriber.selector_cache,
                     )
                     yield base, selector
 
@@ -35,6 +35,7 @@ class FilterIndexedFlowable(IndexedFlowableMixin):
                         right=observable.selector_subject,
                         subscribe_scheduler=subscriber.scheduler,
                         stack=self.stack,
+                        selector_cache=subscriber.selector_cache,
                     )
 
             if subscription.index.base is not None:
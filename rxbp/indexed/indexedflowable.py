@@ -7,7 +7,7 @@ from rxbp.mixins.flowableabsopmixin import FlowableAbsOpMixin
 from rxbp.mixins.sharedflowablemixin import SharedFlowableMixin
 from rxbp.pipeoperation import PipeOperation
 from rxbp.scheduler import Scheduler
-from rxbp.toiterator import to_iterator
+from rxbp.toiterator import to_iterator, to_async_iterator
 from rxbp.typing import ValueType
 from rxbp.utils.getstacklines import get_stack_lines
 
@@ -27,14 +27,28 @@ class IndexedFlowable(
     with other bases to a new sequence matching the base of this IndexedFlowable.
     """
     
-    def share(self) -> 'IndexedFlowable':
+    def share(self, buffer_size: int = None) -> 'IndexedFlowable':
+        """
+        Broadcast the elements of the Flowable to possibly multiple subscribers.
+
+        :param buffer_size: back-pressure the source once this many batches are buffered
+            for the slowest subscriber; the buffer is unbounded by default. The limit
+            counts batches, not elements or memory.
+        """
+
         stack = get_stack_lines()
 
-        return self._share(stack=stack)
+        return self._share(stack=stack, buffer_size=buffer_size)
 
     def run(self, scheduler: Scheduler = None):
         return list(to_iterator(source=self, scheduler=scheduler))
 
+    def to_iterator(self, scheduler: Scheduler = None, prefetch: int = None):
+        return to_iterator(source=self, scheduler=scheduler, prefetch=prefetch)
+
+    def to_async_iterator(self, scheduler: Scheduler = None, prefetch: int = None):
+        return to_async_iterator(source=self, scheduler=scheduler, prefetch=prefetch)
+
     def pipe(self, *operators: PipeOperation[FlowableAbsOpMixin]) -> 'IndexedFlowable':
         flowable = functools.reduce(lambda obs, op: op(obs), operators, self)
 
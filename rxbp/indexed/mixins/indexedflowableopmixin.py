@@ -173,9 +173,9 @@ class IndexedFlowableOpMixin(
         flowable = RepeatFirstFlowable(source=self)
         return self._copy(underlying=flowable)
 
-    def _share(self, stack: List[FrameSummary]):
+    def _share(self, stack: List[FrameSummary], buffer_size: int = None):
         return self._copy(
-            underlying=RefCountFlowable(source=self, stack=stack),
+            underlying=RefCountFlowable(source=self, stack=stack, buffer_size=buffer_size),
             is_shared=True,
         )
 
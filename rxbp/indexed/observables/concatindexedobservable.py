@@ -5,15 +5,13 @@ from rx.disposable import CompositeDisposable
 
 from rxbp.init.initobserverinfo import init_observer_info
 from rxbp.observable import Observable
-from rxbp.observables.maptoiteratorobservable import MapToIteratorObservable
+from rxbp.observables.mapbatchobservable import MapBatchObservable
 from rxbp.observablesubjects.publishobservablesubject import PublishObservableSubject
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
 from rxbp.observers.concatobserver import ConcatObserver
 from rxbp.observers.connectableobserver import ConnectableObserver
 from rxbp.scheduler import Scheduler
-from rxbp.indexed.selectors.selectnext import select_next
-from rxbp.indexed.selectors.selectcompleted import select_completed
 from rxbp.typing import ElementType
 
 
@@ -28,7 +26,7 @@ class ConcatIndexedObservable(Observable):
 
     @property
     def selectors(self):
-        return [MapToIteratorObservable(subject, lambda v: [select_next, select_completed]) for subject in self.subjects]
+        return [MapBatchObservable(subject, lambda batch: [1] * len(batch)) for subject in self.subjects]
 
     def observe(self, observer_info: ObserverInfo):
         """
@@ -11,8 +11,6 @@ from rxbp.acknowledgement.operators.map import _map
 from rxbp.acknowledgement.operators.mergeack import merge_ack
 from rxbp.acknowledgement.operators.zip import _zip
 from rxbp.acknowledgement.stopack import stop_ack, StopAck
-from rxbp.indexed.selectors.selectnext import select_next
-from rxbp.indexed.selectors.selectcompleted import select_completed
 from rxbp.observable import Observable
 from rxbp.observablesubjects.publishobservablesubject import PublishObservableSubject
 from rxbp.observer import Observer
@@ -39,6 +37,11 @@ class ControlledZipIndexedObservable(Observable):
         self.left_selector = PublishObservableSubject()
         self.right_selector = PublishObservableSubject()
 
+        # number of matches of the current left and right element, sent as selector
+        # once the element is requested
+        self.left_count = 0
+        self.right_count = 0
+
         self.lock = threading.RLock()
 
         self.observer = None
@@ -122,8 +125,8 @@ class ControlledZipIndexedObservable(Observable):
 
         # keep elements to be sent in a buffer. Only when the incoming batch of elements is iterated over, the
         # elements in the buffer are sent.
-        left_index_buffer = []                  # index of the elements from the left observable that got selected
-        right_index_buffer = []                 # by the match function
+        left_index_buffer = []                  # number of matches of each element from the left observable
+        right_index_buffer = []                 # and the right observable
         zipped_output_buffer = []
 
         request_new_elem_from_left = False
@@ -134,8 +137,8 @@ class ControlledZipIndexedObservable(Observable):
         while True:
 
             if self.match_func(left_val, right_val):
-                left_index_buffer.append(select_next)
-                right_index_buffer.append(select_next)
+                self.left_count += 1
+                self.right_count += 1
 
                 # add to buffer
                 zipped_output_buffer.append((left_val, right_val))
@@ -144,7 +147,8 @@ class ControlledZipIndexedObservable(Observable):
             request_right = self.request_right(left_val, right_val)
 
             if request_left:
-                left_index_buffer.append(select_completed)
+                left_index_buffer.append(self.left_count)
+                self.left_count = 0
 
                 try:
                     left_val = next(left_iter)
@@ -152,7 +156,8 @@ class ControlledZipIndexedObservable(Observable):
                     request_new_elem_from_left = True
 
             if request_right:
-                right_index_buffer.append(select_completed)
+                right_index_buffer.append(self.right_count)
+                self.right_count = 0
 
                 try:
                     right_val = next(right_iter)
@@ -340,6 +345,12 @@ class ControlledZipIndexedObservable(Observable):
         if exc:
             self.observer.on_error(exc)
         else:
+            # the matches of the current elements are sent even though they are not requested
+            if self.left_count:
+                self.left_selector.on_next([self.left_count])
+            if self.right_count:
+                self.right_selector.on_next([self.right_count])
+
             self.left_selector.on_completed()
             self.right_selector.on_completed()
             self.observer.on_completed()
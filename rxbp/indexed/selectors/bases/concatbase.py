@@ -72,6 +72,7 @@ class ConcatBase(FlowableBase):
                                 selector.observable,
                                 subscriber.scheduler,
                                 stack=stack,
+                                selector_cache=subscriber.selector_cache,
                             )
 
                 if all(isinstance(selector, IdentitySeqMapInfo) for selector in left_selectors):
@@ -32,3 +32,19 @@ class FlowableBase(ABC):
         """
 
         ...
+
+    def cached_match_with(
+            self,
+            other: 'FlowableBase',
+            subscriber: Subscriber,
+            stack: List[FrameSummary],
+    ) -> Optional[FlowableBaseMatch]:
+        """
+        matches two Flowable bases only once per subscription; matching the same
+        pair of bases again returns the selectors created by the first match.
+        """
+
+        return subscriber.selector_cache.get_or_create(
+            key=('match_with', self, other),
+            create=lambda: self.match_with(other, subscriber=subscriber, stack=stack),
+        )
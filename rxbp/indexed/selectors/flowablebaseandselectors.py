@@ -5,19 +5,14 @@ from typing import Optional, Dict, Tuple, List
 from rxbp.indexed.selectors.flowablebase import FlowableBase, FlowableBaseMatch
 from rxbp.indexed.selectors.seqmapinfo import SeqMapInfo
 from rxbp.indexed.selectors.seqmapinfopair import SeqMapInfoPair
-from rxbp.indexed.selectors.selectnext import SelectNext, select_next
-from rxbp.indexed.selectors.selectcompleted import select_completed, SelectCompleted
 from rxbp.indexed.selectors.selectionop import merge_selectors
 from rxbp.indexed.selectors.observableseqmapinfo import ObservableSeqMapInfo
 from rxbp.indexed.selectors.identityseqmapinfo import IdentitySeqMapInfo
 from rxbp.observable import Observable
-from rxbp.observables.controlledzipobservable import ControlledZipObservable
-from rxbp.observables.debugobservable import DebugObservable
-from rxbp.observables.filterobservable import FilterObservable
-from rxbp.observables.init.initdebugobservable import init_debug_observable
 from rxbp.observables.mapobservable import MapObservable
 from rxbp.observables.maptoiteratorobservable import MapToIteratorObservable
 from rxbp.observables.refcountobservable import RefCountObservable
+from rxbp.observables.zipobservable import ZipObservable
 from rxbp.observablesubjects.publishobservablesubject import PublishObservableSubject
 from rxbp.subscriber import Subscriber
 
@@ -87,7 +82,7 @@ class FlowableBaseAndSelectors:
         for selector_base, selector_obs in self.selectors.items():
 
             # get selector maps of bases
-            result = other.base.match_with(selector_base, subscriber=subscriber, stack=stack)
+            result = other.base.cached_match_with(selector_base, subscriber=subscriber, stack=stack)
 
             if isinstance(result, FlowableBaseMatch):
 
@@ -102,6 +97,7 @@ class FlowableBaseAndSelectors:
                             selector_obs,
                             subscribe_scheduler=subscriber.scheduler,
                             stack=stack,
+                            selector_cache=subscriber.selector_cache,
                         ))
 
                         if other.selectors is not None:
@@ -113,10 +109,12 @@ class FlowableBaseAndSelectors:
                                             right=result.left.observable,
                                             subscribe_scheduler=subscriber.scheduler,
                                             stack=stack,
+                                            selector_cache=subscriber.selector_cache,
                                         ),
                                         right=selector_obs,
                                         subscribe_scheduler=subscriber.scheduler,
                                         stack=stack,
+                                        selector_cache=subscriber.selector_cache,
                                     )
                                     yield key, selector
                             selectors = dict(gen_new_selectors())
@@ -135,6 +133,7 @@ class FlowableBaseAndSelectors:
                                         right=selector_obs,
                                         subscribe_scheduler=subscriber.scheduler,
                                         stack=stack,
+                                        selector_cache=subscriber.selector_cache,
                                     )
                                     yield key, selector
                             selectors = dict(gen_new_selectors())
@@ -168,7 +167,7 @@ class FlowableBaseAndSelectors:
         # bases are of type Optional[Base], therefore check first if base is not None
         if self.base is not None and other.base is not None:
 
-            result = self.base.match_with(other.base, subscriber=subscriber, stack=stack)
+            result = self.base.cached_match_with(other.base, subscriber=subscriber, stack=stack)
 
             # this BaseAndSelectors and the other BaseAndSelectors match directly with
             # their bases
@@ -236,7 +235,7 @@ class FlowableBaseAndSelectors:
             for sel_base_1, sel_observable_1 in self.selectors.items():
                 for sel_base_2, sel_observable_2 in other.selectors.items():
 
-                    result = sel_base_1.match_with(
+                    result = sel_base_1.cached_match_with(
                         sel_base_2,
                         subscriber=subscriber,
                         stack=stack,
@@ -245,73 +244,63 @@ class FlowableBaseAndSelectors:
                     # if two bases match ...
                     if isinstance(result, FlowableBaseMatch):
 
-                        # once right is completed, keep consuming left side until it is completed as well
-                        def request_left(left, right):
-                            return not (isinstance(left, SelectCompleted) and isinstance(right, SelectNext))
-
-                        def request_right(left, right):
-                            return not (isinstance(right, SelectCompleted) and isinstance(left, SelectNext))
-
                         if isinstance(result.left, IdentitySeqMapInfo) and isinstance(result.right, IdentitySeqMapInfo):
-                            merge_sel = RefCountObservable(
-                                source=ControlledZipObservable(
-                                    left=sel_observable_1, #init_debug_observable(sel_observable_1, name='d1', stack=stack, subscriber=subscriber),
-                                    right=sel_observable_2, #init_debug_observable(sel_observable_2, name='d1', stack=stack, subscriber=subscriber),
-                                    request_left=request_left,
-                                    request_right=request_right,
-                                    match_func=lambda _, __: True,
-                                    scheduler=subscriber.scheduler,
+
+                            def create_selectors():
+                                # both selectors select from the same sequence, hence, their counts are aligned
+                                merge_sel = RefCountObservable(
+                                    source=ZipObservable(
+                                        left=sel_observable_1,
+                                        right=sel_observable_2,
+                                        stack=stack,
+                                    ),
+                                    subject=PublishObservableSubject(),
+                                    subscribe_scheduler=subscriber.subscribe_scheduler,
                                     stack=stack,
-                                ), #name='d2', stack=stack, subscriber=subscriber),
-                                subject=PublishObservableSubject(),
-                                subscribe_scheduler=subscriber.subscribe_scheduler,
-                                stack=stack,
-                            )
+                                )
+
+                                # an element selected n times by the left and m times by the right selector
+                                # is selected min(n, m) times in the matched sequence
+                                def left_selector(t):
+                                    n_matched = min(t)
+                                    return [1] * n_matched + [0] * (t[0] - n_matched)
 
-                            def left_selector(t):
-                                if isinstance(t[1], SelectNext):
-                                    return [select_next, select_completed]
-                                else:
-                                    return [select_completed]
-
-                            def right_selector(t):
-                                if isinstance(t[0], SelectNext):
-                                    return [select_next, select_completed]
-                                else:
-                                    return [select_completed]
-
-                            left_sel = RefCountObservable(
-                                source=MapToIteratorObservable(
-                                    source=FilterObservable(
+                                def right_selector(t):
+                                    n_matched = min(t)
+                                    return [1] * n_matched + [0] * (t[1] - n_matched)
+
+                                left_sel = RefCountObservable(
+                                    source=MapToIteratorObservable(
                                         source=merge_sel,
-                                        predicate=lambda t: isinstance(t[0], SelectNext),
+                                        func=left_selector,
                                     ),
-                                    func=left_selector,
-                                ),
-                                subject=PublishObservableSubject(),
-                                subscribe_scheduler=subscriber.subscribe_scheduler,
-                                stack=stack,
-                            )
+                                    subject=PublishObservableSubject(),
+                                    subscribe_scheduler=subscriber.subscribe_scheduler,
+                                    stack=stack,
+                                )
 
-                            right_sel = RefCountObservable(
-                                source=MapToIteratorObservable(
-                                    source=FilterObservable(
+                                right_sel = RefCountObservable(
+                                    source=MapToIteratorObservable(
                                         source=merge_sel,
-                                        predicate=lambda t: isinstance(t[1], SelectNext),
+                                        func=right_selector,
                                     ),
-                                    func=right_selector,
-                                ),
-                                subject=PublishObservableSubject(),
-                                subscribe_scheduler=subscriber.scheduler,
-                                stack=stack,
-                            )
+                                    subject=PublishObservableSubject(),
+                                    subscribe_scheduler=subscriber.scheduler,
+                                    stack=stack,
+                                )
 
-                            right_selector_map = MapObservable(
-                                source=FilterObservable(
+                                right_selector_map = MapObservable(
                                     source=merge_sel,
-                                    predicate=lambda t: type(t[0]) == type(t[1]),
-                                ),
-                                func=lambda t: t[0],
+                                    func=min,
+                                )
+
+                                # the entry references the zipped selector observables, such that their ids
+                                # used in the key stay valid as long as the entry is cached
+                                return sel_observable_1, sel_observable_2, left_sel, right_sel, right_selector_map
+
+                            _, _, left_sel, right_sel, right_selector_map = subscriber.selector_cache.get_or_create(
+                                key=('zip_selectors', id(sel_observable_1), id(sel_observable_2)),
+                                create=create_selectors,
                             )
 
                             return FlowableBaseAndSelectorsMatch(
@@ -321,9 +310,9 @@ class FlowableBaseAndSelectors:
                                     base=None,
                                     selectors={
                                         sel_base_1: right_selector_map,
-                                        **{k: merge_selectors(v, left_sel, subscribe_scheduler=subscriber.scheduler, stack=stack) for k, v in
+                                        **{k: merge_selectors(v, left_sel, subscribe_scheduler=subscriber.scheduler, stack=stack, selector_cache=subscriber.selector_cache) for k, v in
                                            self.selectors.items() if k != sel_base_1},
-                                        **{k: merge_selectors(v, right_sel, subscribe_scheduler=subscriber.scheduler, stack=stack) for k, v in
+                                        **{k: merge_selectors(v, right_sel, subscribe_scheduler=subscriber.scheduler, stack=stack, selector_cache=subscriber.selector_cache) for k, v in
                                            other.selectors.items() if k != sel_base_2}
                                     },
                                 ),
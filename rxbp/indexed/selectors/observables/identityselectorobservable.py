@@ -3,8 +3,6 @@ from rx.core.typing import Disposable
 from rxbp.observable import Observable
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
-from rxbp.indexed.selectors.selectnext import select_next
-from rxbp.indexed.selectors.selectcompleted import select_completed
 from rxbp.typing import ElementType
 
 
@@ -20,15 +18,8 @@ class IdentitySelectorObservable(Observable):
 
         class IdentityObserver(Observer):
             def on_next(self, elem: ElementType):
-                def gen_select_msg():
-                    for _ in elem:
-                        yield select_next
-                        yield select_completed
-
-                # val = list(gen_select_msg())
-                # ack = observer_info.on_next(val)
-
-                ack = observer_info.on_next(gen_select_msg())
+                # each element is selected exactly once
+                ack = observer_info.on_next([1 for _ in elem])
                 return ack
 
             def on_error(self, exc: Exception):
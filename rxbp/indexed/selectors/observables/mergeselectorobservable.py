@@ -1,38 +1,49 @@
+import itertools
+import operator
 import threading
+from bisect import bisect_right
+from typing import List, Optional
 
 from rx.disposable import CompositeDisposable
 
+from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.acksubject import AckSubject
 from rxbp.acknowledgement.continueack import continue_ack
-from rxbp.acknowledgement.ack import Ack
-from rxbp.acknowledgement.stopack import stop_ack
-from rxbp.indexed.selectors.selectnext import SelectNext
-from rxbp.indexed.selectors.selectcompleted import SelectCompleted
+from rxbp.acknowledgement.stopack import stop_ack, StopAck
 from rxbp.observable import Observable
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
-from rxbp.scheduler import Scheduler
-from rxbp.states.measuredstates.controlledzipstates import ControlledZipStates
-from rxbp.states.measuredstates.terminationstates import TerminationStates
-from rxbp.states.rawstates.rawcontrolledzipstates import RawControlledZipStates
-from rxbp.states.rawstates.rawterminationstates import RawTerminationStates
 from rxbp.typing import ElementType
 
 
 class MergeSelectorObservable(Observable):
+    """ Composes two selectors into a single selector.
+
+    A selector is a sequence of non-negative counts, one for each element of the sequence it
+    selects from, e.g. a filter emits 1 for each element that passes the predicate and 0 otherwise.
+    The left selector selects from a sequence A and produces a sequence B; the right selector
+    selects from B. The composed selector emits for each element of A the sum of the counts of
+    the right selector over the elements of B the A element got mapped to.
+
+    The counts are composed batch-wise using prefix sums: the prefix sums of the left counts
+    locate the boundaries in the right batch, and the prefix sums of the right counts evaluated
+    at these boundaries give the composed counts.
+
+    lc = 0  1  1  3        left counts: [1, 0, 2]
+    rc = 0  2  3  3        right counts: [2, 1, 0]
+    out:   2  0  1
+    """
+
     def __init__(
             self,
             left: Observable,
             right: Observable,
     ):
         """
-        :param left: lef observable
-        :param right: right observable
-        :param is_lower: if right is lower than left, request next right
-        :param is_higher: if right is higher than left, request next left
+        :param left: selector mapping a sequence A to a sequence B
+        :param right: selector mapping the sequence B to a sequence C
         """
 
-        # save input arguments
         self.left_observable = left
         self.right_observable = right
 
@@ -40,369 +51,275 @@ class MergeSelectorObservable(Observable):
 
         self.observer = None
 
-        # state once observed
-        self.termination_state = RawTerminationStates.InitState()
-        self.state = RawControlledZipStates.WaitOnLeftRight()
-
-    def _iterate_over_batch(
-            self,
-            elem: ElementType,
-            is_left: bool,
-    ) -> Ack:
-        """ This function is called once elements are received from left and right observable
+        self.left_buffer: Optional[List[int]] = None
+        self.left_offset = 0
+        self.left_ack: Optional[AckSubject] = None
+        self.right_buffer: Optional[List[int]] = None
+        self.right_offset = 0
+        self.right_ack: Optional[AckSubject] = None
 
-        Loop over received elements. Send elements downstream if the match function applies. Request new elements
-        from left, right or left and right observable.
+        # the left element at `left_offset` is mapped to `partial_need` right elements
+        # that have not been received yet
+        self.partial_sum = 0
+        self.partial_need = 0
 
-        :param elem: either elements received form left or right observable depending on is_left argument
-        :param is_left: if True then the _iterate_over_batch is called on left elements received
+        self.left_completed = False
+        self.right_completed = False
+        self.is_stopped = False
 
-        :return: acknowledgment that will be returned from `on_next` called from either left or right observable
+    def _compose(self) -> List[int]:
+        """ composes the counts of the left and right slot until one of them is exhausted
         """
 
-        upstream_ack = AckSubject()
+        left_buffer, lo = self.left_buffer, self.left_offset
+        right_buffer, ro = self.right_buffer, self.right_offset
 
-        iterable = iter(elem)
+        composed = []
 
-        # empty iterable
-        try:
-            val = next(iterable)
-        except StopIteration:
-            return continue_ack
+        # complete left element mapped to elements of the previous right batch
+        if self.partial_need:
+            n_consumed = min(self.partial_need, len(right_buffer) - ro)
+            self.partial_sum += sum(right_buffer[ro:ro + n_consumed])
+            self.partial_need -= n_consumed
+            ro += n_consumed
 
-        next_state = RawControlledZipStates.ElementReceived(
-            val=val,
-            is_left=is_left,
-            ack=upstream_ack,
-            iter=iterable,
-        )
+            if self.partial_need:
+                self.right_offset = ro
+                return composed
 
-        with self.lock:
-            next_state.prev_raw_state = self.state
-            next_state.prev_raw_termination_state = self.termination_state
-            self.state = next_state
+            composed.append(self.partial_sum)
+            self.partial_sum = 0
+            lo += 1
 
-        raw_prev_termination_state = next_state.prev_raw_termination_state
-        prev_raw_state = next_state.prev_raw_state
-        prev_state = prev_raw_state.get_measured_state(raw_prev_termination_state)
+        # lc[i] is the number of right elements consumed by the first i left elements
+        lc = list(itertools.chain((0,), itertools.accumulate(itertools.islice(left_buffer, lo, None))))
 
-        if isinstance(prev_state, ControlledZipStates.Stopped):
-            return stop_ack
+        # number of left elements that can be composed with the available right elements
+        n_left = bisect_right(lc, len(right_buffer) - ro) - 1
+        n_right = lc[n_left]
 
-        elif isinstance(prev_state, ControlledZipStates.WaitOnLeftRight):
-            return upstream_ack
-
-        elif is_left and isinstance(prev_state, ControlledZipStates.WaitOnLeft):
-            left_val = val
-            left_iter = iterable
-            left_in_ack = upstream_ack
-            right_val = prev_state.right_val
-            right_iter = prev_state.right_iter
-            right_in_ack = prev_state.right_ack
-            other_upstream_ack = prev_state.right_ack
-
-        elif not is_left and isinstance(prev_state, ControlledZipStates.WaitOnRight):
-            left_val = prev_state.left_val
-            left_iter = prev_state.left_iter
-            left_in_ack = prev_state.left_ack
-            right_val = val
-            right_iter = iterable
-            right_in_ack = upstream_ack
-            other_upstream_ack = prev_state.left_ack
+        if n_left:
+            rc = list(itertools.chain((0,), itertools.accumulate(itertools.islice(right_buffer, ro, ro + n_right))))
+            bounds = list(map(rc.__getitem__, itertools.islice(lc, n_left + 1)))
+            composed.extend(map(operator.sub, itertools.islice(bounds, 1, None), bounds))
 
-        else:
-            raise Exception('unknown state "{}", is_left {}'.format(prev_state, is_left))
-
-        # keep elements to be sent in a buffer. Only when the incoming batch of elements is iterated over, the
-        # elements in the buffer are sent.
-        zipped_output_buffer = []
-
-        request_new_elem_from_left = False
-        request_new_elem_from_right = False
+        lo += n_left
+        ro += n_right
 
-        while True:
+        # the next left element needs more right elements than available
+        if lo < len(left_buffer):
+            self.partial_sum = sum(right_buffer[ro:])
+            self.partial_need = left_buffer[lo] - (len(right_buffer) - ro)
+            ro = len(right_buffer)
 
-            # iterate over next series of SelectComplete (if exists)
-            # break loop when encountering SelectNext or end of list
-            while True:
-                # collect SelectComplete, because they don't appear on the right side
-                if isinstance(left_val, SelectCompleted):
-                    zipped_output_buffer.append(left_val)
-
-                else:
-                    break
-
-                try:
-                    left_val = next(left_iter)
-                except StopIteration:
-                    request_new_elem_from_left = True
-                    break
-
-            # break loop when there are no more right elements
-            if request_new_elem_from_right or request_new_elem_from_left:
-                break
-
-            # left send SelectNext
-            stop_right = False
-            while True:
-                if isinstance(right_val, SelectNext):
-                    # add to buffer
-                    zipped_output_buffer.append(left_val)
-
-                elif isinstance(right_val, SelectCompleted):
-                    stop_right = True
-
-                # always read next right value
-                try:
-                    right_val = next(right_iter)
-                except StopIteration:
-                    request_new_elem_from_right = True
-                    break
-
-                if stop_right:
-                    break
+        self.left_offset = lo
+        self.right_offset = ro
+        return composed
 
-            try:
-                left_val = next(left_iter)
-            except StopIteration:
-                request_new_elem_from_left = True
-                break
-
-        # only send elements downstream, if there are any to be sent
-        if zipped_output_buffer:
-            zip_out_ack = self.observer.on_next(zipped_output_buffer)
+    def _on_next(self, elem: ElementType, is_left: bool) -> Ack:
+        if isinstance(elem, list):
+            buffer = elem
         else:
-            zip_out_ack = continue_ack
-
-        # all elements in the left and right iterable are send downstream
-        if request_new_elem_from_left and request_new_elem_from_right:
-            next_state = RawControlledZipStates.WaitOnLeftRight()
-
-        elif request_new_elem_from_left:
-            next_state = RawControlledZipStates.WaitOnLeft(
-                right_val=right_val,
-                right_iter=right_iter,
-                right_ack=right_in_ack,
-            )
-
-        elif request_new_elem_from_right:
-            next_state = RawControlledZipStates.WaitOnRight(
-                left_val=left_val,
-                left_iter=left_iter,
-                left_ack=left_in_ack,
-            )
+            try:
+                buffer = list(elem)
+            except Exception as exc:
+                self._on_error(exc)
+                return stop_ack
 
-        else:
-            raise Exception('at least one side should be back-pressured')
+        is_completed = False
 
         with self.lock:
-            # get termination state
-            raw_prev_termination_state = self.termination_state
+            if self.is_stopped:
+                return stop_ack
 
-            # set next state
-            self.state = next_state
+            if not buffer:
+                return continue_ack
+
+            if is_left:
+                # left elements mapped to no element do not need to wait on the right selector,
+                # even if the right selector completed
+                if self.right_buffer is None and not any(buffer):
+                    is_forward = True
+
+                # the left elements are mapped to elements the completed right selector
+                # will never send
+                elif self.right_buffer is None and self.right_completed:
+                    self.is_stopped = True
+                    upstream_acks = [ack for ack in (self.left_ack, self.right_ack) if ack is not None]
+                    self.left_ack = None
+                    self.right_ack = None
+                    is_forward = False
+                    is_completed = True
 
-        prev_termination_state = raw_prev_termination_state.get_measured_state()
+                else:
+                    is_forward = False
+                    self.left_buffer = buffer
+                    self.left_offset = 0
 
-        def stop_active_acks():
-            other_upstream_ack.on_next(stop_ack)
+            else:
+                is_forward = False
+                self.right_buffer = buffer
+                self.right_offset = 0
 
-        # stop back-pressuring both sources, because there is no need to request elements
-        # from completed source
-        if isinstance(prev_termination_state, TerminationStates.LeftCompletedState) \
-                and request_new_elem_from_left:
+            if not is_forward and not is_completed and (self.left_buffer is None or self.right_buffer is None):
+                upstream_ack = AckSubject()
 
-            self._signal_on_complete_or_on_error(state=next_state)
-            stop_active_acks()
-            return stop_ack
+                if is_left:
+                    self.left_ack = upstream_ack
+                else:
+                    self.right_ack = upstream_ack
 
-        # stop back-pressuring both sources, because there is no need to request elements
-        # from completed source
-        elif isinstance(prev_termination_state, TerminationStates.RightCompletedState) \
-                and request_new_elem_from_right:
+                return upstream_ack
 
-            self._signal_on_complete_or_on_error(state=next_state)
-            stop_active_acks()
-            return stop_ack
+        if is_completed:
+            self.observer.on_completed()
 
-        # in error state, stop back-pressuring both sources
-        elif isinstance(prev_termination_state, TerminationStates.ErrorState):
+            for ack in upstream_acks:
+                ack.on_next(stop_ack)
 
-            self._signal_on_complete_or_on_error(state=next_state, ex=prev_termination_state.ex)
-            stop_active_acks()
             return stop_ack
 
-        # finish connecting ack only if not in Stopped or Error state
+        if is_forward:
+            return self.observer.on_next(buffer)
+
+        # at this point, both sources are back-pressured; therefore, the slots do not
+        # change until they are updated below
+        composed = self._compose()
+
+        if composed:
+            downstream_ack = self.observer.on_next(composed)
         else:
+            downstream_ack = continue_ack
 
-            if request_new_elem_from_left and request_new_elem_from_right:
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
 
-                # directly return ack depending on whether left or right called `iterate_over_batch`
-                if is_left:
-                    zip_out_ack.subscribe(right_in_ack)
+            is_left_exhausted = self.left_offset == len(self.left_buffer)
+            is_right_exhausted = self.right_offset == len(self.right_buffer)
 
-                else:
-                    zip_out_ack.subscribe(left_in_ack)
+            if is_left_exhausted:
+                self.left_buffer = None
+                self.left_offset = 0
 
-                return zip_out_ack
+            if is_right_exhausted:
+                self.right_buffer = None
+                self.right_offset = 0
 
-            # all elements in the left buffer are send to the observer, back-pressure only left
-            elif request_new_elem_from_left:
+            # there is no need to request elements from a completed source; after the right
+            # selector completed, left elements mapped to no element are still forwarded
+            is_right_done = is_right_exhausted and self.right_completed and not is_left_exhausted
+            if (is_left_exhausted and self.left_completed) or is_right_done \
+                    or isinstance(downstream_ack, StopAck):
+                is_stopped = True
+                self.is_stopped = True
+                other_upstream_acks = [ack for ack in (self.left_ack, self.right_ack) if ack is not None]
+                self.left_ack = None
+                self.right_ack = None
 
-                if is_left:
-                    return zip_out_ack
+            else:
+                is_stopped = False
+                other_upstream_acks = []
 
-                else:
-                    zip_out_ack.subscribe(left_in_ack)
-                    return right_in_ack
+                if is_left_exhausted and self.left_ack is not None:
+                    other_upstream_acks.append(self.left_ack)
+                    self.left_ack = None
 
-            # all elements in the left buffer are send to the observer, back-pressure only right
-            elif request_new_elem_from_right:
+                if is_right_exhausted and self.right_ack is not None:
+                    other_upstream_acks.append(self.right_ack)
+                    self.right_ack = None
 
-                if is_left:
-                    zip_out_ack.subscribe(right_in_ack)
-                    return left_in_ack
+                # the source that sent the last batch is back-pressured until its
+                # elements are composed
+                if (is_left and not is_left_exhausted) or (not is_left and not is_right_exhausted):
+                    upstream_ack = AckSubject()
+
+                    if is_left:
+                        self.left_ack = upstream_ack
+                    else:
+                        self.right_ack = upstream_ack
 
                 else:
-                    return zip_out_ack
+                    upstream_ack = downstream_ack
 
-            else:
-                raise Exception('illegal case')
+        if is_stopped:
+            if not isinstance(downstream_ack, StopAck):
+                self.observer.on_completed()
 
-    def _on_next_left(self, elem: ElementType):
-        if isinstance(elem, list):
-            materialized_elem = elem
-        else:
-            try:
-                materialized_elem = list(elem)
-            except Exception as exc:
-                self.observer.on_error(exc)
-                return stop_ack
+            for ack in other_upstream_acks:
+                ack.on_next(stop_ack)
 
-        if all(isinstance(e, SelectCompleted) for e in materialized_elem):
-            return self.observer.on_next(materialized_elem)
-        else:
-            try:
-                return_ack = self._iterate_over_batch(elem=elem, is_left=True)
-            except Exception as exc:
-                self.observer.on_error(exc)
-                return stop_ack
-            return return_ack
-
-    def _on_next_right(self, elem: ElementType):
-        try:
-            return_ack = self._iterate_over_batch(elem=elem, is_left=False)
-        except Exception as exc:
-            self._on_error(exc)
             return stop_ack
-        return return_ack
 
-    def _signal_on_complete_or_on_error(
-            self,
-            state: ControlledZipStates.ZipState,
-            exc: Exception = None,
-    ):
-        """ this function is called once, because 'on_complete' or 'on_error' are called once according to the rxbp
-        convention
+        for ack in other_upstream_acks:
+            downstream_ack.subscribe(ack)
 
-        :param state: controlled join_flowables state
-        :param ex: catched exception to be forwarded downstream
-        :return:
-        """
+        return upstream_ack
 
-        # stop active acknowledgments
-        if isinstance(state, ControlledZipStates.WaitOnLeftRight):
-            pass
-        elif isinstance(state, ControlledZipStates.WaitOnLeft):
-            state.right_in_ack.on_next(stop_ack)
-        elif isinstance(state, ControlledZipStates.WaitOnRight):
-            state.left_in_ack.on_next(stop_ack)
-        else:
-            pass
+    def _on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_stopped:
+                return
 
-        # terminate observer
-        if exc:
-            self.observer.on_error(exc)
-        else:
-            self.observer.on_completed()
+            self.is_stopped = True
+            upstream_acks = [ack for ack in (self.left_ack, self.right_ack) if ack is not None]
+            self.left_ack = None
+            self.right_ack = None
 
-    def _on_error_or_complete(
-            self,
-            next_final_state: RawTerminationStates.TerminationState,
-            exc: Exception = None,
-    ):
+        self.observer.on_error(exc)
 
+        for ack in upstream_acks:
+            ack.on_next(stop_ack)
+
+    def _on_completed(self, is_left: bool):
         with self.lock:
-            raw_prev_final_state = self.termination_state
-            raw_prev_state = self.state
-            next_final_state.raw_prev_state = raw_prev_final_state
-            self.termination_state = next_final_state
-
-        prev_state = raw_prev_state.get_measured_state(
-            raw_termination_state=raw_prev_final_state,
-        )
-
-        curr_state = raw_prev_state.get_measured_state(
-            raw_termination_state=next_final_state,
-        )
-
-        if not isinstance(prev_state, ControlledZipStates.Stopped) \
-                and isinstance(curr_state, ControlledZipStates.Stopped):
-            self._signal_on_complete_or_on_error(raw_prev_state, exc=exc)
-
-    def _on_error(self, exc):
-        next_final_state = RawTerminationStates.ErrorState(
-            exc=exc,
-        )
-        self._on_error_or_complete(
-            next_final_state=next_final_state,
-            exc=exc,
-        )
-
-    def _on_completed_left(self):
-        next_final_state = RawTerminationStates.LeftCompletedState()
-        self._on_error_or_complete(next_final_state=next_final_state)
-
-    def _on_completed_right(self):
-        next_final_state = RawTerminationStates.RightCompletedState()
-        self._on_error_or_complete(next_final_state=next_final_state,)
+            if self.is_stopped:
+                return
 
-    def observe(self, observer_info: ObserverInfo):
-        """ This function ought be called at most once.
+            if is_left:
+                self.left_completed = True
+                buffer = self.left_buffer
+            else:
+                self.right_completed = True
+                buffer = self.right_buffer
 
-        :param observer_info: downstream obseNonerver
-        :return: Disposable
-        """
+            # the remaining elements of the source still get composed
+            if buffer is not None:
+                return
 
-        self.observer = observer_info.observer
-        source = self
+            # left elements mapped to no element can still be received, unless the left
+            # selector waits on right elements
+            if not is_left and self.left_buffer is None and not self.left_completed:
+                return
 
-        class LeftControlledZipObserver(Observer):
-            def on_next(self, elem: ElementType) -> Ack:
-                return source._on_next_left(elem)
+            self.is_stopped = True
+            upstream_acks = [ack for ack in (self.left_ack, self.right_ack) if ack is not None]
+            self.left_ack = None
+            self.right_ack = None
 
-            def on_error(self, exc: Exception):
-                return source._on_error(exc)
+        self.observer.on_completed()
 
-            def on_completed(self):
-                source._on_completed_left()
+        for ack in upstream_acks:
+            ack.on_next(stop_ack)
+
+    def observe(self, observer_info: ObserverInfo):
+        self.observer = observer_info.observer
+        source = self
+
+        class MergeSelectorInnerObserver(Observer):
+            def __init__(self, is_left: bool):
+                self.is_left = is_left
 
-        class RightControlledZipObserver(Observer):
             def on_next(self, elem: ElementType) -> Ack:
-                return source._on_next_right(elem)
+                return source._on_next(elem, is_left=self.is_left)
 
             def on_error(self, exc: Exception):
-                return source._on_error(exc)
+                source._on_error(exc)
 
             def on_completed(self):
-                source._on_completed_right()
-
-        left_observer = LeftControlledZipObserver()
-        left_subscription = observer_info.copy(observer=left_observer)
-        d1 = self.left_observable.observe(left_subscription)
+                source._on_completed(is_left=self.is_left)
 
-        right_observer = RightControlledZipObserver()
-        left_subscription = observer_info.copy(observer=right_observer)
-        d2 = self.right_observable.observe(left_subscription)
+        d1 = self.left_observable.observe(observer_info.copy(observer=MergeSelectorInnerObserver(is_left=True)))
+        d2 = self.right_observable.observe(observer_info.copy(observer=MergeSelectorInnerObserver(is_left=False)))
 
         return CompositeDisposable(d1, d2)
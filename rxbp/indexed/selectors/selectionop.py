@@ -1,14 +1,13 @@
+import itertools
 from traceback import FrameSummary
 from typing import List
 
-from rxbp.indexed.observables.controlledzipindexedobservable import ControlledZipIndexedObservable
 from rxbp.indexed.selectors.observables.mergeselectorobservable import MergeSelectorObservable
-from rxbp.indexed.selectors.selectnext import SelectNext
-from rxbp.indexed.selectors.selectcompleted import SelectCompleted
+from rxbp.internal.selectorcache import SelectorCache
 from rxbp.observable import Observable
-from rxbp.observables.controlledzipobservable import ControlledZipObservable
-from rxbp.observables.mapobservable import MapObservable
+from rxbp.observables.maptoiteratorobservable import MapToIteratorObservable
 from rxbp.observables.refcountobservable import RefCountObservable
+from rxbp.observables.zipobservable import ZipObservable
 from rxbp.observablesubjects.publishobservablesubject import PublishObservableSubject
 from rxbp.scheduler import Scheduler
 
@@ -18,30 +17,42 @@ def merge_selectors(
         right: Observable,
         subscribe_scheduler: Scheduler,
         stack: List[FrameSummary],
+        selector_cache: SelectorCache = None,
 ):
     """
-    SC RL SN RL SN--->SN--->SN RL SC RL
-    SC--->SC RR SN RR SN RR SC RR SN--->SN
-    ok    -     ok    ok    -     ok
-    SC          SN    SN          SC
+    left:    1  0  2
+    right:   2     1  0
+    result:  2  0  1
 
-    SC RL SC RL SC
-    SC--->SC--->SC
-          SC
+    If a selector cache is given, merging the same two selector observables again
+    returns the already composed selector observable.
     """
 
-    obs = MergeSelectorObservable(
-        left=left,
-        right=right,
-        # scheduler=subscribe_scheduler,
-    )
+    def create():
+        obs = MergeSelectorObservable(
+            left=left,
+            right=right,
+            # scheduler=subscribe_scheduler,
+        )
 
-    o3 = RefCountObservable(
-        source=obs,
-        subject=PublishObservableSubject(),
-        subscribe_scheduler=subscribe_scheduler,
-        stack=stack,
-    )
+        o3 = RefCountObservable(
+            source=obs,
+            subject=PublishObservableSubject(),
+            subscribe_scheduler=subscribe_scheduler,
+            stack=stack,
+        )
+
+        # the entry references the merged observables, such that their ids used
+        # in the key stay valid as long as the entry is cached
+        return left, right, o3
+
+    if selector_cache is None:
+        _, _, o3 = create()
+    else:
+        _, _, o3 = selector_cache.get_or_create(
+            key=('merge_selectors', id(left), id(right)),
+            create=create,
+        )
 
     return o3
 
@@ -52,19 +63,15 @@ def select_observable(
         scheduler: Scheduler,
         stack: List[FrameSummary],
 ):
-    def request_left(left, right):
-        return isinstance(right, SelectCompleted)
+    """ repeats each element of `obs` as many times as given by the count of the selector
+    """
 
-    result = MapObservable(
-        source=ControlledZipObservable(
+    result = MapToIteratorObservable(
+        source=ZipObservable(
             left=obs,
             right=selector,
-            request_left=request_left,
-            request_right=lambda l, r: True,
-            match_func=lambda l, r: isinstance(r, SelectNext),
-            scheduler=scheduler,
             stack=stack,
         ),
-        func=lambda t2: t2[0],
+        func=lambda t2: itertools.repeat(*t2),
     )
     return result
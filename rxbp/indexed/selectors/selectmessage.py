@@ -1,2 +0,0 @@
-class SelectMessage:
-    pass
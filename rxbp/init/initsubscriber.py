@@ -1,12 +1,15 @@
 from rxbp.impl.subscriberimpl import SubscriberImpl
+from rxbp.internal.selectorcache import SelectorCache
 from rxbp.scheduler import Scheduler
 
 
 def init_subscriber(
         scheduler: Scheduler,
         subscribe_scheduler: Scheduler,
+        selector_cache: SelectorCache = None,
 ):
     return SubscriberImpl(
         scheduler=scheduler,
         subscribe_scheduler=subscribe_scheduler,
+        selector_cache=selector_cache or SelectorCache(),
     )
@@ -0,0 +1,203 @@
+import math
+from collections import deque
+from typing import Any, Callable, Union
+
+
+class SumAccumulator:
+    """
+    Incremental sum over a FIFO window of values.
+    """
+
+    __slots__ = ('count', 'total')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+
+    def remove(self, value):
+        self.count -= 1
+
+        if self.count == 0:
+            # reset to avoid accumulating rounding errors
+            self.total = 0
+        else:
+            self.total -= value
+
+    @property
+    def value(self):
+        return self.total
+
+
+class MeanAccumulator(SumAccumulator):
+    """
+    Incremental mean over a FIFO window of values.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        if self.count == 0:
+            return math.nan
+
+        return self.total / self.count
+
+
+class VarianceAccumulator:
+    """
+    Incremental sample variance over a FIFO window of values, based on Welford's
+    algorithm extended by the removal of the oldest value.
+
+    Removing values leaves rounding errors in the sum of squared deviations, which
+    would turn the variance of a window of equal values into a small positive number.
+    Therefore, the number of equal values at the end of the window is tracked, and the
+    variance is exactly 0 if all values of the window are equal.
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'last', 'n_last')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+        # the last added value and the number of times it got added in a row
+        self.last = None
+        self.n_last = 0
+
+    def _reset_if_equal(self):
+        # all values of the window are equal to the last added value
+        if self.count <= self.n_last:
+            self.mean = self.last
+            self.m2 = 0.0
+
+    def add(self, value):
+        if self.n_last and value == self.last:
+            self.n_last += 1
+        else:
+            self.last = value
+            self.n_last = 1
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        self._reset_if_equal()
+
+    def remove(self, value):
+        self.count -= 1
+
+        if self.count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            self.n_last = 0
+        else:
+            delta = value - self.mean
+            self.mean -= delta / self.count
+            self.m2 -= delta * (value - self.mean)
+
+            self._reset_if_equal()
+
+    @property
+    def value(self):
+        if self.count < 2:
+            return math.nan
+
+        # rounding errors can make the sum of squares slightly negative
+        return max(self.m2, 0.0) / (self.count - 1)
+
+
+class StdAccumulator(VarianceAccumulator):
+    """
+    Incremental sample standard deviation over a FIFO window of values.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        return math.sqrt(super().value)
+
+
+class MinAccumulator:
+    """
+    Incremental minimum over a FIFO window of values. The candidates are kept in a
+    monotonic deque of (sequence number, value) tuples, which makes adding and
+    removing a value amortized O(1).
+    """
+
+    __slots__ = ('candidates', 'added', 'removed')
+
+    def __init__(self):
+        self.candidates = deque()
+        self.added = 0
+        self.removed = 0
+
+    def _dominates(self, candidate, value) -> bool:
+        return value <= candidate
+
+    def add(self, value):
+        candidates = self.candidates
+
+        # drop candidates that can no longer become the minimum
+        while candidates and self._dominates(candidates[-1][1], value):
+            candidates.pop()
+
+        candidates.append((self.added, value))
+        self.added += 1
+
+    def remove(self, value):
+        # the removed value is the oldest value of the window
+        if self.candidates[0][0] == self.removed:
+            self.candidates.popleft()
+
+        self.removed += 1
+
+    @property
+    def value(self):
+        if not self.candidates:
+            return None
+
+        return self.candidates[0][1]
+
+
+class MaxAccumulator(MinAccumulator):
+    """
+    Incremental maximum over a FIFO window of values.
+    """
+
+    __slots__ = ()
+
+    def _dominates(self, candidate, value) -> bool:
+        return candidate <= value
+
+
+accumulators = {
+    'sum': SumAccumulator,
+    'mean': MeanAccumulator,
+    'var': VarianceAccumulator,
+    'std': StdAccumulator,
+    'min': MinAccumulator,
+    'max': MaxAccumulator,
+}
+
+
+def to_accumulator_factory(agg: Union[str, Callable[[], Any]]) -> Callable[[], Any]:
+    """
+    Returns a function creating a new accumulator. `agg` is either the name of
+    an accumulator or a function returning an object with an `add` and a `remove`
+    method and a `value` property.
+    """
+
+    if isinstance(agg, str):
+        try:
+            return accumulators[agg]
+        except KeyError:
+            raise Exception(f'unknown aggregation "{agg}", use one of {", ".join(accumulators)}')
+
+    return agg
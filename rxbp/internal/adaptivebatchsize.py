@@ -0,0 +1,75 @@
+import time
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import stop_ack
+
+
+class AdaptiveBatchSize:
+    """
+    Adapts the batch size such that a batch gets acknowledged by the downstream
+    within a target latency.
+
+    The batch size grows as long as batches are acknowledged faster than the target
+    latency, and it shrinks when acknowledgments come back late. The size changes by
+    at most a factor of two per batch to smooth out outliers.
+    """
+
+    def __init__(
+            self,
+            target_latency: float,
+            initial_size: int = None,
+            min_size: int = None,
+            max_size: int = None,
+    ):
+        assert 0 < target_latency, 'target latency needs to be positive'
+
+        self.target_latency = target_latency
+        self.min_size = min_size or 1
+        self.max_size = max_size or 65536
+        self.batch_size = min(self.max_size, max(self.min_size, initial_size or 1))
+
+        # reused for each asynchronous acknowledgment
+        self.latency_single = LatencySingle(source=self)
+
+    def update(self, n_elements: int, latency: float):
+        """ update the batch size given the latency of a batch of `n_elements` elements
+        """
+
+        if n_elements <= 0:
+            return
+
+        if latency <= 0:
+            factor = 2.0
+        else:
+            factor = min(2.0, max(0.5, self.target_latency / latency))
+
+        self.batch_size = min(self.max_size, max(self.min_size, int(n_elements * factor)))
+
+    def measure(self, ack: Ack, n_elements: int, start_time: float):
+        """ measure the latency of the acknowledgment of a batch sent at `start_time`
+
+        There is at most one asynchronous acknowledgment pending at a time.
+        """
+
+        if ack is continue_ack or ack is stop_ack:
+            self.update(n_elements=n_elements, latency=time.perf_counter() - start_time)
+
+        else:
+            single = self.latency_single
+            single.n_elements = n_elements
+            single.start_time = start_time
+            ack.subscribe(single)
+
+
+class LatencySingle(Single):
+    __slots__ = ('source', 'n_elements', 'start_time')
+
+    def __init__(self, source: AdaptiveBatchSize):
+        self.source = source
+        self.n_elements = 0
+        self.start_time = 0.0
+
+    def on_next(self, ack: Ack):
+        self.source.update(n_elements=self.n_elements, latency=time.perf_counter() - self.start_time)
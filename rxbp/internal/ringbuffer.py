@@ -0,0 +1,61 @@
+from typing import Any, List, Optional
+
+
+class RingBuffer:
+    """
+    A growable ring buffer with O(1) append, O(1) removal of the first element
+    and O(1) indexed access relative to the first element.
+    """
+
+    def __init__(self, capacity: int = 16):
+        # the capacity is kept a power of two such that the index can be wrapped by a bit mask
+        capacity = max(capacity, 1)
+        self._capacity = 1 << (capacity - 1).bit_length()
+
+        self._buffer: List[Optional[Any]] = [None] * self._capacity
+        self._head = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return 0 < self._size
+
+    def __getitem__(self, idx: int):
+        if idx < 0:
+            idx += self._size
+
+        if not 0 <= idx < self._size:
+            raise IndexError('ring buffer index out of range')
+
+        return self._buffer[(self._head + idx) & (self._capacity - 1)]
+
+    def __iter__(self):
+        for idx in range(self._size):
+            yield self._buffer[(self._head + idx) & (self._capacity - 1)]
+
+    def _grow(self):
+        self._buffer = list(self) + [None] * self._capacity
+        self._head = 0
+        self._capacity *= 2
+
+    def append(self, value: Any):
+        if self._size == self._capacity:
+            self._grow()
+
+        self._buffer[(self._head + self._size) & (self._capacity - 1)] = value
+        self._size += 1
+
+    def popleft(self) -> Any:
+        if self._size == 0:
+            raise IndexError('pop from an empty ring buffer')
+
+        value = self._buffer[self._head]
+
+        # release the reference to the element
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) & (self._capacity - 1)
+        self._size -= 1
+
+        return value
@@ -0,0 +1,45 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SelectorCache:
+    """
+    Caches the selectors created while matching indexed Flowables within a subscription.
+
+    Matching the same pair of bases, or composing the same pair of selector observables,
+    returns the cached result. Thereby, repeated matches share a single selector observable
+    instead of composing the selectors once per match. The cache is kept by the subscriber,
+    such that each subscription has its own selectors.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+        self.entries: Dict[Hashable, Any] = {}
+
+        # number of lookups that returned a cached entry
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self.entries
+
+    def get_or_create(self, key: Hashable, create: Callable[[], T]) -> T:
+        """ returns the entry cached by `key`, or creates and caches a new entry
+        """
+
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                return self.entries[key]
+
+            self.misses += 1
+
+            entry = create()
+            self.entries[key] = entry
+            return entry
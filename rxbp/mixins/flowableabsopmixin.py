@@ -1,30 +1,68 @@
 from abc import abstractmethod, ABC
 from traceback import FrameSummary
-from typing import Callable, Any, Iterator, List
+from typing import Callable, Any, Iterator, List, Union
 
 from rxbp.acknowledgement.ack import Ack
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observerinfo import ObserverInfo
 from rxbp.scheduler import Scheduler
-from rxbp.typing import ValueType
+from rxbp.typing import ValueType, ElementType
 
 
 class FlowableAbsOpMixin(ABC):
     @abstractmethod
-    def buffer(self, buffer_size: int = None) -> FlowableMixin:
+    def asof_join(
+            self,
+            other: FlowableMixin,
+            key: Callable[[Any], Any] = None,
+            tolerance: Any = None,
+    ) -> FlowableMixin:
+        """
+        Join each element with the last element of the other Flowable whose key is less than or equal
+        to its key. Both Flowables need to be sorted by key. The elements are emitted as tuples
+        `(elem, other_elem)`, where `other_elem` is None if no such element exists.
+
+        :param other: Flowable whose elements get joined to the elements of this Flowable
+        :param key: function selecting the key of an element; if None, the elements are compared directly
+        :param tolerance: maximum difference between the keys of joined elements
+        """
+
+        ...
+
+    @abstractmethod
+    def buffer(
+            self,
+            buffer_size: int = None,
+            low_watermark: int = None,
+            size_func: Callable[[List[Any]], int] = None,
+    ) -> FlowableMixin:
         """
         Buffer the element emitted by the source without back-pressure until the buffer is full.
+        Buffered batches are sent downstream as a single merged batch.
+
+        :param buffer_size: high watermark, the source is back-pressured once more elements are
+            buffered, or sent but not yet acknowledged
+        :param low_watermark: the source is released once the buffer size drops to this number
+            (default: half of the buffer size)
+        :param size_func: maps a batch to its size, e.g. its number of bytes (default: number of
+            elements)
         """
 
         ...
 
     @abstractmethod
-    def concat(self, *sources: FlowableMixin) -> FlowableMixin:
+    def concat(self, *sources: FlowableMixin, lazy: bool = None) -> FlowableMixin:
         """
         Concatentates Flowables sequences together by back-pressuring the tail Flowables until
         the current Flowable has completed.
 
         :param sources: other Flowables that get concatenate to this Flowable.
+        :param lazy: if set to True, a Flowable is subscribed only after the previous Flowable
+            completed, which only works for cold Flowables. By default, the Flowables are subscribed
+            lazily only if they are created by `from_list`, `from_range`, `from_iterable`, `return_value`
+            or `empty`, possibly followed by `map`, `map_batch`, `map_to_iterator`, `filter` or
+            `filter_mask`; otherwise, all Flowables are subscribed at once to not miss elements of
+            hot Flowables.
         """
 
         ...
@@ -117,6 +155,17 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def filter_mask(self, predicate: Callable[[ElementType], Any]) -> FlowableMixin:
+        """ Only emit those elements selected by a boolean mask that is computed
+        for the whole batch by a single call of the given predicate.
+
+        :param predicate: a function that maps a batch to a boolean mask of the same length
+        :return: filtered Flowable
+        """
+
+        ...
+
     @abstractmethod
     def first(self, stack: List[FrameSummary]) -> FlowableMixin:
         """
@@ -138,6 +187,8 @@ class FlowableAbsOpMixin(ABC):
             self,
             func: Callable[[Any], FlowableMixin],
             stack: List[FrameSummary],
+            max_concurrent: int = None,
+            ordered: bool = None,
     ) -> FlowableMixin:
         """
         Apply a function to each item emitted by the source and flattens the result.
@@ -145,6 +196,38 @@ class FlowableAbsOpMixin(ABC):
         The specified function must return a Flowable. The resulting Flowable
         concatenates the elements of each inner Flowables.
         The resulting Flowable concatenates the items of each inner Flowable.
+
+        :param max_concurrent: if given, up to `max_concurrent` inner Flowables are \
+        subscribed and observed at the same time. The source is back-pressured while \
+        `max_concurrent` inner Flowables are active.
+        :param ordered: if True (default), the items of an inner Flowable are emitted \
+        only after all previous inner Flowables completed. Otherwise, the items are \
+        emitted in the order they are received from the inner Flowables; without \
+        `max_concurrent`, any number of inner Flowables is observed at the same time.
+        """
+
+        ...
+
+    @abstractmethod
+    def group_by(
+            self,
+            key_func: Callable[[Any], Any],
+            max_groups: int = None,
+            group_buffer: int = None,
+    ) -> FlowableMixin:
+        """
+        Group the elements by the key selected by `key_func` and emit a `(key, Flowable)`
+        pair for each new key. The group Flowables are hot; each group buffers the elements
+        its observer did not acknowledge yet. With a bounded `group_buffer`, the groups need
+        to be observed concurrently, e.g. by `flat_map` with `ordered=False` and
+        `max_concurrent` set to `max_groups`; otherwise, the source stalls once the buffer
+        of a group that is not observed is full.
+
+        :param key_func: function selecting the key of an element
+        :param max_groups: maximum number of groups; once exceeded, the least recently \
+        used idle group gets completed
+        :param group_buffer: number of elements buffered per group. If None, the buffers \
+        are unbounded; otherwise, the source is back-pressured by groups whose buffer is full.
         """
 
         ...
@@ -159,6 +242,16 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def map_batch(self, func: Callable[[ElementType], ElementType]) -> FlowableMixin:
+        """ Map each batch emitted by the source by applying the given function
+        to the whole batch at once.
+
+        :param func: function that maps a batch (e.g. a list or a NumPy array) to a new batch
+        """
+
+        ...
+
     @abstractmethod
     def map_to_iterator(
             self,
@@ -174,11 +267,25 @@ class FlowableAbsOpMixin(ABC):
         ...
 
     @abstractmethod
-    def merge(self, *others: FlowableMixin) -> FlowableMixin:
+    def merge(self, *others: FlowableMixin, prioritized: bool = False) -> FlowableMixin:
         """
         Merge the elements of this and the other Flowable sequences into a single *Flowable*.
 
         :param sources: other Flowables that get merged to this Flowable.
+        :param prioritized: if True, elements buffered while the downstream is busy are sent in the order
+        of the Flowables; otherwise, they are sent in the order of arrival
+        """
+
+        ...
+
+    @abstractmethod
+    def merge_sorted(self, other: FlowableMixin, key: Callable[[Any], Any] = None) -> FlowableMixin:
+        """
+        Merge the elements of this and the other Flowable, both sorted by key, into a single sorted
+        *Flowable*. On equal keys, the elements of this Flowable are emitted first.
+
+        :param other: Flowable whose elements get merged to this Flowable
+        :param key: function selecting the key of an element; if None, the elements are compared directly
         """
 
         ...
@@ -203,6 +310,31 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def parallel_map(self, func: Callable[[Any], Any], max_workers: int = None, ordered: bool = True) -> FlowableMixin:
+        """ Map each element emitted by the source by applying the given function in worker processes.
+
+        :param func: picklable function that defines the mapping applied to each element
+        :param max_workers: maximum number of batches mapped at the same time
+        :param ordered: if True, the mapped batches are emitted in the order they were received
+        """
+
+        ...
+
+    @abstractmethod
+    def rebatch(self, batch_size: int = None, target_latency: float = None, timespan: float = None) -> FlowableMixin:
+        """ Merge and split the batches emitted by the source into batches of a given size.
+
+        :param batch_size: number of elements in a batch, or the initial batch size if \
+        `target_latency` is specified
+        :param target_latency: if specified, the batch size adapts such that a batch gets \
+        acknowledged by the downstream within the given number of seconds
+        :param timespan: if specified, buffered elements are emitted at the latest after \
+        the given number of seconds
+        """
+
+        ...
+
     @abstractmethod
     def reduce(
             self,
@@ -219,6 +351,23 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def reduce_batch(
+            self,
+            func: Callable[[Any, ElementType], Any],
+            initial: Any,
+    ) -> FlowableMixin:
+        """
+        Apply an accumulator function over each batch of a Flowable sequence and
+        emits a single element.
+
+        :param func: An accumulator function to be invoked on each batch
+        :param initial: The initial accumulator value
+        :return: a Flowable that emits the final accumulated value
+        """
+
+        ...
+
     @abstractmethod
     def repeat_first(self) -> FlowableMixin:
         """
@@ -228,6 +377,28 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def rolling(
+            self,
+            agg: Union[str, Callable[[], Any]],
+            n: int,
+            value: Callable[[Any], Any] = None,
+    ) -> FlowableMixin:
+        """
+        Emit the aggregate of the last `n` elements for every element, once `n`
+        elements are received. The aggregate is updated incrementally in O(1) per
+        element (amortized for "min" and "max").
+
+        :param agg: either one of "sum", "mean", "min", "max", "var", "std", or a \
+        function returning an object with an `add` and a `remove` method and a \
+        `value` property
+        :param n: number of elements in the window
+        :param value: function selecting the value of an element that is aggregated; \
+        defaults to the element itself
+        """
+
+        ...
+
     @abstractmethod
     def scan(self, func: Callable[[Any, Any], Any], initial: Any) -> FlowableMixin:
         """
@@ -242,7 +413,24 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
-    def share(self) -> FlowableMixin:
+    @abstractmethod
+    def scan_cumulative(self, func: Callable[[Any, ElementType], ElementType], initial: Any) -> FlowableMixin:
+        """
+        Apply a cumulative function over each batch of a Flowable sequence and return
+        each intermediate result.
+
+        The function is given the accumulated value of the previous batch and the
+        current batch, and returns the accumulated values for each element of the batch.
+        The last accumulated value is used as the accumulator for the next batch.
+
+        :param func: A cumulative function to be invoked on each batch
+        :param initial: The initial accumulator value
+        :return: a Flowable that emits the accumulated values
+        """
+
+        ...
+
+    def share(self, buffer_size: int = None) -> FlowableMixin:
         """
         Broadcast the elements of the Flowable to possibly multiple subscribers.
 
@@ -261,6 +449,67 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def unbatch(self, batch_size: int) -> FlowableMixin:
+        """ Split the batches emitted by the source into batches of at most `batch_size` elements.
+
+        :param batch_size: maximum number of elements in a batch
+        """
+
+        ...
+
+    @abstractmethod
+    def window_count(
+            self,
+            n: int,
+            step: int = None,
+            agg: Union[str, Callable[[], Any]] = None,
+            value: Callable[[Any], Any] = None,
+    ) -> FlowableMixin:
+        """
+        Emit a window of the last `n` elements every `step` elements. Windows with
+        fewer than `n` elements are not emitted.
+
+        :param n: number of elements in a window
+        :param step: number of elements between two windows, defaults to `n`
+        :param agg: if given, each window is aggregated by an incremental accumulator \
+        instead of being emitted as a list; either one of "sum", "mean", "min", "max", \
+        "var", "std", or a function returning an object with an `add` and a `remove` \
+        method and a `value` property
+        :param value: function selecting the value of an element that enters the window; \
+        defaults to the element itself
+        """
+
+        ...
+
+    @abstractmethod
+    def window_time(
+            self,
+            span: float,
+            step: float = None,
+            agg: Union[str, Callable[[], Any]] = None,
+            timestamp: Callable[[Any], float] = None,
+            value: Callable[[Any], Any] = None,
+    ) -> FlowableMixin:
+        """
+        Emit the elements falling into the time windows `[k*step, k*step + span)`.
+        A window is emitted once an element with a later timestamp is received or
+        once the source completes; empty windows are skipped.
+
+        :param span: duration of a window in seconds
+        :param step: seconds between the start of two windows, defaults to `span`
+        :param agg: if given, each window is aggregated by an incremental accumulator \
+        instead of being emitted as a list; either one of "sum", "mean", "min", "max", \
+        "var", "std", or a function returning an object with an `add` and a `remove` \
+        method and a `value` property
+        :param timestamp: function returning the non-decreasing timestamp of an \
+        element in seconds; defaults to the time the element is received
+        :param value: function selecting the value of an element that enters the window, \
+        e.g. the measurement of a `(timestamp, measurement)` record; defaults to the element itself
+        """
+
+        ...
+
     @abstractmethod
     def zip(self, *others: FlowableMixin) -> FlowableMixin:
         """
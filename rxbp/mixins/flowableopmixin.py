@@ -3,11 +3,12 @@ import itertools
 from abc import abstractmethod, ABC
 from dataclasses import dataclass
 from traceback import FrameSummary
-from typing import Callable, Any, Tuple, Iterator, List
+from typing import Callable, Any, Tuple, Iterator, List, Union
 
 import rx
 
 from rxbp.acknowledgement.ack import Ack
+from rxbp.flowables.asofjoinflowable import AsofJoinFlowable
 from rxbp.flowables.bufferflowable import BufferFlowable
 from rxbp.flowables.concatflowable import ConcatFlowable
 from rxbp.flowables.controlledzipflowable import ControlledZipFlowable
@@ -15,35 +16,47 @@ from rxbp.flowables.defaultifemptyflowable import DefaultIfEmptyFlowable
 from rxbp.flowables.doactionflowable import DoActionFlowable
 from rxbp.flowables.evictingbufferflowable import EvictingBufferFlowable
 from rxbp.flowables.filterflowable import FilterFlowable
+from rxbp.flowables.filtermaskflowable import FilterMaskFlowable
 from rxbp.flowables.firstflowable import FirstFlowable
 from rxbp.flowables.firstordefaultflowable import FirstOrDefaultFlowable
 from rxbp.flowables.flatmapflowable import FlatMapFlowable
+from rxbp.flowables.groupbyflowable import GroupByFlowable
 from rxbp.flowables.init.initdebugflowable import init_debug_flowable
 from rxbp.flowables.lastflowable import LastFlowable
+from rxbp.flowables.mapbatchflowable import MapBatchFlowable
 from rxbp.flowables.mapflowable import MapFlowable
 from rxbp.flowables.maptoiteratorflowable import MapToIteratorFlowable
-from rxbp.flowables.mergeflowable import MergeFlowable
+from rxbp.flowables.mergenflowable import MergeNFlowable
+from rxbp.flowables.mergesortedflowable import MergeSortedFlowable
 from rxbp.flowables.observeonflowable import ObserveOnFlowable
 from rxbp.flowables.pairwiseflowable import PairwiseFlowable
+from rxbp.flowables.parallelmapflowable import ParallelMapFlowable
+from rxbp.flowables.rebatchflowable import RebatchFlowable
+from rxbp.flowables.reducebatchflowable import ReduceBatchFlowable
 from rxbp.flowables.reduceflowable import ReduceFlowable
 from rxbp.flowables.refcountflowable import RefCountFlowable
 from rxbp.flowables.repeatfirstflowable import RepeatFirstFlowable
+from rxbp.flowables.scancumulativeflowable import ScanCumulativeFlowable
 from rxbp.flowables.scanflowable import ScanFlowable
 from rxbp.flowables.subscribeonflowable import SubscribeOnFlowable
 from rxbp.flowables.tolistflowable import ToListFlowable
-from rxbp.flowables.zipflowable import ZipFlowable
+from rxbp.flowables.unbatchflowable import UnbatchFlowable
+from rxbp.flowables.windowcountflowable import WindowCountFlowable
+from rxbp.flowables.windowtimeflowable import WindowTimeFlowable
+from rxbp.flowables.zipnflowable import ZipNFlowable
 from rxbp.flowables.zipwithindexflowable import ZipWithIndexFlowable
+from rxbp.internal.accumulators import to_accumulator_factory
 from rxbp.mixins.flowableabsopmixin import FlowableAbsOpMixin
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.mixins.sharedflowablemixin import SharedFlowableMixin
 from rxbp.observables.materializeobservable import MaterializeObservable
 from rxbp.observerinfo import ObserverInfo
-from rxbp.overflowstrategy import OverflowStrategy
+from rxbp.overflowstrategy import OverflowStrategy, BackPressure
 from rxbp.scheduler import Scheduler
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 from rxbp.torx import to_rx
-from rxbp.typing import ValueType
+from rxbp.typing import ValueType, ElementType
 from rxbp.utils.getstacklines import get_stack_lines
 
 
@@ -71,19 +84,38 @@ class FlowableOpMixin(
     #     raw = functools.reduce(lambda obs, op: op(obs), operators, self)
     #     return self._copy(raw)
 
-    def buffer(self, buffer_size: int = None) -> 'FlowableOpMixin':
-        flowable = BufferFlowable(source=self, buffer_size=buffer_size)
+    def asof_join(
+            self,
+            other: FlowableMixin,
+            key: Callable[[Any], Any] = None,
+            tolerance: Any = None,
+    ) -> 'FlowableOpMixin':
+        flowable = AsofJoinFlowable(source=self, other=other, key=key, tolerance=tolerance)
+        return self._copy(underlying=flowable)
+
+    def buffer(
+            self,
+            buffer_size: int = None,
+            low_watermark: int = None,
+            size_func: Callable[[List[Any]], int] = None,
+    ) -> 'FlowableOpMixin':
+        flowable = BufferFlowable(
+            source=self,
+            buffer_size=buffer_size,
+            low_watermark=low_watermark,
+            size_func=size_func,
+        )
         return self._copy(underlying=flowable)
 
-    def concat(self, *others: FlowableMixin) -> 'FlowableOpMixin':
+    def concat(self, *others: FlowableMixin, lazy: bool = None) -> 'FlowableOpMixin':
         if len(others) == 0:
             return self
 
-        all_sources = itertools.chain([self], others)
-        flowable = ConcatFlowable(sources=list(all_sources))
-
         sources = (self,) + others
 
+        all_sources = itertools.chain([self], others)
+        flowable = ConcatFlowable(sources=list(all_sources), lazy=lazy)
+
         try:
             source = next(source for source in sources if isinstance(source, SharedFlowableMixin))
         except StopIteration:
@@ -171,6 +203,10 @@ class FlowableOpMixin(
     # def execute_on(self, scheduler: Scheduler):
     #     return self._copy(underlying=ExecuteOnFlowable(source=self, scheduler=scheduler))
 
+    def fast_filter(self, predicate: Callable[[Any], bool]) -> 'FlowableOpMixin':
+        flowable = FilterFlowable(source=self, predicate=predicate)
+        return self._copy(underlying=flowable)
+
     def filter(
             self,
             predicate: Callable[[Any], bool],
@@ -179,6 +215,10 @@ class FlowableOpMixin(
         flowable = FilterFlowable(source=self, predicate=predicate)
         return self._copy(underlying=flowable)
 
+    def filter_mask(self, predicate: Callable[[ElementType], Any]) -> 'FlowableOpMixin':
+        flowable = FilterMaskFlowable(source=self, predicate=predicate)
+        return self._copy(underlying=flowable)
+
     def first(self, stack: List[FrameSummary]):
         flowable = FirstFlowable(source=self, stack=stack)
         return self._copy(underlying=flowable)
@@ -187,8 +227,37 @@ class FlowableOpMixin(
         flowable = FirstOrDefaultFlowable(source=self, lazy_val=lazy_val)
         return self._copy(underlying=flowable)
 
-    def flat_map(self, func: Callable[[Any], 'FlowableOpMixin'], stack: List[FrameSummary]):
-        flowable = FlatMapFlowable(source=self, func=func, stack=stack)
+    def flat_map(
+            self,
+            func: Callable[[Any], 'FlowableOpMixin'],
+            stack: List[FrameSummary],
+            max_concurrent: int = None,
+            ordered: bool = None,
+    ):
+        if ordered is None:
+            ordered = True
+
+        flowable = FlatMapFlowable(
+            source=self,
+            func=func,
+            stack=stack,
+            max_concurrent=max_concurrent,
+            ordered=ordered,
+        )
+        return self._copy(underlying=flowable)
+
+    def group_by(
+            self,
+            key_func: Callable[[ValueType], Any],
+            max_groups: int = None,
+            group_buffer: int = None,
+    ):
+        flowable = GroupByFlowable(
+            source=self,
+            key_func=key_func,
+            max_groups=max_groups,
+            group_buffer=group_buffer,
+        )
         return self._copy(underlying=flowable)
 
     def last(self, stack: List[FrameSummary]):
@@ -199,6 +268,10 @@ class FlowableOpMixin(
         flowable = MapFlowable(source=self, func=func)
         return self._copy(underlying=flowable)
 
+    def map_batch(self, func: Callable[[ElementType], ElementType]):
+        flowable = MapBatchFlowable(source=self, func=func)
+        return self._copy(underlying=flowable)
+
     def map_to_iterator(
             self,
             func: Callable[[ValueType], Iterator[ValueType]],
@@ -223,7 +296,7 @@ class FlowableOpMixin(
 
         return self._copy(underlying=MaterializeFlowable(source=self))
 
-    def merge(self, *others: FlowableMixin):
+    def merge(self, *others: FlowableMixin, prioritized: bool = False):
 
         assert all(isinstance(source, FlowableMixin) for source in others), \
             f'"{others}" must all be of type FlowableMixin'
@@ -233,18 +306,7 @@ class FlowableOpMixin(
         else:
             sources = (self,) + others
 
-            def gen_stack():
-                for source in reversed(sources):
-                    def func(right: 'FlowableOpMixin' = None, left: 'FlowableOpMixin' = source):
-                        if right is None:
-                            return left
-                        else:
-                            flowable = MergeFlowable(source=left, other=right)
-                            return flowable
-
-                    yield func
-
-            flowable: FlowableMixin = functools.reduce(lambda acc, func: func(acc), gen_stack(), None)
+            flowable = MergeNFlowable(sources=list(sources), prioritized=prioritized)
 
             try:
                 source = next(source for source in sources if isinstance(source, SharedFlowableMixin))
@@ -253,6 +315,10 @@ class FlowableOpMixin(
 
             return source._copy(underlying=flowable)
 
+    def merge_sorted(self, other: FlowableMixin, key: Callable[[Any], Any] = None) -> 'FlowableOpMixin':
+        flowable = MergeSortedFlowable(source=self, other=other, key=key)
+        return self._copy(underlying=flowable)
+
     def observe_on(self, scheduler: Scheduler):
 
         return self._copy(underlying=ObserveOnFlowable(source=self, scheduler=scheduler))
@@ -261,6 +327,22 @@ class FlowableOpMixin(
 
         return self._copy(underlying=PairwiseFlowable(source=self))
 
+    def parallel_map(self, func: Callable[[ValueType], Any], max_workers: int = None, ordered: bool = True):
+        flowable = ParallelMapFlowable(source=self, func=func, max_workers=max_workers, ordered=ordered)
+        return self._copy(underlying=flowable)
+
+    def rebatch(self, batch_size: int = None, target_latency: float = None, timespan: float = None):
+        assert batch_size is not None or target_latency is not None, \
+            'either batch size or target latency needs to be specified'
+
+        flowable = RebatchFlowable(
+            source=self,
+            batch_size=batch_size,
+            target_latency=target_latency,
+            timespan=timespan,
+        )
+        return self._copy(underlying=flowable)
+
     def reduce(
             self,
             func: Callable[[Any, Any], Any],
@@ -273,17 +355,46 @@ class FlowableOpMixin(
         )
         return self._copy(underlying=flowable)
 
+    def reduce_batch(
+            self,
+            func: Callable[[Any, ElementType], Any],
+            initial: Any,
+    ):
+        flowable = ReduceBatchFlowable(
+            source=self,
+            func=func,
+            initial=initial,
+        )
+        return self._copy(underlying=flowable)
+
     def repeat_first(self):
 
         flowable = RepeatFirstFlowable(source=self)
         return self._copy(underlying=flowable)
 
+    def rolling(self, agg: Union[str, Callable[[], Any]], n: int, value: Callable[[Any], Any] = None):
+        flowable = WindowCountFlowable(
+            source=self,
+            n=n,
+            step=1,
+            accumulator_factory=to_accumulator_factory(agg),
+            value_selector=value,
+        )
+        return self._copy(underlying=flowable)
+
     def scan(self, func: Callable[[Any, Any], Any], initial: Any):
         flowable = ScanFlowable(source=self, func=func, initial=initial)
         return self._copy(underlying=flowable)
 
-    def _share(self, stack: List[FrameSummary]):
-        return self._copy(underlying=RefCountFlowable(source=self, stack=stack), is_shared=True)
+    def scan_cumulative(self, func: Callable[[Any, ElementType], ElementType], initial: Any):
+        flowable = ScanCumulativeFlowable(source=self, func=func, initial=initial)
+        return self._copy(underlying=flowable)
+
+    def _share(self, stack: List[FrameSummary], buffer_size: int = None):
+        return self._copy(
+            underlying=RefCountFlowable(source=self, stack=stack, buffer_size=buffer_size),
+            is_shared=True,
+        )
 
     def to_list(self):
 
@@ -299,6 +410,44 @@ class FlowableOpMixin(
 
         return to_rx(source=self, batched=batched)
 
+    def unbatch(self, batch_size: int):
+        flowable = UnbatchFlowable(source=self, batch_size=batch_size)
+        return self._copy(underlying=flowable)
+
+    def window_count(
+            self,
+            n: int,
+            step: int = None,
+            agg: Union[str, Callable[[], Any]] = None,
+            value: Callable[[Any], Any] = None,
+    ):
+        flowable = WindowCountFlowable(
+            source=self,
+            n=n,
+            step=step if step is not None else n,
+            accumulator_factory=to_accumulator_factory(agg) if agg is not None else None,
+            value_selector=value,
+        )
+        return self._copy(underlying=flowable)
+
+    def window_time(
+            self,
+            span: float,
+            step: float = None,
+            agg: Union[str, Callable[[], Any]] = None,
+            timestamp: Callable[[Any], float] = None,
+            value: Callable[[Any], Any] = None,
+    ):
+        flowable = WindowTimeFlowable(
+            source=self,
+            span=span,
+            step=step if step is not None else span,
+            timestamp=timestamp,
+            accumulator_factory=to_accumulator_factory(agg) if agg is not None else None,
+            value_selector=value,
+        )
+        return self._copy(underlying=flowable)
+
     def zip(self, others: Tuple['FlowableOpMixin'], stack: List[FrameSummary]):
 
         assert all(isinstance(source, FlowableMixin) for source in others), \
@@ -307,30 +456,9 @@ class FlowableOpMixin(
         if len(others) == 0:
             return self.map(lambda v: (v,))
         else:
-            sources = (self,) + others
+            sources = (self,) + tuple(others)
 
-            def gen_stack():
-                for source in reversed(sources):
-                    def func(right: 'FlowableOpMixin' = None, left: 'FlowableOpMixin' = source):
-                        if right is None:
-                            return left.map(lambda v: (v,))
-                        else:
-                            def inner_result_selector(t: Tuple[Any, Tuple[Any]]):
-                                return (t[0],) + t[1]
-
-                            flowable = MapFlowable(
-                                source=ZipFlowable(
-                                    left=left,
-                                    right=right,
-                                    stack=stack,
-                                ),
-                                func=inner_result_selector,
-                            )
-                            return flowable
-
-                    yield func
-
-            flowable: FlowableMixin = functools.reduce(lambda acc, func: func(acc), gen_stack(), None)
+            flowable = ZipNFlowable(sources=list(sources), stack=stack)
 
             try:
                 source = next(source for source in sources if isinstance(source, SharedFlowableMixin))
@@ -345,7 +473,10 @@ class FlowableOpMixin(
         return self._copy(underlying=flowable)
 
     def strategy(self, overflow_strategy: OverflowStrategy) -> 'FlowableOpMixin':
-        flowable = EvictingBufferFlowable(source=self, overflow_strategy=overflow_strategy)
+        if isinstance(overflow_strategy, BackPressure):
+            flowable = BufferFlowable(source=self, buffer_size=overflow_strategy.buffer_size)
+        else:
+            flowable = EvictingBufferFlowable(source=self, overflow_strategy=overflow_strategy)
         return self._copy(underlying=flowable)
 
     def subscribe_on(self, scheduler: Scheduler):
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from rxbp.internal.selectorcache import SelectorCache
 from rxbp.mixins.copymixin import CopyMixin
 from rxbp.scheduler import Scheduler
 from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
@@ -15,3 +16,8 @@ class SubscriberMixin(CopyMixin, ABC):
     @abstractmethod
     def subscribe_scheduler(self) -> TrampolineScheduler:
         ...
+
+    @property
+    @abstractmethod
+    def selector_cache(self) -> SelectorCache:
+        ...
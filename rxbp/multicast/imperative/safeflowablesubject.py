@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Generic, List
+from typing import Any, Generic, List, Optional
 
 from rx.disposable import CompositeDisposable
 
@@ -27,6 +27,7 @@ class SafeFlowableSubject(
 ):
     composite_diposable: CompositeDisposable
     scheduler: Scheduler
+    buffer_size: Optional[int] = None
 
     def __post_init__(self):
         self.is_first = True
@@ -55,7 +56,10 @@ class SafeFlowableSubject(
         # )
 
         if self._observable_subject is None:
-            self._observable_subject = CacheServeFirstObservableSubject(scheduler=subscriber.scheduler)
+            self._observable_subject = CacheServeFirstObservableSubject(
+                scheduler=subscriber.scheduler,
+                buffer_size=self.buffer_size,
+            )
         return init_subscription(observable=self._observable_subject)
 
     def subscribe_to(self, source: Flowable, scheduler: Scheduler = None):
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from rxbp.internal.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.adaptivebatchobserver import AdaptiveBatchObserver
+
+
+@dataclass
+class AdaptiveBatchObservable(Observable):
+    source: Observable
+    batch_size: AdaptiveBatchSize
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=AdaptiveBatchObserver(
+                observer=observer_info.observer,
+                batch_size=self.batch_size,
+            ),
+        ))
@@ -0,0 +1,107 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any
+
+from rxbp.observables.sortedmergebaseobservable import SortedMergeBaseObservable
+
+
+@dataclass
+class AsofJoinObservable(SortedMergeBaseObservable):
+    """ Joins each element of the left observable with the last element of the right observable
+    whose key is less than or equal to the key of the left element.
+
+    Both sources need to be sorted by `key`. The left elements are emitted as tuples
+    `(left_elem, right_elem)`, where `right_elem` is None if there is no such right element or if
+    its key lies more than `tolerance` before the key of the left element.
+
+    Left elements whose key is smaller than the last key of the current right batch are matched
+    at once. If the left batch is exhausted, the right source is back-pressured; otherwise, the
+    last right element is carried over and the next right batch is requested.
+    """
+
+    tolerance: Any = None
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        # last element and key of a previously released right batch
+        self.carry = None
+        self.carry_key = None
+        self.has_carry = False
+
+    def _join(self, l_start: int, l_end: int):
+        """ matches the left elements from `l_start` to `l_end`; returns the joined elements
+        and the index of the last matched right element
+        """
+
+        lbuf, rbuf = self.buffers
+        lkeys, rkeys = self.keys
+        ro = self.offsets[self.RIGHT]
+        tolerance = self.tolerance
+
+        joined = []
+        j_start = ro
+
+        for idx in range(l_start, l_end):
+            lkey = lkeys[idx]
+
+            if rbuf is None:
+                j = -1
+            else:
+                # left keys are sorted, hence the search can start at the last match
+                j = bisect_right(rkeys, lkey, j_start) - 1
+
+            if j_start <= j:
+                j_start = j
+                right, rkey, has_right = rbuf[j], rkeys[j], True
+            else:
+                right, rkey, has_right = self.carry, self.carry_key, self.has_carry
+
+            if not has_right or (tolerance is not None and tolerance < lkey - rkey):
+                right = None
+
+            joined.append((lbuf[idx], right))
+
+        return joined, j_start
+
+    def _step(self):
+        lbuf, rbuf = self.buffers
+        l_completed, r_completed = self.completed
+
+        if lbuf is not None and rbuf is not None:
+            lkeys, rkeys = self.keys
+            lo = self.offsets[self.LEFT]
+
+            # the following right batch might contain a better match for left keys
+            # equal to the last right key
+            l_end = bisect_left(lkeys, rkeys[-1], lo)
+            elements, j_last = self._join(lo, l_end)
+
+            if l_end == len(lbuf):
+                self._clear_slot(self.LEFT)
+
+                # keep the last matched right element for the next left batch
+                self.offsets[self.RIGHT] = j_last
+                cleared = (self.LEFT,)
+
+            else:
+                self.carry = rbuf[-1]
+                self.carry_key = rkeys[-1]
+                self.has_carry = True
+
+                self._clear_slot(self.RIGHT)
+                self.offsets[self.LEFT] = l_end
+                cleared = (self.RIGHT,)
+
+            return elements, cleared, False
+
+        # no more right elements, the remaining left elements are matched with the carry
+        if lbuf is not None and r_completed:
+            elements, _ = self._join(self.offsets[self.LEFT], len(lbuf))
+            self._clear_slot(self.LEFT)
+            return elements, (self.LEFT,), l_completed
+
+        if lbuf is None and l_completed:
+            return [], (), True
+
+        return None
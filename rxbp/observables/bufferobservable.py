@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Callable, List, Any, Optional
 
 from rxbp.observable import Observable
 from rxbp.observerinfo import ObserverInfo
@@ -11,7 +12,9 @@ class BufferObservable(Observable):
     source: Observable
     scheduler: Scheduler
     subscribe_scheduler: Scheduler
-    buffer_size: int
+    buffer_size: Optional[int]
+    low_watermark: Optional[int] = None
+    size_func: Callable[[List[Any]], int] = None
 
     def observe(self, observer_info: ObserverInfo):
         return self.source.observe(observer_info.copy(
@@ -20,5 +23,7 @@ class BufferObservable(Observable):
                 scheduler=self.scheduler,
                 subscribe_scheduler=self.subscribe_scheduler,
                 buffer_size=self.buffer_size,
+                low_watermark=self.low_watermark,
+                size_func=self.size_func,
             ),
         ))
@@ -28,9 +28,10 @@ class ConcatObservable(Observable):
         sources[n] -> ConnectableObserver -> Subject --
         """
 
+        # one connectable observer for each source except the first one
         conn_observers = [ConnectableObserver(
             underlying=None,
-        ) for _ in self.sources]
+        ) for _ in self.sources[1:]]
 
         iter_conn_obs = iter(conn_observers)
 
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.concurrentflatmapobserver import ConcurrentFlatMapObserver
+from rxbp.scheduler import Scheduler
+
+
+@dataclass
+class ConcurrentFlatMapObservable(Observable):
+    source: Observable
+    func: Callable[[Any], Observable]
+    max_concurrent: Optional[int]
+    ordered: bool
+    subscribe_scheduler: Scheduler
+
+    def observe(self, observer_info: ObserverInfo):
+        composite_disposable = CompositeDisposable()
+
+        disposable = self.source.observe(
+            observer_info.copy(observer=ConcurrentFlatMapObserver(
+                observer_info=observer_info,
+                func=self.func,
+                max_concurrent=self.max_concurrent,
+                ordered=self.ordered,
+                subscribe_scheduler=self.subscribe_scheduler,
+                composite_disposable=composite_disposable,
+            )),
+        )
+        composite_disposable.add(disposable)
+
+        return composite_disposable
@@ -1,7 +1,7 @@
 import threading
 from dataclasses import dataclass
 from traceback import FrameSummary
-from typing import Callable, Any, List
+from typing import Callable, Any, List, Optional
 
 from rx.disposable import CompositeDisposable
 
@@ -15,10 +15,8 @@ from rxbp.observable import Observable
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
 from rxbp.scheduler import Scheduler
-from rxbp.states.measuredstates.controlledzipstates import ControlledZipStates
-from rxbp.states.measuredstates.terminationstates import TerminationStates
-from rxbp.states.rawstates.rawcontrolledzipstates import RawControlledZipStates
-from rxbp.states.rawstates.rawterminationstates import RawTerminationStates
+from rxbp.states.intstates.intcontrolledzipstate import IntControlledZipState
+from rxbp.states.intstates.intterminationstate import IntTerminationState
 from rxbp.typing import ElementType
 from rxbp.utils.tooperatorexception import to_operator_exception
 
@@ -39,8 +37,8 @@ class ControlledZipObservable(Observable):
         self.observer = None
 
         # state once observed
-        self.termination_state = RawTerminationStates.InitState()
-        self.state = RawControlledZipStates.WaitOnLeftRight()
+        self.termination_state = IntTerminationState()
+        self.state = IntControlledZipState()
 
     def _iterate_over_batch(
             self,
@@ -66,53 +64,64 @@ class ControlledZipObservable(Observable):
         except StopIteration:
             return continue_ack
 
-        upstream_ack = AckSubject()
-
-        next_state = RawControlledZipStates.ElementReceived(
-            val=val,
-            is_left=is_left,
-            ack=upstream_ack,
-            iter=iterable,
-        )
+        state = self.state
 
         with self.lock:
-            next_state.prev_raw_state = self.state
-            next_state.prev_raw_termination_state = self.termination_state
-            self.state = next_state
+            prev_state = state.measure(self.termination_state)
 
-        raw_prev_termination_state = next_state.prev_raw_termination_state
-        prev_raw_state = next_state.prev_raw_state
-        prev_state = prev_raw_state.get_measured_state(raw_prev_termination_state)
+            if prev_state == IntControlledZipState.STOPPED:
+                return stop_ack
 
-        if isinstance(prev_state, ControlledZipStates.Stopped):
-            return stop_ack
+            # Needed for `signal_on_complete_or_on_error`
+            elif prev_state == IntControlledZipState.WAIT_ON_LEFT_RIGHT:
 
-        elif isinstance(prev_state, ControlledZipStates.WaitOnLeftRight):
-            return upstream_ack
-
-        elif is_left and isinstance(prev_state, ControlledZipStates.WaitOnLeft):
-            left_val = val
-            left_iter = iterable
-            left_in_ack = upstream_ack
-            right_val = prev_state.right_val
-            right_iter = prev_state.right_iter
-            right_in_ack = prev_state.right_ack
-            other_upstream_ack = prev_state.right_ack
-
-        elif not is_left and isinstance(prev_state, ControlledZipStates.WaitOnRight):
-            left_val = prev_state.left_val
-            left_iter = prev_state.left_iter
-            left_in_ack = prev_state.left_ack
-            right_val = val
-            right_iter = iterable
-            right_in_ack = upstream_ack
-            other_upstream_ack = prev_state.left_ack
+                # the upstream acknowledgment is only created if the source needs to wait
+                upstream_ack = AckSubject()
 
-        else:
-            raise Exception(to_operator_exception(
-                message=f'unknown state "{prev_state}", is_left {is_left}',
-                stack=self.stack,
-            ))
+                if is_left:
+                    state.value = IntControlledZipState.WAIT_ON_RIGHT
+                    state.left_val = val
+                    state.left_iter = iterable
+                    state.left_ack = upstream_ack
+
+                else:
+                    state.value = IntControlledZipState.WAIT_ON_LEFT
+                    state.right_val = val
+                    state.right_iter = iterable
+                    state.right_ack = upstream_ack
+
+                return upstream_ack
+
+            elif is_left and prev_state == IntControlledZipState.WAIT_ON_LEFT:
+                left_val = val
+                left_iter = iterable
+                right_val = state.right_val
+                right_iter = state.right_iter
+                other_upstream_ack = state.right_ack
+
+            elif not is_left and prev_state == IntControlledZipState.WAIT_ON_RIGHT:
+                left_val = state.left_val
+                left_iter = state.left_iter
+                right_val = val
+                right_iter = iterable
+                other_upstream_ack = state.left_ack
+
+            else:
+                state.value = IntControlledZipState.ZIP_ELEMENTS
+
+                raise Exception(to_operator_exception(
+                    message=f'unknown state "{prev_state}", is_left {is_left}',
+                    stack=self.stack,
+                ))
+
+            state.value = IntControlledZipState.ZIP_ELEMENTS
+            state.is_left = is_left
+            state.left_val = None
+            state.left_iter = None
+            state.left_ack = None
+            state.right_val = None
+            state.right_iter = None
+            state.right_ack = None
 
         # keep elements to be sent in a buffer. Only when the incoming batch of elements is iterated over, the
         # elements in the buffer are sent.
@@ -157,60 +166,55 @@ class ControlledZipObservable(Observable):
         else:
             zip_out_ack = continue_ack
 
-        # all elements in the left and right iterable are send downstream
+        # the source whose elements are not completely zipped is back-pressured
         if request_new_elem_from_left and request_new_elem_from_right:
-            next_state = RawControlledZipStates.WaitOnLeftRight()
-
-        elif request_new_elem_from_left:
-            next_state = RawControlledZipStates.WaitOnLeft(
-                right_val=right_val,
-                right_iter=right_iter,
-                right_ack=right_in_ack,
-            )
-
-        elif request_new_elem_from_right:
-            next_state = RawControlledZipStates.WaitOnRight(
-                left_val=left_val,
-                left_iter=left_iter,
-                left_ack=left_in_ack,
-            )
+            upstream_ack = None
+        elif request_new_elem_from_right == is_left:
+            upstream_ack = AckSubject()
+        else:
+            upstream_ack = other_upstream_ack
 
+        if is_left:
+            left_in_ack, right_in_ack = upstream_ack, other_upstream_ack
         else:
-            raise Exception('at least one side should be back-pressured')
+            left_in_ack, right_in_ack = other_upstream_ack, upstream_ack
 
         with self.lock:
-            # get termination state
-            raw_prev_termination_state = self.termination_state
 
-            # set next state
-            self.state = next_state
+            # all elements in the left and right iterable are send downstream
+            if request_new_elem_from_left and request_new_elem_from_right:
+                state.value = IntControlledZipState.WAIT_ON_LEFT_RIGHT
 
-        prev_termination_state = raw_prev_termination_state.get_measured_state()
+            elif request_new_elem_from_left:
+                state.value = IntControlledZipState.WAIT_ON_LEFT
+                state.right_val = right_val
+                state.right_iter = right_iter
+                state.right_ack = right_in_ack
 
-        def stop_active_acks():
-            other_upstream_ack.on_next(stop_ack)
+            elif request_new_elem_from_right:
+                state.value = IntControlledZipState.WAIT_ON_RIGHT
+                state.left_val = left_val
+                state.left_iter = left_iter
+                state.left_ack = left_in_ack
 
-        # stop back-pressuring both sources, because there is no need to request elements
-        # from completed source
-        if isinstance(prev_termination_state, TerminationStates.LeftCompletedState) \
-                and request_new_elem_from_left:
+            else:
+                raise Exception('at least one side should be back-pressured')
 
-            self._signal_on_complete_or_on_error(state=next_state)
-            stop_active_acks()
-            return stop_ack
+            # get termination state
+            termination_state = self.termination_state.value
+            termination_exc = self.termination_state.exc
 
         # stop back-pressuring both sources, because there is no need to request elements
         # from completed source
-        elif isinstance(prev_termination_state, TerminationStates.RightCompletedState) \
-                and request_new_elem_from_right:
-            self._signal_on_complete_or_on_error(state=next_state)
-            stop_active_acks()
+        if termination_state == IntTerminationState.ERROR:
+            self.observer.on_error(termination_exc)
+            other_upstream_ack.on_next(stop_ack)
             return stop_ack
 
-        # in error state, stop back-pressuring both sources
-        elif isinstance(prev_termination_state, TerminationStates.ErrorState):
-            self._signal_on_complete_or_on_error(state=next_state, exc=prev_termination_state.ex)
-            stop_active_acks()
+        elif (termination_state & IntTerminationState.LEFT_COMPLETED and request_new_elem_from_left) \
+                or (termination_state & IntTerminationState.RIGHT_COMPLETED and request_new_elem_from_right):
+            self.observer.on_completed()
+            other_upstream_ack.on_next(stop_ack)
             return stop_ack
 
         # finish connecting ack only if not in Stopped or Error state
@@ -257,26 +261,22 @@ class ControlledZipObservable(Observable):
 
     def _signal_on_complete_or_on_error(
             self,
-            state: ControlledZipStates.ZipState,
+            state: int,
+            other_upstream_ack: Optional[AckSubject],
             exc: Exception = None,
     ):
         """ this function is called once, because 'on_complete' or 'on_error' are called once according to the rxbp
         convention
 
-        :param state: controlled join_flowables state
-        :param ex: catched exception to be forwarded downstream
+        :param state: measured controlled zip state before the termination
+        :param other_upstream_ack: acknowledgment of the back-pressured source if any
+        :param exc: catched exception to be forwarded downstream
         :return:
         """
 
         # stop active acknowledgments
-        if isinstance(state, ControlledZipStates.WaitOnLeftRight):
-            pass
-        elif isinstance(state, ControlledZipStates.WaitOnLeft):
-            state.right_ack.on_next(stop_ack)
-        elif isinstance(state, ControlledZipStates.WaitOnRight):
-            state.left_ack.on_next(stop_ack)
-        else:
-            pass
+        if state == IntControlledZipState.WAIT_ON_LEFT or state == IntControlledZipState.WAIT_ON_RIGHT:
+            other_upstream_ack.on_next(stop_ack)
 
         # terminate observer
         if exc:
@@ -286,44 +286,47 @@ class ControlledZipObservable(Observable):
 
     def _on_error_or_complete(
             self,
-            next_final_state: RawTerminationStates.TerminationState,
+            is_left: bool = None,
             exc: Exception = None,
     ):
+        state = self.state
+        termination_state = self.termination_state
 
         with self.lock:
-            raw_prev_final_state = self.termination_state
-            raw_prev_state = self.state
-            next_final_state.raw_prev_state = raw_prev_final_state
-            self.termination_state = next_final_state
+            prev_state = state.measure(termination_state)
 
-        prev_state = raw_prev_state.get_measured_state(
-            raw_termination_state=raw_prev_final_state,
-        )
+            if exc is not None:
+                termination_state.on_error(exc)
+            elif is_left:
+                termination_state.on_completed_left()
+            else:
+                termination_state.on_completed_right()
 
-        curr_state = raw_prev_state.get_measured_state(
-            raw_termination_state=next_final_state,
-        )
+            curr_state = state.measure(termination_state)
 
-        if not isinstance(prev_state, ControlledZipStates.Stopped) \
-                and isinstance(curr_state, ControlledZipStates.Stopped):
-            self._signal_on_complete_or_on_error(prev_state, exc=exc)
+            if prev_state == IntControlledZipState.WAIT_ON_LEFT:
+                other_upstream_ack = state.right_ack
+            elif prev_state == IntControlledZipState.WAIT_ON_RIGHT:
+                other_upstream_ack = state.left_ack
+            else:
+                other_upstream_ack = None
+
+        if prev_state != IntControlledZipState.STOPPED \
+                and curr_state == IntControlledZipState.STOPPED:
+            self._signal_on_complete_or_on_error(
+                state=prev_state,
+                other_upstream_ack=other_upstream_ack,
+                exc=exc,
+            )
 
     def _on_error(self, exc):
-        next_final_state = RawTerminationStates.ErrorState(
-            exc=exc,
-        )
-        self._on_error_or_complete(
-            next_final_state=next_final_state,
-            exc=exc,
-        )
+        self._on_error_or_complete(exc=exc)
 
     def _on_completed_left(self):
-        next_final_state = RawTerminationStates.LeftCompletedState()
-        self._on_error_or_complete(next_final_state=next_final_state)
+        self._on_error_or_complete(is_left=True)
 
     def _on_completed_right(self):
-        next_final_state = RawTerminationStates.RightCompletedState()
-        self._on_error_or_complete(next_final_state=next_final_state,)
+        self._on_error_or_complete(is_left=False)
 
     def observe(self, observer_info: ObserverInfo):
         """ This function ought be called at most once.
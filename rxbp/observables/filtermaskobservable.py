@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.filtermaskobserver import FilterMaskObserver
+
+
+@dataclass
+class FilterMaskObservable(Observable):
+    source: Observable
+    predicate: Callable[[Any], Any]
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=FilterMaskObserver(
+                observer=observer_info.observer,
+                predicate=self.predicate,
+            ),
+        ))
@@ -0,0 +1,112 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterable, Any, Optional
+
+from rx.disposable import Disposable
+
+from rxbp.acknowledgement.operators.tofuture import to_future
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.scheduler import Scheduler
+from rxbp.schedulers.asyncioscheduler import AsyncIOScheduler
+
+
+@dataclass
+class FromAsyncIterableObservable(Observable):
+    """
+    Iterates over an asynchronous iterable on an asyncio event loop. The next element is
+    requested only after the downstream acknowledged the previous batch.
+    """
+
+    async_iterable: AsyncIterable[Any]
+    batch_size: int
+    is_batched: bool
+    scheduler: Scheduler
+    loop: Optional[asyncio.AbstractEventLoop]
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self.loop is not None:
+            return self.loop
+
+        elif isinstance(self.scheduler, AsyncIOScheduler):
+            return self.scheduler.loop
+
+        else:
+            # without a running event loop, the iterable would never be iterated
+            try:
+                return asyncio.get_running_loop()
+            except RuntimeError:
+                raise Exception('from_async_iterable requires an event loop; either specify the `loop` '
+                                'argument, subscribe with an AsyncIOScheduler, or subscribe on a running '
+                                'event loop')
+
+    async def _gen_batches(self):
+        if self.is_batched:
+            async for batch in self.async_iterable:
+                if isinstance(batch, list):
+                    yield batch
+                else:
+                    yield list(batch)
+
+        else:
+            batch = []
+
+            async for elem in self.async_iterable:
+                batch.append(elem)
+
+                if self.batch_size <= len(batch):
+                    yield batch
+                    batch = []
+
+            if batch:
+                yield batch
+
+    async def _run(self, observer: Observer, loop: asyncio.AbstractEventLoop):
+        batches = self._gen_batches()
+
+        try:
+            async for batch in batches:
+                ack = observer.on_next(batch)
+
+                if not ack.is_sync:
+                    ack = await to_future(ack, loop=loop)
+
+                if isinstance(ack, StopAck):
+                    return
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as exc:
+            observer.on_error(exc)
+            return
+
+        finally:
+            await batches.aclose()
+
+        observer.on_completed()
+
+    def observe(self, observer_info: ObserverInfo):
+        loop = self._get_loop()
+        coro = self._run(observer_info.observer, loop)
+
+        try:
+            is_loop_thread = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            is_loop_thread = False
+
+        if is_loop_thread:
+            task = loop.create_task(coro)
+
+            def dispose():
+                task.cancel()
+
+        else:
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+
+            def dispose():
+                future.cancel()
+
+        return Disposable(dispose)
@@ -2,16 +2,63 @@ from typing import Iterator, Any, Optional
 
 from rx.disposable import Disposable, BooleanDisposable, CompositeDisposable
 
-from rxbp.acknowledgement.continueack import ContinueAck
-from rxbp.acknowledgement.operators.observeon import _observe_on
+from rxbp.acknowledgement.continueack import continue_ack
 from rxbp.acknowledgement.single import Single
-from rxbp.acknowledgement.stopack import StopAck
+from rxbp.acknowledgement.stopack import stop_ack
 from rxbp.mixins.executionmodelmixin import ExecutionModelMixin
 from rxbp.observable import Observable
 from rxbp.observerinfo import ObserverInfo
 from rxbp.scheduler import Scheduler
 
 
+class RescheduleSingle(Single):
+    """
+    Continues the loop over the iterator on the scheduler once the asynchronous
+    acknowledgment is received.
+
+    There is at most one asynchronous acknowledgment pending per subscription,
+    therefore this Single is reused for each acknowledgment.
+    """
+
+    __slots__ = ('source', 'observer', 'scheduler', 'disposable', 'em', 'next_item', 'ack')
+
+    def __init__(
+            self,
+            source: 'FromIteratorObservable',
+            observer,
+            scheduler: Scheduler,
+            disposable: BooleanDisposable,
+            em: ExecutionModelMixin,
+    ):
+        self.source = source
+        self.observer = observer
+        self.scheduler = scheduler
+        self.disposable = disposable
+        self.em = em
+
+        self.next_item = None
+        self.ack = None
+
+    def on_next(self, ack):
+        self.ack = ack
+        self.scheduler.schedule(self._run)
+
+    def _run(self, _, __):
+        if self.ack is continue_ack:
+            try:
+                self.source.fast_loop(self.next_item, self.observer, self.scheduler, self.disposable, self.em,
+                                      sync_index=0)
+            except Exception as e:
+                self.source.trigger_cancel(self.scheduler)
+                self.scheduler.report_failure(e)
+        else:
+            self.source.trigger_cancel(self.scheduler)
+
+    def on_error(self, err):
+        self.source.trigger_cancel(self.scheduler)
+        self.scheduler.report_failure(err)
+
+
 class FromIteratorObservable(Observable):
     def __init__(
             self,
@@ -27,6 +74,9 @@ class FromIteratorObservable(Observable):
         self.subscribe_scheduler = subscribe_scheduler
         self.on_finish = on_finish
 
+        # reused for each asynchronous acknowledgment
+        self.reschedule_single: Optional[RescheduleSingle] = None
+
     def observe(self, observer_info: ObserverInfo):
         observer_info = observer_info.observer
 
@@ -60,23 +110,20 @@ class FromIteratorObservable(Observable):
             scheduler.report_failure(e)
 
     def reschedule(self, ack, next_item, observer, scheduler: Scheduler, disposable, em: ExecutionModelMixin):
-        class ResultSingle(Single):
-            def on_next(_, next):
-                if isinstance(next, ContinueAck):
-                    try:
-                        self.fast_loop(next_item, observer, scheduler, disposable, em, sync_index=0)
-                    except Exception as e:
-                        self.trigger_cancel(scheduler)
-                        scheduler.report_failure(e)
-                else:
-                    self.trigger_cancel(scheduler)
+        single = self.reschedule_single
 
-            def on_error(_, err):
-                self.trigger_cancel(scheduler)
-                scheduler.report_failure(err)
+        if single is None or single.observer is not observer:
+            single = RescheduleSingle(
+                source=self,
+                observer=observer,
+                scheduler=scheduler,
+                disposable=disposable,
+                em=em,
+            )
+            self.reschedule_single = single
 
-        _observe_on(source=ack, scheduler=scheduler).subscribe(ResultSingle())
-        # ack.subscribe(ResultSingle())
+        single.next_item = next_item
+        ack.subscribe(single)
 
     def fast_loop(self, current_item, observer, scheduler: Scheduler,
                   disposable: BooleanDisposable, em: ExecutionModelMixin, sync_index: int):
@@ -114,9 +161,9 @@ class FromIteratorObservable(Observable):
                     observer.on_completed()
                 break
             else:
-                if isinstance(ack, ContinueAck):
+                if ack is continue_ack:
                     next_index = em.next_frame_index(sync_index)
-                elif isinstance(ack, StopAck):
+                elif ack is stop_ack:
                     next_index = -1
                 else:
                     next_index = 0
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Tuple, Optional
+
+from rxbp.config import is_operator_fusion_enabled
+from rxbp.observable import Observable
+from rxbp.observables.filterobservable import FilterObservable
+from rxbp.observables.mapobservable import MapObservable
+from rxbp.observables.maptoiteratorobservable import MapToIteratorObservable
+from rxbp.observables.zipwithindexobservable import ZipWithIndexObservable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.fusedobserver import FusedObserver, FusedStage
+
+
+@dataclass
+class FusedObservable(Observable):
+    source: Observable
+    stages: Tuple[FusedStage, ...]
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=FusedObserver(
+                observer=observer_info.observer,
+                stages=self.stages,
+            ),
+        ))
+
+
+def _to_fused_stages(observable: Observable) -> Optional[Tuple[FusedStage, ...]]:
+    if isinstance(observable, FusedObservable):
+        return observable.stages
+    elif isinstance(observable, MapObservable):
+        return FusedStage(kind=FusedStage.MAP, func=observable.func),
+    elif isinstance(observable, FilterObservable):
+        return FusedStage(kind=FusedStage.FILTER, func=observable.predicate),
+    elif isinstance(observable, ZipWithIndexObservable):
+        return FusedStage(kind=FusedStage.ZIP_WITH_INDEX, func=observable.selector),
+    elif isinstance(observable, MapToIteratorObservable):
+        return FusedStage(kind=FusedStage.MAP_TO_ITERATOR, func=observable.func),
+    else:
+        return None
+
+
+def fuse_observable(source: Observable, stage: FusedStage) -> Optional[Observable]:
+    """
+    Fuse the operator given by `stage` with the source Observable, if the source is
+    itself a fusable operator; otherwise, return None.
+    """
+
+    if not is_operator_fusion_enabled():
+        return None
+
+    prev_stages = _to_fused_stages(source)
+
+    if prev_stages is None or prev_stages[-1].kind == FusedStage.MAP_TO_ITERATOR:
+        return None
+
+    return FusedObservable(
+        source=source.source,
+        stages=prev_stages + (stage,),
+    )
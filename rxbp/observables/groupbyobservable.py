@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.groupbyobserver import GroupByObserver
+from rxbp.scheduler import Scheduler
+
+
+@dataclass
+class GroupByObservable(Observable):
+    source: Observable
+    key_func: Callable[[Any], Any]
+    max_groups: Optional[int]
+    group_buffer: Optional[int]
+    scheduler: Scheduler
+    subscribe_scheduler: Scheduler
+
+    def observe(self, observer_info: ObserverInfo):
+        observer = GroupByObserver(
+            observer_info=observer_info,
+            key_func=self.key_func,
+            max_groups=self.max_groups,
+            group_buffer=self.group_buffer,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.subscribe_scheduler,
+        )
+        return self.source.observe(observer_info.copy(observer=observer))
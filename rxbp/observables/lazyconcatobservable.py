@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import List, Callable
+
+from rx.disposable import SerialDisposable
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.lazyconcatobserver import LazyConcatObserver
+from rxbp.scheduler import Scheduler
+
+
+@dataclass
+class LazyConcatObservable(Observable):
+    """
+    Concatenates the sources by observing only one source at a time.
+
+    sources[0] --> LazyConcatObserver --> observer
+                     |
+                     | on_completed
+                     v
+    sources[1] --> LazyConcatObserver --> observer
+    ...
+
+    Compared to `ConcatObservable`, the sources are not observed all at once, which
+    only works for cold sources. The sources are given as functions that create the
+    observable once it is needed.
+    """
+
+    sources: List[Callable[[], Observable]]
+    subscribe_scheduler: Scheduler
+
+    def observe(self, observer_info: ObserverInfo):
+        serial_disposable = SerialDisposable()
+
+        observer = LazyConcatObserver(
+            observer_info=observer_info,
+            sources=iter(self.sources),
+            subscribe_scheduler=self.subscribe_scheduler,
+            serial_disposable=serial_disposable,
+        )
+
+        observer.observe_next()
+
+        return serial_disposable
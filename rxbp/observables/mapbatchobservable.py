@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.mapbatchobserver import MapBatchObserver
+
+
+@dataclass
+class MapBatchObservable(Observable):
+    source: Observable
+    func: Callable[[Any], Any]
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=MapBatchObserver(
+                observer=observer_info.observer,
+                func=self.func,
+            ),
+        ))
@@ -0,0 +1,219 @@
+import heapq
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import stop_ack, StopAck
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.typing import ElementType
+
+
+@dataclass
+class MergeNObservable(Observable):
+    """ Merges the elements of an arbitrary number of observables.
+
+    A received batch is sent immediately if the downstream is not busy. Otherwise, the batch is
+    stored in the slot of its source and the source is back-pressured. Once the downstream
+    acknowledges, the next buffered batch is selected either in the order of arrival, or, if
+    `prioritized` is True, from the source that comes first in `sources`.
+    """
+
+    sources: List[Observable]
+    prioritized: bool = False
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+
+        self.observer: Optional[Observer] = None
+
+        n_sources = len(self.sources)
+
+        # one slot per source
+        self.elems: List[Optional[ElementType]] = [None] * n_sources
+        self.acks: List[Optional[AckSubject]] = [None] * n_sources
+
+        # indices of the slots containing a batch; a heap if prioritized, otherwise a FIFO queue
+        self.buffered = [] if self.prioritized else deque()
+
+        self.n_completed = 0
+
+        # True while a batch is sent or the downstream acknowledgment is pending
+        self.is_emitting = False
+        self.is_stopped = False
+
+        self.result_single = MergeNObservable.ResultSingle(source=self)
+
+    class ResultSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'MergeNObservable'):
+            self.source = source
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, ContinueAck):
+                self.source._emit_buffered()
+
+            else:
+                self.source._stop()
+
+        def on_error(self, exc: Exception):
+            raise NotImplementedError
+
+    def _pop_buffered(self) -> int:
+        """ returns the index of the next slot to be emitted; called while holding the lock
+        """
+
+        if self.prioritized:
+            return heapq.heappop(self.buffered)
+        else:
+            return self.buffered.popleft()
+
+    def _emit_buffered(self):
+        """ sends the buffered batches until the buffer is empty or the downstream returns
+        an asynchronous acknowledgment
+        """
+
+        while True:
+            with self.lock:
+                if self.is_stopped:
+                    return
+
+                if not self.buffered:
+                    self.is_emitting = False
+
+                    # the buffered elements got emitted after all sources completed
+                    if self.n_completed == len(self.sources):
+                        self.is_stopped = True
+                        is_completed = True
+                    else:
+                        is_completed = False
+
+                    break
+
+                idx = self._pop_buffered()
+                elem = self.elems[idx]
+                upstream_ack = self.acks[idx]
+                self.elems[idx] = None
+                self.acks[idx] = None
+
+            ack = self.observer.on_next(elem)
+
+            if isinstance(ack, StopAck):
+                upstream_ack.on_next(stop_ack)
+                self._stop()
+                return
+
+            elif not isinstance(ack, ContinueAck):
+                ack.subscribe(self.result_single)
+                upstream_ack.on_next(continue_ack)
+                return
+
+            upstream_ack.on_next(continue_ack)
+
+        if is_completed:
+            self.observer.on_completed()
+
+    def _stop(self) -> bool:
+        """ stops all sources and returns True if the observable has already been stopped before
+        """
+
+        with self.lock:
+            is_stopped = self.is_stopped
+            self.is_stopped = True
+            upstream_acks = [ack for ack in self.acks if ack is not None]
+            self.elems = [None] * len(self.elems)
+            self.acks = [None] * len(self.acks)
+            self.buffered.clear()
+
+        for ack in upstream_acks:
+            ack.on_next(stop_ack)
+
+        return is_stopped
+
+    def _on_next(self, idx: int, elem: ElementType) -> Ack:
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            # buffer batch and back-pressure source
+            if self.is_emitting:
+                upstream_ack = AckSubject()
+                self.elems[idx] = elem
+                self.acks[idx] = upstream_ack
+
+                if self.prioritized:
+                    heapq.heappush(self.buffered, idx)
+                else:
+                    self.buffered.append(idx)
+
+                return upstream_ack
+
+            self.is_emitting = True
+
+        ack = self.observer.on_next(elem)
+
+        if isinstance(ack, StopAck):
+            self._stop()
+            return stop_ack
+
+        elif isinstance(ack, ContinueAck):
+            # send batches buffered in the meantime
+            self._emit_buffered()
+
+        else:
+            ack.subscribe(self.result_single)
+
+        return continue_ack
+
+    def _on_error(self, exc: Exception):
+        if not self._stop():
+            self.observer.on_error(exc)
+
+    def _on_completed(self):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.n_completed += 1
+
+            # the buffered elements are emitted before completing the observer
+            if self.n_completed < len(self.sources) or self.is_emitting:
+                return
+
+            self.is_stopped = True
+
+        self.observer.on_completed()
+
+    def observe(self, observer_info: ObserverInfo):
+        self.observer = observer_info.observer
+
+        source = self
+
+        class MergeNInnerObserver(Observer):
+            def __init__(self, idx: int):
+                self.idx = idx
+
+            def on_next(self, elem: ElementType) -> Ack:
+                return source._on_next(self.idx, elem)
+
+            def on_error(self, exc: Exception):
+                source._on_error(exc)
+
+            def on_completed(self):
+                source._on_completed()
+
+        disposables = [
+            observable.observe(observer_info.copy(observer=MergeNInnerObserver(idx=idx)))
+            for idx, observable in enumerate(self.sources)
+        ]
+
+        return CompositeDisposable(*disposables)
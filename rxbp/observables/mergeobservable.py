@@ -1,4 +1,5 @@
 import threading
+from typing import Optional
 
 from rx.disposable import CompositeDisposable
 
@@ -10,9 +11,8 @@ from rxbp.acknowledgement.stopack import stop_ack
 from rxbp.observable import Observable
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
-from rxbp.states.measuredstates.mergestates import MergeStates
-from rxbp.states.rawstates.rawmergestates import RawMergeStates
-from rxbp.states.rawstates.rawterminationstates import RawTerminationStates
+from rxbp.states.intstates.intmergestate import IntMergeState
+from rxbp.states.intstates.intterminationstate import IntTerminationState
 from rxbp.typing import ElementType
 
 
@@ -53,64 +53,85 @@ class MergeObservable(Observable):
 
         # MergeObservable states
         self.observer = None
-        self.termination_state = RawTerminationStates.InitState()
-        self.state = RawMergeStates.NoneReceived()
+        self.termination_state = IntTerminationState()
+        self.state = IntMergeState()
 
         self.lock = threading.RLock()
 
+        # the same single is subscribed to every asynchronous acknowledgment
+        self.result_single = MergeObservable.ResultSingle(source=self)
+
     class ResultSingle(Single):
+        __slots__ = ('source',)
+
         def __init__(self, source: 'MergeObservable'):
             self.source = source
 
         def on_next(self, ack: Ack):
             if isinstance(ack, ContinueAck):
-                next_state = RawMergeStates.OnAckReceived()
+                source = self.source
+                state = source.state
 
-                with self.source.lock:
-                    next_state.prev_raw_state = self.source.state
-                    next_state.prev_raw_termination_state = self.source.termination_state
-                    self.source.state = next_state
+                elem = None
+                upstream_ack = None
 
-                raw_termination_state = next_state.prev_raw_termination_state
-                meas_prev_state = next_state.prev_raw_state.get_measured_state(raw_termination_state)
-                meas_state = next_state.get_measured_state(raw_termination_state)
+                with source.lock:
+                    prev_state = state.measure(source.termination_state)
 
-                # acknowledgment already sent to left and right
-                if isinstance(meas_state, MergeStates.NoneReceived):
-                    pass
+                    # acknowledgment already sent to left and right
+                    if prev_state == IntMergeState.NONE_RECEIVED_WAIT_ACK:
+                        state.value = IntMergeState.NONE_RECEIVED
 
-                # send buffered element and request new one
-                elif isinstance(meas_state, MergeStates.NoneReceivedWaitAck):
+                    elif prev_state == IntMergeState.LEFT_RECEIVED:
+                        state.value = IntMergeState.NONE_RECEIVED_WAIT_ACK
+                        elem = state.left_elem
+                        upstream_ack = state.left_ack
+                        state.left_elem = None
+                        state.left_ack = None
 
-                    if isinstance(meas_prev_state, MergeStates.SingleReceived):
-                        ack = self.source.observer.on_next(meas_prev_state.elem)
-                        ack.subscribe(self)
-                        meas_prev_state.ack.on_next(continue_ack)
-
-                    else:
-                        raise Exception(f'illegal previous state "{meas_prev_state}"')
-
-                # send first buffered element and request new one
-                elif isinstance(meas_state, MergeStates.SingleReceived):
+                    elif prev_state == IntMergeState.RIGHT_RECEIVED:
+                        state.value = IntMergeState.NONE_RECEIVED_WAIT_ACK
+                        elem = state.right_elem
+                        upstream_ack = state.right_ack
+                        state.right_elem = None
+                        state.right_ack = None
 
                     # previous state indicated that the next element sent is from left
-                    if isinstance(meas_prev_state, MergeStates.BothReceivedContinueLeft):
-                        ack = self.source.observer.on_next(meas_prev_state.left_elem)
-                        ack.subscribe(self)
-                        meas_prev_state.left_ack.on_next(continue_ack)
+                    elif prev_state == IntMergeState.BOTH_RECEIVED_CONTINUE_LEFT:
+                        state.value = IntMergeState.RIGHT_RECEIVED
+                        elem = state.left_elem
+                        upstream_ack = state.left_ack
+                        state.left_elem = None
+                        state.left_ack = None
+
+                    elif prev_state == IntMergeState.BOTH_RECEIVED_CONTINUE_RIGHT:
+                        state.value = IntMergeState.LEFT_RECEIVED
+                        elem = state.right_elem
+                        upstream_ack = state.right_ack
+                        state.right_elem = None
+                        state.right_ack = None
+
+                    elif prev_state != IntMergeState.STOPPED:
+                        raise Exception(f'illegal previous state "{prev_state}"')
+
+                    meas_state = state.measure(source.termination_state)
+
+                if meas_state == IntMergeState.NONE_RECEIVED:
+                    pass
 
-                    elif isinstance(meas_prev_state, MergeStates.BothReceivedContinueRight):
-                        ack = self.source.observer.on_next(meas_prev_state.right_elem)
-                        ack.subscribe(self)
-                        meas_prev_state.right_ack.on_next(continue_ack)
+                # send buffered element and request new one
+                elif meas_state == IntMergeState.NONE_RECEIVED_WAIT_ACK \
+                        or meas_state == IntMergeState.LEFT_RECEIVED \
+                        or meas_state == IntMergeState.RIGHT_RECEIVED:
 
-                    else:
-                        raise Exception(f'illegal previous state "{meas_prev_state}"')
+                    ack = source.observer.on_next(elem)
+                    ack.subscribe(self)
+                    upstream_ack.on_next(continue_ack)
 
-                elif isinstance(meas_state, MergeStates.Stopped):
-                    if isinstance(meas_prev_state, MergeStates.SingleReceived):
-                        self.source.observer.on_next(meas_prev_state.elem)
-                        self.source.observer.on_completed()
+                elif meas_state == IntMergeState.STOPPED:
+                    if prev_state == IntMergeState.LEFT_RECEIVED or prev_state == IntMergeState.RIGHT_RECEIVED:
+                        source.observer.on_next(elem)
+                        source.observer.on_completed()
 
                     else:
                         pass
@@ -121,60 +142,86 @@ class MergeObservable(Observable):
         def on_error(self, exc: Exception):
             raise NotImplementedError
 
-    def _on_next(self, next_state: RawMergeStates.ElementReceivedBase):
+    def _on_next(self, elem: ElementType, is_left: bool):
+        state = self.state
+
+        # the upstream acknowledgment is only created if the element gets buffered
+        upstream_ack = None
+
         with self.lock:
-            next_state.prev_raw_state = self.state
-            next_state.prev_raw_termination_state = self.termination_state
-            self.state = next_state
+            prev_state = state.measure(self.termination_state)
+
+            if prev_state == IntMergeState.NONE_RECEIVED:
+                state.value = IntMergeState.NONE_RECEIVED_WAIT_ACK
+
+            elif prev_state == IntMergeState.NONE_RECEIVED_WAIT_ACK:
+                upstream_ack = AckSubject()
+
+                if is_left:
+                    state.value = IntMergeState.LEFT_RECEIVED
+                    state.left_elem = elem
+                    state.left_ack = upstream_ack
+                else:
+                    state.value = IntMergeState.RIGHT_RECEIVED
+                    state.right_elem = elem
+                    state.right_ack = upstream_ack
+
+            elif is_left and prev_state == IntMergeState.RIGHT_RECEIVED:
+                upstream_ack = AckSubject()
+                state.value = IntMergeState.BOTH_RECEIVED_CONTINUE_RIGHT
+                state.left_elem = elem
+                state.left_ack = upstream_ack
+
+            elif not is_left and prev_state == IntMergeState.LEFT_RECEIVED:
+                upstream_ack = AckSubject()
+                state.value = IntMergeState.BOTH_RECEIVED_CONTINUE_LEFT
+                state.right_elem = elem
+                state.right_ack = upstream_ack
 
-        raw_termination_state = next_state.prev_raw_termination_state
-        meas_prev_state = next_state.prev_raw_state.get_measured_state(raw_termination_state)
-        meas_state = next_state.get_measured_state(raw_termination_state)
+            elif prev_state == IntMergeState.STOPPED:
+                state.value = IntMergeState.STOPPED
+
+            else:
+                raise Exception(f'illegal state "{prev_state}"')
+
+            meas_state = state.measure(self.termination_state)
 
         # left is first
-        if isinstance(meas_state, MergeStates.NoneReceivedWaitAck):
+        if meas_state == IntMergeState.NONE_RECEIVED_WAIT_ACK:
 
             # send element
-            out_ack = self.observer.on_next(next_state.elem)
+            out_ack = self.observer.on_next(elem)
 
-            out_ack.subscribe(MergeObservable.ResultSingle(source=self))
+            out_ack.subscribe(self.result_single)
 
             return continue_ack
 
-        elif isinstance(meas_state, MergeStates.SingleReceived):
-            pass
-
-        elif isinstance(meas_state, MergeStates.BothReceived):
-            pass
-
         # keep waiting for right and acknowledment
-        elif isinstance(meas_state, MergeStates.Stopped):
-            if isinstance(meas_prev_state, MergeStates.Stopped):
-                self.observer.on_completed()
-                return stop_ack
-            else:
-                pass
+        elif meas_state == IntMergeState.STOPPED:
 
-        else:
-            raise Exception(f'illegal state "{meas_state}"')
+            # the state only changes to stopped if it was stopped before
+            self.observer.on_completed()
+            return stop_ack
 
-        return next_state.ack
+        return upstream_ack
 
-    def _signal_on_complete_or_on_error(self, prev_state: MergeStates.MergeState, exc: Exception = None):
+    def _signal_on_complete_or_on_error(
+            self,
+            prev_state: int,
+            upstream_ack: Optional[AckSubject],
+            exc: Exception = None,
+    ):
         """ this function is called once
 
-        :param raw_state:
+        :param prev_state: measured state before the termination
+        :param upstream_ack: acknowledgment of the buffered element if any
         :param exc:
         :return:
         """
 
         # stop active acknowledgments
-        if isinstance(prev_state, MergeStates.NoneReceivedWaitAck):
-            pass
-        elif isinstance(prev_state, MergeStates.SingleReceived):
-            prev_state.ack.on_next(stop_ack)
-        else:
-            pass
+        if prev_state == IntMergeState.LEFT_RECEIVED or prev_state == IntMergeState.RIGHT_RECEIVED:
+            upstream_ack.on_next(stop_ack)
 
         # terminate observer
         if exc:
@@ -182,37 +229,40 @@ class MergeObservable(Observable):
         else:
             self.observer.on_completed()
 
-    def _on_error_or_complete(self, next_termination_state: RawTerminationStates.TerminationState, exc: Exception = None):
+    def _on_error_or_complete(self, is_left: bool = None, exc: Exception = None):
+        state = self.state
+        termination_state = self.termination_state
+
         with self.lock:
-            next_termination_state.raw_prev_state = self.termination_state
-            self.termination_state = next_termination_state
+            prev_state = state.measure(termination_state)
 
-            raw_state = self.state
+            if exc is not None:
+                termination_state.on_error(exc)
+            elif is_left:
+                termination_state.on_completed_left()
+            else:
+                termination_state.on_completed_right()
 
-        prev_raw_termination_state = next_termination_state.raw_prev_state
-        raw_termination_state = next_termination_state
+            meas_state = state.measure(termination_state)
 
-        meas_prev_state = raw_state.get_measured_state(prev_raw_termination_state)
-        meas_state = raw_state.get_measured_state(raw_termination_state)
+            if prev_state == IntMergeState.LEFT_RECEIVED:
+                upstream_ack = state.left_ack
+            elif prev_state == IntMergeState.RIGHT_RECEIVED:
+                upstream_ack = state.right_ack
+            else:
+                upstream_ack = None
 
-        if not isinstance(meas_prev_state, MergeStates.Stopped) \
-                and isinstance(meas_state, MergeStates.Stopped):
-            self._signal_on_complete_or_on_error(meas_prev_state, exc)
+        if prev_state != IntMergeState.STOPPED and meas_state == IntMergeState.STOPPED:
+            self._signal_on_complete_or_on_error(prev_state, upstream_ack=upstream_ack, exc=exc)
 
     def _on_error(self, exc: Exception):
-        termination_state = RawTerminationStates.ErrorState(exc)
-
-        self._on_error_or_complete(next_termination_state=termination_state, exc=exc)
+        self._on_error_or_complete(exc=exc)
 
     def _on_completed_left(self):
-        termination_state = RawTerminationStates.LeftCompletedState()
-
-        self._on_error_or_complete(next_termination_state=termination_state)
+        self._on_error_or_complete(is_left=True)
 
     def _on_completed_right(self):
-        termination_state = RawTerminationStates.RightCompletedState()
-
-        self._on_error_or_complete(next_termination_state=termination_state)
+        self._on_error_or_complete(is_left=False)
 
     def observe(self, observer_info: ObserverInfo):
         self.observer = observer_info.observer
@@ -220,8 +270,7 @@ class MergeObservable(Observable):
 
         class LeftObserver(Observer):
             def on_next(self, elem: ElementType):
-                next_state = RawMergeStates.OnLeftReceived(elem=elem, ack=AckSubject())
-                return source._on_next(next_state)
+                return source._on_next(elem, is_left=True)
 
             def on_error(self, exc):
                 source._on_error(exc)
@@ -231,8 +280,7 @@ class MergeObservable(Observable):
 
         class RightObserver(Observer):
             def on_next(self, elem: ElementType):
-                next_state = RawMergeStates.OnRightReceived(elem=elem, ack=AckSubject())
-                return source._on_next(next_state)
+                return source._on_next(elem, is_left=False)
 
             def on_error(self, exc):
                 source._on_error(exc)
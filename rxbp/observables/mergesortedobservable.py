@@ -0,0 +1,82 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+from rxbp.observables.sortedmergebaseobservable import SortedMergeBaseObservable
+
+
+@dataclass
+class MergeSortedObservable(SortedMergeBaseObservable):
+    """ Merges two observables whose elements are sorted by `key` into a single sorted observable.
+
+    Once both slots are filled, the source whose current batch ends with the smaller key gets
+    merged completely together with the elements of the other source whose key lie in the same
+    range. The other source keeps its remaining elements as offset and gets back-pressured.
+    On equal keys, the elements of the left source are emitted first.
+
+    If `key` is None, the elements themselves are compared.
+    """
+
+    def _merge(self, l_start: int, l_end: int, r_start: int, r_end: int):
+        lbuf, rbuf = self.buffers
+        lkeys, rkeys = self.keys
+
+        if l_start == l_end:
+            return rbuf[r_start:r_end]
+
+        if r_start == r_end:
+            return lbuf[l_start:l_end]
+
+        keys = lkeys[l_start:l_end] + rkeys[r_start:r_end]
+        elements = lbuf[l_start:l_end] + rbuf[r_start:r_end]
+
+        # a stable sort of two sorted runs is a linear merge that keeps left elements first
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return list(map(elements.__getitem__, order))
+
+    def _step(self):
+        lbuf, rbuf = self.buffers
+        l_completed, r_completed = self.completed
+
+        if lbuf is not None and rbuf is not None:
+            lkeys, rkeys = self.keys
+            lo, ro = self.offsets
+
+            if not rkeys[-1] < lkeys[-1]:
+                # right elements with a key equal to the last left key are emitted afterwards
+                r_end = bisect_left(rkeys, lkeys[-1], ro)
+                elements = self._merge(lo, len(lbuf), ro, r_end)
+
+                self._clear_slot(self.LEFT)
+
+                if r_end == len(rbuf):
+                    self._clear_slot(self.RIGHT)
+                    cleared = (self.LEFT, self.RIGHT)
+                else:
+                    self.offsets[self.RIGHT] = r_end
+                    cleared = (self.LEFT,)
+
+            else:
+                l_end = bisect_right(lkeys, rkeys[-1], lo)
+                elements = self._merge(lo, l_end, ro, len(rbuf))
+
+                self._clear_slot(self.RIGHT)
+                self.offsets[self.LEFT] = l_end
+                cleared = (self.RIGHT,)
+
+            return elements, cleared, False
+
+        # the other source completed, the remaining elements can be sent as they are
+        if lbuf is not None and r_completed:
+            elements = lbuf[self.offsets[self.LEFT]:]
+            self._clear_slot(self.LEFT)
+            return elements, (self.LEFT,), l_completed
+
+        if rbuf is not None and l_completed:
+            elements = rbuf[self.offsets[self.RIGHT]:]
+            self._clear_slot(self.RIGHT)
+            return elements, (self.RIGHT,), r_completed
+
+        if lbuf is None and rbuf is None and l_completed and r_completed:
+            return [], (), True
+
+        return None
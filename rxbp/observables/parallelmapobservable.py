@@ -0,0 +1,43 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.parallelmapobserver import ParallelMapObserver
+from rxbp.scheduler import Scheduler
+from rxbp.schedulers.processpoolscheduler import ProcessPoolScheduler
+
+
+@dataclass
+class ParallelMapObservable(Observable):
+    source: Observable
+    func: Callable[[Any], Any]
+    scheduler: Scheduler
+    max_workers: Optional[int]
+    ordered: bool
+
+    def observe(self, observer_info: ObserverInfo):
+        if isinstance(self.scheduler, ProcessPoolScheduler):
+            # reuse the worker processes of the scheduler
+            executor = self.scheduler.executor
+            max_in_flight = self.max_workers or self.scheduler.max_workers
+            shutdown_executor = False
+
+        else:
+            max_in_flight = self.max_workers or os.cpu_count() or 1
+            executor = ProcessPoolExecutor(max_workers=max_in_flight)
+            shutdown_executor = True
+
+        return self.source.observe(observer_info.copy(
+            observer=ParallelMapObserver(
+                observer=observer_info.observer,
+                func=self.func,
+                executor=executor,
+                scheduler=self.scheduler,
+                max_in_flight=max_in_flight,
+                ordered=self.ordered,
+                shutdown_executor=shutdown_executor,
+            ),
+        ))
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.internal.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.rebatchobserver import RebatchObserver
+from rxbp.scheduler import Scheduler
+
+
+@dataclass
+class RebatchObservable(Observable):
+    source: Observable
+    batch_size: Optional[int]
+    target_latency: Optional[float]
+    timespan: Optional[float]
+    scheduler: Scheduler
+
+    def observe(self, observer_info: ObserverInfo):
+        if self.target_latency is not None:
+            adaptive_batch_size = AdaptiveBatchSize(
+                target_latency=self.target_latency,
+                initial_size=self.batch_size,
+            )
+        else:
+            adaptive_batch_size = None
+
+        return self.source.observe(observer_info.copy(
+            observer=RebatchObserver(
+                observer=observer_info.observer,
+                batch_size=self.batch_size,
+                adaptive_batch_size=adaptive_batch_size,
+                timespan=self.timespan,
+                scheduler=self.scheduler,
+            ),
+        ))
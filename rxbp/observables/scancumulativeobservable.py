@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.scancumulativeobserver import ScanCumulativeObserver
+
+
+@dataclass
+class ScanCumulativeObservable(Observable):
+    source: Observable
+    func: Callable[[Any, Any], Any]
+    initial: Any
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=ScanCumulativeObserver(
+                observer=observer_info.observer,
+                func=self.func,
+                initial=self.initial,
+            ),
+        ))
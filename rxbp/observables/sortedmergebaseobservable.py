@@ -0,0 +1,265 @@
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Any, List, Optional, Tuple
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import stop_ack, StopAck
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.typing import ElementType
+
+
+@dataclass
+class SortedMergeBaseObservable(Observable, ABC):
+    """ Base class of observables combining a left and a right source whose elements are sorted by
+    some key.
+
+    Each received batch is kept in the slot of its source together with the keys of its elements
+    and the offset of the first element not processed yet. A source stays back-pressured until
+    its slot has been processed by `_step` completely. Only one thread at a time calls `_step` and
+    sends the resulting elements downstream.
+    """
+
+    left: Observable
+    right: Observable
+    key: Optional[Callable[[Any], Any]]
+
+    LEFT = 0
+    RIGHT = 1
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+
+        self.observer: Optional[Observer] = None
+
+        # one slot per source, the left source is at index 0, the right source at index 1
+        self.buffers: List[Optional[List]] = [None, None]
+        self.keys: List[Optional[List]] = [None, None]
+        self.offsets = [0, 0]
+        self.acks: List[Optional[AckSubject]] = [None, None]
+        self.completed = [False, False]
+
+        # True while `_step` is called or the downstream acknowledgment is pending
+        self.is_emitting = False
+        self.is_stopped = False
+
+        self.resume_single = SortedMergeBaseObservable.ResumeSingle(source=self)
+
+    @abstractmethod
+    def _step(self) -> Optional[Tuple[List, Tuple[int, ...], bool]]:
+        """ computes the next batch to be sent downstream; called while holding the lock
+
+        :return: None if more elements are needed; otherwise, the elements to be sent, the
+        indices of the slots that got cleared, and True if the observer should be completed
+        """
+
+        ...
+
+    def _clear_slot(self, idx: int):
+        self.buffers[idx] = None
+        self.keys[idx] = None
+        self.offsets[idx] = 0
+
+    class ResumeSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'SortedMergeBaseObservable'):
+            self.source = source
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, ContinueAck):
+                self.source._drain(caller_idx=None)
+            else:
+                self.source._stop()
+
+        def on_error(self, exc: Exception):
+            raise NotImplementedError
+
+    def _stop(self):
+        with self.lock:
+            self.is_stopped = True
+            upstream_acks = [ack for ack in self.acks if ack is not None]
+            self.acks = [None, None]
+
+        for ack in upstream_acks:
+            ack.on_next(stop_ack)
+
+    def _drain(self, caller_idx: Optional[int]) -> Optional[Ack]:
+        """ sends elements downstream until more elements are needed or the downstream returns
+        an asynchronous acknowledgment
+
+        :param caller_idx: index of the source calling `on_next`, None otherwise
+        :return: the acknowledgment returned to the source calling `on_next`
+        """
+
+        caller_ack = None
+
+        while True:
+            with self.lock:
+                if self.is_stopped:
+                    self.is_emitting = False
+                    return stop_ack
+
+                step = self._step()
+
+                if step is None:
+                    self.is_emitting = False
+
+                    # the source calling `on_next` is back-pressured until its slot is processed
+                    if caller_idx is not None and caller_ack is None:
+                        caller_ack = AckSubject()
+                        self.acks[caller_idx] = caller_ack
+
+                    return caller_ack
+
+                elements, cleared, is_completed = step
+
+                is_caller_cleared = False
+                upstream_acks = []
+
+                for idx in cleared:
+                    if idx == caller_idx and caller_ack is None:
+                        is_caller_cleared = True
+                    else:
+                        upstream_ack = self.acks[idx]
+                        self.acks[idx] = None
+
+                        if upstream_ack is not None:
+                            upstream_acks.append(upstream_ack)
+
+                if is_completed:
+                    self.is_stopped = True
+                    upstream_acks += [ack for ack in self.acks if ack is not None]
+                    self.acks = [None, None]
+
+            if elements:
+                ack = self.observer.on_next(elements)
+            else:
+                ack = continue_ack
+
+            if is_completed:
+                self.observer.on_completed()
+
+                for upstream_ack in upstream_acks:
+                    upstream_ack.on_next(stop_ack)
+
+                return stop_ack
+
+            if isinstance(ack, StopAck):
+                for upstream_ack in upstream_acks:
+                    upstream_ack.on_next(stop_ack)
+
+                self._stop()
+                return stop_ack
+
+            elif isinstance(ack, ContinueAck):
+                for upstream_ack in upstream_acks:
+                    upstream_ack.on_next(continue_ack)
+
+                if is_caller_cleared:
+                    caller_ack = continue_ack
+
+            # resume once the downstream acknowledged the elements
+            else:
+                for upstream_ack in upstream_acks:
+                    ack.subscribe(upstream_ack)
+
+                if is_caller_cleared:
+                    caller_ack = ack
+
+                elif caller_idx is not None and caller_ack is None:
+                    with self.lock:
+                        caller_ack = AckSubject()
+                        self.acks[caller_idx] = caller_ack
+
+                ack.subscribe(self.resume_single)
+                return caller_ack
+
+    def _on_next(self, idx: int, elem: ElementType) -> Ack:
+        if isinstance(elem, list):
+            buffer = elem
+        else:
+            buffer = list(elem)
+
+        # keys are extracted once per batch
+        if self.key is None:
+            keys = buffer
+        else:
+            try:
+                keys = list(map(self.key, buffer))
+            except Exception as exc:
+                self._on_error(exc)
+                return stop_ack
+
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            if not buffer:
+                return continue_ack
+
+            self.buffers[idx] = buffer
+            self.keys[idx] = keys
+            self.offsets[idx] = 0
+
+            if self.is_emitting:
+                upstream_ack = AckSubject()
+                self.acks[idx] = upstream_ack
+                return upstream_ack
+
+            self.is_emitting = True
+
+        return self._drain(caller_idx=idx)
+
+    def _on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+        self._stop()
+        self.observer.on_error(exc)
+
+    def _on_completed(self, idx: int):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.completed[idx] = True
+
+            # the completion is processed once the pending elements are sent
+            if self.is_emitting:
+                return
+
+            self.is_emitting = True
+
+        self._drain(caller_idx=None)
+
+    def observe(self, observer_info: ObserverInfo):
+        self.observer = observer_info.observer
+
+        source = self
+
+        class SortedMergeInnerObserver(Observer):
+            def __init__(self, idx: int):
+                self.idx = idx
+
+            def on_next(self, elem: ElementType) -> Ack:
+                return source._on_next(self.idx, elem)
+
+            def on_error(self, exc: Exception):
+                source._on_error(exc)
+
+            def on_completed(self):
+                source._on_completed(self.idx)
+
+        d1 = self.left.observe(observer_info.copy(observer=SortedMergeInnerObserver(idx=self.LEFT)))
+        d2 = self.right.observe(observer_info.copy(observer=SortedMergeInnerObserver(idx=self.RIGHT)))
+
+        return CompositeDisposable(d1, d2)
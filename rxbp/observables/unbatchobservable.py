@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.unbatchobserver import UnbatchObserver
+
+
+@dataclass
+class UnbatchObservable(Observable):
+    source: Observable
+    batch_size: int
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=UnbatchObserver(
+                observer=observer_info.observer,
+                batch_size=self.batch_size,
+            ),
+        ))
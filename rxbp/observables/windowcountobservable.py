@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+import rx
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.windowcountobserver import WindowCountObserver
+
+
+@dataclass
+class WindowCountObservable(Observable):
+    source: Observable
+    n: int
+    step: int
+    accumulator_factory: Optional[Callable[[], Any]]
+    value_selector: Optional[Callable[[Any], Any]]
+
+    def observe(self, observer_info: ObserverInfo) -> rx.typing.Disposable:
+        return self.source.observe(observer_info.copy(
+            observer=WindowCountObserver(
+                next_observer=observer_info.observer,
+                n=self.n,
+                step=self.step,
+                accumulator_factory=self.accumulator_factory,
+                value_selector=self.value_selector,
+            ),
+        ))
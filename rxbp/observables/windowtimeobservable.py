@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+import rx
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.windowtimeobserver import WindowTimeObserver
+from rxbp.scheduler import Scheduler
+
+
+@dataclass
+class WindowTimeObservable(Observable):
+    source: Observable
+    span: float
+    step: float
+    timestamp: Optional[Callable[[Any], float]]
+    accumulator_factory: Optional[Callable[[], Any]]
+    value_selector: Optional[Callable[[Any], Any]]
+    scheduler: Scheduler
+
+    def observe(self, observer_info: ObserverInfo) -> rx.typing.Disposable:
+        return self.source.observe(observer_info.copy(
+            observer=WindowTimeObserver(
+                next_observer=observer_info.observer,
+                span=self.span,
+                step=self.step,
+                timestamp=self.timestamp,
+                accumulator_factory=self.accumulator_factory,
+                scheduler=self.scheduler,
+                value_selector=self.value_selector,
+            ),
+        ))
@@ -0,0 +1,219 @@
+import threading
+from dataclasses import dataclass
+from traceback import FrameSummary
+from typing import List, Optional
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack, StopAck
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.typing import ElementType
+from rxbp.utils.tooperatorexception import to_operator_exception
+
+
+@dataclass
+class ZipNObservable(Observable):
+    """ Zips the elements of an arbitrary number of observables into flat tuples.
+
+    The observable keeps one slot per source containing the received batch and the offset
+    of the first element that has not been zipped yet. A source is back-pressured until
+    all other sources sent a batch. Once all slots are filled, the aligned elements of all
+    slots are zipped at once, and a new batch is requested from the sources whose slot got
+    exhausted.
+    """
+
+    sources: List[Observable]
+    stack: Optional[List[FrameSummary]] = None
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+
+        self.observer: Optional[Observer] = None
+
+        n_sources = len(self.sources)
+
+        # one slot per source
+        self.buffers: List[Optional[List]] = [None] * n_sources
+        self.offsets: List[int] = [0] * n_sources
+        self.acks: List[Optional[AckSubject]] = [None] * n_sources
+        self.completed: List[bool] = [False] * n_sources
+
+        # number of slots without elements
+        self.n_waiting = n_sources
+
+        self.is_stopped = False
+
+    def _on_next(self, idx: int, elem: ElementType) -> Ack:
+        if isinstance(elem, list):
+            buffer = elem
+        else:
+            try:
+                buffer = list(elem)
+            except Exception as exc:
+                self._on_error(Exception(to_operator_exception(
+                    message=f'zip failed to materialize a batch of source {idx}: {exc!r}',
+                    stack=self.stack,
+                )))
+                return stop_ack
+
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            # request a new batch from the source
+            if not buffer:
+                return continue_ack
+
+            self.buffers[idx] = buffer
+            self.offsets[idx] = 0
+            self.n_waiting -= 1
+
+            # wait on other sources
+            if self.n_waiting:
+                upstream_ack = AckSubject()
+                self.acks[idx] = upstream_ack
+                return upstream_ack
+
+        # at this point, all sources are back-pressured; therefore, the slots do not
+        # change until they are updated below
+        n_zipped = min(len(buffer) - offset for buffer, offset in zip(self.buffers, self.offsets))
+
+        def gen_columns():
+            for buffer, offset in zip(self.buffers, self.offsets):
+                if offset == 0 and n_zipped == len(buffer):
+                    yield buffer
+                else:
+                    yield buffer[offset:offset + n_zipped]
+
+        zipped_elements = list(zip(*gen_columns()))
+
+        downstream_ack = self.observer.on_next(zipped_elements)
+
+        with self.lock:
+            # the observable got stopped by an error while zipping
+            if self.is_stopped:
+                return stop_ack
+
+            if isinstance(downstream_ack, StopAck):
+                self.is_stopped = True
+
+            # sources whose slot got exhausted
+            requested = []
+
+            for slot_idx, buffer in enumerate(self.buffers):
+                offset = self.offsets[slot_idx] + n_zipped
+
+                if offset == len(buffer):
+                    requested.append(slot_idx)
+                    self.buffers[slot_idx] = None
+                    self.offsets[slot_idx] = 0
+                    self.n_waiting += 1
+
+                    if self.completed[slot_idx]:
+                        self.is_stopped = True
+
+                else:
+                    self.offsets[slot_idx] = offset
+
+            if self.is_stopped:
+                other_upstream_acks = [ack for ack in self.acks if ack is not None]
+                self.acks = [None] * len(self.acks)
+
+            else:
+                other_upstream_acks = []
+
+                for slot_idx in requested:
+                    upstream_ack = self.acks[slot_idx]
+
+                    if upstream_ack is not None:
+                        other_upstream_acks.append(upstream_ack)
+                        self.acks[slot_idx] = None
+
+                # the source that sent the last batch is back-pressured until
+                # its elements are zipped
+                if self.buffers[idx] is not None:
+                    upstream_ack = AckSubject()
+                    self.acks[idx] = upstream_ack
+
+                else:
+                    upstream_ack = downstream_ack
+
+            is_stopped = self.is_stopped
+
+        if is_stopped:
+            if not isinstance(downstream_ack, StopAck):
+                self.observer.on_completed()
+
+            for ack in other_upstream_acks:
+                ack.on_next(stop_ack)
+
+            return stop_ack
+
+        for ack in other_upstream_acks:
+            downstream_ack.subscribe(ack)
+
+        return upstream_ack
+
+    def _on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.is_stopped = True
+            upstream_acks = [ack for ack in self.acks if ack is not None]
+            self.acks = [None] * len(self.acks)
+
+        self.observer.on_error(exc)
+
+        for ack in upstream_acks:
+            ack.on_next(stop_ack)
+
+    def _on_completed(self, idx: int):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.completed[idx] = True
+
+            # the remaining elements of the source still get zipped
+            if self.buffers[idx] is not None:
+                return
+
+            self.is_stopped = True
+            upstream_acks = [ack for ack in self.acks if ack is not None]
+            self.acks = [None] * len(self.acks)
+
+        self.observer.on_completed()
+
+        for ack in upstream_acks:
+            ack.on_next(stop_ack)
+
+    def observe(self, observer_info: ObserverInfo):
+        self.observer = observer_info.observer
+
+        source = self
+
+        class ZipNInnerObserver(Observer):
+            def __init__(self, idx: int):
+                self.idx = idx
+
+            def on_next(self, elem: ElementType) -> Ack:
+                return source._on_next(self.idx, elem)
+
+            def on_error(self, exc: Exception):
+                source._on_error(exc)
+
+            def on_completed(self):
+                source._on_completed(self.idx)
+
+        disposables = [
+            observable.observe(observer_info.copy(observer=ZipNInnerObserver(idx=idx)))
+            for idx, observable in enumerate(self.sources)
+        ]
+
+        return CompositeDisposable(*disposables)
@@ -1,4 +1,3 @@
-import itertools
 import threading
 from traceback import FrameSummary
 from typing import Callable, Any, Optional, List
@@ -12,10 +11,8 @@ from rxbp.acknowledgement.stopack import stop_ack, StopAck
 from rxbp.observable import Observable
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
-from rxbp.states.measuredstates.terminationstates import TerminationStates
-from rxbp.states.measuredstates.zipstates import ZipStates
-from rxbp.states.rawstates.rawterminationstates import RawTerminationStates
-from rxbp.states.rawstates.rawzipstates import RawZipStates
+from rxbp.states.intstates.intterminationstate import IntTerminationState
+from rxbp.states.intstates.intzipstate import IntZipState
 from rxbp.typing import ElementType
 from rxbp.utils.tooperatorexception import to_operator_exception
 
@@ -69,87 +66,101 @@ class ZipObservable(Observable):
 
         # Zip2Observable states
         self.observer: Optional[Observer] = None
-        self.termination_state = RawTerminationStates.InitState()
-        self.state: RawZipStates.ZipState = RawZipStates.WaitOnLeftRight()
+        self.termination_state = IntTerminationState()
+        self.state = IntZipState()
 
     def _iterate_over_batch(self, elem: ElementType, is_left: bool):
         """
         this function is called on `on_next` call from left or right observable
         """
 
-        # if elem is a list, make an iterator out of it
-        iterable = iter(elem)
-
-        # in case the zip process is started and the output observer returns a synchronous acknowledgment,
-        # then `upstream_ack` is not actually needed; nevertheless, it is created here, because it makes
-        # the code simpler
-        upstream_ack = AckSubject()
+        # the received batch is kept as a list; the elements not zipped yet are
+        # referenced by an offset into the list
+        if isinstance(elem, list):
+            buffer = elem
+        else:
+            try:
+                buffer = list(elem)
+            except Exception:
+                raise Exception(to_operator_exception(
+                    message='',
+                    stack=self.stack,
+                ))
 
-        # prepare next raw state
-        next_state = RawZipStates.ElementReceived(
-            is_left=is_left,
-            ack=upstream_ack,
-            iter=iterable,
-        )
+        state = self.state
 
         # synchronous update the state
         with self.lock:
-            next_state.prev_raw_state = self.state
-            next_state.prev_raw_termination_state = self.termination_state
-            self.state = next_state
+            prev_state = state.measure(self.termination_state)
 
-        meas_state = next_state.get_measured_state(next_state.prev_raw_termination_state)
+            # pattern match measured state
+            if prev_state == IntZipState.STOPPED:
+                return stop_ack
 
-        # pattern match measured state
-        if isinstance(meas_state, ZipStates.Stopped):
-            return stop_ack
+            # request a new batch from the source
+            elif not buffer:
+                return continue_ack
 
-        # wait on other observable
-        elif isinstance(meas_state, ZipStates.WaitOnRight) or isinstance(meas_state, ZipStates.WaitOnLeft):
-            return upstream_ack
+            # wait on other observable
+            elif prev_state == IntZipState.WAIT_ON_LEFT_RIGHT:
+
+                # the upstream acknowledgment is only created if the source needs to wait
+                upstream_ack = AckSubject()
+
+                if is_left:
+                    state.value = IntZipState.WAIT_ON_RIGHT
+                    state.left_buffer = buffer
+                    state.left_offset = 0
+                    state.left_ack = upstream_ack
+                else:
+                    state.value = IntZipState.WAIT_ON_LEFT
+                    state.right_buffer = buffer
+                    state.right_offset = 0
+                    state.right_ack = upstream_ack
+
+                return upstream_ack
+
+            # start zipping operation
+            elif prev_state == IntZipState.WAIT_ON_LEFT:
+                left_buffer = buffer
+                left_offset = 0
+                right_buffer = state.right_buffer
+                right_offset = state.right_offset
+                other_upstream_ack = state.right_ack
+
+            elif prev_state == IntZipState.WAIT_ON_RIGHT:
+                left_buffer = state.left_buffer
+                left_offset = state.left_offset
+                right_buffer = buffer
+                right_offset = 0
+                other_upstream_ack = state.left_ack
 
-        # start zipping operation
-        elif isinstance(meas_state, ZipStates.ZipElements):
-            if is_left:
-                other_upstream_ack = meas_state.right_ack
             else:
-                other_upstream_ack = meas_state.left_ack
+                raise Exception(f'unknown state "{prev_state}", is_left {is_left}')
+
+            state.value = IntZipState.ZIP_ELEMENTS
+            state.left_buffer = None
+            state.right_buffer = None
+            state.left_ack = None
+            state.right_ack = None
+
+        # zip the aligned prefix of the left and right batch in one step
+        n_left = len(left_buffer) - left_offset
+        n_right = len(right_buffer) - right_offset
+        n_zipped = min(n_left, n_right)
+
+        if 0 < n_zipped:
+            if n_zipped == len(left_buffer):
+                left_elements = left_buffer
+            else:
+                left_elements = left_buffer[left_offset:left_offset + n_zipped]
 
-        else:
-            raise Exception(f'unknown state "{meas_state}", is_left {is_left}')
-
-        # in case left and right batch don't match in number of elements,
-        # n1 will not be None after zipping
-        n1 = [None]
-
-        def gen_zipped_elements():
-            """ generate a sequence of zipped elements """
-            while True:
-                n1[0] = None
-                try:
-                    n1[0] = next(meas_state.left_iter)
-                    n2 = next(meas_state.right_iter)
-                except StopIteration:
-                    break
-
-                # yield self.selector(n1[0], n2)
-                yield (n1[0], n2)
-
-        try:
-            # zip left and right batch
-            zipped_elements = list(gen_zipped_elements())
-
-        except Exception as exc:
-            # self.observer.on_error(exc)
-            other_upstream_ack.on_next(stop_ack)
-            # return stop_ack
-            raise Exception(to_operator_exception(
-                message='',
-                stack=self.stack,
-            ))
-
-        if 0 < len(zipped_elements):
-            downstream_ack = self.observer.on_next(zipped_elements)
+            if n_zipped == len(right_buffer):
+                right_elements = right_buffer
+            else:
+                right_elements = right_buffer[right_offset:right_offset + n_zipped]
+
+            downstream_ack = self.observer.on_next(list(zip(left_elements, right_elements)))
         else:
             downstream_ack = continue_ack
 
@@ -157,74 +168,50 @@ class ZipObservable(Observable):
             other_upstream_ack.on_next(stop_ack)
             return stop_ack
 
-        # request new element from left source
-        if n1[0] is None:
-            new_left_iter = None
-            request_new_elem_from_left = True
-
-            # request new element also from right source?
-            try:
-                val = next(meas_state.right_iter)
-                new_right_iter = itertools.chain([val], meas_state.right_iter)
-                request_new_elem_from_right = False
-
-            # request new element from left and right source
-            except StopIteration:
-                new_right_iter = None
-                request_new_elem_from_right = True
+        # request new element from a source whose batch is completely zipped
+        request_new_elem_from_left = n_left == n_zipped
+        request_new_elem_from_right = n_right == n_zipped
 
-        # request new element only from right source
+        # the source whose elements are not completely zipped is back-pressured
+        if request_new_elem_from_left and request_new_elem_from_right:
+            upstream_ack = None
+        elif request_new_elem_from_right == is_left:
+            upstream_ack = AckSubject()
         else:
-            new_left_iter = itertools.chain(n1, meas_state.left_iter)
-            new_right_iter = None
-
-            request_new_elem_from_left = False
-            request_new_elem_from_right = True
+            upstream_ack = other_upstream_ack
 
         # define next state after zipping
         # -------------------------------
 
-        # request new element from both sources
-        if request_new_elem_from_left and request_new_elem_from_right:
-            next_state = RawZipStates.WaitOnLeftRight()
-
-        # request new element only from right source
-        elif request_new_elem_from_right:
-
-            next_state = RawZipStates.WaitOnRight(
-                left_iter=new_left_iter,
-                left_ack=meas_state.left_ack,
-            )
-
-        # request new element only from left source
-        elif request_new_elem_from_left:
-
-            next_state = RawZipStates.WaitOnLeft(
-                right_iter=new_right_iter,
-                right_ack=meas_state.right_ack,
-            )
+        with self.lock:
 
-        else:
-            raise Exception('after the zip operation, a new element needs '
-                            'to be requested from at least one source')
+            # request new element from both sources
+            if request_new_elem_from_left and request_new_elem_from_right:
+                state.value = IntZipState.WAIT_ON_LEFT_RIGHT
 
-        with self.lock:
-            # get termination state
-            raw_prev_termination_state = self.termination_state
+            # request new element only from right source
+            elif request_new_elem_from_right:
+                state.value = IntZipState.WAIT_ON_RIGHT
+                state.left_buffer = left_buffer
+                state.left_offset = left_offset + n_zipped
+                state.left_ack = upstream_ack
 
-            # set next state
-            self.state = next_state
+            # request new element only from left source
+            else:
+                state.value = IntZipState.WAIT_ON_LEFT
+                state.right_buffer = right_buffer
+                state.right_offset = right_offset + n_zipped
+                state.right_ack = upstream_ack
 
-        meas_state = next_state.get_measured_state(raw_prev_termination_state)
+            meas_state = state.measure(self.termination_state)
+            termination_exc = self.termination_state.exc
 
         # stop zip observable
         # previous state cannot be "Stopped", therefore don't check previous state
-        if isinstance(meas_state, ZipStates.Stopped):
-
-            prev_termination_state = raw_prev_termination_state.get_measured_state()
+        if meas_state == IntZipState.STOPPED:
 
-            if isinstance(prev_termination_state, TerminationStates.ErrorState):
-                self.observer.on_error(prev_termination_state.ex)
+            if termination_exc is not None:
+                self.observer.on_error(termination_exc)
                 other_upstream_ack.on_next(stop_ack)
                 return stop_ack
 
@@ -267,7 +254,8 @@ class ZipObservable(Observable):
 
     def _signal_on_complete_or_on_error(
             self,
-            state: ZipStates.ZipState,
+            state: int,
+            other_upstream_ack: Optional[AckSubject],
             exc: Exception = None,
     ):
         """
@@ -275,14 +263,8 @@ class ZipObservable(Observable):
         """
 
         # stop active acknowledgments
-        if isinstance(state, ZipStates.WaitOnLeftRight):
-            pass
-        elif isinstance(state, ZipStates.WaitOnLeft):
-            state.right_ack.on_next(stop_ack)
-        elif isinstance(state, ZipStates.WaitOnRight):
-            state.left_ack.on_next(stop_ack)
-        else:
-            pass
+        if state == IntZipState.WAIT_ON_LEFT or state == IntZipState.WAIT_ON_RIGHT:
+            other_upstream_ack.on_next(stop_ack)
 
         # terminate observer
         if exc:
@@ -292,37 +274,45 @@ class ZipObservable(Observable):
 
     def _on_error_or_complete(
             self,
-            next_final_state: RawTerminationStates.TerminationState,
+            is_left: bool,
             exc: Exception = None,
     ):
+        state = self.state
+        termination_state = self.termination_state
+
         with self.lock:
-            raw_prev_final_state = self.termination_state
-            raw_prev_state = self.state
-            next_final_state.raw_prev_state = raw_prev_final_state
-            self.termination_state = next_final_state
+            prev_state = state.measure(termination_state)
 
-        prev_state = raw_prev_state.get_measured_state(raw_prev_final_state)
-        curr_state = raw_prev_state.get_measured_state(next_final_state)
+            if is_left:
+                termination_state.on_completed_left()
+            else:
+                termination_state.on_completed_right()
 
-        if not isinstance(prev_state, ZipStates.Stopped) \
-                and isinstance(curr_state, ZipStates.Stopped):
-            self._signal_on_complete_or_on_error(prev_state, exc=exc)
+            curr_state = state.measure(termination_state)
+
+            if prev_state == IntZipState.WAIT_ON_LEFT:
+                other_upstream_ack = state.right_ack
+            elif prev_state == IntZipState.WAIT_ON_RIGHT:
+                other_upstream_ack = state.left_ack
+            else:
+                other_upstream_ack = None
+
+        if prev_state != IntZipState.STOPPED and curr_state == IntZipState.STOPPED:
+            self._signal_on_complete_or_on_error(
+                state=prev_state,
+                other_upstream_ack=other_upstream_ack,
+                exc=exc,
+            )
 
     def _on_error(self, exc: Exception):
-        # next_final_state = RawTerminationStates.ErrorState(exc=exc)
-        #
-        # self._on_error_or_complete(next_final_state=next_final_state, exc=exc)
+        # the exception is forwarded immediately without updating the termination state
         self.observer.on_error(exc)
 
     def _on_completed_left(self):
-        next_final_state = RawTerminationStates.LeftCompletedState()
-
-        self._on_error_or_complete(next_final_state=next_final_state)
+        self._on_error_or_complete(is_left=True)
 
     def _on_completed_right(self):
-        next_final_state = RawTerminationStates.RightCompletedState()
-
-        self._on_error_or_complete(next_final_state=next_final_state)
+        self._on_error_or_complete(is_left=False)
 
     def observe(self, observer_info: ObserverInfo):
         self.observer = observer_info.observer
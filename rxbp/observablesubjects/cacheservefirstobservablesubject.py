@@ -9,29 +9,36 @@ from rx.core.notification import OnNext, OnCompleted, OnError, Notification
 from rx.disposable import Disposable, SingleAssignmentDisposable
 
 from rxbp.acknowledgement.acksubject import AckSubject
-from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.continueack import continue_ack
 from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.operators.observeon import _observe_on
 from rxbp.acknowledgement.single import Single
-from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.internal.ringbuffer import RingBuffer
 from rxbp.mixins.executionmodelmixin import ExecutionModelMixin
 from rxbp.observablesubjects.observablesubjectbase import ObservableSubjectBase
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
 from rxbp.scheduler import Scheduler
 from rxbp.typing import ElementType
+from rxbp.utils.isarraybatch import is_array_batch
 
 
 @dataclass
 class CacheServeFirstObservableSubject(ObservableSubjectBase):
     """ A observable Subject that does not back-pressure on a `on_next` call
     and buffers the last elements according to the slowest subscriber.
+
+    If `buffer_size` is given, the Subject back-pressures on a `on_next` call
+    once the buffer contains `buffer_size` batches. The limit counts batches
+    regardless of their size, it does not bound the memory used by the buffer.
     """
     scheduler: Scheduler
+    buffer_size: Optional[int] = None
 
     def __post_init__(self):
         # mutable state
-        self.shared_state = self.SharedState()
+        self.shared_state = self.SharedState(buffer_size=self.buffer_size)
 
         self.lock = threading.RLock()
 
@@ -40,13 +47,19 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
         that has not yet been sent to all subscribers
         """
 
-        def __init__(self):
+        def __init__(self, buffer_size: Optional[int] = None):
 
             self.state = CacheServeFirstObservableSubject.NormalState()
 
             # notification buffer
             self.first_idx = -1
-            self.queue: List[Notification] = []
+            self.queue = RingBuffer()
+
+            # back-pressure the source if the buffer reaches this size
+            self.buffer_size = buffer_size
+
+            # ack returned to the source when it got back-pressured due to a full buffer
+            self.buffer_full_ack: Optional[AckSubject] = None
 
             # contains inner subscriptions that are currently inactive, e.g. they sent
             # all elements in the buffer
@@ -55,6 +68,11 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
             # used for deque the buffer
             self.current_index: Dict['CacheServeFirstObservableSubject.InnerSubscription', int] = {}
 
+            # number of subscriptions per index and the smallest index of any subscription;
+            # this avoids computing the minimum over all subscriptions for each element
+            self.index_counter: Dict[int, int] = {}
+            self.min_index: Optional[int] = None
+
             self.subscriptions: List['CacheServeFirstObservableSubject.InnerSubscription'] = []
 
             # the inner subscription reaching the end of the buffer requests a new element
@@ -70,21 +88,64 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
             if subscription in self.inactive_subscriptions:
                 self.inactive_subscriptions.remove(subscription)
             self.subscriptions.remove(subscription)
+            self.remove_index(subscription)
+
+        def set_index(self, subscription, index: int):
+            prev_index = self.current_index.get(subscription)
+            self.current_index[subscription] = index
+
+            self.index_counter[index] = self.index_counter.get(index, 0) + 1
+
+            if self.min_index is None or index < self.min_index:
+                self.min_index = index
+
+            if prev_index is not None:
+                self._decrement_index(prev_index)
+
+        def remove_index(self, subscription):
+            if self.current_index is None or subscription not in self.current_index:
+                return
+
+            index = self.current_index.pop(subscription)
+            self._decrement_index(index)
+
+        def _decrement_index(self, index: int):
+            counter = self.index_counter[index] - 1
+
+            if 0 < counter:
+                self.index_counter[index] = counter
+                return
+
+            del self.index_counter[index]
+
+            if not self.index_counter:
+                self.min_index = None
+
+            elif index == self.min_index:
+                # the minimum index only increases, therefore each index is skipped at most once
+                min_index = index + 1
+                while min_index not in self.index_counter:
+                    min_index += 1
+                self.min_index = min_index
 
         def dispose(self):
 
             self.queue = None
             self.inactive_subscriptions = None
             self.current_index = None
+            self.index_counter = None
             self.current_ack = None
+            self.buffer_full_ack = None
 
             self.add_inner_subscription = types.MethodType(lambda _: None, self)
             self.on_next = types.MethodType(lambda _, __: ([], 0), self)
             self.on_completed = types.MethodType(lambda: [], self)
             self.on_error = types.MethodType(lambda _: [], self)
             self.get_element_for = types.MethodType(lambda _, __, ___: (False, None), self)
-            self.should_dequeue = types.MethodType(lambda _: False, self)
-            self.dequeue = types.MethodType(lambda: None, self)
+            self.set_index = types.MethodType(lambda _, __, ___: None, self)
+            self.remove_index = types.MethodType(lambda _, __: None, self)
+            self.should_dequeue = types.MethodType(lambda _, __: False, self)
+            self.dequeue = types.MethodType(lambda _: None, self)
 
         def get_element_for(
                 self,
@@ -139,20 +200,42 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
 
             return inactive_subscriptions
 
-        def should_dequeue(self, index: int):
-            if not self.current_index:
+        def is_buffer_full(self) -> bool:
+            """ returns True if the source needs to be back-pressured until the slowest
+            subscriber catches up
+            """
+
+            # the buffer is removed once the subject is disposed
+            if self.buffer_size is None or self.min_index is None or self.queue is None:
                 return False
 
-            result = index <= min(self.current_index.values())
-            return result
+            return self.buffer_size <= len(self.queue)
 
-        def dequeue(self):
-            try:
-                self.queue.pop(0)
-                self.first_idx += 1
+        def should_dequeue(self, index: int = None):
+            """ returns True if there are elements in the buffer that have been sent to all subscribers
+            """
+
+            if self.min_index is None:
+                return False
 
-            except:
-                pass
+            return self.first_idx < self.min_index and 0 < len(self.queue)
+
+        def dequeue(self) -> Optional[AckSubject]:
+            """ remove all elements from the buffer that have been sent to all subscribers, and
+            return the acknowledgment of a back-pressured source if the buffer is no longer full
+            """
+
+            if self.min_index is not None:
+                while self.first_idx < self.min_index and 0 < len(self.queue):
+                    self.queue.popleft()
+                    self.first_idx += 1
+
+            if self.buffer_full_ack is not None and not self.is_buffer_full():
+                ack = self.buffer_full_ack
+                self.buffer_full_ack = None
+                return ack
+
+            return None
 
     class State(ABC):
         @abstractmethod
@@ -210,7 +293,7 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
 
             def on_next(self, ack: Ack):
                 # start fast_loop
-                if isinstance(ack, ContinueAck):
+                if ack is continue_ack:
                     with self.inner_subscription.lock:
                         has_elem, notification = self.inner_subscription.shared_state.get_element_for(
                             self.inner_subscription,
@@ -224,7 +307,7 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
                     else:
                         pass
 
-                elif isinstance(ack, StopAck):
+                elif ack is stop_ack:
                     self.inner_subscription.signal_stop()
 
                 else:
@@ -237,17 +320,17 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
             """ inner subscription gets only notified if all items from buffer are sent, and
             last ack received """
 
-            # state is written without lock, because current_index is only used for dequeueing
-            self.shared_state.current_index[self] = current_index
+            with self.lock:
+                self.shared_state.set_index(self, current_index)
 
             ack = self.observer.on_next(values)
 
-            if isinstance(ack, ContinueAck):
+            if ack is continue_ack:
                 # append right away again to inactive subscription list
                 self.shared_state.inactive_subscriptions.append(self)
                 return ack
 
-            elif isinstance(ack, StopAck):
+            elif ack is stop_ack:
                 self.signal_stop()
                 return ack
 
@@ -269,7 +352,11 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
 
         def signal_stop(self):
             with self.lock:
-                del self.shared_state.current_index[self]
+                self.shared_state.remove_index(self)
+                buffer_full_ack = self.shared_state.dequeue()
+
+            if buffer_full_ack is not None:
+                buffer_full_ack.on_next(continue_ack)
 
         def fast_loop(self, current_index: int, notification: Notification, sync_index: int):
 
@@ -277,12 +364,14 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
             while True:
 
                 current_index += 1
-                self.shared_state.current_index[self] = current_index
 
-                dequeue_buffer = self.shared_state.should_dequeue(current_index)
-                if dequeue_buffer:
-                    with self.lock:
-                        self.shared_state.dequeue()
+                with self.lock:
+                    self.shared_state.set_index(self, current_index)
+                    buffer_full_ack = self.shared_state.dequeue()
+
+                # release a source that got back-pressured due to a full buffer
+                if buffer_full_ack is not None:
+                    buffer_full_ack.on_next(continue_ack)
 
                 # try:
                 if isinstance(notification, OnCompleted):
@@ -291,12 +380,12 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
 
                 else:
                     # for mypy to type check correctly
-                    assert isinstance(notification.value, list)
+                    assert isinstance(notification.value, list) or is_array_batch(notification.value)
 
                     ack = self.observer.on_next(notification.value)
 
                 # synchronous or asynchronous acknowledgment
-                if isinstance(ack, ContinueAck):
+                if ack is continue_ack:
                     with self.lock:
                         has_elem, notification = self.shared_state.get_element_for(
                             self, current_index, ack)
@@ -317,7 +406,7 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
                     else:
                         break
 
-                elif isinstance(ack, StopAck):
+                elif ack is stop_ack:
                     self.signal_stop()
                     break
 
@@ -382,7 +471,7 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
     def on_next(self, elem: ElementType):
 
         # received elements need to be materialized before being multi-casted
-        if isinstance(elem, list):
+        if isinstance(elem, list) or is_array_batch(elem):
             materialized_values = elem
         else:
             try:
@@ -408,19 +497,21 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
 
         inner_ack_list = list(gen_inner_ack())
 
-        if all(isinstance(ack, StopAck) for ack in inner_ack_list):
+        if all(ack is stop_ack for ack in inner_ack_list):
             if len(inner_ack_list) == len(self.shared_state.subscriptions):
                 return stop_ack
 
-        dequeue_buffer = self.shared_state.should_dequeue(current_index)
-        if dequeue_buffer:
-            with self.lock:
-                self.shared_state.dequeue()
+        with self.lock:
+            self.shared_state.dequeue()
 
-        continue_acks = [ack for ack in inner_ack_list if isinstance(ack, ContinueAck)]
+            # back-pressure the source until the slowest subscriber catches up
+            if self.shared_state.is_buffer_full():
+                buffer_full_ack = AckSubject()
+                self.shared_state.buffer_full_ack = buffer_full_ack
+                return buffer_full_ack
 
         # return any Continue or Stop ack
-        if 0 < len(continue_acks):
+        if any(ack is continue_ack for ack in inner_ack_list):
             return continue_ack
 
         else:
@@ -0,0 +1,36 @@
+import time
+from dataclasses import dataclass
+
+from rxbp.internal.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+
+
+@dataclass
+class AdaptiveBatchObserver(Observer):
+    """ Measures the acknowledgment latency of each batch sent downstream and adapts
+    the batch size used by the source accordingly.
+    """
+
+    observer: Observer
+    batch_size: AdaptiveBatchSize
+
+    def on_next(self, elem: ElementType):
+        start_time = time.perf_counter()
+
+        ack = self.observer.on_next(elem)
+
+        if hasattr(elem, '__len__'):
+            n_elements = len(elem)
+        else:
+            n_elements = self.batch_size.batch_size
+
+        self.batch_size.measure(ack=ack, n_elements=n_elements, start_time=start_time)
+
+        return ack
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
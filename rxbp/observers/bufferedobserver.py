@@ -1,181 +1,225 @@
+import itertools
 import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Callable, List, Any
 
-from rxbp.acknowledgement.acksubject import AckSubject
-from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.acknowledgement.ack import Ack
-from rxbp.acknowledgement.operators.observeon import _observe_on
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack, ContinueAck
 from rxbp.acknowledgement.single import Single
-from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.acknowledgement.stopack import stop_ack, StopAck
 from rxbp.observer import Observer
 from rxbp.scheduler import Scheduler
-from rxbp.states.measuredstates.bufferedstates import BufferedStates
-from rxbp.states.rawstates.rawbufferedstates import RawBufferedStates
 from rxbp.typing import ElementType
 
 
 @dataclass
 class BufferedObserver(Observer):
+    """
+    Buffers the received batches and sends them to the underlying observer on
+    the scheduler. Buffered batches are sent as a single merged batch as soon as
+    the underlying observer acknowledges the previous one.
+
+    The size of the buffer counts the elements (or whatever `size_func` measures,
+    e.g. bytes) that are buffered or sent but not yet acknowledged by the underlying
+    observer. The upstream is back-pressured once the size exceeds the high watermark
+    `buffer_size` and is released once the size drops to the low watermark. Thereby,
+    the upstream is released in chunks instead of element by element.
+    """
+
     underlying: Observer
     scheduler: Scheduler
     subscribe_scheduler: Scheduler
+
+    # high watermark, a buffer size of None never back-pressures the upstream
     buffer_size: Optional[int]
 
+    # low watermark, defaults to half of the high watermark
+    low_watermark: Optional[int] = None
+
+    # maps a batch to its size, defaults to the number of elements
+    size_func: Callable[[List[Any]], int] = None
+
     def __post_init__(self):
         self.em = self.scheduler.get_execution_model()
 
+        if self.low_watermark is None and self.buffer_size is not None:
+            self.low_watermark = self.buffer_size // 2
+
+        if self.size_func is None:
+            self.size_func = len
+
         self.lock = threading.RLock()
 
-        self.state: RawBufferedStates.State = RawBufferedStates.InitialState(meas_state=None, last_ack=continue_ack)
-        self.queue = []
-        self.back_pressure = None
+        self.queue = deque()
 
-    def _start_loop(self, last_ack: Optional[Ack], next_index: int):
-        def schedule_ack(ack: Ack, next: ElementType):
-            outer_self = self
+        # size of the buffered batches and of the batch waiting on its acknowledgment
+        self.queued_size = 0
+        self.sent_size = 0
 
-            class ResultSingle(Single):
-                def on_next(self, ack: Ack):
-                    if isinstance(ack, ContinueAck):
-                        last_ack = outer_self.underlying.on_next(next)
+        # the acknowledgment returned to the upstream while it is back-pressured
+        self.back_pressure: Optional[AckSubject] = None
 
-                        with outer_self.lock:
-                            outer_self.queue.pop(0)
-                            len_queue = len(outer_self.queue)
-                            return_ack = outer_self.back_pressure
-                            curr_state = outer_self.state
+        # a drain loop is scheduled or waits on an acknowledgment
+        self.is_running = False
 
-                        if len_queue == 0:
-                            is_completed = outer_self._complete(
-                                curr_state=curr_state.get_measured_state(False),
-                                prev_state=curr_state.get_measured_state(True),
-                            )
+        self.is_completed = False
+        self.is_stopped = False
 
-                            if not is_completed and isinstance(return_ack, AckSubject):
-                                return_ack.on_next(continue_ack)
+        # there is at most one asynchronous acknowledgment pending, therefore
+        # the same Single is reused for each of them
+        self.result_single = self.ResultSingle(source=self)
 
-                        else:
-                            next_index = outer_self.em.next_frame_index(0)
-                            outer_self._start_loop(last_ack=last_ack, next_index=next_index)
+    class ResultSingle(Single):
+        __slots__ = ('source',)
 
-                    else:
-                        outer_self.state = RawBufferedStates.OnErrorOrDownStreamStopped()
+        def __init__(self, source: 'BufferedObserver'):
+            self.source = source
 
-            _observe_on(ack, self.scheduler).subscribe(ResultSingle())
+        def on_next(self, ack: Ack):
+            outer_self = self.source
 
-        while True:
-            next = self.queue[0]
+            if isinstance(ack, ContinueAck):
+                outer_self._on_acknowledged()
+                outer_self.scheduler.schedule(outer_self._drain)
 
-            if next_index == 0:
+            else:
+                outer_self._stop()
 
-                if isinstance(last_ack, ContinueAck):
-                    last_ack = self.underlying.on_next(next)
+    def _stop(self):
+        with self.lock:
+            self.is_stopped = True
+            self.queue.clear()
+            back_pressure = self.back_pressure
+            self.back_pressure = None
 
-                    with self.lock:
-                        self.queue.pop(0)
-                        len_queue = len(self.queue)
-                        upstream_ack = self.back_pressure
-                        curr_state = self.state
+        if back_pressure is not None:
+            back_pressure.on_next(stop_ack)
 
-                    if len_queue == 0:
-                        is_completed = self._complete(
-                            curr_state=curr_state.get_measured_state(False),
-                            prev_state=curr_state.get_measured_state(True),
-                        )
+    def _on_acknowledged(self):
+        """ releases the upstream once the buffer size drops to the low watermark
+        """
 
-                        if is_completed:
-                            return
+        with self.lock:
+            self.sent_size = 0
 
-                        elif isinstance(upstream_ack, AckSubject):
-                            upstream_ack.on_next(continue_ack)
+            if self.back_pressure is not None and self.queued_size <= self.low_watermark:
+                back_pressure = self.back_pressure
+                self.back_pressure = None
+            else:
+                back_pressure = None
 
-                        else:
-                            return
+        if back_pressure is not None:
+            back_pressure.on_next(continue_ack)
 
-                    next_index = self.em.next_frame_index(next_index)
+    def _drain(self, _=None, __=None):
+        next_index = 0
 
-                elif isinstance(last_ack, StopAck):
-                    self.state = RawBufferedStates.OnErrorOrDownStreamStopped()
+        while True:
+            with self.lock:
+                if self.is_stopped:
                     return
 
+                if not self.queue:
+                    self.is_running = False
+
+                    if self.is_completed:
+                        self.is_stopped = True
+                        is_completed = True
+                    else:
+                        is_completed = False
+
+                    break
+
+                # merge all buffered batches into a single batch
+                if len(self.queue) == 1:
+                    batch = self.queue.popleft()
                 else:
-                    schedule_ack(last_ack, next=next)
+                    batch = list(itertools.chain.from_iterable(self.queue))
+                    self.queue.clear()
+
+                self.sent_size = self.queued_size
+                self.queued_size = 0
+
+            ack = self.underlying.on_next(batch)
+
+            if isinstance(ack, ContinueAck):
+                self._on_acknowledged()
+
+                next_index = self.em.next_frame_index(next_index)
+
+                # schedule next batch from time to time
+                if next_index == 0:
+                    self.scheduler.schedule(self._drain)
                     return
 
-            # schedule next element from time to time
-            else:
-                schedule_ack(last_ack, next=next)
+            elif isinstance(ack, StopAck):
+                self._stop()
                 return
 
-    def on_next(self, elem: ElementType):
-        if self.back_pressure is None:
-            if len(self.queue) < self.buffer_size:
-                return_ack = continue_ack
-
             else:
-                return_ack = AckSubject()
-                self.back_pressure = return_ack
+                ack.subscribe(self.result_single)
+                return
 
+        if is_completed:
+            self.underlying.on_completed()
+
+    def on_next(self, elem: ElementType):
+        if isinstance(elem, list):
+            batch = elem
         else:
-            return_ack = self.back_pressure
+            batch = list(elem)
+
+        size = self.size_func(batch)
 
         with self.lock:
-            len_queue = len(self.queue)
-            self.queue.append(elem)
+            if self.is_stopped:
+                return stop_ack
 
-        prev_meas_state = self.state.get_measured_state(bool(len_queue))
+            self.queue.append(batch)
+            self.queued_size += size
 
-        if isinstance(prev_meas_state, BufferedStates.WaitingState):
-            last_ack = prev_meas_state.last_ack
+            if self.back_pressure is None:
+                if self.buffer_size is None or self.queued_size + self.sent_size <= self.buffer_size:
+                    return_ack = continue_ack
+                else:
+                    return_ack = AckSubject()
+                    self.back_pressure = return_ack
+            else:
+                return_ack = self.back_pressure
 
-            self._start_loop(last_ack=last_ack, next_index=1)
+            if self.is_running:
+                return return_ack
 
-            return return_ack
+            self.is_running = True
 
-        elif isinstance(prev_meas_state, BufferedStates.RunningState):
-            return return_ack
+        # the batches are sent on the scheduler
+        self.scheduler.schedule(self._drain)
 
-        else:
-            return stop_ack
+        return return_ack
 
     def on_error(self, exc):
-        next_raw_state = RawBufferedStates.OnErrorOrDownStreamStopped()
-
         with self.lock:
-            prev_state = self.state
-            self.state = next_raw_state
+            if self.is_stopped:
+                return
 
-        prev_meas_state = prev_state.get_measured_state(has_elements=False)
+            self.is_stopped = True
+            self.queue.clear()
 
-        if not isinstance(prev_meas_state, BufferedStates.Completed):
-            self.underlying.on_error(exc)
+        self.underlying.on_error(exc)
 
-    def _complete(
-            self,
-            prev_state: BufferedStates.State,
-            curr_state: BufferedStates.State,
-    ):
+    def on_completed(self):
+        with self.lock:
+            if self.is_stopped:
+                return
 
-        if not isinstance(prev_state, BufferedStates.Completed) and \
-                isinstance(curr_state, BufferedStates.Completed):
-            self.underlying.on_completed()
-            return True
+            self.is_completed = True
 
-        else:
-            return False
+            # complete once the drain loop has sent the remaining batches
+            if self.is_running:
+                return
 
-    def on_completed(self):
-        next_raw_state = RawBufferedStates.OnCompleted(
-            prev_state=None,
-        )
+            self.is_stopped = True
 
-        with self.lock:
-            next_raw_state.prev_state = self.state
-            self.state = next_raw_state
-            len_queue = len(self.queue)
-
-        self._complete(
-            curr_state=next_raw_state.get_measured_state(bool(len_queue)),
-            prev_state=next_raw_state.prev_state.get_measured_state(bool(len_queue)),
-        )
+        self.underlying.on_completed()
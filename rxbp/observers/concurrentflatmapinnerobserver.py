@@ -0,0 +1,30 @@
+from collections import deque
+from dataclasses import dataclass
+
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+
+
+@dataclass
+class ConcurrentFlatMapInnerObserver(Observer):
+    """
+    Observes a single inner observable of a `ConcurrentFlatMapObserver` and forwards
+    its events to it.
+    """
+
+    source: 'ConcurrentFlatMapObserver'
+
+    def __post_init__(self):
+        # (batch, acknowledgment) tuples not yet sent downstream, only used if the
+        # output is ordered
+        self.queue = deque()
+        self.is_completed = False
+
+    def on_next(self, elem: ElementType):
+        return self.source.on_inner_next(self, elem)
+
+    def on_error(self, exc: Exception):
+        self.source.on_error(exc)
+
+    def on_completed(self):
+        self.source.on_inner_completed(self)
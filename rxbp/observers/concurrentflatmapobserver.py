@@ -0,0 +1,314 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.concurrentflatmapinnerobserver import ConcurrentFlatMapInnerObserver
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+
+
+@dataclass
+class ConcurrentFlatMapObserver(Observer):
+    """
+    Observes up to `max_concurrent` inner observables at the same time, or any number of
+    inner observables if `max_concurrent` is None.
+
+    The outer values are queued and an inner observable is only created and observed
+    once fewer than `max_concurrent` inner observables are active. The outer
+    acknowledgment is returned when all values of the outer batch got observed, which
+    back-pressures the outer source while `max_concurrent` inner observables are active.
+
+    The batches received from the inner observables are sent downstream one at a
+    time. If `ordered` is True, the batches of an inner observable are only sent once
+    all inner observables created before it completed; otherwise, the batches are sent
+    in the order they are received.
+    """
+
+    observer_info: ObserverInfo
+    func: Callable[[Any], Observable]
+    max_concurrent: Optional[int]
+    ordered: bool
+    subscribe_scheduler: Scheduler
+    composite_disposable: CompositeDisposable
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+        self.next_observer = self.observer_info.observer
+
+        # outer values whose inner observable is not observed yet
+        self.pending_vals = deque()
+        self.outer_ack: Optional[AckSubject] = None
+
+        # number of inner observables that did not complete yet
+        self.active = 0
+
+        # inner observers in the order they are created, only used if the output is ordered
+        self.inner_observers = deque()
+
+        # (batch, acknowledgment) tuples ready to be sent downstream, only used if the
+        # output is unordered
+        self.ready = deque()
+
+        self.is_subscribing = False
+        self.is_emitting = False
+        self.is_outer_completed = False
+        self.is_stopped = False
+
+    class EmitSingle(Single):
+        __slots__ = ('source', 'inner_ack')
+
+        def __init__(self, source: 'ConcurrentFlatMapObserver', inner_ack: AckSubject):
+            self.source = source
+            self.inner_ack = inner_ack
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, ContinueAck):
+                self.inner_ack.on_next(continue_ack)
+                self.source._emit()
+            else:
+                self.source._stop()
+                self.inner_ack.on_next(stop_ack)
+
+    def _observe_pending(self, _=None, __=None):
+        """ creates and observes inner observables until `max_concurrent` inner
+        observables are active
+        """
+
+        with self.lock:
+            if self.is_subscribing:
+                return
+
+            self.is_subscribing = True
+
+        while True:
+            with self.lock:
+                is_saturated = self.max_concurrent is not None and self.max_concurrent <= self.active
+
+                if self.is_stopped or not self.pending_vals or is_saturated:
+                    self.is_subscribing = False
+
+                    if self.pending_vals and not self.is_stopped:
+                        outer_ack = None
+                    else:
+                        outer_ack = self.outer_ack
+                        self.outer_ack = None
+
+                    break
+
+                val = self.pending_vals.popleft()
+                self.active += 1
+
+                inner_observer = ConcurrentFlatMapInnerObserver(source=self)
+
+                if self.ordered:
+                    self.inner_observers.append(inner_observer)
+
+            try:
+                inner_observable = self.func(val)
+
+                disposable = inner_observable.observe(self.observer_info.copy(
+                    observer=inner_observer,
+                ))
+                self.composite_disposable.add(disposable)
+            except Exception as exc:
+                with self.lock:
+                    self.is_subscribing = False
+                self.on_error(exc)
+                return
+
+        if outer_ack is not None:
+            if self.is_stopped:
+                outer_ack.on_next(stop_ack)
+            else:
+                outer_ack.on_next(continue_ack)
+
+    def _schedule_observe_pending(self):
+        if self.subscribe_scheduler.idle:
+            disposable = self.subscribe_scheduler.schedule(self._observe_pending)
+            self.composite_disposable.add(disposable)
+        else:
+            self._observe_pending()
+
+    def _next_item(self):
+        """ returns the next (batch, acknowledgment) tuple that can be sent downstream
+        """
+
+        if self.ordered:
+            inner_observers = self.inner_observers
+
+            while inner_observers:
+                head = inner_observers[0]
+
+                if head.queue:
+                    return head.queue.popleft()
+
+                if not head.is_completed:
+                    return None
+
+                inner_observers.popleft()
+
+            return None
+
+        elif self.ready:
+            return self.ready.popleft()
+
+        else:
+            return None
+
+    def _try_emit(self):
+        with self.lock:
+            if self.is_emitting:
+                return
+
+            self.is_emitting = True
+
+        self._emit()
+
+    def _emit(self):
+        """ sends the queued batches downstream one after the other; returns when
+        the queue is empty or when the downstream acknowledgment is asynchronous
+        """
+
+        while True:
+            with self.lock:
+                item = self._next_item()
+
+                if item is None:
+                    self.is_emitting = False
+
+                    is_done = (
+                        self.is_outer_completed
+                        and not self.pending_vals
+                        and self.active == 0
+                        and not self.is_stopped
+                    )
+                    if is_done:
+                        self.is_stopped = True
+                    break
+
+            elem, inner_ack = item
+
+            ack = self.next_observer.on_next(elem)
+
+            # avoid a nested call for acknowledgments that are already resolved
+            if isinstance(ack, AckSubject) and ack.has_value:
+                ack = ack.value
+
+            if isinstance(ack, ContinueAck):
+                inner_ack.on_next(continue_ack)
+
+            elif isinstance(ack, StopAck):
+                self._stop()
+                inner_ack.on_next(stop_ack)
+                return
+
+            else:
+                ack.subscribe(self.EmitSingle(source=self, inner_ack=inner_ack))
+                return
+
+        if is_done:
+            self.next_observer.on_completed()
+
+    def _stop(self) -> bool:
+        """ stops the observer and returns True if it was already stopped
+        """
+
+        with self.lock:
+            was_stopped = self.is_stopped
+            self.is_stopped = True
+            self.pending_vals.clear()
+
+            queued = list(self.ready)
+            self.ready.clear()
+            for inner_observer in self.inner_observers:
+                queued.extend(inner_observer.queue)
+                inner_observer.queue.clear()
+            self.inner_observers.clear()
+
+            outer_ack = self.outer_ack
+            self.outer_ack = None
+
+        for _, inner_ack in queued:
+            inner_ack.on_next(stop_ack)
+
+        if outer_ack is not None:
+            outer_ack.on_next(stop_ack)
+
+        return was_stopped
+
+    def on_inner_next(self, inner_observer: ConcurrentFlatMapInnerObserver, elem: ElementType):
+        if self.is_stopped:
+            return stop_ack
+
+        inner_ack = AckSubject()
+
+        with self.lock:
+            if self.ordered:
+                inner_observer.queue.append((elem, inner_ack))
+            else:
+                self.ready.append((elem, inner_ack))
+
+        self._try_emit()
+        return inner_ack
+
+    def on_inner_completed(self, inner_observer: ConcurrentFlatMapInnerObserver):
+        with self.lock:
+            inner_observer.is_completed = True
+            self.active -= 1
+            has_pending = bool(self.pending_vals)
+
+        if has_pending:
+            self._schedule_observe_pending()
+
+        self._try_emit()
+
+    def on_next(self, outer_elem: ElementType):
+        if isinstance(outer_elem, list):
+            outer_vals = outer_elem
+        else:
+            try:
+                # materialize received values immediately
+                outer_vals = list(outer_elem)
+            except Exception as exc:
+                self.on_error(exc)
+                return stop_ack
+
+        if len(outer_vals) == 0:
+            return continue_ack
+
+        # the ack that might be returned by this `on_next`
+        outer_ack = AckSubject()
+
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            self.pending_vals.extend(outer_vals)
+            self.outer_ack = outer_ack
+
+        self._schedule_observe_pending()
+
+        return outer_ack
+
+    def on_error(self, exc: Exception):
+        if self._stop():
+            return
+
+        self.next_observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            self.is_outer_completed = True
+
+        self._try_emit()
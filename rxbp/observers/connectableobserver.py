@@ -1,76 +1,156 @@
+import threading
+from collections import deque
 from dataclasses import dataclass
+from typing import Optional, Callable
 
+from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.acksubject import AckSubject
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
-from rxbp.acknowledgement.operators.map import _map
-from rxbp.acknowledgement.operators.mergeall import _merge_all
 from rxbp.acknowledgement.single import Single
 from rxbp.acknowledgement.stopack import StopAck, stop_ack
 from rxbp.observer import Observer
-from rxbp.scheduler import Scheduler
 from rxbp.typing import ElementType
 
 
 @dataclass
 class ConnectableObserver(Observer):
+    """
+    Queues the batches received before `connect` is called and sends them to the
+    underlying observer once connected.
+
+    The first `buffer_size` queued batches are acknowledged immediately. Any further
+    batch gets the same pending acknowledgment, which is resolved once the queue
+    is drained. On connect, the queue is drained iteratively such that a large burst
+    of batches does not build up a chain of nested acknowledgments.
+    """
+
     underlying: Observer
-    # scheduler: Scheduler        # todo: remote this
+    buffer_size: int = 0
 
     def __post_init__(self):
-        self.root_ack = AckSubject()
-        self.connected_ack = self.root_ack
+        self.lock = threading.RLock()
+
+        # batches received before the observer got connected
+        self.queue = deque()
+
+        # acknowledgment shared by all batches exceeding the buffer size
+        self.pending_ack: Optional[AckSubject] = None
+
+        # on_completed or on_error received before the queue got drained
+        self.terminal_action: Optional[Callable[[], None]] = None
+
+        self.is_draining = False
         self.is_connected = False
         self.was_canceled = False
-        self.is_volatile = False
+
+    class DrainSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'ConnectableObserver'):
+            self.source = source
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, ContinueAck):
+                self.source._drain()
+            else:
+                self.source._stop()
 
     def connect(self):
-        self.is_connected = True
-        self.root_ack.on_next(continue_ack)
+        with self.lock:
+            if self.is_draining or self.is_connected:
+                return
+
+            self.is_draining = True
+
+        self._drain()
+
+    def _drain(self):
+        queue = self.queue
+
+        while True:
+            with self.lock:
+                if not queue:
+                    self.is_connected = True
+                    self.is_draining = False
+                    pending_ack = self.pending_ack
+                    self.pending_ack = None
+                    terminal_action = self.terminal_action
+                    self.terminal_action = None
+                    break
+
+                elem = queue.popleft()
+
+            ack = self.underlying.on_next(elem)
+
+            # avoid a nested call for acknowledgments that are already resolved
+            if isinstance(ack, AckSubject) and ack.has_value:
+                ack = ack.value
+
+            if isinstance(ack, ContinueAck):
+                continue
+
+            elif isinstance(ack, StopAck):
+                self._stop()
+                return
+
+            else:
+                ack.subscribe(self.DrainSingle(source=self))
+                return
+
+        if pending_ack is not None:
+            pending_ack.on_next(continue_ack)
+
+        if terminal_action is not None:
+            terminal_action()
+
+    def _stop(self):
+        with self.lock:
+            self.was_canceled = True
+            self.is_connected = True
+            self.is_draining = False
+            self.queue.clear()
+            pending_ack = self.pending_ack
+            self.pending_ack = None
+            self.terminal_action = None
+
+        if pending_ack is not None:
+            pending_ack.on_next(stop_ack)
 
     def on_next(self, elem: ElementType):
         if not self.is_connected:
-            def __(v):
-                if isinstance(v, ContinueAck):
-                    ack = self.underlying.on_next(elem)
-                    return ack
-                else:
-                    return StopAck()
-
-            new_ack = AckSubject()
-            # _merge_all(_map(_observe_on(self.connected_ack, scheduler=self.scheduler), func=__)).subscribe(new_ack)
-            _merge_all(_map(self.connected_ack, func=__)).subscribe(new_ack)
-
-            self.connected_ack = new_ack
-            return self.connected_ack
-        elif not self.was_canceled:
-            ack = self.underlying.on_next(elem)
-            return ack
-        else:
+            with self.lock:
+                if not self.is_connected:
+                    self.queue.append(elem)
+
+                    if len(self.queue) <= self.buffer_size:
+                        return continue_ack
+
+                    if self.pending_ack is None:
+                        self.pending_ack = AckSubject()
+
+                    return self.pending_ack
+
+        if self.was_canceled:
             return stop_ack
 
+        return self.underlying.on_next(elem)
+
     def on_error(self, err):
         self.was_canceled = True
 
         if not self.is_connected:
-            class ResultSingle(Single):
-                def on_next(_, v):
-                    if isinstance(v, ContinueAck):
-                        self.underlying.on_error(err)
+            with self.lock:
+                if not self.is_connected:
+                    self.terminal_action = lambda: self.underlying.on_error(err)
+                    return
 
-            # _observe_on(self.connected_ack, scheduler=self.scheduler).subscribe(ResultSingle())
-            self.connected_ack.subscribe(ResultSingle())
-        else:
-            self.underlying.on_error(err)
+        self.underlying.on_error(err)
 
     def on_completed(self):
         if not self.is_connected:
-            class ResultSingle(Single):
-                def on_next(_, v):
-                    if isinstance(v, ContinueAck):
-                        self.underlying.on_completed()
-
-            # _observe_on(self.connected_ack, scheduler=self.scheduler).subscribe(ResultSingle())
-            self.connected_ack.subscribe(ResultSingle())
+            with self.lock:
+                if not self.is_connected:
+                    self.terminal_action = lambda: self.underlying.on_completed()
+                    return
 
-        else:
-            self.underlying.on_completed()
+        self.underlying.on_completed()
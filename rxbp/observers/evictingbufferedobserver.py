@@ -7,7 +7,7 @@ from rxbp.acknowledgement.operators.observeon import _observe_on
 from rxbp.acknowledgement.single import Single
 from rxbp.acknowledgement.stopack import StopAck
 from rxbp.observer import Observer
-from rxbp.overflowstrategy import OverflowStrategy, DropOld, ClearBuffer, Drop
+from rxbp.overflowstrategy import OverflowStrategy, DropOld, ClearBuffer, Drop, OverflowStats
 from rxbp.scheduler import Scheduler
 
 
@@ -64,51 +64,76 @@ class EvictingBufferedObserver(Observer):
         self.lock = threading.RLock()
 
         self.items_to_push = AtomicInt(lock=self.lock, init_val = 0)
-        self.queue = self.Buffer(lock=self.lock, strategy=strategy)
+
+        # counters of this subscription, the strategy might be shared by multiple subscriptions
+        self.stats = OverflowStats()
+        self.queue = self.Buffer(lock=self.lock, strategy=strategy, stats=self.stats)
+
+        if strategy.on_subscribe is not None:
+            strategy.on_subscribe(self.stats)
 
     class Buffer:
-        def __init__(self, lock, strategy: OverflowStrategy):
+        def __init__(self, lock, strategy: OverflowStrategy, stats: OverflowStats):
             self.lock = lock
             self.strategy = strategy
+            self.stats = stats
 
-            self.buffer_ref = AtomicAny(lock=lock, init_val=(0, []))
+            self.queue = []
 
         def drain(self) -> List:
-            current = self.buffer_ref.get_and_set((0, []))
-            return current[1]
+            with self.lock:
+                queue = self.queue
+                self.queue = []
 
-        def offer(self, a) -> int:
-            current = self.buffer_ref.get()
-            length, queue = current
+                self.stats.buffered_batches -= len(queue)
+                self.stats.buffered_elements -= sum(len(batch) for batch in queue)
+
+            return queue
+
+        def offer(self, a: List) -> int:
+            """ adds a batch to the buffer and returns the number of dropped batches
+            """
+
+            stats = self.stats
+
+            with self.lock:
+                if len(self.queue) < self.strategy.buffer_size:
+                    self.queue.append(a)
+                    dropped = []
+
+                elif isinstance(self.strategy, DropOld):
+                    dropped = self.queue[:1]
+                    self.queue = self.queue[1:] + [a]
 
-            if length < self.strategy.buffer_size:
-                update = (length + 1, queue + [a])
-                if not self.buffer_ref.compare_and_set(current, update):
-                    return self.offer(a)
-                else:
-                    return 0
-            else:
-                if isinstance(self.strategy, DropOld):
-                    update = (length, queue[1:] + [a])
-                    if not self.buffer_ref.compare_and_set(current, update):
-                        return self.offer(a)
-                    else:
-                        return 1
                 elif isinstance(self.strategy, ClearBuffer):
-                    update = (1, [a])
-                    if not self.buffer_ref.compare_and_set(current, update):
-                        return self.offer(a)
-                    else:
-                        return length
+                    dropped = self.queue
+                    self.queue = [a]
+
                 elif isinstance(self.strategy, Drop):
-                    return length
+                    dropped = [a]
+
                 else:
                     raise Exception('illegal case')
 
+                n_dropped_elements = sum(len(batch) for batch in dropped)
+
+                stats.buffered_batches += 1 - len(dropped)
+                stats.buffered_elements += len(a) - n_dropped_elements
+                stats.dropped_batches += len(dropped)
+                stats.dropped_elements += n_dropped_elements
+
+            if dropped and self.strategy.on_drop is not None:
+                self.strategy.on_drop(stats)
+
+            return len(dropped)
+
     def on_next(self, elem):
         if self.upstream_is_complete or self.downstream_is_complete:
             return StopAck()
         else:
+            if not isinstance(elem, list):
+                elem = list(elem)
+
             dropped = self.queue.offer(elem)
             increment = 1 - dropped
             self.push_to_consumer(increment)
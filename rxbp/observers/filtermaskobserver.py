@@ -0,0 +1,37 @@
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.isarraybatch import is_array_batch
+from rxbp.utils.materializebatch import materialize_batch
+
+
+@dataclass
+class FilterMaskObserver(Observer):
+    observer: Observer
+    predicate: Callable[[ElementType], Any]
+
+    def on_next(self, elem: ElementType):
+        try:
+            batch = materialize_batch(elem)
+            mask = self.predicate(batch)
+
+            if is_array_batch(batch):
+                filtered = batch[mask]
+            else:
+                filtered = list(itertools.compress(batch, mask))
+
+        except Exception as exc:
+            self.observer.on_error(exc)
+            return stop_ack
+
+        return self.observer.on_next(filtered)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
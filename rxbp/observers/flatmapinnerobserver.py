@@ -1,6 +1,6 @@
 import threading
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional
 
 from rxbp.acknowledgement.acksubject import AckSubject
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
@@ -9,8 +9,7 @@ from rxbp.acknowledgement.stopack import StopAck, stop_ack
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
 from rxbp.observers.connectableobserver import ConnectableObserver
-from rxbp.states.measuredstates.flatmapstates import FlatMapStates
-from rxbp.states.rawstates.rawflatmapstates import RawFlatMapStates
+from rxbp.states.intstates.intflatmapstate import IntFlatMapState
 from rxbp.typing import ElementType
 
 
@@ -20,7 +19,25 @@ class FlatMapInnerObserver(Observer):
     next_conn_observer: Optional[ConnectableObserver]
     outer_upstream_ack: AckSubject
     lock: threading.RLock()
-    state: List[RawFlatMapStates.State]
+    state: IntFlatMapState
+
+    def __post_init__(self):
+        # the same single is subscribed to every asynchronous acknowledgment
+        self.result_single = FlatMapInnerObserver.ResultSingle(source=self)
+
+    class ResultSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'FlatMapInnerObserver'):
+            self.source = source
+
+        def on_error(self, exc: Exception):
+            raise NotImplementedError
+
+        def on_next(self, ack):
+            if isinstance(ack, StopAck):
+                self.source.state.value = IntFlatMapState.STOPPED
+                self.source.outer_upstream_ack.on_next(ack)
 
     def on_next(self, elem: ElementType):
 
@@ -32,20 +49,11 @@ class FlatMapInnerObserver(Observer):
 
         # if ack==Stop, then update state
         if isinstance(ack, StopAck):
-            self.state[0] = RawFlatMapStates.Stopped()
+            self.state.value = IntFlatMapState.STOPPED
             self.outer_upstream_ack.on_next(ack)
 
         elif not isinstance(ack, ContinueAck):
-            class ResultSingle(Single):
-                def on_error(self, exc: Exception):
-                    raise NotImplementedError
-
-                def on_next(_, ack):
-                    if isinstance(ack, StopAck):
-                        self.state[0] = RawFlatMapStates.Stopped()
-                        self.outer_upstream_ack.on_next(ack)
-
-            ack.subscribe(ResultSingle())
+            ack.subscribe(self.result_single)
 
         return ack
 
@@ -69,18 +77,24 @@ class FlatMapInnerObserver(Observer):
         """ on_next* (on_completed | on_error)?
         """
 
-        if self.next_conn_observer is None:
-            next_state = RawFlatMapStates.WaitOnOuter()
-
-        else:
-            next_state = RawFlatMapStates.Active()
+        state = self.state
 
         with self.lock:
-            next_state.raw_prev_state = self.state[0]
-            self.state[0] = next_state
+            prev_state = state.value
+
+            if self.next_conn_observer is None:
+                if prev_state == IntFlatMapState.STOPPED or prev_state == IntFlatMapState.ON_OUTER_COMPLETED:
+                    state.value = IntFlatMapState.STOPPED
+                else:
+                    state.value = IntFlatMapState.WAIT_ON_OUTER
+
+            else:
+                if prev_state == IntFlatMapState.STOPPED:
+                    pass
+                elif prev_state != IntFlatMapState.ON_OUTER_COMPLETED:
+                    state.value = IntFlatMapState.ACTIVE
 
-        prev_meas_state = next_state.raw_prev_state.get_measured_state()
-        meas_state = next_state.get_measured_state()
+            meas_state = state.value
 
         # possible previous states
         # - Active -> outer on_next call completed before this
@@ -88,27 +102,22 @@ class FlatMapInnerObserver(Observer):
         # - WaitComplete -> outer.on_complete or outer.on_error was called
 
         # connect next child observer
-        if any([
-            isinstance(meas_state, FlatMapStates.Active),
-            isinstance(meas_state, FlatMapStates.OnOuterCompleted),
-        ]):
+        if meas_state == IntFlatMapState.ACTIVE or meas_state == IntFlatMapState.ON_OUTER_COMPLETED:
             self.next_conn_observer.connect()
 
-        elif isinstance(meas_state, FlatMapStates.WaitOnOuter):
+        elif meas_state == IntFlatMapState.WAIT_ON_OUTER:
             self.outer_upstream_ack.on_next(continue_ack)
 
-        elif isinstance(meas_state, FlatMapStates.Stopped):
+        elif meas_state == IntFlatMapState.STOPPED:
 
-            if isinstance(prev_meas_state, FlatMapStates.OnOuterCompleted):
+            if prev_state == IntFlatMapState.ON_OUTER_COMPLETED:
                 self.observer_info.observer.on_completed()
-            elif isinstance(prev_meas_state, FlatMapStates.OnOuterException):
-                self.observer_info.observer.on_next(prev_meas_state.exc)
-            elif isinstance(prev_meas_state, FlatMapStates.Stopped):
+            elif prev_state == IntFlatMapState.STOPPED:
                 pass
             else:
-                raise Exception(f'illegal case "{prev_meas_state}"')
+                raise Exception(f'illegal case "{prev_state}"')
 
             return
 
         else:
-            raise Exception(f'illegal state "{meas_state}"')
\ No newline at end of file
+            raise Exception(f'illegal state "{meas_state}"')
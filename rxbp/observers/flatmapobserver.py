@@ -13,8 +13,7 @@ from rxbp.observerinfo import ObserverInfo
 from rxbp.observers.connectableobserver import ConnectableObserver
 from rxbp.observers.flatmapinnerobserver import FlatMapInnerObserver
 from rxbp.scheduler import Scheduler
-from rxbp.states.measuredstates.flatmapstates import FlatMapStates
-from rxbp.states.rawstates.rawflatmapstates import RawFlatMapStates
+from rxbp.states.intstates.intflatmapstate import IntFlatMapState
 from rxbp.typing import ElementType
 
 
@@ -28,7 +27,7 @@ class FlatMapObserver(Observer):
 
     def __post_init__(self):
         self.lock = threading.RLock()
-        self.state = [RawFlatMapStates.InitialState()]
+        self.state = IntFlatMapState()
 
     def on_next(self, outer_elem: ElementType):
         if isinstance(outer_elem, list):
@@ -93,15 +92,13 @@ class FlatMapObserver(Observer):
                 lock=self.lock,
             )
 
-            next_state = RawFlatMapStates.Active()
-
             with self.lock:
-                next_state.raw_prev_state = self.state[0]
-                self.state[0] = next_state
+                prev_state = self.state.value
 
-            meas_state = next_state.raw_prev_state.get_measured_state()
+                if prev_state != IntFlatMapState.STOPPED and prev_state != IntFlatMapState.ON_OUTER_COMPLETED:
+                    self.state.value = IntFlatMapState.ACTIVE
 
-            if isinstance(meas_state, FlatMapStates.Stopped):
+            if prev_state == IntFlatMapState.STOPPED:
                 return stop_ack
 
             # for mypy to type check correctly
@@ -148,18 +145,19 @@ class FlatMapObserver(Observer):
         self.observer_info.observer.on_error(exc)
 
     def on_completed(self):
-        next_state = RawFlatMapStates.OnOuterCompleted()
-
         with self.lock:
-            next_state.raw_prev_state = self.state[0]
-            self.state[0] = next_state
+            prev_state = self.state.value
+
+            if prev_state == IntFlatMapState.STOPPED or prev_state == IntFlatMapState.WAIT_ON_OUTER:
+                self.state.value = IntFlatMapState.STOPPED
+            else:
+                self.state.value = IntFlatMapState.ON_OUTER_COMPLETED
 
-        meas_prev_state = next_state.raw_prev_state.get_measured_state()
-        meas_state = next_state.get_measured_state()
+            meas_state = self.state.value
 
-        if isinstance(meas_state, FlatMapStates.Stopped):
+        if meas_state == IntFlatMapState.STOPPED:
 
-            if not isinstance(meas_prev_state, FlatMapStates.Stopped):
+            if prev_state != IntFlatMapState.STOPPED:
                 # calls to root.on_next and root.on_completed happen in order,
                 # therefore state is not changed concurrently at the WaitOnNextChild
                 self.observer_info.observer.on_completed()
@@ -0,0 +1,94 @@
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Any, Tuple
+
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+
+
+@dataclass(frozen=True)
+class FusedStage:
+    """
+    A stateless and synchronous operator that is fused with its neighbouring
+    operators into a single observer.
+    """
+
+    MAP = 0
+    FILTER = 1
+    ZIP_WITH_INDEX = 2
+    MAP_TO_ITERATOR = 3
+
+    kind: int
+    func: Callable
+
+
+@dataclass
+class FusedObserver(Observer):
+    """
+    Applies a sequence of fused operators on each element in a single loop instead
+    of wrapping the batch into a generator per operator.
+
+    A `map_to_iterator` operator can only be the last fused stage.
+    """
+
+    observer: Observer
+    stages: Tuple[FusedStage, ...]
+
+    def __post_init__(self):
+        if self.stages[-1].kind == FusedStage.MAP_TO_ITERATOR:
+            inner_stages = self.stages[:-1]
+            self.flat_func = self.stages[-1].func
+        else:
+            inner_stages = self.stages
+            self.flat_func = None
+
+        # the index of each `zip_with_index` operator is counted per subscription
+        self.ops = tuple(
+            (stage.kind, stage.func, itertools.count() if stage.kind == FusedStage.ZIP_WITH_INDEX else None)
+            for stage in inner_stages
+        )
+
+    def _gen_fused(self, elem: ElementType):
+        ops = self.ops
+
+        for v in elem:
+            for kind, func, counter in ops:
+                if kind == FusedStage.MAP:
+                    v = func(v)
+                elif kind == FusedStage.FILTER:
+                    if not func(v):
+                        break
+                else:
+                    v = func(v, next(counter))
+            else:
+                yield v
+
+    def on_next(self, elem: ElementType):
+        if self.flat_func is None:
+
+            # like `map`, the fused operators do not consume elements from the iterator/list,
+            # therefore it is not their responsibility to catch an exception
+            return self.observer.on_next(self._gen_fused(elem))
+
+        else:
+            flat_func = self.flat_func
+
+            def gen_flattened():
+                for v in self._gen_fused(elem):
+                    yield from flat_func(v)
+
+            # like `map_to_iterator`, the elements are materialized
+            try:
+                buffer = list(gen_flattened())
+            except Exception as exc:
+                self.observer.on_error(exc)
+                return stop_ack
+
+            return self.observer.on_next(buffer)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
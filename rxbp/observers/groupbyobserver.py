@@ -0,0 +1,343 @@
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Any, Optional, List
+
+from rx.disposable import Disposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.bufferedobserver import BufferedObserver
+from rxbp.observers.connectableobserver import ConnectableObserver
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+
+
+@dataclass
+class GroupByObserver(Observer):
+    """
+    Routes each received element to the group of its key. A new group is sent
+    downstream as a `(key, Flowable)` pair; the pairs are queued until the downstream
+    acknowledged the previous ones, which does not back-pressure the upstream, as a
+    downstream like `flat_map` might only acknowledge them once the groups completed.
+
+    Each group buffers the elements that are not yet acknowledged by its observer,
+    including the elements received before the group got observed. If `group_buffer`
+    is None, the buffer is unbounded and the upstream is never back-pressured.
+    Otherwise, each group buffers up to `group_buffer` elements and the upstream is
+    back-pressured by groups whose buffer is full.
+
+    Once `max_groups` groups exist, the least recently used idle group is completed
+    to make room for a new group; if no group is idle, the least recently used group
+    is completed.
+    """
+
+    observer_info: ObserverInfo
+    key_func: Callable[[Any], Any]
+    max_groups: Optional[int]
+    group_buffer: Optional[int]
+    scheduler: Scheduler
+    subscribe_scheduler: Scheduler
+
+    def __post_init__(self):
+        self.next_observer = self.observer_info.observer
+        self.lock = threading.RLock()
+
+        # groups in least recently used order
+        self.groups = OrderedDict()
+
+        # batches of new groups not yet sent downstream
+        self.group_queue = deque()
+
+        # new groups are being sent downstream or wait on a downstream acknowledgment
+        self.is_emitting = False
+
+        # downstream stopped requesting new groups
+        self.is_stopped = False
+
+        # the upstream completed, which is signaled downstream once all new groups are sent
+        self.is_completed = False
+        self.is_completion_sent = False
+
+    class Group:
+        __slots__ = ('key', 'observer', 'flowable', 'ack', 'is_stopped')
+
+        def __init__(self, key: Any, observer: Observer, flowable: Any):
+            self.key = key
+            self.observer = observer
+            self.flowable = flowable
+            self.ack: Optional[Ack] = None
+            self.is_stopped = False
+
+        @property
+        def is_idle(self):
+            ack = self.ack
+            return ack is None or isinstance(ack, (ContinueAck, StopAck)) or ack.has_value
+
+        def dispose(self):
+            self.is_stopped = True
+
+    class AckJoin:
+        """ resolves the upstream acknowledgment once all acknowledgments of a batch resolved
+        """
+
+        __slots__ = ('source', 'lock', 'count', 'ack')
+
+        def __init__(self, source: 'GroupByObserver', count: int):
+            self.source = source
+            self.lock = threading.Lock()
+            self.count = count
+            self.ack = AckSubject()
+
+        def on_ack(self):
+            with self.lock:
+                self.count -= 1
+                is_done = self.count == 0
+
+            if is_done:
+                self.ack.on_next(self.source._upstream_ack())
+
+    class GroupSingle(Single):
+        __slots__ = ('join', 'group')
+
+        def __init__(self, join: 'GroupByObserver.AckJoin', group: 'GroupByObserver.Group'):
+            self.join = join
+            self.group = group
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, StopAck):
+                self.group.is_stopped = True
+
+            self.join.on_ack()
+
+    class EmitSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'GroupByObserver'):
+            self.source = source
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, StopAck):
+                self.source._stop_emitting()
+
+            self.source._emit()
+
+    def _create_group(self, key: Any) -> Group:
+        # imported here to avoid a circular import, as Flowable depends on this operator
+        from rxbp.init.initsharedflowable import init_shared_flowable
+        from rxbp.multicast.flowables.connectableflowable import ConnectableFlowable
+
+        conn_observer = ConnectableObserver(underlying=None)
+
+        # the buffer also holds the elements received before the group is observed
+        observer = BufferedObserver(
+            underlying=conn_observer,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.subscribe_scheduler,
+            buffer_size=self.group_buffer,
+        )
+
+        group = self.Group(key=key, observer=observer, flowable=None)
+        group.flowable = init_shared_flowable(
+            underlying=ConnectableFlowable(
+                conn_observer=conn_observer,
+                disposable=Disposable(group.dispose),
+            ),
+        )
+        return group
+
+    def _evict(self) -> Group:
+        """ removes the least recently used idle group, or the least recently used
+        group if no group is idle
+        """
+
+        for key, group in self.groups.items():
+            if group.is_idle:
+                break
+        else:
+            key = next(iter(self.groups))
+
+        return self.groups.pop(key)
+
+    def _stop_emitting(self):
+        """ the downstream stopped requesting new groups; the queued groups are never
+        observed and therefore stopped
+        """
+
+        with self.lock:
+            self.is_stopped = True
+
+            for groups in self.group_queue:
+                for group in groups:
+                    group.is_stopped = True
+
+            self.group_queue.clear()
+
+    def _try_emit(self):
+        with self.lock:
+            if self.is_emitting:
+                return
+
+            self.is_emitting = True
+
+        self._emit()
+
+    def _emit(self):
+        """ sends the queued new groups downstream one batch after the other; returns
+        when the queue is empty or when the downstream acknowledgment is asynchronous
+        """
+
+        while True:
+            with self.lock:
+                if not self.group_queue:
+                    self.is_emitting = False
+
+                    send_completion = self.is_completed and not self.is_completion_sent
+                    if send_completion:
+                        self.is_completion_sent = True
+                    break
+
+                groups = self.group_queue.popleft()
+
+            ack = self.next_observer.on_next([(group.key, group.flowable) for group in groups])
+
+            # avoid a nested call for acknowledgments that are already resolved
+            if isinstance(ack, AckSubject) and ack.has_value:
+                ack = ack.value
+
+            if isinstance(ack, ContinueAck):
+                continue
+
+            elif isinstance(ack, StopAck):
+                self._stop_emitting()
+
+            else:
+                ack.subscribe(self.EmitSingle(source=self))
+                return
+
+        if send_completion:
+            self.next_observer.on_completed()
+
+    def _upstream_ack(self) -> Ack:
+        with self.lock:
+            is_stopped = self.is_stopped and all(group.is_stopped for group in self.groups.values())
+
+        if is_stopped:
+            return stop_ack
+        else:
+            return continue_ack
+
+    def on_next(self, elem: ElementType):
+        # group the elements of the batch by key
+        batches = {}
+        try:
+            for value in elem:
+                key = self.key_func(value)
+                batch = batches.get(key)
+
+                if batch is None:
+                    batches[key] = [value]
+                else:
+                    batch.append(value)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        new_groups: List[GroupByObserver.Group] = []
+        evicted_groups: List[GroupByObserver.Group] = []
+        routed = []
+
+        with self.lock:
+            groups = self.groups
+
+            for key, batch in batches.items():
+                group = groups.get(key)
+
+                # the group observer stops once the group is stopped by its observer
+                if group is not None and group.observer.is_stopped:
+                    group.is_stopped = True
+
+                if group is not None and not group.is_stopped:
+                    groups.move_to_end(key)
+
+                else:
+                    # a stopped group is replaced by a new group
+                    if group is not None:
+                        del groups[key]
+
+                    # elements of new keys are dropped if the downstream stopped
+                    if self.is_stopped:
+                        continue
+
+                    if self.max_groups is not None and self.max_groups <= len(groups):
+                        evicted_groups.append(self._evict())
+
+                    group = self._create_group(key)
+                    groups[key] = group
+                    new_groups.append(group)
+
+                routed.append((group, batch))
+
+        if new_groups:
+            with self.lock:
+                self.group_queue.append(new_groups)
+
+            self._try_emit()
+
+        async_acks = []
+
+        for group, batch in routed:
+            ack = group.observer.on_next(batch)
+            group.ack = ack
+
+            if isinstance(ack, StopAck):
+                group.is_stopped = True
+
+            # an evicted group gets completed right away, its acknowledgment might
+            # therefore never resolve
+            elif not isinstance(ack, ContinueAck) and group not in evicted_groups:
+                async_acks.append((group, ack))
+
+        # evicted groups are completed after they received the elements of this batch
+        for group in evicted_groups:
+            group.observer.on_completed()
+
+        if not async_acks:
+            return self._upstream_ack()
+
+        join = self.AckJoin(source=self, count=len(async_acks))
+
+        for group, ack in async_acks:
+            ack.subscribe(self.GroupSingle(join=join, group=group))
+
+        return join.ack
+
+    def _pop_groups(self):
+        with self.lock:
+            groups = list(self.groups.values())
+            self.groups.clear()
+
+        return groups
+
+    def on_error(self, exc: Exception):
+        with self.lock:
+            self.group_queue.clear()
+
+        for group in self._pop_groups():
+            group.observer.on_error(exc)
+
+        self.next_observer.on_error(exc)
+
+    def on_completed(self):
+        for group in self._pop_groups():
+            group.observer.on_completed()
+
+        with self.lock:
+            self.is_completed = True
+
+        self._try_emit()
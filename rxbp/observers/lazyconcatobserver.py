@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Iterator, Callable, Optional
+
+from rx.disposable import SerialDisposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+
+
+@dataclass
+class LazyConcatObserver(Observer):
+    """
+    Observes one source after the other. The next source is created and observed only
+    after the current source completed and its last batch got acknowledged.
+    """
+
+    observer_info: ObserverInfo
+    sources: Iterator[Callable[[], Observable]]
+    subscribe_scheduler: Scheduler
+    serial_disposable: SerialDisposable
+
+    def __post_init__(self):
+        self.next_observer = self.observer_info.observer
+        self.ack: Optional[Ack] = None
+
+    class ObserveNextSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'LazyConcatObserver'):
+            self.source = source
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, ContinueAck):
+                self.source._schedule_next()
+
+    def observe_next(self) -> bool:
+        """ observes the next source and returns False if there is no source left
+        """
+
+        try:
+            get_observable = next(self.sources)
+        except StopIteration:
+            return False
+
+        self.ack = None
+
+        observable = get_observable()
+        self.serial_disposable.disposable = observable.observe(self.observer_info.copy(
+            observer=self,
+        ))
+        return True
+
+    def _observe_next_or_complete(self, _=None, __=None):
+        try:
+            has_next = self.observe_next()
+        except Exception as exc:
+            self.next_observer.on_error(exc)
+            return
+
+        if not has_next:
+            self.next_observer.on_completed()
+
+    def _schedule_next(self):
+        if self.subscribe_scheduler.idle:
+            self.subscribe_scheduler.schedule(self._observe_next_or_complete)
+        else:
+            self._observe_next_or_complete()
+
+    def on_next(self, elem: ElementType):
+        self.ack = self.next_observer.on_next(elem)
+        return self.ack
+
+    def on_error(self, exc):
+        self.next_observer.on_error(exc)
+
+    def on_completed(self):
+        ack = self.ack
+
+        if ack is None or isinstance(ack, ContinueAck):
+            self._schedule_next()
+
+        elif isinstance(ack, StopAck):
+            return
+
+        else:
+            ack.subscribe(self.ObserveNextSingle(source=self))
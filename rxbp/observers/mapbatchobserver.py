@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.materializebatch import materialize_batch
+
+
+@dataclass
+class MapBatchObserver(Observer):
+    observer: Observer
+    func: Callable[[ElementType], ElementType]
+
+    def on_next(self, elem: ElementType):
+        # the function is applied eagerly on the whole batch, therefore
+        # exceptions need to be caught here
+        try:
+            batch = self.func(materialize_batch(elem))
+        except Exception as exc:
+            self.observer.on_error(exc)
+            return stop_ack
+
+        return self.observer.on_next(batch)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
@@ -0,0 +1,229 @@
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Callable, Any, Optional, Dict, Deque, List
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+
+
+def _map_batch(func: Callable[[Any], Any], batch: List) -> List:
+    """ executed in a worker process; needs to be a module-level function to be picklable
+    """
+
+    return [func(elem) for elem in batch]
+
+
+@dataclass
+class ParallelMapObserver(Observer):
+    """ Sends each batch to a worker process and emits the mapped batches either in the
+    order they were received (`ordered=True`) or in the order they got mapped.
+
+    At most `max_in_flight` batches are either processed or wait to be emitted. Once
+    this limit is reached, the upstream is back-pressured.
+    """
+
+    observer: Observer
+    func: Callable[[Any], Any]
+    executor: Executor
+    scheduler: Scheduler
+    max_in_flight: int
+    ordered: bool
+    shutdown_executor: bool
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+
+        # number of batches sent to a worker process and not yet emitted
+        self.in_flight = 0
+
+        # sequence number of the next batch
+        self.next_seq = 0
+
+        # sequence number of the next emitted batch if `ordered=True`
+        self.next_emit_seq = 0
+
+        # mapped batches that are ready to be emitted
+        self.ordered_futures: Dict[int, Future] = {}
+        self.unordered_futures: Deque[Future] = deque()
+
+        # upstream acknowledgment returned if too many batches are in flight
+        self.upstream_ack: Optional[AckSubject] = None
+
+        self.is_emitting = False
+        self.is_upstream_completed = False
+        self.is_stopped = False
+
+    def on_next(self, elem: ElementType) -> Ack:
+        if self.is_stopped:
+            return stop_ack
+
+        try:
+            batch = elem if isinstance(elem, list) else list(elem)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        if not batch:
+            return continue_ack
+
+        with self.lock:
+            seq = self.next_seq
+            self.next_seq += 1
+            self.in_flight += 1
+
+            if self.in_flight < self.max_in_flight:
+                ack = continue_ack
+            else:
+                self.upstream_ack = AckSubject()
+                ack = self.upstream_ack
+
+        try:
+            future = self.executor.submit(_map_batch, self.func, batch)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        future.add_done_callback(lambda f: self._on_mapped(seq, f))
+
+        return ack
+
+    def on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.is_stopped = True
+            upstream_ack = self.upstream_ack
+            self.upstream_ack = None
+
+        self._dispose_executor()
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(stop_ack)
+
+        self.observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            self.is_upstream_completed = True
+
+            complete = not self.is_emitting and self.in_flight == 0 and not self.is_stopped
+            if complete:
+                self.is_stopped = True
+
+        if complete:
+            self._dispose_executor()
+            self.observer.on_completed()
+
+    def _dispose_executor(self):
+        if self.shutdown_executor:
+            self.executor.shutdown(wait=False)
+
+    def _on_mapped(self, seq: int, future: Future):
+        """ called by the executor once a batch got mapped
+        """
+
+        with self.lock:
+            if self.ordered:
+                self.ordered_futures[seq] = future
+            else:
+                self.unordered_futures.append(future)
+
+            start_emitting = not self.is_emitting and not self.is_stopped
+            if start_emitting:
+                self.is_emitting = True
+
+        # emit batches on the scheduler rather than on the thread of the executor
+        if start_emitting:
+            self.scheduler.schedule(self._emit)
+
+    def _pop_ready_future(self) -> Optional[Future]:
+        if self.ordered:
+            return self.ordered_futures.pop(self.next_emit_seq, None)
+
+        elif self.unordered_futures:
+            return self.unordered_futures.popleft()
+
+        return None
+
+    def _emit(self, _, __):
+        while True:
+            with self.lock:
+                if self.is_stopped:
+                    return
+
+                future = self._pop_ready_future()
+
+                if future is None:
+                    self.is_emitting = False
+
+                    complete = self.is_upstream_completed and self.in_flight == 0
+                    if complete:
+                        self.is_stopped = True
+
+                    break
+
+                self.next_emit_seq += 1
+                self.in_flight -= 1
+
+                if self.upstream_ack is not None and self.in_flight < self.max_in_flight:
+                    upstream_ack = self.upstream_ack
+                    self.upstream_ack = None
+                else:
+                    upstream_ack = None
+
+            exc = future.exception()
+            if exc is not None:
+                self.on_error(exc)
+                return
+
+            ack = self.observer.on_next(future.result())
+
+            if upstream_ack is not None:
+                upstream_ack.on_next(continue_ack)
+
+            if ack is continue_ack:
+                continue
+
+            elif ack is stop_ack:
+                self._stop()
+                return
+
+            else:
+                ack.subscribe(self.EmitSingle(source=self))
+                return
+
+        if complete:
+            self._dispose_executor()
+            self.observer.on_completed()
+
+    def _stop(self):
+        with self.lock:
+            self.is_stopped = True
+            upstream_ack = self.upstream_ack
+            self.upstream_ack = None
+
+        self._dispose_executor()
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(stop_ack)
+
+    class EmitSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'ParallelMapObserver'):
+            self.source = source
+
+        def on_next(self, ack: Ack):
+            if ack is continue_ack:
+                self.source.scheduler.schedule(self.source._emit)
+            else:
+                self.source._stop()
@@ -0,0 +1,265 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, List
+
+from rx.disposable import Disposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.internal.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+
+
+@dataclass
+class RebatchObserver(Observer):
+    """ Collects the received elements and emits them in batches of `batch_size` elements.
+
+    Smaller batches are merged, larger batches are split. The remaining elements are
+    emitted once the source completes, or, if `timespan` is given, at the latest `timespan`
+    seconds after they were received. If `adaptive_batch_size` is given, the batch size
+    adapts to the acknowledgment latency of the downstream.
+
+    Only a single batch is emitted at a time. If the upstream sends a batch while elements
+    are emitted due to the timer, the upstream is back-pressured.
+    """
+
+    observer: Observer
+    batch_size: Optional[int]
+    adaptive_batch_size: Optional[AdaptiveBatchSize]
+    timespan: Optional[float] = None
+    scheduler: Optional[Scheduler] = None
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+
+        self.buffer: List = []
+
+        # index of the first element in the buffer that has not been emitted yet
+        self.buffer_idx = 0
+
+        # True while a batch is emitted or an asynchronous acknowledgment is pending
+        self.is_emitting = False
+
+        # acknowledgment returned to the upstream while emitting
+        self.upstream_ack: Optional[AckSubject] = None
+
+        self.is_completed = False
+        self.is_stopped = False
+
+        # the timer only flushes the buffer, if no elements have been emitted since it was started
+        self.timer_disposable: Optional[Disposable] = None
+        self.timer_generation = 0
+        self.started_timer_generation = -1
+
+    def _get_batch_size(self) -> int:
+        if self.adaptive_batch_size is not None:
+            return self.adaptive_batch_size.batch_size
+        else:
+            return self.batch_size
+
+    def _pop_batch(self, batch_size: int = None) -> List:
+        """ removes a batch from the buffer; called while holding the lock
+        """
+
+        if batch_size is None:
+            batch = self.buffer[self.buffer_idx:]
+            self.buffer = []
+            self.buffer_idx = 0
+
+        else:
+            next_idx = self.buffer_idx + batch_size
+            batch = self.buffer[self.buffer_idx:next_idx]
+            self.buffer_idx = next_idx
+
+        self.timer_generation += 1
+        return batch
+
+    def _send_batch(self, batch: List) -> Ack:
+        if self.adaptive_batch_size is None:
+            return self.observer.on_next(batch)
+
+        start_time = time.perf_counter()
+        ack = self.observer.on_next(batch)
+        self.adaptive_batch_size.measure(ack=ack, n_elements=len(batch), start_time=start_time)
+        return ack
+
+    def _emit_loop(self, batch: Optional[List]) -> Ack:
+        """ emits the given batch and afterwards full batches until the buffer contains less
+        elements than the batch size or the downstream returns an asynchronous acknowledgment
+        """
+
+        while True:
+            if batch is not None:
+                ack = self._send_batch(batch)
+
+                if ack is stop_ack:
+                    with self.lock:
+                        self.is_stopped = True
+                        upstream_ack = self.upstream_ack
+                        self.upstream_ack = None
+
+                    self._dispose_timer()
+
+                    if upstream_ack is not None:
+                        upstream_ack.on_next(stop_ack)
+
+                    return stop_ack
+
+                elif ack is not continue_ack:
+                    with self.lock:
+                        # the upstream acknowledgment is created before subscribing to the
+                        # downstream acknowledgment such that it is surely released
+                        if self.upstream_ack is None:
+                            self.upstream_ack = AckSubject()
+                        upstream_ack = self.upstream_ack
+
+                    ack.subscribe(self.ResumeSingle(source=self))
+                    return upstream_ack
+
+            with self.lock:
+                batch_size = self._get_batch_size()
+
+                if batch_size <= len(self.buffer) - self.buffer_idx:
+                    batch = self._pop_batch(batch_size)
+                    continue
+
+                if self.buffer_idx:
+                    self.buffer = self.buffer[self.buffer_idx:]
+                    self.buffer_idx = 0
+
+                self.is_emitting = False
+                upstream_ack = self.upstream_ack
+                self.upstream_ack = None
+                is_completed = self.is_completed
+
+                # the timer is started when the first element is buffered
+                timer_generation = self.timer_generation
+                start_timer = self.timespan is not None and not is_completed and 0 < len(self.buffer) \
+                              and self.started_timer_generation != timer_generation
+                if start_timer:
+                    self.started_timer_generation = timer_generation
+
+            if is_completed:
+                self._complete()
+
+            else:
+                if start_timer:
+                    self._start_timer(timer_generation)
+
+                if upstream_ack is not None:
+                    upstream_ack.on_next(continue_ack)
+
+            return continue_ack
+
+    class ResumeSingle(Single):
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'RebatchObserver'):
+            self.source = source
+
+        def on_next(self, ack: Ack):
+            if ack is continue_ack:
+                self.source._emit_loop(batch=None)
+
+            else:
+                source = self.source
+
+                with source.lock:
+                    source.is_stopped = True
+                    upstream_ack = source.upstream_ack
+                    source.upstream_ack = None
+
+                source._dispose_timer()
+
+                if upstream_ack is not None:
+                    upstream_ack.on_next(stop_ack)
+
+    def _start_timer(self, timer_generation: int):
+        def action(_, __):
+            with self.lock:
+                if self.is_stopped or self.is_completed or timer_generation != self.timer_generation \
+                        or not self.buffer:
+                    return
+
+                # restart the timer once the downstream acknowledged the current batch
+                if self.is_emitting:
+                    self.started_timer_generation = -1
+                    return
+
+                self.is_emitting = True
+                batch = self._pop_batch()
+
+            self._emit_loop(batch=batch)
+
+        self._dispose_timer()
+        self.timer_disposable = self.scheduler.schedule_relative(self.timespan, action)
+
+    def _dispose_timer(self):
+        timer_disposable = self.timer_disposable
+
+        if timer_disposable is not None:
+            self.timer_disposable = None
+            timer_disposable.dispose()
+
+    def _complete(self):
+        self._dispose_timer()
+
+        with self.lock:
+            batch = self._pop_batch()
+
+        if batch:
+            self.observer.on_next(batch)
+
+        self.observer.on_completed()
+
+    def on_next(self, elem: ElementType):
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            try:
+                self.buffer.extend(elem)
+            except Exception as exc:
+                is_emitting = None
+                exception = exc
+            else:
+                is_emitting = self.is_emitting
+                self.is_emitting = True
+
+                # the timer is currently emitting elements
+                if is_emitting:
+                    if self.upstream_ack is None:
+                        self.upstream_ack = AckSubject()
+                    return self.upstream_ack
+
+        if is_emitting is None:
+            self.on_error(exception)
+            return stop_ack
+
+        return self._emit_loop(batch=None)
+
+    def on_error(self, exc):
+        self._dispose_timer()
+
+        with self.lock:
+            self.is_stopped = True
+            self.buffer = []
+            self.buffer_idx = 0
+
+        self.observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            self.is_completed = True
+            is_emitting = self.is_emitting
+            self.is_emitting = True
+
+        # otherwise, the remaining elements are emitted once the downstream acknowledged
+        if not is_emitting:
+            self._complete()
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.materializebatch import materialize_batch
+
+
+@dataclass
+class ReduceBatchObserver(Observer):
+    observer: Observer
+    func: Callable[[Any, ElementType], Any]
+    initial: Any
+
+    def __post_init__(self):
+        self.acc = self.initial
+
+    def on_next(self, elem: ElementType):
+        try:
+            self.acc = self.func(self.acc, materialize_batch(elem))
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        return continue_ack
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        _ = self.observer.on_next([self.acc])
+        self.observer.on_completed()
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Callable, Any
+
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.materializebatch import materialize_batch
+
+
+@dataclass
+class ScanCumulativeObserver(Observer):
+    observer: Observer
+    func: Callable[[Any, ElementType], ElementType]
+    initial: Any
+
+    def __post_init__(self):
+        self.acc = self.initial
+
+    def on_next(self, elem: ElementType):
+        try:
+            batch = self.func(self.acc, materialize_batch(elem))
+
+            # the last accumulated value is the initial value of the next batch
+            if 0 < len(batch):
+                self.acc = batch[-1]
+
+        except Exception as exc:
+            self.observer.on_error(exc)
+            return stop_ack
+
+        return self.observer.on_next(batch)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
@@ -0,0 +1,121 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional, List
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+
+
+@dataclass
+class UnbatchObserver(Observer):
+    """ Splits received batches into batches of at most `batch_size` elements. Smaller
+    batches are sent downstream as they are.
+    """
+
+    observer: Observer
+    batch_size: int
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+
+        # True while the batches of a split batch are emitted
+        self.is_emitting = False
+        self.is_completed = False
+
+    def _emit_loop(self, batch: List, idx: int, upstream_ack: Optional[AckSubject]) -> Ack:
+        while idx < len(batch):
+            next_idx = idx + self.batch_size
+            ack = self.observer.on_next(batch[idx:next_idx])
+            idx = next_idx
+
+            if ack is continue_ack:
+                continue
+
+            elif ack is stop_ack:
+                if upstream_ack is not None:
+                    upstream_ack.on_next(stop_ack)
+                return stop_ack
+
+            elif idx < len(batch):
+                if upstream_ack is None:
+                    upstream_ack = AckSubject()
+
+                ack.subscribe(self.ResumeSingle(source=self, batch=batch, idx=idx, upstream_ack=upstream_ack))
+                return upstream_ack
+
+            else:
+                # the last acknowledgment is forwarded to the upstream
+                with self.lock:
+                    self.is_emitting = False
+                    is_completed = self.is_completed
+
+                if is_completed:
+                    self.observer.on_completed()
+
+                if upstream_ack is not None:
+                    ack.subscribe(upstream_ack)
+                    return upstream_ack
+
+                return ack
+
+        with self.lock:
+            self.is_emitting = False
+            is_completed = self.is_completed
+
+        if is_completed:
+            self.observer.on_completed()
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(continue_ack)
+
+        return continue_ack
+
+    class ResumeSingle(Single):
+        __slots__ = ('source', 'batch', 'idx', 'upstream_ack')
+
+        def __init__(self, source: 'UnbatchObserver', batch: List, idx: int, upstream_ack: AckSubject):
+            self.source = source
+            self.batch = batch
+            self.idx = idx
+            self.upstream_ack = upstream_ack
+
+        def on_next(self, ack: Ack):
+            if ack is continue_ack:
+                self.source._emit_loop(batch=self.batch, idx=self.idx, upstream_ack=self.upstream_ack)
+            else:
+                self.upstream_ack.on_next(stop_ack)
+
+    def on_next(self, elem: ElementType):
+        if isinstance(elem, list):
+            batch = elem
+        else:
+            try:
+                batch = list(elem)
+            except Exception as exc:
+                self.observer.on_error(exc)
+                return stop_ack
+
+        if len(batch) <= self.batch_size:
+            return self.observer.on_next(batch)
+
+        with self.lock:
+            self.is_emitting = True
+
+        return self._emit_loop(batch=batch, idx=0, upstream_ack=None)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            self.is_completed = True
+            is_emitting = self.is_emitting
+
+        # otherwise, the downstream is completed once the split batch is emitted
+        if not is_emitting:
+            self.observer.on_completed()
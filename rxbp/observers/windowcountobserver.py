@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.internal.ringbuffer import RingBuffer
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+
+
+@dataclass
+class WindowCountObserver(Observer):
+    """
+    Emits a window of the last `n` elements every `step` elements. The window is
+    either emitted as a list, or, if an accumulator is given, as the value of the
+    accumulator, which is updated incrementally for every element entering and
+    leaving the window. If `value_selector` is given, the window holds the selected
+    values instead of the elements.
+    """
+
+    next_observer: Observer
+    n: int
+    step: int
+    accumulator_factory: Optional[Callable[[], Any]]
+    value_selector: Optional[Callable[[Any], Any]] = None
+
+    def __post_init__(self):
+        self.window = RingBuffer(capacity=self.n)
+        self.accumulator = self.accumulator_factory() if self.accumulator_factory is not None else None
+
+        # number of elements until the next window is emitted
+        self.countdown = self.n
+
+    def on_next(self, elem: ElementType):
+        window = self.window
+        accumulator = self.accumulator
+        value_selector = self.value_selector
+        n = self.n
+
+        windows = []
+
+        try:
+            for value in elem:
+                if value_selector is not None:
+                    value = value_selector(value)
+
+                if len(window) == n:
+                    removed = window.popleft()
+
+                    if accumulator is not None:
+                        accumulator.remove(removed)
+
+                window.append(value)
+
+                if accumulator is not None:
+                    accumulator.add(value)
+
+                self.countdown -= 1
+
+                if self.countdown == 0:
+                    self.countdown = self.step
+
+                    if accumulator is None:
+                        windows.append(list(window))
+                    else:
+                        windows.append(accumulator.value)
+
+        except Exception as exc:
+            self.next_observer.on_error(exc)
+            return stop_ack
+
+        if not windows:
+            return continue_ack
+
+        return self.next_observer.on_next(windows)
+
+    def on_error(self, exc):
+        self.next_observer.on_error(exc)
+
+    def on_completed(self):
+        self.next_observer.on_completed()
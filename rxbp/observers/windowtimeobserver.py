@@ -0,0 +1,127 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, Any, Optional
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.internal.ringbuffer import RingBuffer
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+
+
+@dataclass
+class WindowTimeObserver(Observer):
+    """
+    Emits the elements falling into the time windows `[k*step, k*step + span)`.
+    A window is emitted as soon as an element with a later timestamp is received,
+    or once the source completes; empty windows are skipped.
+
+    The timestamps are assumed to be non-decreasing; elements that do not fall into
+    the current or a later window are dropped. As all buffered elements belong to
+    the window that is emitted next, an accumulator is updated incrementally for
+    every element entering and leaving the buffer. If `value_selector` is given, the
+    windows hold the selected values instead of the elements.
+    """
+
+    next_observer: Observer
+    span: float
+    step: float
+    timestamp: Optional[Callable[[Any], float]]
+    accumulator_factory: Optional[Callable[[], Any]]
+    scheduler: Scheduler
+    value_selector: Optional[Callable[[Any], Any]] = None
+
+    def __post_init__(self):
+        # (timestamp, value) tuples of the window emitted next
+        self.window = RingBuffer()
+        self.accumulator = self.accumulator_factory() if self.accumulator_factory is not None else None
+
+        # start of the window emitted next
+        self.start: Optional[float] = None
+
+    def _first_start(self, ts: float) -> float:
+        """ returns the start of the first window containing the timestamp
+        """
+
+        return (math.floor((ts - self.span) / self.step) + 1) * self.step
+
+    def _emit_window(self, windows: list):
+        if self.accumulator is None:
+            windows.append([value for _, value in self.window])
+        else:
+            windows.append(self.accumulator.value)
+
+        # advance to the next window and remove the elements leaving the window
+        self.start += self.step
+
+        window = self.window
+        while window and window[0][0] < self.start:
+            _, removed = window.popleft()
+
+            if self.accumulator is not None:
+                self.accumulator.remove(removed)
+
+    def on_next(self, elem: ElementType):
+        window = self.window
+        accumulator = self.accumulator
+        value_selector = self.value_selector
+        span = self.span
+
+        windows = []
+
+        try:
+            if self.timestamp is None:
+                now = self.scheduler.now.timestamp()
+
+            for value in elem:
+                if self.timestamp is None:
+                    ts = now
+                else:
+                    ts = self.timestamp(value)
+
+                if self.start is None:
+                    self.start = self._first_start(ts)
+
+                # emit the windows ending before the timestamp
+                while self.start + span <= ts:
+                    if not window:
+                        # skip empty windows
+                        self.start = self._first_start(ts)
+                        break
+
+                    self._emit_window(windows)
+
+                if ts < self.start:
+                    continue
+
+                if value_selector is not None:
+                    value = value_selector(value)
+
+                window.append((ts, value))
+
+                if accumulator is not None:
+                    accumulator.add(value)
+
+        except Exception as exc:
+            self.next_observer.on_error(exc)
+            return stop_ack
+
+        if not windows:
+            return continue_ack
+
+        return self.next_observer.on_next(windows)
+
+    def on_error(self, exc):
+        self.next_observer.on_error(exc)
+
+    def on_completed(self):
+        windows = []
+
+        while self.window:
+            self._emit_window(windows)
+
+        if windows:
+            self.next_observer.on_next(windows)
+
+        self.next_observer.on_completed()
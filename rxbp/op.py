@@ -1,4 +1,4 @@
-from typing import Any, Callable, Iterator
+from typing import Any, Callable, Iterator, List, Union
 
 from rxbp.acknowledgement.ack import Ack
 from rxbp.flowable import Flowable
@@ -8,31 +8,94 @@ from rxbp.overflowstrategy import OverflowStrategy
 from rxbp.pipeoperation import PipeOperation
 from rxbp.scheduler import Scheduler
 from rxbp.subscriber import Subscriber
-from rxbp.typing import ValueType
+from rxbp.typing import ValueType, ElementType
 from rxbp.utils.getstacklines import get_stack_lines
 
 
-def buffer(buffer_size: int = None):
+def asof_join(other: Flowable, key: Callable[[Any], Any] = None, tolerance: Any = None):
+    """
+    Join each element with the last element of the other Flowable whose key is less than or equal
+    to its key. Both Flowables need to be sorted by key. The elements are emitted as tuples
+    `(elem, other_elem)`, where `other_elem` is None if no such element exists.
+
+    :param other: Flowable whose elements get joined to the elements of this Flowable
+    :param key: function selecting the key of an element; if None, the elements are compared directly
+    :param tolerance: maximum difference between the keys of joined elements
+    """
+
+    def op_func(source: Flowable):
+        return source.asof_join(other, key=key, tolerance=tolerance)
+
+    return PipeOperation(op_func)
+
+
+def buffer(
+        buffer_size: int = None,
+        low_watermark: int = None,
+        size_func: Callable[[List[Any]], int] = None,
+):
     """
     Buffer the element emitted by the source without back-pressure until the buffer is full.
+    Buffered batches are sent downstream as a single merged batch.
+
+    :param buffer_size: high watermark, the source is back-pressured once more elements are
+        buffered, or sent but not yet acknowledged
+    :param low_watermark: the source is released once the buffer size drops to this number
+        (default: half of the buffer size)
+    :param size_func: maps a batch to its size, e.g. its number of bytes (default: number of
+        elements)
+    """
+
+    def op_func(source: Flowable):
+        return source.buffer(
+            buffer_size=buffer_size,
+            low_watermark=low_watermark,
+            size_func=size_func,
+        )
+
+    return PipeOperation(op_func)
+
+
+def buffer_with_count_or_time(count: int, timespan: float):
+    """ Coalesce the batches emitted by the source into batches of `count` elements.
+    Buffered elements are emitted at the latest after `timespan` seconds, e.g.
+
+    ::
+
+        rxbp.interval(0.001).pipe(
+            rxbp.op.buffer_with_count_or_time(count=100, timespan=0.1),
+        )
+
+    :param count: maximum number of elements in a batch
+    :param timespan: maximum number of seconds an element is buffered
     """
 
     def op_func(source: Flowable):
-        return source.buffer(buffer_size=buffer_size)
+        return source.rebatch(batch_size=count, timespan=timespan)
 
     return PipeOperation(op_func)
 
 
-def concat(*sources: FlowableMixin):
+def concat(*sources: FlowableMixin, lazy: bool = None):
     """
     Concatentates Flowables sequences together by back-pressuring the tail Flowables until
     the current Flowable has completed.
 
     :param sources: other Flowables that get concatenate to this Flowable.
+    :param lazy: if set to True, a Flowable is subscribed only after the previous Flowable
+        completed, which only works for cold Flowables. By default, the Flowables are subscribed
+        lazily only if they are created by `from_list`, `from_range`, `from_iterable`, `return_value`
+        or `empty`, possibly followed by `map`, `map_batch`, `map_to_iterator`, `filter` or
+        `filter_mask`; otherwise, all Flowables are subscribed at once to not miss elements of
+        hot Flowables.
     """
 
     def op_func(left: Flowable):
-        return left.concat(*sources)
+        # indexed Flowables are always concatenated eagerly
+        if lazy is None:
+            return left.concat(*sources)
+
+        return left.concat(*sources, lazy=lazy)
 
     return PipeOperation(op_func)
 
@@ -181,6 +244,25 @@ def filter(predicate: Callable[[Any], bool]):
     return PipeOperation(op_func)
 
 
+def filter_mask(predicate: Callable[[ElementType], Any]):
+    """
+    Only emit those elements selected by a boolean mask. The mask is computed for
+    the whole batch by a single call of the given predicate, e.g.
+
+    ::
+
+        rxbp.op.filter_mask(lambda batch: batch > 0.5)
+
+    :param predicate: a function that maps a batch to a boolean mask of the same length
+    :return: filtered Flowable
+    """
+
+    def op_func(left: Flowable):
+        return left.filter_mask(predicate=predicate)
+
+    return PipeOperation(op_func)
+
+
 def first():
     """
     Emit the first element only and stop the Flowable sequence thereafter.
@@ -216,19 +298,34 @@ def first_or_default(lazy_val: Callable[[], Any]):
     return PipeOperation(op_func)
 
 
-def flat_map(func: Callable[[Any], Flowable]):
+def flat_map(
+        func: Callable[[Any], Flowable],
+        max_concurrent: int = None,
+        ordered: bool = None,
+):
     """
     Apply a function to each item emitted by the source and flattens the result.
 
     The specified function must return a Flowable. The resulting Flowable
     concatenates the elements of each inner Flowables.
     The resulting Flowable concatenates the items of each inner Flowable.
+
+    :param max_concurrent: if given, up to `max_concurrent` inner Flowables are
+    subscribed and observed at the same time. The source is back-pressured while
+    `max_concurrent` inner Flowables are active.
+    :param ordered: if True (default), the items of an inner Flowable are emitted
+    only after all previous inner Flowables completed. Otherwise, the items are
+    emitted in the order they are received from the inner Flowables; without
+    `max_concurrent`, any number of inner Flowables is observed at the same time.
     """
 
+    if max_concurrent is not None and max_concurrent < 1:
+        raise Exception(f'max_concurrent needs to be at least 1, got "{max_concurrent}"')
+
     stack = get_stack_lines()
 
     def op_func(source: Flowable):
-        return source.flat_map(func=func, stack=stack)
+        return source.flat_map(func=func, stack=stack, max_concurrent=max_concurrent, ordered=ordered)
 
     return PipeOperation(op_func)
 
@@ -242,6 +339,46 @@ def flatten():
     return PipeOperation(op_func)
 
 
+def group_by(
+        key_func: Callable[[Any], Any],
+        max_groups: int = None,
+        group_buffer: int = None,
+):
+    """
+    Group the elements by the key selected by `key_func` and emit a `(key, Flowable)`
+    pair for each new key. Each element is routed to its group by a single dictionary
+    lookup.
+
+    The group Flowables are hot. Each group buffers the elements its observer did not
+    acknowledge yet, including the elements received before the group got observed. By
+    default, the buffers are unbounded and the source is never back-pressured, such that
+    the groups can be observed in any order, e.g. one after the other by `flat_map`.
+
+    To bound the memory, set `group_buffer` and observe the groups concurrently, e.g.
+
+    ::
+
+        rxbp.op.group_by(lambda v: v.device_id, max_groups=100, group_buffer=1000),
+        rxbp.op.flat_map(lambda kv: kv[1].pipe(...), max_concurrent=100, ordered=False),
+
+    With `group_buffer`, the pipeline stalls once the buffer of a group that is not
+    observed is full, e.g. if `flat_map` uses the default `ordered=True`, or if its
+    `max_concurrent` is smaller than the number of groups. Set `max_groups` to at most
+    `max_concurrent`, or omit `max_concurrent` to observe any number of groups.
+
+    :param key_func: function selecting the key of an element
+    :param max_groups: maximum number of groups; once exceeded, the least recently
+    used idle group gets completed
+    :param group_buffer: number of elements buffered per group. If None, the buffers
+    are unbounded; otherwise, the source is back-pressured by groups whose buffer is full.
+    """
+
+    def op_func(source: Flowable):
+        return source.group_by(key_func=key_func, max_groups=max_groups, group_buffer=group_buffer)
+
+    return PipeOperation(op_func)
+
+
 def last():
     """
     Emit the last element of the Flowable sequence
@@ -279,6 +416,23 @@ def map(func: Callable[[Any], Any]):
     return PipeOperation(op_func)
 
 
+def map_batch(func: Callable[[ElementType], ElementType]):
+    """ Map each batch emitted by the source by applying the given function to
+    the whole batch at once. Array batches (e.g. NumPy arrays) are kept intact, e.g.
+
+    ::
+
+        rxbp.op.map_batch(lambda batch: 2 * batch)
+
+    :param func: function that maps a batch to a new batch
+    """
+
+    def op_func(source: Flowable):
+        return source.map_batch(func=func)
+
+    return PipeOperation(op_func)
+
+
 def map_to_iterator(
         func: Callable[[ValueType], Iterator[ValueType]],
 ):
@@ -295,15 +449,32 @@ def map_to_iterator(
     return PipeOperation(op_func)
 
 
-def merge(*others: Flowable):
+def merge(*others: Flowable, prioritized: bool = False):
     """
     Merge the elements of this and the other Flowable sequences into a single *Flowable*.
 
     :param sources: other Flowables that get merged to this Flowable.
+    :param prioritized: if True, elements buffered while the downstream is busy are sent in the order
+    of the Flowables; otherwise, they are sent in the order of arrival
     """
 
     def op_func(left: Flowable):
-        return left.merge(*others)
+        return left.merge(*others, prioritized=prioritized)
+
+    return PipeOperation(op_func)
+
+
+def merge_sorted(other: Flowable, key: Callable[[Any], Any] = None):
+    """
+    Merge the elements of this and the other Flowable, both sorted by key, into a single sorted
+    *Flowable*. On equal keys, the elements of this Flowable are emitted first.
+
+    :param other: Flowable whose elements get merged to this Flowable
+    :param key: function selecting the key of an element; if None, the elements are compared directly
+    """
+
+    def op_func(source: Flowable):
+        return source.merge_sorted(other, key=key)
 
     return PipeOperation(op_func)
 
@@ -334,6 +505,60 @@ def pairwise():
     return PipeOperation(op_func)
 
 
+def parallel_map(func: Callable[[Any], Any], max_workers: int = None, ordered: bool = True):
+    """ Map each element emitted by the source by applying the given function. Whole
+    batches are sent to worker processes, which makes it possible to use multiple
+    cores for CPU-bound functions, e.g.
+
+    ::
+
+        rxbp.range(1000).pipe(
+            rxbp.op.parallel_map(extract_features, max_workers=4),
+        )
+
+    The function and the elements need to be picklable. If the Flowable is subscribed
+    with a `ProcessPoolScheduler`, its worker processes are used; otherwise, a process
+    pool is created for each subscription.
+
+    :param func: picklable function that defines the mapping applied to each element
+    :param max_workers: maximum number of batches mapped at the same time; the source \
+    gets back-pressured once this number of batches are in flight
+    :param ordered: if True, the mapped batches are emitted in the order they were received; \
+    otherwise, they are emitted as soon as they are mapped
+    """
+
+    def op_func(source: Flowable):
+        return source.parallel_map(func=func, max_workers=max_workers, ordered=ordered)
+
+    return PipeOperation(op_func)
+
+
+def rebatch(batch_size: int = None, target_latency: float = None, timespan: float = None):
+    """ Merge and split the batches emitted by the source into batches of a given size.
+    The remaining elements are emitted once the source completes, or, if a timespan is
+    given, at the latest after the timespan.
+
+    If a target latency is given, the batch size grows as long as the downstream
+    acknowledges batches faster than the target latency and shrinks otherwise, e.g.
+
+    ::
+
+        rxbp.op.rebatch(target_latency=0.01)
+
+    :param batch_size: number of elements in a batch, or the initial batch size if \
+    `target_latency` is specified
+    :param target_latency: if specified, the batch size adapts such that a batch gets \
+    acknowledged by the downstream within the given number of seconds
+    :param timespan: if specified, buffered elements are emitted at the latest after \
+    the given number of seconds; requires a non-blocking scheduler
+    """
+
+    def op_func(source: Flowable):
+        return source.rebatch(batch_size=batch_size, target_latency=target_latency, timespan=timespan)
+
+    return PipeOperation(op_func)
+
+
 def reduce(
         func: Callable[[Any, Any], Any],
         initial: Any,
@@ -352,6 +577,29 @@ def reduce(
     return PipeOperation(op_func)
 
 
+def reduce_batch(
+        func: Callable[[Any, ElementType], Any],
+        initial: Any,
+):
+    """
+    Apply an accumulator function over each batch of a Flowable sequence and emits
+    a single element, e.g.
+
+    ::
+
+        rxbp.op.reduce_batch(lambda acc, batch: acc + batch.sum(), initial=0)
+
+    :param func: An accumulator function to be invoked on each batch
+    :param initial: The initial accumulator value
+    :return: a Flowable that emits the final accumulated value
+    """
+
+    def op_func(source: Flowable):
+        return source.reduce_batch(func=func, initial=initial)
+
+    return PipeOperation(op_func)
+
+
 def repeat_first():
     """
     Return a Flowable that repeats the first element it receives from the source
@@ -364,6 +612,33 @@ def repeat_first():
     return PipeOperation(op_func)
 
 
+def rolling(agg: Union[str, Callable[[], Any]], n: int, value: Callable[[Any], Any] = None):
+    """
+    Emit the aggregate of the last `n` elements for every element, once `n`
+    elements are received. The aggregate is updated incrementally in O(1) per
+    element (amortized for "min" and "max"), e.g.
+
+    ::
+
+        rxbp.op.rolling("mean", n=100)
+
+    :param agg: either one of "sum", "mean", "min", "max", "var", "std", or a
+    function returning an object with an `add` and a `remove` method and a
+    `value` property
+    :param n: number of elements in the window
+    :param value: function selecting the value of an element that is aggregated;
+    defaults to the element itself
+    """
+
+    if n < 1:
+        raise Exception(f'n needs to be at least 1, got "{n}"')
+
+    def op_func(source: Flowable):
+        return source.rolling(agg=agg, n=n, value=value)
+
+    return PipeOperation(op_func)
+
+
 def scan(func: Callable[[Any, Any], Any], initial: Any):
     """
     Apply an accumulator function over a Flowable sequence and return each intermediate result.
@@ -381,6 +656,31 @@ def scan(func: Callable[[Any, Any], Any], initial: Any):
     return PipeOperation(op_func)
 
 
+def scan_cumulative(
+        func: Callable[[Any, ElementType], ElementType],
+        initial: Any,
+):
+    """
+    Apply a cumulative function over each batch of a Flowable sequence and return
+    each intermediate result, e.g.
+
+    ::
+
+        rxbp.op.scan_cumulative(lambda acc, batch: acc + np.cumsum(batch), initial=0)
+
+    The last accumulated value of a batch is used as the accumulator for the next batch.
+
+    :param func: A cumulative function to be invoked on each batch
+    :param initial: The initial accumulator value
+    :return: a Flowable that emits the accumulated values
+    """
+
+    def op_func(source: Flowable):
+        return source.scan_cumulative(func=func, initial=initial)
+
+    return PipeOperation(op_func)
+
+
 # def share():
 #     """
 #     Broadcast the elements of the Flowable to possibly multiple subscribers.
@@ -395,6 +695,36 @@ def scan(func: Callable[[Any, Any], Any], initial: Any):
 #     return PipeOperation(inner_func)
 
 
+def to_async_iterator(scheduler: Scheduler = None, prefetch: int = None):
+    """
+    Subscribe to the Flowable once iterated with `async for` and return an asynchronous
+    iterator over the emitted elements.
+
+    :param scheduler: scheduler used to subscribe the Flowable; if None, an `AsyncIOScheduler`
+    running on the event loop of the caller is used
+    :param prefetch: maximum number of batches buffered before the Flowable gets back-pressured
+    """
+
+    def op_func(source: Flowable):
+        return source.to_async_iterator(scheduler=scheduler, prefetch=prefetch)
+
+    return PipeOperation(op_func)
+
+
+def to_iterator(scheduler: Scheduler = None, prefetch: int = None):
+    """
+    Subscribe to the Flowable and return a blocking iterator over the emitted elements.
+
+    :param scheduler: scheduler used to subscribe the Flowable
+    :param prefetch: maximum number of batches buffered before the Flowable gets back-pressured
+    """
+
+    def op_func(source: Flowable):
+        return source.to_iterator(scheduler=scheduler, prefetch=prefetch)
+
+    return PipeOperation(op_func)
+
+
 def to_list():
     """
     Create a new Flowable that collects the elements from the source sequence,
@@ -407,6 +737,92 @@ def to_list():
     return PipeOperation(op_func)
 
 
+def unbatch(batch_size: int):
+    """ Split the batches emitted by the source into batches of at most `batch_size` elements.
+    Smaller batches are sent as they are.
+
+    :param batch_size: maximum number of elements in a batch
+    """
+
+    def op_func(source: Flowable):
+        return source.unbatch(batch_size=batch_size)
+
+    return PipeOperation(op_func)
+
+
+def window_count(
+        n: int,
+        step: int = None,
+        agg: Union[str, Callable[[], Any]] = None,
+        value: Callable[[Any], Any] = None,
+):
+    """
+    Emit a window of the last `n` elements every `step` elements. Windows with
+    fewer than `n` elements are not emitted. The elements are kept in a ring buffer,
+    such that sliding the window costs O(1) per element.
+
+    :param n: number of elements in a window
+    :param step: number of elements between two windows, defaults to `n`
+    :param agg: if given, each window is aggregated by an incremental accumulator
+    instead of being emitted as a list; either one of "sum", "mean", "min", "max",
+    "var", "std", or a function returning an object with an `add` and a `remove`
+    method and a `value` property
+    :param value: function selecting the value of an element that enters the window;
+    defaults to the element itself
+    """
+
+    if n < 1 or (step is not None and step < 1):
+        raise Exception(f'n and step need to be at least 1, got "{n}" and "{step}"')
+
+    def op_func(source: Flowable):
+        return source.window_count(n=n, step=step, agg=agg, value=value)
+
+    return PipeOperation(op_func)
+
+
+def window_time(
+        span: float,
+        step: float = None,
+        agg: Union[str, Callable[[], Any]] = None,
+        timestamp: Callable[[Any], float] = None,
+        value: Callable[[Any], Any] = None,
+):
+    """
+    Emit the elements falling into the time windows `[k*step, k*step + span)`.
+    A window is emitted once an element with a later timestamp is received or
+    once the source completes; empty windows are skipped.
+
+    ::
+
+        rxbp.op.window_time(span=10.0, step=1.0, agg="max", timestamp=lambda v: v.time)
+
+    For `(timestamp, measurement)` records, the measurement is selected by `value`, e.g.
+
+    ::
+
+        rxbp.op.window_time(span=10.0, agg="mean", timestamp=lambda r: r[0], value=lambda r: r[1])
+
+    :param span: duration of a window in seconds
+    :param step: seconds between the start of two windows, defaults to `span`
+    :param agg: if given, each window is aggregated by an incremental accumulator
+    instead of being emitted as a list; either one of "sum", "mean", "min", "max",
+    "var", "std", or a function returning an object with an `add` and a `remove`
+    method and a `value` property
+    :param timestamp: function returning the non-decreasing timestamp of an
+    element in seconds; defaults to the time the element is received
+    :param value: function selecting the value of an element that enters the window;
+    defaults to the element itself
+    """
+
+    if span <= 0 or (step is not None and step <= 0):
+        raise Exception(f'span and step need to be positive, got "{span}" and "{step}"')
+
+    def op_func(source: Flowable):
+        return source.window_time(span=span, step=step, agg=agg, timestamp=timestamp, value=value)
+
+    return PipeOperation(op_func)
+
+
 def zip(*others: Flowable):
     """
     Create a new Flowable from one or more Flowables by combining their item in pairs in a strict sequence.
@@ -435,7 +851,10 @@ def zip_with_index():
 
 def strategy(overflow_strategy: OverflowStrategy):
     """
-    Buffer the element emitted by the source use overflow strategy.
+    Buffer the element emitted by the source use overflow strategy. Except for `BackPressure`,
+    the strategies drop batches once the buffer is full. Each subscription counts the dropped
+    batches and the buffer fill in its own `OverflowStats`, which are passed to the `on_subscribe`
+    callback of the strategy once subscribed and to the `on_drop` callback whenever batches are dropped.
     """
 
     def op_func(source: Flowable):
@@ -1,9 +1,46 @@
 from abc import ABC
+from typing import Callable
+
+
+class OverflowStats:
+    """
+    Counters of an evicting buffer, which are updated whenever batches are buffered,
+    sent or dropped. Each subscription creates its own buffer and its own counters.
+    """
+
+    def __init__(self):
+        # number of batches and elements that got dropped because the buffer was full
+        self.dropped_batches = 0
+        self.dropped_elements = 0
+
+        # number of batches and elements currently held by the buffer
+        self.buffered_batches = 0
+        self.buffered_elements = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(dropped_batches={self.dropped_batches}, ' \
+               f'dropped_elements={self.dropped_elements}, buffered_batches={self.buffered_batches}, ' \
+               f'buffered_elements={self.buffered_elements})'
 
 
 class OverflowStrategy(ABC):
-    def __init__(self, buffer_size: int):
+    def __init__(
+            self,
+            buffer_size: int,
+            on_drop: Callable[[OverflowStats], None] = None,
+            on_subscribe: Callable[[OverflowStats], None] = None,
+    ):
+        """
+        :param buffer_size: maximum number of buffered batches
+        :param on_drop: called with the updated stats of the subscription each time
+            batches are dropped
+        :param on_subscribe: called with the stats of each new subscription, which
+            makes the current buffer fill readable before anything is dropped
+        """
+
         self.buffer_size = buffer_size
+        self.on_drop = on_drop
+        self.on_subscribe = on_subscribe
 
 
 class BackPressure(OverflowStrategy):
@@ -15,18 +52,18 @@ class BackPressure(OverflowStrategy):
 
 
 class DropOld(OverflowStrategy):
-    # unbounded buffer
-
-    # def __init__(self, buffer_size: int):
-    #     self.buffer_size = buffer_size
+    """
+    DropOld strategy drops the oldest batch in the buffer to make room for a new batch
+    once the buffer is full.
+    """
     pass
 
 
 class ClearBuffer(OverflowStrategy):
-    # unbounded buffer
-
-    # def __init__(self, buffer_size: int):
-    #     self.buffer_size = buffer_size
+    """
+    ClearBuffer strategy drops all batches in the buffer to make room for a new batch
+    once the buffer is full.
+    """
     pass
 
 
@@ -11,14 +11,33 @@ from rxbp.scheduler import SchedulerBase
 
 class AsyncIOScheduler(SchedulerBase, Disposable):
     def __init__(self, loop: asyncio.AbstractEventLoop = None, new_thread: bool = None):
+        """
+        :param loop: the event loop the actions are scheduled on
+        :param new_thread: if set to False, no thread is started to run the event loop; if in
+            addition no loop is given, the actions are scheduled on the running event loop of
+            the caller
+        """
+
         super().__init__()
 
-        self.loop: asyncio.AbstractEventLoop = loop or asyncio.new_event_loop()
+        if loop is not None:
+            self.loop = loop
+        elif new_thread is False:
+            # an event loop that is not running would never execute the scheduled actions
+            try:
+                self.loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise Exception('AsyncIOScheduler with new_thread=False needs to be created on a running '
+                                'event loop if no loop is given')
+        else:
+            self.loop = asyncio.new_event_loop()
 
         if new_thread is None or new_thread is True:
-            t = Thread(target=self.start_loop)
-            t.setDaemon(True)
-            t.start()
+            self.thread = Thread(target=self.start_loop)
+            self.thread.setDaemon(True)
+            self.thread.start()
+        else:
+            self.thread = None
 
     @property
     def idle(self) -> bool:
@@ -40,13 +59,23 @@ class AsyncIOScheduler(SchedulerBase, Disposable):
         # return self.loop.time()
         return datetime.datetime.now()
 
+    def _is_loop_thread(self):
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
     def schedule(self,
                  action: ScheduledAction,
                  state=None):
         def func():
             action(self, state)
 
-        handle = self.loop.call_soon_threadsafe(func)
+        # avoid waking up the event loop if the action is scheduled from within the loop
+        if self._is_loop_thread():
+            handle = self.loop.call_soon(func)
+        else:
+            handle = self.loop.call_soon_threadsafe(func)
 
         def dispose():
             handle.cancel()
@@ -0,0 +1,45 @@
+import asyncio
+import concurrent.futures
+import os
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Callable, Any
+
+from rxbp.schedulers.asyncioscheduler import AsyncIOScheduler
+
+
+class ProcessPoolScheduler(AsyncIOScheduler):
+    """ A scheduler that executes scheduled actions on an event loop thread and provides a
+    pool of worker processes for CPU-bound work.
+
+    Scheduled actions are closures over the observer state and cannot be sent to another process,
+    therefore, they are executed on the event loop. CPU-bound functions are sent to the worker
+    processes by the `submit` method, e.g. by the `parallel_map` operator. Functions and their
+    arguments need to be picklable.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = None,
+            loop: asyncio.AbstractEventLoop = None,
+            new_thread: bool = True,
+            executor: concurrent.futures.Executor = None,
+    ):
+        # starts a new thread
+        super().__init__(loop=loop, new_thread=new_thread)
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor or ProcessPoolExecutor(max_workers=self.max_workers)
+
+    @property
+    def is_order_guaranteed(self) -> bool:
+        return True
+
+    def submit(self, func: Callable, *args: Any) -> Future:
+        """ Executes `func(*args)` in a worker process
+        """
+
+        return self.executor.submit(func, *args)
+
+    def dispose(self):
+        self.executor.shutdown(wait=False)
+        super().dispose()
@@ -1,13 +1,13 @@
-import datetime
+import heapq
+import itertools
 import logging
 import threading
 import time
 import traceback
-from typing import Optional
+from collections import deque
+from typing import Optional, Any
 
 from rx.core import typing
-from rx.internal import PriorityQueue
-from rx.scheduler.scheduleditem import ScheduledItem
 from rx.scheduler.scheduler import Scheduler
 
 from rxbp.scheduler import SchedulerBase as RxBPSchedulerBase
@@ -15,15 +15,59 @@ from rxbp.scheduler import SchedulerBase as RxBPSchedulerBase
 log = logging.getLogger('Rx')
 
 
+class TrampolineItem(typing.Disposable):
+    """
+    An action scheduled on the trampoline. Disposing the item before it is invoked
+    cancels the action, disposing it afterwards disposes whatever the action returned.
+    """
+
+    __slots__ = ('action', 'state', 'is_disposed', 'disposable')
+
+    def __init__(self, action: typing.ScheduledAction, state: Any):
+        self.action = action
+        self.state = state
+        self.is_disposed = False
+        self.disposable = None
+
+    def invoke(self, scheduler: 'TrampolineScheduler'):
+        ret = self.action(scheduler, self.state)
+
+        if isinstance(ret, typing.Disposable):
+            if self.is_disposed:
+                ret.dispose()
+            else:
+                self.disposable = ret
+
+    def dispose(self) -> None:
+        self.is_disposed = True
+
+        disposable = self.disposable
+        if disposable is not None:
+            self.disposable = None
+            disposable.dispose()
+
+
 class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
     def __init__(self):
         """Gets a scheduler that schedules work as soon as possible on the
-        current thread."""
+        current thread.
+
+        Immediate actions are kept in a FIFO queue. Timed actions are kept in a
+        separate priority queue ordered by their monotonic due time, which is only
+        consulted if some timed action is pending.
+        """
 
         super().__init__()
 
         self._idle = True
-        self.queue = PriorityQueue()
+
+        # immediate actions
+        self.queue = deque()
+
+        # timed actions as (duetime, sequence number, item) tuples, where the duetime
+        # is given by `time.monotonic`
+        self.timed_queue = []
+        self._timed_counter = itertools.count()
 
         self.lock = threading.RLock()
 
@@ -51,7 +95,21 @@ class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
             (best effort).
         """
 
-        return self.schedule_absolute(self.now, action, state=state)
+        item = TrampolineItem(action, state)
+
+        with self.lock:
+            self.queue.append(item)
+
+            if self._idle:
+                self._idle = False
+                start_trampoline = True
+            else:
+                start_trampoline = False
+
+        if start_trampoline:
+            self._run_trampoline()
+
+        return item
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -68,9 +126,28 @@ class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
             (best effort).
         """
 
-        # duetime = SchedulerBase.normalize(self.to_timedelta(duetime))
-        duetime = self.to_timedelta(duetime)
-        return self.schedule_absolute(self.now + duetime, action, state=state)
+        seconds = self.to_seconds(duetime)
+
+        if seconds <= 0:
+            return self.schedule(action, state=state)
+
+        log.warning("Do not schedule imperative work!")
+
+        item = TrampolineItem(action, state)
+
+        with self.lock:
+            heapq.heappush(self.timed_queue, (time.monotonic() + seconds, next(self._timed_counter), item))
+
+            if self._idle:
+                self._idle = False
+                start_trampoline = True
+            else:
+                start_trampoline = False
+
+        if start_trampoline:
+            self._run_trampoline()
+
+        return item
 
     def schedule_absolute(self, duetime: typing.AbsoluteTime,
                           action: typing.ScheduledAction,
@@ -84,48 +161,49 @@ class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
         """
 
         duetime = self.to_datetime(duetime)
+        return self.schedule_relative(duetime - self.now, action, state=state)
 
-        if duetime > self.now:
-            log.warning("Do not schedule imperative work!")
+    def _invoke(self, item: TrampolineItem):
+        if item.is_disposed:
+            return
 
-        si = ScheduledItem(self, state, action, duetime)
+        try:
+            item.invoke(self)
+        except Exception:
+            traceback.print_exc()
 
-        with self.lock:
-            self.queue.enqueue(si)
+    def _run_trampoline(self):
+        queue = self.queue
+        timed_queue = self.timed_queue
 
-            if self._idle:
-                self._idle = False
-                start_trampoline = True
-            else:
-                start_trampoline = False
+        while True:
 
-        if start_trampoline:
-            while True:
-                try:
-                    while self.queue:
-                        item: ScheduledItem = self.queue.peek()
-
-                        if item.is_cancelled():
-                            with self.lock:
-                                self.queue.dequeue()
-
-                        else:
-                            diff = item.duetime - item.scheduler.now
-                            if diff <= datetime.timedelta(0):
-                                item.invoke()
-                                with self.lock:
-                                    self.queue.dequeue()
-                            else:
-                                time.sleep(diff.total_seconds())
-
-                except:
-                    traceback.print_exc()
-                finally:
-                    with self.lock:
-                        if not self.queue:
-                            self._idle = True
-                            # self.queue.clear()
-                            break
-
-        return si.disposable
+            # fast path, only immediate actions are pending
+            while queue and not timed_queue:
+                self._invoke(queue.popleft())
+
+            if timed_queue:
+                with self.lock:
+                    duetime, _, item = timed_queue[0]
+                    diff = duetime - time.monotonic()
+
+                    # a timed action that is due runs before the immediate actions
+                    # scheduled after it
+                    if diff <= 0:
+                        heapq.heappop(timed_queue)
+                    else:
+                        item = None
+
+                if item is not None:
+                    self._invoke(item)
+
+                elif queue:
+                    self._invoke(queue.popleft())
+
+                else:
+                    time.sleep(diff)
 
+            with self.lock:
+                if not queue and not timed_queue:
+                    self._idle = True
+                    break
@@ -1,5 +1,6 @@
+import asyncio
 import math
-from typing import Iterable, Any, List
+from typing import Iterable, Any, List, AsyncIterable
 
 import rx
 from rx import operators
@@ -7,6 +8,8 @@ from rx.core import typing
 
 from rxbp.flowable import Flowable
 from rxbp.flowables.createflowable import CreateFlowable
+from rxbp.flowables.fromadaptiveiterableflowable import FromAdaptiveIterableFlowable
+from rxbp.flowables.fromasynciterableflowable import FromAsyncIterableFlowable
 from rxbp.flowables.fromemptyflowable import FromEmptyFlowable
 from rxbp.flowables.fromiterableflowable import FromIterableFlowable
 from rxbp.flowables.fromrxbufferingflowable import FromRxBufferingFlowable
@@ -14,22 +17,32 @@ from rxbp.flowables.fromrxevictingflowable import FromRxEvictingFlowable
 from rxbp.flowables.fromsingleelementflowable import FromSingleElementFlowable
 from rxbp.flowables.intervalflowable import IntervalFlowable
 from rxbp.init.initflowable import init_flowable
-from rxbp.overflowstrategy import OverflowStrategy, BackPressure, DropOld, ClearBuffer
+from rxbp.internal.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.overflowstrategy import OverflowStrategy, BackPressure, DropOld, ClearBuffer, Drop
 from rxbp.utils.getstacklines import get_stack_lines
+from rxbp.utils.isarraybatch import is_array_batch
 
 
-def concat(*sources: Flowable):
+def concat(*sources: Flowable, lazy: bool = None):
     """
     Concatentates Flowables sequences together by back-pressuring the tail Flowables until
     the current Flowable has completed.
 
     :param sources: Zero or more Flowables
+    :param lazy: if set to True, a Flowable is subscribed only after the previous Flowable
+        completed, which only works for cold Flowables. By default, the Flowables are subscribed
+        lazily only if they are created by `from_list`, `from_range`, `from_iterable`, `return_value`
+        or `empty`, possibly followed by `map`, `map_batch`, `map_to_iterator`, `filter` or
+        `filter_mask`; otherwise, all Flowables are subscribed at once to not miss elements of
+        hot Flowables.
     """
 
     if len(sources) == 0:
         return empty()
-    else:
+    elif lazy is None:
         return sources[0].concat(*sources[1:])
+    else:
+        return sources[0].concat(*sources[1:], lazy=lazy)
 
 
 def empty():
@@ -40,6 +53,38 @@ def empty():
     return init_flowable(FromEmptyFlowable())
 
 
+def from_async_iterable(
+        async_iterable: AsyncIterable,
+        batch_size: int = None,
+        is_batched: bool = None,
+        loop: asyncio.AbstractEventLoop = None,
+) -> Flowable:
+    """
+    Create a Flowable that emits the elements of an asynchronous iterable, e.g. an async generator.
+    The next element is only requested once the downstream acknowledged the previous batch.
+
+    The iterable is iterated on the given event loop. If no loop is given, it is iterated on
+    the loop of an `AsyncIOScheduler` used to subscribe, or else on the running event loop of
+    the caller. If there is no such loop, subscribing raises an exception.
+
+    :param async_iterable: the asynchronous iterable whose elements are sent
+    :param batch_size: determines the number of elements that are sent in a batch
+    :param is_batched: if set to True, the elements of the iterable are batches, which are
+    sent downstream as they are
+    :param loop: the event loop the iterable is iterated on
+    """
+
+    if batch_size is None:
+        batch_size = 1
+
+    return init_flowable(FromAsyncIterableFlowable(
+        async_iterable=async_iterable,
+        batch_size=batch_size,
+        is_batched=is_batched is True,
+        loop=loop,
+    ))
+
+
 def from_iterable(iterable: Iterable): #, base: Any = None):
     """
     Create a Flowable that emits each element of the given iterable.
@@ -54,16 +99,48 @@ def from_iterable(iterable: Iterable): #, base: Any = None):
     ))
 
 
-def from_list(val: List, batch_size: int = None, base: Any = None):
+def from_list(
+        val: List,
+        batch_size: int = None,
+        base: Any = None,
+        as_array: bool = None,
+        target_latency: float = None,
+):
     """
     Create a Flowable that emits each element of the given list.
 
+    If the given list is an array (e.g. a NumPy ndarray), the batches are sent as
+    array slices.
+
     :param val: the list whose elements are sent
     :param batch_size: determines the number of elements that are sent in a batch
     :param base: the base of the Flowable sequence
+    :param as_array: if set to True, the list is converted to a NumPy array and the
+    batches are sent as array slices
+    :param target_latency: if set, the batch size adapts such that a batch gets acknowledged
+    by the downstream within the given number of seconds; `batch_size` is used as initial size
     """
 
-    buffer = val
+    if as_array is True:
+        import numpy as np
+
+        buffer = np.asarray(val)
+    else:
+        buffer = val
+
+    if target_latency is not None:
+        def gen_batches(adaptive_batch_size: AdaptiveBatchSize):
+            idx = 0
+            while idx < len(buffer):
+                next_idx = idx + adaptive_batch_size.batch_size
+                yield buffer[idx:next_idx]
+                idx = next_idx
+
+        return init_flowable(FromAdaptiveIterableFlowable(
+            lazy_iterable=gen_batches,
+            target_latency=target_latency,
+            initial_size=batch_size,
+        ))
 
     if batch_size is None or len(buffer) == batch_size:
 
@@ -72,7 +149,7 @@ def from_list(val: List, batch_size: int = None, base: Any = None):
         ))
 
     else:
-        if batch_size == 1:
+        if batch_size == 1 and not is_array_batch(buffer):
             class EachElementIterable():
                 def __iter__(self):
                     return ([e] for e in buffer)
@@ -101,13 +178,23 @@ def from_list(val: List, batch_size: int = None, base: Any = None):
         ))
 
 
-def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any = None):
+def from_range(
+        arg1: int,
+        arg2: int = None,
+        batch_size: int = None,
+        base: Any = None,
+        as_array: bool = None,
+        target_latency: float = None,
+):
     """
     Create a Flowable that emits elements defined by the range.
 
     :param arg1: start identifier
     :param arg2: end identifier
     :param batch_size: determines the number of elements that are sent in a batch
+    :param as_array: if set to True, the batches are sent as NumPy arrays
+    :param target_latency: if set, the batch size adapts such that a batch gets acknowledged
+    by the downstream within the given number of seconds; `batch_size` is used as initial size
     """
 
     if arg2 is None:
@@ -119,7 +206,33 @@ def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any =
 
     n_elements = stop_idx - start_idx
 
-    if batch_size is None:
+    if as_array is True:
+        import numpy as np
+
+        to_batch = np.arange
+    else:
+        to_batch = range
+
+    if target_latency is not None:
+        def gen_batches(adaptive_batch_size: AdaptiveBatchSize):
+            current_start_idx = start_idx
+            while current_start_idx < stop_idx:
+                current_stop_idx = min(current_start_idx + adaptive_batch_size.batch_size, stop_idx)
+                yield to_batch(current_start_idx, current_stop_idx)
+                current_start_idx = current_stop_idx
+
+        return init_flowable(FromAdaptiveIterableFlowable(
+            lazy_iterable=gen_batches,
+            target_latency=target_latency,
+            initial_size=batch_size,
+        ))
+
+    elif batch_size is None and as_array is True:
+        return init_flowable(FromSingleElementFlowable(
+            lazy_elem=lambda: to_batch(start_idx, stop_idx),
+        ))
+
+    elif batch_size is None:
         class FromRangeIterable:
             def __iter__(self):
                 return iter(range(start_idx, stop_idx))
@@ -141,11 +254,11 @@ def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any =
                 for idx in range(n_batches):
                     current_stop_idx = current_stop_idx + batch_size
 
-                    yield range(current_start_idx, current_stop_idx)
+                    yield to_batch(current_start_idx, current_stop_idx)
 
                     current_start_idx = current_stop_idx
 
-                yield range(current_start_idx, stop_idx)
+                yield to_batch(current_start_idx, stop_idx)
 
         iterable = FromRangeIterable()
 
@@ -164,10 +277,13 @@ def from_rx(
     Wrap a rx.Observable and exposes it as a Flowable, relaying signals in a backpressure-aware manner.
 
     :param source: an rx.observable
-    :param overflow_strategy: define which batches are ignored once the buffer is full
+    :param overflow_strategy: define which batches are ignored once the buffer is full; each
+    subscription counts the ignored batches and elements and the buffer fill in its own
+    `OverflowStats`, which are passed to the `on_subscribe` and `on_drop` callbacks of the strategy
     :param batch_size: determines the number of elements that are sent in a batch
     :param is_batched: if set to True, the elements emitted by the source rx.Observable are
-    either of type List or of type Iterator
+    either of type List, of type Iterator or arrays (e.g. NumPy ndarrays), which are
+    sent downstream as they are
     """
 
     if is_batched is True:
@@ -180,7 +296,7 @@ def from_rx(
             operators.buffer_with_count(batch_size),
         )
 
-    if isinstance(overflow_strategy, DropOld) or isinstance(overflow_strategy, ClearBuffer):
+    if isinstance(overflow_strategy, (DropOld, ClearBuffer, Drop)):
         return init_flowable(FromRxEvictingFlowable(
             batched_source=batched_source,
             overflow_strategy=overflow_strategy,
@@ -192,7 +308,7 @@ def from_rx(
         elif isinstance(overflow_strategy, BackPressure):
             buffer_size = overflow_strategy.buffer_size
         else:
-            raise AssertionError('only BackPressure is currently supported as overflow strategy')
+            raise AssertionError(f'overflow strategy "{overflow_strategy}" is not supported')
 
         return init_flowable(FromRxBufferingFlowable(
             batched_source=batched_source,
@@ -201,17 +317,19 @@ def from_rx(
         ))
 
 
-def merge(*sources: Flowable) -> Flowable:
+def merge(*sources: Flowable, prioritized: bool = False) -> Flowable:
     """
     Merge the elements of zero or more *Flowables* into a single *Flowable*.
 
     :param sources: zero or more Flowables whose elements are merged
+    :param prioritized: if True, elements buffered while the downstream is busy are sent in the order
+    of the Flowables; otherwise, they are sent in the order of arrival
     """
 
     if len(sources) == 0:
         return empty()
     else:
-        return sources[0].merge(*sources[1:])
+        return sources[0].merge(*sources[1:], prioritized=prioritized)
 
 
 def return_value(val: Any):
@@ -0,0 +1,88 @@
+from typing import Iterator, Optional, Any
+
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.states.intstates.intterminationstate import IntTerminationState
+from rxbp.states.measuredstates.controlledzipstates import ControlledZipStates
+
+
+class IntControlledZipState:
+    """ State of the `ControlledZipObservable` encoded as an integer.
+
+    The current value, the buffered iterator and the acknowledgment of the back-pressured
+    source are kept in slots. The state is only modified while holding the lock of the
+    `ControlledZipObservable`.
+    """
+
+    __slots__ = (
+        'value', 'is_left',
+        'left_val', 'left_iter', 'left_ack',
+        'right_val', 'right_iter', 'right_ack',
+    )
+
+    WAIT_ON_LEFT_RIGHT = 0
+    WAIT_ON_LEFT = 1
+    WAIT_ON_RIGHT = 2
+    ZIP_ELEMENTS = 3
+    STOPPED = 4
+
+    def __init__(self):
+        self.value = IntControlledZipState.WAIT_ON_LEFT_RIGHT
+
+        # the side whose batch is currently zipped in state ZIP_ELEMENTS
+        self.is_left = False
+
+        self.left_val: Any = None
+        self.left_iter: Optional[Iterator] = None
+        self.left_ack: Optional[AckSubject] = None
+        self.right_val: Any = None
+        self.right_iter: Optional[Iterator] = None
+        self.right_ack: Optional[AckSubject] = None
+
+    def measure(self, termination_state: IntTerminationState) -> int:
+        """ returns the state taking into account the termination state
+        """
+
+        value = self.value
+
+        if value == IntControlledZipState.WAIT_ON_LEFT_RIGHT:
+            is_stopped = termination_state.value != IntTerminationState.INIT
+        elif value == IntControlledZipState.WAIT_ON_LEFT:
+            is_stopped = termination_state.is_left_completed()
+        elif value == IntControlledZipState.WAIT_ON_RIGHT:
+            is_stopped = termination_state.is_right_completed()
+        else:
+            return value
+
+        if is_stopped:
+            return IntControlledZipState.STOPPED
+        else:
+            return value
+
+    def get_measured_state(self, termination_state: IntTerminationState) -> ControlledZipStates.ZipState:
+        value = self.measure(termination_state)
+
+        if value == IntControlledZipState.WAIT_ON_LEFT_RIGHT:
+            return ControlledZipStates.WaitOnLeftRight()
+        elif value == IntControlledZipState.WAIT_ON_LEFT:
+            return ControlledZipStates.WaitOnLeft(
+                right_val=self.right_val,
+                right_ack=self.right_ack,
+                right_iter=self.right_iter,
+            )
+        elif value == IntControlledZipState.WAIT_ON_RIGHT:
+            return ControlledZipStates.WaitOnRight(
+                left_val=self.left_val,
+                left_ack=self.left_ack,
+                left_iter=self.left_iter,
+            )
+        elif value == IntControlledZipState.ZIP_ELEMENTS:
+            if self.is_left:
+                return ControlledZipStates.ZipElements(
+                    val=self.left_val, is_left=True, ack=self.left_ack, iter=self.left_iter,
+                )
+            else:
+                return ControlledZipStates.ZipElements(
+                    val=self.right_val, is_left=False, ack=self.right_ack, iter=self.right_iter,
+                )
+        else:
+            return ControlledZipStates.Stopped()
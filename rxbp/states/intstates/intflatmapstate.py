@@ -0,0 +1,34 @@
+from rxbp.states.measuredstates.flatmapstates import FlatMapStates
+
+
+class IntFlatMapState:
+    """ State of the `FlatMapObserver` encoded as an integer.
+
+    The state is shared between the outer and the inner observers, and is only modified
+    while holding the lock of the `FlatMapObserver`.
+    """
+
+    __slots__ = ('value',)
+
+    INITIAL = 0
+    WAIT_ON_OUTER = 1
+    ACTIVE = 2
+    ON_OUTER_COMPLETED = 3
+    STOPPED = 4
+
+    def __init__(self):
+        self.value = IntFlatMapState.INITIAL
+
+    def get_measured_state(self) -> FlatMapStates.State:
+        value = self.value
+
+        if value == IntFlatMapState.INITIAL:
+            return FlatMapStates.InitialState()
+        elif value == IntFlatMapState.WAIT_ON_OUTER:
+            return FlatMapStates.WaitOnOuter()
+        elif value == IntFlatMapState.ACTIVE:
+            return FlatMapStates.Active()
+        elif value == IntFlatMapState.ON_OUTER_COMPLETED:
+            return FlatMapStates.OnOuterCompleted()
+        else:
+            return FlatMapStates.Stopped()
@@ -0,0 +1,74 @@
+from typing import Optional
+
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.states.intstates.intterminationstate import IntTerminationState
+from rxbp.states.measuredstates.mergestates import MergeStates
+from rxbp.typing import ElementType
+
+
+class IntMergeState:
+    """ State of the `MergeObservable` encoded as an integer.
+
+    The buffered elements and the acknowledgments of the back-pressured sources are kept
+    in slots. The state is only modified while holding the lock of the `MergeObservable`.
+    """
+
+    __slots__ = ('value', 'left_elem', 'left_ack', 'right_elem', 'right_ack')
+
+    NONE_RECEIVED = 0
+    NONE_RECEIVED_WAIT_ACK = 1
+    LEFT_RECEIVED = 2
+    RIGHT_RECEIVED = 3
+    BOTH_RECEIVED_CONTINUE_LEFT = 4
+    BOTH_RECEIVED_CONTINUE_RIGHT = 5
+    STOPPED = 6
+
+    def __init__(self):
+        self.value = IntMergeState.NONE_RECEIVED
+
+        self.left_elem: Optional[ElementType] = None
+        self.left_ack: Optional[AckSubject] = None
+        self.right_elem: Optional[ElementType] = None
+        self.right_ack: Optional[AckSubject] = None
+
+    def measure(self, termination_state: IntTerminationState) -> int:
+        """ returns the state taking into account the termination state
+        """
+
+        value = self.value
+        termination_value = termination_state.value
+
+        if value == IntMergeState.STOPPED or termination_value == IntTerminationState.ERROR:
+            return IntMergeState.STOPPED
+
+        # buffered elements are still sent after both sources completed
+        elif value <= IntMergeState.NONE_RECEIVED_WAIT_ACK \
+                and termination_value == IntTerminationState.BOTH_COMPLETED:
+            return IntMergeState.STOPPED
+
+        else:
+            return value
+
+    def get_measured_state(self, termination_state: IntTerminationState) -> MergeStates.MergeState:
+        value = self.measure(termination_state)
+
+        if value == IntMergeState.NONE_RECEIVED:
+            return MergeStates.NoneReceived()
+        elif value == IntMergeState.NONE_RECEIVED_WAIT_ACK:
+            return MergeStates.NoneReceivedWaitAck()
+        elif value == IntMergeState.LEFT_RECEIVED:
+            return MergeStates.LeftReceived(elem=self.left_elem, ack=self.left_ack)
+        elif value == IntMergeState.RIGHT_RECEIVED:
+            return MergeStates.RightReceived(elem=self.right_elem, ack=self.right_ack)
+        elif value == IntMergeState.BOTH_RECEIVED_CONTINUE_LEFT:
+            return MergeStates.BothReceivedContinueLeft(
+                left_elem=self.left_elem, right_elem=self.right_elem,
+                left_ack=self.left_ack, right_ack=self.right_ack,
+            )
+        elif value == IntMergeState.BOTH_RECEIVED_CONTINUE_RIGHT:
+            return MergeStates.BothReceivedContinueRight(
+                left_elem=self.left_elem, right_elem=self.right_elem,
+                left_ack=self.left_ack, right_ack=self.right_ack,
+            )
+        else:
+            return MergeStates.Stopped()
@@ -0,0 +1,61 @@
+from typing import Optional
+
+from rxbp.states.measuredstates.terminationstates import TerminationStates
+
+
+class IntTerminationState:
+    """ Termination state of an operator with a left and a right source.
+
+    The state is encoded as integer flags that are updated in place while holding the
+    lock of the operator. Measured states are only created for introspection.
+    """
+
+    __slots__ = ('value', 'exc')
+
+    INIT = 0
+    LEFT_COMPLETED = 1
+    RIGHT_COMPLETED = 2
+    BOTH_COMPLETED = 3
+    ERROR = 4
+
+    def __init__(self):
+        self.value = IntTerminationState.INIT
+        self.exc: Optional[Exception] = None
+
+    def on_completed_left(self):
+        if self.value != IntTerminationState.ERROR:
+            self.value |= IntTerminationState.LEFT_COMPLETED
+
+    def on_completed_right(self):
+        if self.value != IntTerminationState.ERROR:
+            self.value |= IntTerminationState.RIGHT_COMPLETED
+
+    def on_error(self, exc: Exception):
+        self.value = IntTerminationState.ERROR
+        self.exc = exc
+
+    def is_left_completed(self) -> bool:
+        """ True if the left source completed, or if any source raised an exception
+        """
+
+        return self.value & (IntTerminationState.LEFT_COMPLETED | IntTerminationState.ERROR) != 0
+
+    def is_right_completed(self) -> bool:
+        """ True if the right source completed, or if any source raised an exception
+        """
+
+        return self.value & (IntTerminationState.RIGHT_COMPLETED | IntTerminationState.ERROR) != 0
+
+    def get_measured_state(self) -> TerminationStates.TerminationState:
+        value = self.value
+
+        if value == IntTerminationState.INIT:
+            return TerminationStates.InitState()
+        elif value == IntTerminationState.LEFT_COMPLETED:
+            return TerminationStates.LeftCompletedState()
+        elif value == IntTerminationState.RIGHT_COMPLETED:
+            return TerminationStates.RightCompletedState()
+        elif value == IntTerminationState.BOTH_COMPLETED:
+            return TerminationStates.BothCompletedState()
+        else:
+            return TerminationStates.ErrorState(exc=self.exc)
@@ -0,0 +1,81 @@
+import itertools
+from typing import Optional, List
+
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.states.intstates.intterminationstate import IntTerminationState
+from rxbp.states.measuredstates.zipstates import ZipStates
+
+
+class IntZipState:
+    """ State of the `ZipObservable` encoded as an integer.
+
+    The buffered batch, the offset of its first element not zipped yet and the acknowledgment
+    of the back-pressured source are kept in slots, such that a state transition does not
+    allocate any object. The state is only modified while holding the lock of the `ZipObservable`.
+    """
+
+    __slots__ = (
+        'value',
+        'left_buffer', 'left_offset', 'left_ack',
+        'right_buffer', 'right_offset', 'right_ack',
+    )
+
+    WAIT_ON_LEFT_RIGHT = 0
+    WAIT_ON_LEFT = 1
+    WAIT_ON_RIGHT = 2
+    ZIP_ELEMENTS = 3
+    STOPPED = 4
+
+    def __init__(self):
+        self.value = IntZipState.WAIT_ON_LEFT_RIGHT
+
+        self.left_buffer: Optional[List] = None
+        self.left_offset = 0
+        self.left_ack: Optional[AckSubject] = None
+        self.right_buffer: Optional[List] = None
+        self.right_offset = 0
+        self.right_ack: Optional[AckSubject] = None
+
+    def measure(self, termination_state: IntTerminationState) -> int:
+        """ returns the state taking into account the termination state
+        """
+
+        value = self.value
+
+        if value == IntZipState.WAIT_ON_LEFT_RIGHT:
+            is_stopped = termination_state.value != IntTerminationState.INIT
+        elif value == IntZipState.WAIT_ON_LEFT:
+            is_stopped = termination_state.is_left_completed()
+        elif value == IntZipState.WAIT_ON_RIGHT:
+            is_stopped = termination_state.is_right_completed()
+        else:
+            return value
+
+        if is_stopped:
+            return IntZipState.STOPPED
+        else:
+            return value
+
+    def get_measured_state(self, termination_state: IntTerminationState) -> ZipStates.ZipState:
+        value = self.measure(termination_state)
+
+        # the buffers are only materialized as iterators for introspection
+        def left_iter():
+            return itertools.islice(self.left_buffer or [], self.left_offset, None)
+
+        def right_iter():
+            return itertools.islice(self.right_buffer or [], self.right_offset, None)
+
+        if value == IntZipState.WAIT_ON_LEFT_RIGHT:
+            return ZipStates.WaitOnLeftRight()
+        elif value == IntZipState.WAIT_ON_LEFT:
+            return ZipStates.WaitOnLeft(right_ack=self.right_ack, right_iter=right_iter())
+        elif value == IntZipState.WAIT_ON_RIGHT:
+            return ZipStates.WaitOnRight(left_ack=self.left_ack, left_iter=left_iter())
+        elif value == IntZipState.ZIP_ELEMENTS:
+            return ZipStates.ZipElements(
+                left_ack=self.left_ack, left_iter=left_iter(),
+                right_ack=self.right_ack, right_iter=right_iter(),
+            )
+        else:
+            return ZipStates.Stopped()
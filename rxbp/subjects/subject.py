@@ -9,13 +9,17 @@ from rxbp.subscription import Subscription
 
 
 class Subject(SubjectBase):
-    def __init__(self):
+    def __init__(self, buffer_size: int = None):
         super().__init__()
 
+        self._buffer_size = buffer_size
         self._obs_subject = None
 
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
-        self._obs_subject = CacheServeFirstObservableSubject(scheduler=subscriber.scheduler)
+        self._obs_subject = CacheServeFirstObservableSubject(
+            scheduler=subscriber.scheduler,
+            buffer_size=self._buffer_size,
+        )
         return init_subscription(observable=self._obs_subject)
 
     def on_next(self, elem: Any):
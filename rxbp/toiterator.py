@@ -1,63 +1,262 @@
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+import threading
+from collections import deque
+from typing import Optional, Deque, List, AsyncIterator, Iterator, Any
 
-from rxbp.acknowledgement.continueack import continue_ack
 from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
 from rxbp.mixins.flowablesubscribemixin import FlowableSubscribeMixin
 from rxbp.observer import Observer
 from rxbp.scheduler import Scheduler
+from rxbp.schedulers.asyncioscheduler import AsyncIOScheduler
+from rxbp.schedulers.eventloopscheduler import EventLoopScheduler
+from rxbp.schedulers.timeoutscheduler import TimeoutScheduler
 from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
 from rxbp.typing import ElementType
 
 
-def to_iterator(source: FlowableSubscribeMixin, scheduler: Scheduler = None):
-    @dataclass
-    class ToIteratorObserver(Observer):
-        received: List[ElementType]
-        is_completed: bool
-        exception: Optional[Exception]
+class ToIteratorObserver(Observer):
+    """ Buffers the received batches until they get consumed by an iterator.
+
+    Once `prefetch` batches are buffered, the source gets back-pressured by returning
+    an asynchronous acknowledgment. The acknowledgment is released as soon as the
+    consumer drained the buffer down to half of the prefetch depth.
+    """
+
+    def __init__(self, prefetch: Optional[int] = None):
+        assert prefetch is None or 0 < prefetch, 'prefetch needs to be positive'
+
+        self.prefetch = prefetch
+        self.low_watermark = None if prefetch is None else prefetch // 2
+
+        self.received: Deque[List] = deque()
+        self.is_completed = False
+        self.exception: Optional[Exception] = None
+        self.ack: Optional[AckSubject] = None
+
+        self.lock = threading.Lock()
+
+    def _notify(self):
+        """ called while holding the lock whenever a new notification got buffered
+        """
 
-        def on_next(self, elem: ElementType) -> Ack:
-            if not isinstance(elem, list):
+        pass
+
+    def on_next(self, elem: ElementType) -> Ack:
+        if not isinstance(elem, list):
+            try:
                 elem = list(elem)
+            except Exception as exc:
+                self.on_error(exc)
+                return stop_ack
 
+        with self.lock:
             self.received.append(elem)
-            return continue_ack
+            self._notify()
+
+            if self.prefetch is None or len(self.received) < self.prefetch:
+                return continue_ack
 
-        def on_error(self, exc: Exception):
+            self.ack = AckSubject()
+            return self.ack
+
+    def on_error(self, exc: Exception):
+        with self.lock:
             self.exception = exc
+            self._notify()
 
-        def on_completed(self):
+    def on_completed(self):
+        with self.lock:
             self.is_completed = True
+            self._notify()
 
-    observer = ToIteratorObserver(
-        received=[],
-        is_completed=False,
-        exception=None,
-    )
+    def pop_batch(self) -> Optional[List]:
+        """ returns the next buffered batch, or None if the buffer is empty; called while holding the lock
+        """
+
+        if not self.received:
+            return None
+
+        return self.received.popleft()
+
+    def release_ack(self) -> Optional[AckSubject]:
+        """ returns the acknowledgment of a back-pressured source if the buffer has been
+        drained sufficiently; called while holding the lock
+
+        The returned acknowledgment needs to be released outside of the lock.
+        """
+
+        if self.ack is not None and len(self.received) <= self.low_watermark:
+            ack = self.ack
+            self.ack = None
+            return ack
+
+        return None
+
+
+class ToBlockingIteratorObserver(ToIteratorObserver):
+    def __init__(self, prefetch: Optional[int] = None):
+        super().__init__(prefetch=prefetch)
+
+        self.condition = threading.Condition(self.lock)
+
+    def _notify(self):
+        self.condition.notify()
+
+
+class ToAsyncIteratorObserver(ToIteratorObserver):
+    def __init__(self, loop: asyncio.AbstractEventLoop, prefetch: Optional[int] = None):
+        super().__init__(prefetch=prefetch)
+
+        self.loop = loop
+        self.event = asyncio.Event()
+
+    def _notify(self):
+        # the observer might get called from a thread other than the one running the event loop
+        self.loop.call_soon_threadsafe(self.event.set)
+
+
+def _can_block(scheduler: Scheduler) -> bool:
+    """ returns True if the scheduler does not depend on the consuming thread to execute its
+    actions, either because it runs on its own thread or because it executes them synchronously
+    """
+
+    if isinstance(scheduler, AsyncIOScheduler):
+        return scheduler.thread is not None
+
+    return isinstance(scheduler, (EventLoopScheduler, TimeoutScheduler, TrampolineScheduler))
+
+
+def to_iterator(
+        source: FlowableSubscribeMixin,
+        scheduler: Scheduler = None,
+        prefetch: int = None,
+        sleep_interval: float = 0.1,
+) -> Iterator[Any]:
+    """ Subscribes to the Flowable and returns a blocking iterator over the emitted elements.
+
+    :param scheduler: scheduler used to subscribe the Flowable
+    :param prefetch: maximum number of batches buffered before the Flowable gets back-pressured;
+    if None, the buffer is unbounded
+    :param sleep_interval: if the scheduler is driven by the current thread (e.g. a virtual
+    time scheduler), it is driven by `scheduler.sleep(sleep_interval)` while waiting for
+    the next batch
+    """
+
+    observer = ToBlockingIteratorObserver(prefetch=prefetch)
     subscribe_scheduler = TrampolineScheduler()
     scheduler = scheduler or subscribe_scheduler
 
-    source.subscribe(
+    # a scheduler driven by the current thread (e.g. a virtual time scheduler) would
+    # never emit a batch while the consumer blocks on the condition
+    can_block = _can_block(scheduler)
+
+    disposable = source.subscribe(
         observer=observer,
         scheduler=scheduler,
         subscribe_scheduler=subscribe_scheduler,
     )
 
     def gen():
-        while True:
+        try:
             while True:
-                if len(observer.received):
-                    break
+                with observer.condition:
+                    while True:
+                        batch = observer.pop_batch()
+
+                        if batch is not None:
+                            ack = observer.release_ack()
+                            break
+
+                        if observer.is_completed:
+                            return  # StopIteration
+
+                        if observer.exception is not None:
+                            raise observer.exception
+
+                        if not can_block:
+                            break
+
+                        observer.condition.wait()
+
+                if batch is None:
+                    # the scheduler executes actions that might call the observer,
+                    # therefore, it is driven outside of the lock
+                    scheduler.sleep(sleep_interval)
+                    continue
+
+                # the source might continue emitting elements synchronously,
+                # therefore, the acknowledgment is released outside of the lock
+                if ack is not None:
+                    ack.on_next(continue_ack)
+
+                yield from batch
+
+        finally:
+            disposable.dispose()
+
+    return gen()
+
+
+def to_async_iterator(
+        source: FlowableSubscribeMixin,
+        scheduler: Scheduler = None,
+        prefetch: int = None,
+) -> AsyncIterator[Any]:
+    """ Subscribes to the Flowable once iterated with `async for` and returns an asynchronous iterator
+    over the emitted elements.
+
+    :param scheduler: scheduler used to subscribe the Flowable; if None, an `AsyncIOScheduler`
+    running on the event loop of the caller is used
+    :param prefetch: maximum number of batches buffered before the Flowable gets back-pressured;
+    if None, the buffer is unbounded
+    """
+
+    async def gen():
+        loop = asyncio.get_event_loop()
+        scheduler_ = scheduler or AsyncIOScheduler(loop=loop, new_thread=False)
+
+        observer = ToAsyncIteratorObserver(loop=loop, prefetch=prefetch)
+
+        disposable = source.subscribe(
+            observer=observer,
+            scheduler=scheduler_,
+            subscribe_scheduler=scheduler_,
+        )
+
+        try:
+            while True:
+                while True:
+                    with observer.lock:
+                        batch = observer.pop_batch()
+
+                        if batch is None:
+                            if observer.is_completed:
+                                return  # StopAsyncIteration
+
+                            if observer.exception is not None:
+                                raise observer.exception
+
+                            observer.event.clear()
+                            ack = None
+
+                        else:
+                            ack = observer.release_ack()
+
+                    if batch is not None:
+                        break
 
-                if observer.is_completed:
-                    return  # StopIteration
+                    await observer.event.wait()
 
-                if observer.exception is not None:
-                    raise observer.exception
+                if ack is not None:
+                    ack.on_next(continue_ack)
 
-                scheduler.sleep(0.1)
+                for elem in batch:
+                    yield elem
 
-            yield from observer.received.pop(0)
+        finally:
+            disposable.dispose()
 
     return gen()
@@ -1,4 +1,4 @@
-from typing import TypeVar, Union, Iterator, List
+from typing import TypeVar, Union, Iterator, List, Any
 
 # value send over a Flowable
 ValueType = TypeVar('ValueType')
@@ -10,3 +10,8 @@ ValueType = TypeVar('ValueType')
 # But sometimes you cannot avoid buffering data in a list.
 # A batch consists of zero or more elements.
 ElementType = Union[Iterator[ValueType], List[ValueType]]
+
+# Optionally, a batch can be an array (e.g. a NumPy ndarray or a record array),
+# which is kept intact by the batch operators `map_batch`, `filter_mask`,
+# `scan_cumulative` and `reduce_batch`.
+ArrayBatchType = Any
@@ -1,9 +1,68 @@
+import sys
 import traceback
 
 from traceback import FrameSummary
-from typing import List
+from typing import List, Tuple, Optional
 
+from rxbp import config
 
-def get_stack_lines(index: int = 2) -> List[FrameSummary]:
-    stack_lines = traceback.extract_stack()[:-index]
-    return stack_lines
+
+class LazyStackLines:
+    """ Stack lines that reference the code objects and line numbers of the captured frames.
+
+    The source lines are only looked up, when the stack lines are iterated, e.g. when an
+    operator exception is formatted.
+    """
+
+    __slots__ = ('_entries',)
+
+    def __init__(self, entries: List[Tuple]):
+        # (code object, line number) tuples ordered from the oldest to the most recent frame
+        self._entries = entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [FrameSummary(code.co_filename, lineno, code.co_name) for code, lineno in self._entries[idx]]
+
+        code, lineno = self._entries[idx]
+        return FrameSummary(code.co_filename, lineno, code.co_name)
+
+    def __iter__(self):
+        for code, lineno in self._entries:
+            yield FrameSummary(code.co_filename, lineno, code.co_name)
+
+
+def get_stack_lines(index: int = 2) -> Optional[List[FrameSummary]]:
+    """ Captures the stack of the caller used to report where an operator got created
+
+    :param index: number of most recent frames that are skipped; by default, the frame of
+    this function and the frame of the operator function
+    """
+
+    mode = config.get_stack_capture()
+
+    if mode == config.STACK_CAPTURE_LAZY:
+        entries = []
+
+        # frame 0 refers to this function
+        frame = sys._getframe(index)
+        while frame is not None:
+            entries.append((frame.f_code, frame.f_lineno))
+            frame = frame.f_back
+
+        entries.reverse()
+        return LazyStackLines(entries)
+
+    elif mode == config.STACK_CAPTURE_CALLER:
+        frame = sys._getframe(index)
+        return LazyStackLines([(frame.f_code, frame.f_lineno)])
+
+    elif mode == config.STACK_CAPTURE_FULL:
+        stack_lines = traceback.extract_stack()[:-index]
+        return stack_lines
+
+    else:
+        return None
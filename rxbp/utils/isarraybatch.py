@@ -0,0 +1,11 @@
+from typing import Any
+
+
+def is_array_batch(elem: Any) -> bool:
+    """
+    Returns True if the batch is array-like (e.g. a NumPy ndarray or a record array).
+
+    The check does not import NumPy, which keeps it an optional dependency.
+    """
+
+    return hasattr(elem, '__array_interface__')
@@ -0,0 +1,14 @@
+from rxbp.typing import ElementType
+from rxbp.utils.isarraybatch import is_array_batch
+
+
+def materialize_batch(elem: ElementType) -> ElementType:
+    """
+    Turns an iterator batch into a list, while lists and array batches are
+    returned untouched such that they can be processed by a single vectorized call.
+    """
+
+    if isinstance(elem, list) or is_array_batch(elem):
+        return elem
+    else:
+        return list(elem)
@@ -1,11 +1,14 @@
 from traceback import FrameSummary
-from typing import List
+from typing import List, Optional
 
 
 def to_operator_exception(
         message: str,
-        stack: List[FrameSummary],
+        stack: Optional[List[FrameSummary]],
 ) -> str:
+    if stack is None:
+        return message
+
     exception_lines = [
         message,
         f'  Traceback rxbp (most recent call last):',
@@ -0,0 +1,62 @@
+import unittest
+
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack, ContinueAck
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import stop_ack, StopAck
+
+
+class TSingle(Single):
+    def __init__(self):
+        self.received = []
+
+    def on_next(self, elem):
+        self.received.append(elem)
+
+
+class TestAckSubject(unittest.TestCase):
+    def test_acks_are_interned(self):
+        self.assertIs(continue_ack, ContinueAck())
+        self.assertIs(stop_ack, StopAck())
+
+    def test_subscribe_before_on_next(self):
+        ack = AckSubject()
+        single = TSingle()
+        ack.subscribe(single)
+
+        ack.on_next(continue_ack)
+
+        self.assertEqual([continue_ack], single.received)
+
+    def test_subscribe_after_on_next(self):
+        ack = AckSubject()
+        single = TSingle()
+        ack.on_next(continue_ack)
+
+        ack.subscribe(single)
+
+        self.assertEqual([continue_ack], single.received)
+        self.assertTrue(ack.has_value)
+        self.assertIs(continue_ack, ack.value)
+
+    def test_multiple_subscribers(self):
+        ack = AckSubject()
+        singles = [TSingle() for _ in range(3)]
+        for single in singles:
+            ack.subscribe(single)
+
+        ack.on_next(stop_ack)
+
+        for single in singles:
+            self.assertEqual([stop_ack], single.received)
+
+    def test_merge_continue_and_stop(self):
+        ack1 = AckSubject()
+        ack2 = AckSubject()
+        single = TSingle()
+        ack1.merge(ack2).subscribe(single)
+
+        ack1.on_next(continue_ack)
+        ack2.on_next(stop_ack)
+
+        self.assertEqual([stop_ack], single.received)
@@ -1,262 +1,185 @@
 import unittest
 
-from rxbp.acknowledgement.continueack import ContinueAck
-from rxbp.observerinfo import ObserverInfo
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck
 from rxbp.indexed.selectors.observables.mergeselectorobservable import MergeSelectorObservable
-from rxbp.indexed.selectors.selectnext import select_next
-from rxbp.indexed.selectors.selectcompleted import select_completed
-from rxbp.states.measuredstates.controlledzipstates import ControlledZipStates
-from rxbp.states.measuredstates.terminationstates import TerminationStates
+from rxbp.init.initobserverinfo import init_observer_info
 from rxbp.testing.tobservable import TObservable
 from rxbp.testing.tobserver import TObserver
-from rxbp.testing.tscheduler import TScheduler
-from rxbp.init.initobserverinfo import init_observer_info
 
 
 class TestMergeSelectorObservable(unittest.TestCase):
     def setUp(self) -> None:
         self.left = TObservable()
         self.right = TObservable()
-        self.scheduler = TScheduler()
         self.obs = MergeSelectorObservable(
             left=self.left,
             right=self.right,
-            # scheduler=self.scheduler,
         )
         self.exception = Exception()
 
-    def measure_state(self, obs: MergeSelectorObservable):
-        return obs.state.get_measured_state(obs.termination_state)
+    def test_forward_unselected_left_elements(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
 
-    def measure_termination_state(self, obs: MergeSelectorObservable):
-        return obs.termination_state.get_measured_state()
+        ack = self.left.on_next_list([0, 0, 0])
 
-    def test_initialize(self):
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual([0, 0, 0], sink.received)
+
+    def test_wait_on_right(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
+        ack = self.left.on_next_list([1, 0])
 
-    def test_state_waitonleftright_to_waitonleftright_with_leftonnext(self):
-        """
-                           left.on_next
-        WaitOnLeftRight -----------------> WaitOnLeftRight
-         InitState                             InitState
-        """
+        self.assertFalse(ack.has_value)
+        self.assertEqual([], sink.received)
 
+    def test_compose_masks(self):
         sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
+        self.obs.observe(init_observer_info(sink))
 
-        ack = self.left.on_next_list([select_completed])
+        ack_left = self.left.on_next_list([True, False, True, True])
+        ack_right = self.right.on_next_list([False, True, True])
 
-        self.assertIsInstance(ack, ContinueAck)
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
-        self.assertEqual([select_completed], sink.received)
+        self.assertEqual([0, 0, 1, 1], sink.received)
+        self.assertIsInstance(ack_left.value, ContinueAck)
+        self.assertIsInstance(ack_right, ContinueAck)
+
+    def test_select_same_element_multiple_times(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
 
-    def test_multiple_left_select_complete_should_not_wait_on_right(self):
-        """
-                           left.on_next
-        WaitOnLeftRight -----------------> WaitOnLeftRight
-         InitState                             InitState
-        """
+        ack_left = self.left.on_next_list([2, 0, 1])
+        ack_right = self.right.on_next_list([1, 2, 3])
 
+        self.assertEqual([3, 0, 3], sink.received)
+        self.assertIsInstance(ack_left.value, ContinueAck)
+        self.assertIsInstance(ack_right, ContinueAck)
+
+    def test_keep_remaining_left_elements(self):
         sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
+        self.obs.observe(init_observer_info(sink))
 
-        ack = self.left.on_next_list([select_completed, select_completed, select_completed])
+        ack_left = self.left.on_next_list([1, 0, 1, 0])
+        ack_right1 = self.right.on_next_list([1])
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
-        self.assertEqual([select_completed, select_completed, select_completed], sink.received)
-        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual([1, 0], sink.received)
+        self.assertFalse(ack_left.has_value)
+        self.assertIsInstance(ack_right1, ContinueAck)
+
+        ack_right2 = self.right.on_next_list([1])
 
-    def test_wait_on_left_right_to_wait_on_right(self):
-        """
-                         left.on_next
-        WaitOnLeftRight -----------------> WaitOnRight
-         InitState                          InitState
-        """
+        self.assertEqual([1, 0, 1, 0], sink.received)
+        self.assertIsInstance(ack_left.value, ContinueAck)
+        self.assertIsInstance(ack_right2, ContinueAck)
 
+    def test_left_element_spanning_multiple_right_batches(self):
         sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
+        self.obs.observe(init_observer_info(sink))
 
-        ack = self.left.on_next_list([select_next, select_completed])
+        ack_left = self.left.on_next_list([3])
+        self.right.on_next_list([1, 1])
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnRight)
         self.assertEqual([], sink.received)
-        self.assertFalse(ack.is_sync)
+        self.assertFalse(ack_left.has_value)
+
+        self.right.on_next_list([1, 0])
 
-    def test_wait_on_right_to_wait_on_left_right(self):
-        """
-                        right.on_next
-        WaitOnRight -----------------> WaitOnLeftRight
-         InitState                          InitState
-        """
+        self.assertEqual([3], sink.received)
+        self.assertIsInstance(ack_left.value, ContinueAck)
 
+    def test_keep_remaining_right_elements(self):
         sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
-        ack_left = self.left.on_next_list([select_next, select_completed])
+        self.obs.observe(init_observer_info(sink))
 
-        ack_right = self.right.on_next_list([select_completed])
+        ack_right = self.right.on_next_list([1, 0, 1])
+        ack_left1 = self.left.on_next_list([0, 2])
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
-        self.assertEqual([select_completed], sink.received)
-        self.assertIsInstance(ack_left.value, ContinueAck)
-        self.assertIsInstance(ack_right, ContinueAck)
+        self.assertEqual([0, 1], sink.received)
+        self.assertFalse(ack_right.has_value)
+        self.assertIsInstance(ack_left1, ContinueAck)
 
-    def test_select_same_element_multiple_times(self):
-        """
-                        right.on_next
-        WaitOnRight -----------------> WaitOnLeftRight
-         InitState                          InitState
-        """
+        self.left.on_next_list([1])
 
-        sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
-        ack_left = self.left.on_next_list([select_next, select_completed])
+        self.assertEqual([0, 1, 1], sink.received)
+        self.assertIsInstance(ack_right.value, ContinueAck)
 
-        ack_right = self.right.on_next_list([select_next, select_next, select_completed])
+    def test_back_pressure_on_asynchronous_ack(self):
+        sink = TObserver(immediate_continue=0)
+        self.obs.observe(init_observer_info(sink))
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
-        self.assertEqual([select_next, select_next, select_completed], sink.received)
-        self.assertIsInstance(ack_left.value, ContinueAck)
-        self.assertIsInstance(ack_right, ContinueAck)
+        ack_left = self.left.on_next_list([1, 1])
+        ack_right = self.right.on_next_list([1, 0])
 
-    def test_state_waitonleft_to_waitonleftright(self):
-        """
-                        left.on_next
-        WaitOnLeft -----------------> WaitOnLeftRight
-         InitState                       InitState
-        """
+        self.assertEqual([1, 0], sink.received)
+        self.assertFalse(ack_left.has_value)
+        self.assertFalse(ack_right.has_value)
 
-        sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
-        ack_right = self.right.on_next_list([select_next, select_completed])
+        sink.ack.on_next(continue_ack)
 
-        ack_left = self.left.on_next_list([select_next, select_completed, select_completed])
+        self.assertIsInstance(ack_left.value, ContinueAck)
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
-        self.assertEqual([select_next, select_completed, select_completed], sink.received)
-        self.assertIsInstance(ack_left, ContinueAck)
-        self.assertIsInstance(ack_right.value, ContinueAck)
+    def test_right_on_completed(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
 
-    def test_state_waitonleft_to_waitonleft(self):
-        """
-                        left.on_next
-        WaitOnLeft ---------------------> WaitOnLeft
-         InitState                          InitState
-        """
+        ack_left = self.left.on_next_list([1])
+        self.right.on_completed()
 
+        self.assertTrue(sink.is_completed)
+        self.assertIsInstance(ack_left.value, StopAck)
+
+    def test_complete_after_remaining_elements(self):
         sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
-        ack_right = self.right.on_next_list([select_next, select_completed])
+        self.obs.observe(init_observer_info(sink))
 
-        ack_left = self.left.on_next_list([select_completed, select_completed])
+        self.right.on_next_list([1, 1])
+        self.right.on_completed()
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeft)
-        self.assertEqual([select_completed, select_completed], sink.received)
-        self.assertIsInstance(ack_left, ContinueAck)
-        self.assertFalse(ack_right.has_value)
+        self.assertFalse(sink.is_completed)
+
+        self.left.on_next_list([2])
+        self.left.on_next_list([0])
+        self.left.on_completed()
 
-    def test_drain_left_select_completed(self):
-        """
-                    right.on_next
-        WaitOnRight -----------------> WaitOnLeftRight
-         InitState                          InitState
-        """
+        self.assertEqual([2, 0], sink.received)
+        self.assertTrue(sink.is_completed)
 
+    def test_forward_unselected_left_elements_after_right_completed(self):
         sink = TObserver()
-        obs = MergeSelectorObservable(
-            left=self.left,
-            right=self.right,
-            # scheduler=self.scheduler,
-        )
-        obs.observe(init_observer_info(sink))
-        ack_left = self.left.on_next_list([select_next, select_completed, select_completed])
+        self.obs.observe(init_observer_info(sink))
+
+        self.right.on_completed()
+        ack1 = self.left.on_next_list([0, 0])
+        ack2 = self.left.on_next_list([0])
 
-        ack_right = self.right.on_next_list([select_completed])
+        self.assertEqual([0, 0, 0], sink.received)
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertFalse(sink.is_completed)
 
-        self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.InitState)
-        self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
-        self.assertEqual([select_completed, select_completed], sink.received)
-        self.assertIsInstance(ack_left.value, ContinueAck)
-        self.assertIsInstance(ack_right, ContinueAck)
+        self.left.on_completed()
 
-    def test_right_on_completed(self):
-        """
-                    right.on_completed               left.on_next
-        WaitOnLeft --------------------> WaitOnLeft ------------------> Stopped
-        """
+        self.assertTrue(sink.is_completed)
 
-        sink = TObserver(immediate_continue=0)
+    def test_complete_on_selected_left_elements_after_right_completed(self):
+        sink = TObserver()
         self.obs.observe(init_observer_info(sink))
-        self.right.on_next_list([select_completed])
 
         self.right.on_completed()
+        ack = self.left.on_next_list([0, 1])
 
-        self.assertIsInstance(self.measure_state(self.obs), ControlledZipStates.WaitOnLeft)
-
-        self.left.on_next_list([select_next])
-
-        self.assertIsInstance(self.measure_state(self.obs), ControlledZipStates.Stopped)
-        self.assertEqual([], sink.received)     # the last SelectCompleted is optional
+        self.assertIsInstance(ack, StopAck)
+        self.assertTrue(sink.is_completed)
 
     def test_exception(self):
-        """
-                    right.on_error
-        WaitOnRight -------------> Stopped
-        """
-
-        sink = TObserver(immediate_continue=0)
+        sink = TObserver()
         self.obs.observe(init_observer_info(sink))
-        ack1 = self.left.on_next_list([select_completed])
 
+        ack_left = self.left.on_next_list([1])
         self.right.on_error(self.exception)
 
-        self.assertIsInstance(self.measure_state(self.obs), ControlledZipStates.Stopped)
         self.assertEqual(self.exception, sink.exception)
+        self.assertIsInstance(ack_left.value, StopAck)
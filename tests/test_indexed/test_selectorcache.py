@@ -0,0 +1,89 @@
+import unittest
+
+from rxbp.indexed.selectors.bases.numericalbase import NumericalBase
+from rxbp.indexed.selectors.flowablebaseandselectors import FlowableBaseAndSelectors
+from rxbp.indexed.selectors.identityseqmapinfo import IdentitySeqMapInfo
+from rxbp.indexed.selectors.selectionop import merge_selectors
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.internal.selectorcache import SelectorCache
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestSelectorCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.subscriber = init_subscriber(
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+        self.sel1 = TObservable()
+        self.sel2 = TObservable()
+
+    def test_get_or_create(self):
+        cache = SelectorCache()
+
+        entry1 = cache.get_or_create(key='a', create=object)
+        entry2 = cache.get_or_create(key='a', create=object)
+
+        self.assertIs(entry1, entry2)
+        self.assertIn('a', cache)
+        self.assertEqual(1, len(cache))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_merge_same_selectors(self):
+        cache = self.subscriber.selector_cache
+
+        obs1 = merge_selectors(self.sel1, self.sel2, self.scheduler, stack=[], selector_cache=cache)
+        obs2 = merge_selectors(self.sel1, self.sel2, self.scheduler, stack=[], selector_cache=cache)
+
+        self.assertIs(obs1, obs2)
+        self.assertEqual(1, cache.hits)
+
+    def test_merge_different_selectors(self):
+        cache = self.subscriber.selector_cache
+
+        obs1 = merge_selectors(self.sel1, self.sel2, self.scheduler, stack=[], selector_cache=cache)
+        obs2 = merge_selectors(self.sel2, self.sel1, self.scheduler, stack=[], selector_cache=cache)
+
+        self.assertIsNot(obs1, obs2)
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(2, cache.misses)
+
+    def test_match_same_bases(self):
+        b1 = NumericalBase(1)
+        t1 = FlowableBaseAndSelectors(base=b1)
+        t2 = FlowableBaseAndSelectors(base=b1)
+
+        t1.match_with(t2, subscriber=self.subscriber, stack=[])
+        result = t1.match_with(t2, subscriber=self.subscriber, stack=[])
+
+        self.assertIsInstance(result.left, IdentitySeqMapInfo)
+        self.assertIsInstance(result.right, IdentitySeqMapInfo)
+        self.assertEqual(1, self.subscriber.selector_cache.hits)
+
+    def test_match_same_selectors(self):
+        b1 = NumericalBase(1)
+        t1 = FlowableBaseAndSelectors(base=NumericalBase(2), selectors={b1: self.sel1})
+        t2 = FlowableBaseAndSelectors(base=NumericalBase(3), selectors={b1: self.sel2})
+
+        result1 = t1.match_with(t2, subscriber=self.subscriber, stack=[])
+        result2 = t1.match_with(t2, subscriber=self.subscriber, stack=[])
+
+        self.assertIs(result1.left.observable, result2.left.observable)
+        self.assertIs(result1.right.observable, result2.right.observable)
+        self.assertIs(result1.base_selectors.selectors[b1], result2.base_selectors.selectors[b1])
+
+    def test_separate_cache_per_subscriber(self):
+        subscriber = init_subscriber(
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+
+        obs1 = merge_selectors(self.sel1, self.sel2, self.scheduler, stack=[],
+                               selector_cache=self.subscriber.selector_cache)
+        obs2 = merge_selectors(self.sel1, self.sel2, self.scheduler, stack=[],
+                               selector_cache=subscriber.selector_cache)
+
+        self.assertIsNot(obs1, obs2)
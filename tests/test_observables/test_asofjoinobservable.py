@@ -0,0 +1,115 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.asofjoinobservable import AsofJoinObservable
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestAsofJoinObservable(unittest.TestCase):
+    def setUp(self):
+        self.left = TObservable()
+        self.right = TObservable()
+        self.exception = Exception('test')
+
+    def test_join_last_smaller_or_equal_key(self):
+        sink = TObserver()
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.left.on_next_list([0, 2, 5])
+        ack2 = self.right.on_next_list([1, 3, 4, 6])
+
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertFalse(ack2.has_value)
+        self.assertListEqual(sink.received, [(0, None), (2, 1), (5, 4)])
+
+    def test_carry_last_element_of_right_batch(self):
+        sink = TObserver()
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.left.on_next_list([2, 7])
+        ack2 = self.right.on_next_list([1, 3])
+
+        self.assertFalse(ack1.has_value)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertListEqual(sink.received, [(2, 1)])
+
+        self.right.on_next_list([8])
+
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertListEqual(sink.received, [(2, 1), (7, 3)])
+
+    def test_wait_on_right_for_equal_keys(self):
+        sink = TObserver()
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=lambda v: v[0])
+        obs.observe(init_observer_info(sink))
+
+        self.left.on_next_list([(2, 'l')])
+        self.right.on_next_list([(1, 'a'), (2, 'b')])
+        self.right.on_next_list([(2, 'c'), (3, 'd')])
+
+        self.assertListEqual(sink.received, [((2, 'l'), (2, 'c'))])
+
+    def test_tolerance(self):
+        sink = TObserver()
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=None, tolerance=1)
+        obs.observe(init_observer_info(sink))
+
+        self.left.on_next_list([2, 5])
+        self.right.on_next_list([1, 3, 10])
+
+        self.assertListEqual(sink.received, [(2, 1), (5, None)])
+
+    def test_flush_after_right_completed(self):
+        sink = TObserver()
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        self.right.on_next_list([1])
+        self.right.on_completed()
+        self.left.on_next_list([2, 3])
+        self.left.on_completed()
+
+        self.assertListEqual(sink.received, [(2, 1), (3, 1)])
+        self.assertTrue(sink.is_completed)
+
+    def test_complete_on_left_completed(self):
+        sink = TObserver()
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack = self.right.on_next_list([1, 2])
+        self.left.on_completed()
+
+        self.assertIsInstance(ack.value, StopAck)
+        self.assertTrue(sink.is_completed)
+
+    def test_back_pressure_on_asynchronous_ack(self):
+        sink = TObserver(immediate_continue=0)
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.left.on_next_list([1, 2])
+        self.right.on_next_list([0, 3])
+
+        self.assertFalse(ack1.has_value)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertListEqual(sink.received, [(1, 0), (2, 0)])
+
+    def test_exception(self):
+        sink = TObserver()
+        obs = AsofJoinObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack = self.right.on_next_list([1, 2])
+        self.left.on_error(self.exception)
+
+        self.assertIsInstance(ack.value, StopAck)
+        self.assertEqual(sink.exception, self.exception)
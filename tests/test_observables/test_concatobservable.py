@@ -69,3 +69,12 @@ class TestConcatObservable(unittest.TestCase):
         ack = self.sources[1].on_next_single(0)
 
         self.assertIsInstance(ack, StopAck)
+
+    def test_on_completed(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_completed()
+        self.sources[1].on_completed()
+
+        self.assertTrue(sink.is_completed)
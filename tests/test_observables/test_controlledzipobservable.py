@@ -1,9 +1,8 @@
 from rxbp.acknowledgement.acksubject import AckSubject
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.indexed.observables.controlledzipindexedobservable import ControlledZipIndexedObservable
 from rxbp.observables.controlledzipobservable import ControlledZipObservable
-from rxbp.indexed.selectors.selectcompleted import SelectCompleted
-from rxbp.indexed.selectors.selectnext import SelectNext
 from rxbp.states.measuredstates.controlledzipstates import ControlledZipStates
 from rxbp.states.measuredstates.terminationstates import TerminationStates
 from rxbp.testing.testcasebase import TestCaseBase
@@ -265,7 +264,7 @@ class TestControlledZipObservable(TestCaseBase):
         sink = TObserver(immediate_continue=0)
         left_sel_sink = TObserver(immediate_continue=0)
         right_sel_sink = TObserver(immediate_continue=0)
-        obs = ControlledZipObservable(
+        obs = ControlledZipIndexedObservable(
             left=self.left, right=self.right, scheduler=self.scheduler,
             request_left=lambda left, right: left <= right,
             request_right=lambda left, right: right <= left,
@@ -303,7 +302,7 @@ class TestControlledZipObservable(TestCaseBase):
         right_sel_sink = TObserver(immediate_continue=0)
         ack1 = AckSubject()
         ack2 = AckSubject()
-        obs = ControlledZipObservable(
+        obs = ControlledZipIndexedObservable(
             left=self.left, right=self.right, scheduler=self.scheduler,
             request_left=lambda left, right: left <= right,
             request_right=lambda left, right: right <= left,
@@ -317,12 +316,11 @@ class TestControlledZipObservable(TestCaseBase):
         self.right.on_next_single(2).subscribe(ack2)
 
         self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeft)
-        self.assertIsInstance(left_sel_sink.received[0], SelectCompleted)
+        self.assertEqual([0], left_sel_sink.received)
 
         self.left.on_next_single(2).subscribe(ack1)
 
         self.assertIsInstance(self.measure_state(obs), ControlledZipStates.WaitOnLeftRight)
 
-        for instance_obj, class_obj in zip(left_sel_sink.received, [SelectCompleted, SelectNext, SelectCompleted]):
-            self.assertIsInstance(instance_obj, class_obj)
+        self.assertEqual([0, 1], left_sel_sink.received)
 
@@ -0,0 +1,98 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.lazyconcatobservable import LazyConcatObservable
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestLazyConcatObservable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.sources = [TObservable(), TObservable()]
+        self.obs = LazyConcatObservable(
+            sources=[lambda source=source: source for source in self.sources],
+            subscribe_scheduler=self.scheduler,
+        )
+        self.exception = Exception('dummy')
+
+    def test_observe_first_source_only(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
+
+        self.assertIsNotNone(self.sources[0].observer)
+        self.assertIsNone(self.sources[1].observer)
+
+    def test_on_next_first(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
+
+        ack = self.sources[0].on_next_single(1)
+
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual([1], sink.received)
+
+    def test_observe_second_after_first_completed(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
+        self.sources[0].on_next_single(1)
+
+        self.sources[0].on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsNotNone(self.sources[1].observer)
+
+        ack = self.sources[1].on_next_single(2)
+
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual([1, 2], sink.received)
+        self.assertFalse(sink.is_completed)
+
+    def test_wait_on_last_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        self.obs.observe(init_observer_info(sink))
+        self.sources[0].on_next_single(1)
+
+        self.sources[0].on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsNone(self.sources[1].observer)
+
+        sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertIsNotNone(self.sources[1].observer)
+
+    def test_stop_on_stop_ack(self):
+        sink = TObserver(immediate_continue=0)
+        self.obs.observe(init_observer_info(sink))
+        self.sources[0].on_next_single(1)
+
+        self.sources[0].on_completed()
+        sink.ack.on_next(stop_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertIsNone(self.sources[1].observer)
+
+    def test_on_completed(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_completed()
+        self.scheduler.advance_by(1)
+        self.sources[1].on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertTrue(sink.is_completed)
+
+    def test_on_error(self):
+        sink = TObserver()
+        self.obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_error(self.exception)
+
+        self.assertEqual(self.exception, sink.exception)
+        self.assertIsNone(self.sources[1].observer)
@@ -0,0 +1,114 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.mergenobservable import MergeNObservable
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestMergeNObservable(unittest.TestCase):
+    def setUp(self):
+        self.sources = [TObservable(), TObservable(), TObservable()]
+        self.exception = Exception('test')
+
+    def test_emit_with_synchronous_ack(self):
+        sink = TObserver()
+        obs = MergeNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_single(1)
+        ack2 = self.sources[2].on_next_single(2)
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertListEqual(sink.received, [1, 2])
+
+    def test_buffer_while_emitting(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_single(1)
+        ack2 = self.sources[1].on_next_single(2)
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+        self.assertListEqual(sink.received, [1])
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack2.value, ContinueAck)
+        self.assertListEqual(sink.received, [1, 2])
+
+    def test_emit_in_order_of_arrival(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_single(1)
+        self.sources[2].on_next_single(3)
+        self.sources[1].on_next_single(2)
+
+        sink.immediate_continue = 2
+        sink.ack.on_next(continue_ack)
+
+        self.assertListEqual(sink.received, [1, 3, 2])
+
+    def test_emit_prioritized(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(sources=self.sources, prioritized=True)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[2].on_next_single(3)
+        self.sources[1].on_next_single(2)
+        self.sources[0].on_next_single(1)
+
+        sink.immediate_continue = 2
+        sink.ack.on_next(continue_ack)
+
+        self.assertListEqual(sink.received, [3, 1, 2])
+
+    def test_complete_after_buffered_elements(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_single(1)
+        self.sources[1].on_next_single(2)
+        for source in self.sources:
+            source.on_completed()
+
+        self.assertFalse(sink.is_completed)
+
+        sink.immediate_continue = 1
+        sink.ack.on_next(continue_ack)
+
+        self.assertListEqual(sink.received, [1, 2])
+        self.assertTrue(sink.is_completed)
+
+    def test_stop_buffered_sources(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_single(1)
+        ack2 = self.sources[1].on_next_single(2)
+
+        sink.ack.on_next(stop_ack)
+
+        self.assertIsInstance(ack2.value, StopAck)
+        self.assertListEqual(sink.received, [1])
+
+    def test_on_error(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_single(1)
+        ack2 = self.sources[1].on_next_single(2)
+        self.sources[2].on_error(self.exception)
+
+        self.assertEqual(self.exception, sink.exception)
+        self.assertIsInstance(ack2.value, StopAck)
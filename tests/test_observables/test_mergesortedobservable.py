@@ -0,0 +1,126 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.mergesortedobservable import MergeSortedObservable
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestMergeSortedObservable(unittest.TestCase):
+    def setUp(self):
+        self.left = TObservable()
+        self.right = TObservable()
+        self.exception = Exception('test')
+
+    def test_wait_on_other_source(self):
+        sink = TObserver()
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack = self.left.on_next_list([1, 3])
+
+        self.assertFalse(ack.has_value)
+        self.assertListEqual(sink.received, [])
+
+    def test_merge_smaller_batch(self):
+        sink = TObserver()
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.left.on_next_list([1, 3, 5])
+        ack2 = self.right.on_next_list([2, 4, 6, 8])
+
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertFalse(ack2.has_value)
+        self.assertListEqual(sink.received, [1, 2, 3, 4, 5])
+
+        ack3 = self.left.on_next_list([7, 9])
+
+        self.assertFalse(ack3.has_value)
+        self.assertIsInstance(ack2.value, ContinueAck)
+        self.assertListEqual(sink.received, [1, 2, 3, 4, 5, 6, 7, 8])
+
+    def test_left_elements_first_on_equal_keys(self):
+        sink = TObserver()
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=lambda v: v[0])
+        obs.observe(init_observer_info(sink))
+
+        self.left.on_next_list([(1, 'l'), (2, 'l')])
+        self.right.on_next_list([(1, 'r'), (2, 'r')])
+
+        self.assertListEqual(sink.received, [(1, 'l'), (1, 'r'), (2, 'l')])
+
+    def test_flush_after_other_source_completed(self):
+        sink = TObserver()
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        self.left.on_next_list([1, 3])
+        self.right.on_next_list([2, 4, 5])
+        self.left.on_completed()
+
+        self.assertListEqual(sink.received, [1, 2, 3, 4, 5])
+        self.assertFalse(sink.is_completed)
+
+        self.right.on_completed()
+
+        self.assertTrue(sink.is_completed)
+
+    def test_back_pressure_on_asynchronous_ack(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.left.on_next_list([1, 2])
+        ack2 = self.right.on_next_list([1, 2])
+
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack2.has_value)
+        self.assertListEqual(sink.received, [1, 1, 2])
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+    def test_complete_after_pending_elements(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        self.right.on_completed()
+        self.left.on_next_list([1, 2])
+        self.left.on_completed()
+
+        self.assertListEqual(sink.received, [1, 2])
+        self.assertFalse(sink.is_completed)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertTrue(sink.is_completed)
+
+    def test_stop_ack(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.left.on_next_list([1, 3])
+        ack2 = self.right.on_next_list([2, 4])
+
+        sink.ack.on_next(stop_ack)
+
+        self.assertIsInstance(ack1.value, StopAck)
+        self.assertIsInstance(ack2.value, StopAck)
+
+    def test_exception(self):
+        sink = TObserver()
+        obs = MergeSortedObservable(left=self.left, right=self.right, key=None)
+        obs.observe(init_observer_info(sink))
+
+        ack = self.left.on_next_list([1, 3])
+        self.right.on_error(self.exception)
+
+        self.assertIsInstance(ack.value, StopAck)
+        self.assertEqual(sink.exception, self.exception)
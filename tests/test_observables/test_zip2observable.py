@@ -306,4 +306,31 @@ class TestZip2Observable(TestCaseBase):
 
         self.assertIsInstance(self.measure_termination_state(obs), TerminationStates.LeftCompletedState)
         self.assertIsInstance(self.measure_state(obs), ZipStates.WaitOnRight)
-        self.assertListEqual(sink.received, [(1, 1)])
\ No newline at end of file
+        self.assertListEqual(sink.received, [(1, 1)])
+
+    def test_keep_remaining_elements_as_offset(self):
+        """
+                    s2.on_next             s2.on_next
+        WaitOnRight ------------> WaitOnRight ------------> WaitOnLeftRight
+        """
+
+        sink = TObserver()
+        obs = ZipObservable(self.left, self.right, stack=[])
+        obs.observe(init_observer_info(sink))
+
+        left_buffer = [1, 2, 3]
+        ack1 = self.left.on_next_list(left_buffer)
+        ack2 = self.right.on_next_list([1])
+
+        self.assertIsInstance(self.measure_state(obs), ZipStates.WaitOnRight)
+        self.assertIs(obs.state.left_buffer, left_buffer)
+        self.assertEqual(obs.state.left_offset, 1)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertFalse(ack1.has_value)
+
+        ack2 = self.right.on_next_iter([2, 3])
+
+        self.assertIsInstance(self.measure_state(obs), ZipStates.WaitOnLeftRight)
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertListEqual(sink.received, [(1, 1), (2, 2), (3, 3)])
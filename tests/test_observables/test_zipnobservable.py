@@ -0,0 +1,130 @@
+import traceback
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.zipnobservable import ZipNObservable
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestZipNObservable(unittest.TestCase):
+    def setUp(self):
+        self.sources = [TObservable(), TObservable(), TObservable()]
+        self.exception = Exception('test')
+
+    def test_wait_on_all_sources(self):
+        sink = TObserver()
+        obs = ZipNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_single(1)
+        ack2 = self.sources[1].on_next_single(2)
+
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack2.has_value)
+        self.assertListEqual(sink.received, [])
+
+    def test_zip_flat_tuples(self):
+        sink = TObserver()
+        obs = ZipNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_single(1)
+        ack2 = self.sources[1].on_next_single(2)
+        ack3 = self.sources[2].on_next_single(3)
+
+        self.assertListEqual(sink.received, [(1, 2, 3)])
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2.value, ContinueAck)
+        self.assertIsInstance(ack3, ContinueAck)
+
+    def test_keep_remaining_elements(self):
+        sink = TObserver()
+        obs = ZipNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1, 2])
+        ack2 = self.sources[1].on_next_list([1, 2, 3])
+        ack3 = self.sources[2].on_next_single(1)
+
+        self.assertListEqual(sink.received, [(1, 1, 1)])
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack2.has_value)
+        self.assertIsInstance(ack3, ContinueAck)
+
+        ack3 = self.sources[2].on_next_single(2)
+
+        self.assertListEqual(sink.received, [(1, 1, 1), (2, 2, 2)])
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertFalse(ack2.has_value)
+        self.assertIsInstance(ack3, ContinueAck)
+
+    def test_asynchronous_ack(self):
+        sink = TObserver(immediate_continue=0)
+        obs = ZipNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_single(1)
+        ack2 = self.sources[1].on_next_single(2)
+        ack3 = self.sources[2].on_next_single(3)
+
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack3.has_value)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2.value, ContinueAck)
+        self.assertIsInstance(ack3.value, ContinueAck)
+
+    def test_complete_on_empty_slot(self):
+        sink = TObserver()
+        obs = ZipNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_single(1)
+        self.sources[1].on_completed()
+
+        self.assertTrue(sink.is_completed)
+        self.assertIsInstance(ack1.value, StopAck)
+
+    def test_complete_after_slot_got_exhausted(self):
+        sink = TObserver()
+        obs = ZipNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_single(1)
+        self.sources[0].on_completed()
+        ack2 = self.sources[1].on_next_list([1, 2])
+
+        self.assertFalse(sink.is_completed)
+
+        self.sources[2].on_next_single(1)
+
+        self.assertListEqual(sink.received, [(1, 1, 1)])
+        self.assertTrue(sink.is_completed)
+        self.assertIsInstance(ack2.value, StopAck)
+
+    def test_on_error(self):
+        sink = TObserver()
+        obs = ZipNObservable(sources=self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_single(1)
+        self.sources[2].on_error(self.exception)
+
+        self.assertEqual(self.exception, sink.exception)
+        self.assertIsInstance(ack1.value, StopAck)
+
+    def test_on_error_materialize_batch(self):
+        sink = TObserver()
+        stack = traceback.extract_stack()
+        obs = ZipNObservable(sources=self.sources, stack=stack)
+        obs.observe(init_observer_info(sink))
+
+        ack = self.sources[0].on_next(1)
+
+        self.assertIsInstance(ack, StopAck)
+        self.assertIn('Traceback rxbp (most recent call last):', str(sink.exception))
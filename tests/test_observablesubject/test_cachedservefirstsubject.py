@@ -255,6 +255,33 @@ class TestCachedServeFirstSubject(TestCaseBase):
         self.assertEqual([1, 2, 3], o1.received)
         self.assertEqual([1, 2, 3], o2.received)
 
+    def test_on_next_buffer_size_back_pressures_source(self):
+        subject = CacheServeFirstObservableSubject(scheduler=self.scheduler, buffer_size=2)
+        source = TObservable()
+        source.observe(init_observer_info(subject))
+
+        o1 = TObserver()
+        o2 = TObserver(immediate_continue=0)
+        subject.observe(init_observer_info(o1))
+        subject.observe(init_observer_info(o2))
+        source.on_next_single(1)
+        source.on_next_single(2)
+
+        # state change
+        ack = source.on_next_single(3)
+
+        # validation
+        self.assertIsNot(continue_ack, ack)
+        self.assertEqual(2, len(subject.shared_state.queue))
+
+        o2.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertIs(continue_ack, ack.value)
+        self.assertEqual([1, 2, 3], o1.received)
+        self.assertEqual([1, 2], o2.received)
+        self.assertEqual(1, len(subject.shared_state.queue))
+
     def test_on_error(self):
         """
                on_completed
@@ -321,3 +348,11 @@ class TestCachedServeFirstSubject(TestCaseBase):
         self.source.on_next_single(1)
 
         self.assertEqual([], sink.received)
+
+    def test_is_buffer_full_after_dispose(self):
+        subject = CacheServeFirstObservableSubject(scheduler=self.scheduler, buffer_size=1)
+        subject.observe(init_observer_info(TObserver(immediate_continue=0)))
+
+        subject.dispose()
+
+        self.assertFalse(subject.shared_state.is_buffer_full())
@@ -98,3 +98,114 @@ class TestBackpressureBufferedObserver(unittest.TestCase):
 
         self.assertFalse(ack.is_sync)
         self.assertEqual([0, 1], sink.received)
+
+    def test_merge_buffered_batches(self):
+        sink = TObserver(immediate_continue=0)
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=10,
+        )
+        self.source.observe(init_observer_info(observer))
+        self.source.on_next_list([0, 1])
+        self.scheduler.advance_by(1)
+
+        self.source.on_next_list([2])
+        self.source.on_next_list([3, 4])
+        sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([0, 1, 2, 3, 4], sink.received)
+        self.assertEqual(2, sink.on_next_counter)
+
+    def test_count_elements(self):
+        sink = TObserver(immediate_continue=0)
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=3,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        ack1 = self.source.on_next_list([0, 1])
+        ack2 = self.source.on_next_list([2, 3])
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+    def test_release_on_low_watermark(self):
+        sink = TObserver(immediate_continue=0)
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=2,
+            low_watermark=0,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        ack = self.source.on_next_list([0, 1, 2])
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([0, 1, 2], sink.received)
+        self.assertFalse(ack.has_value)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack.value, ContinueAck)
+
+    def test_size_func(self):
+        sink = TObserver()
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=5,
+            size_func=lambda batch: sum(len(e) for e in batch),
+        )
+        self.source.observe(init_observer_info(observer))
+
+        ack1 = self.source.on_next_list(['ab', 'c'])
+        ack2 = self.source.on_next_list(['def'])
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+    def test_complete_after_buffered_batches(self):
+        sink = TObserver()
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=10,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([0, 1])
+        self.source.on_completed()
+
+        self.assertFalse(sink.is_completed)
+
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([0, 1], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_wait_on_downstream_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=10,
+        )
+        self.source.observe(init_observer_info(observer))
+        self.source.on_next_list([0])
+        self.scheduler.advance_by(1)
+
+        self.source.on_next_list([1])
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([0], sink.received)
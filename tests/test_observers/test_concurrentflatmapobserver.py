@@ -0,0 +1,154 @@
+import unittest
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.concurrentflatmapobserver import ConcurrentFlatMapObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestConcurrentFlatMapObserver(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+        self.inner_sources = [TObservable() for _ in range(3)]
+
+        self.sink = TObserver()
+        self.scheduler = TScheduler()
+        self.composite_disposable = CompositeDisposable()
+        self.exc = Exception()
+
+    def observe(self, max_concurrent: int, ordered: bool, sink: TObserver = None):
+        observer = ConcurrentFlatMapObserver(
+            observer_info=init_observer_info(observer=sink or self.sink),
+            func=lambda v: v,
+            max_concurrent=max_concurrent,
+            ordered=ordered,
+            subscribe_scheduler=self.scheduler,
+            composite_disposable=self.composite_disposable,
+        )
+        self.source.observe(init_observer_info(observer))
+        return observer
+
+    def test_observe_up_to_max_concurrent(self):
+        self.observe(max_concurrent=2, ordered=True)
+
+        ack = self.source.on_next_list(self.inner_sources)
+        self.scheduler.advance_by(1)
+
+        self.assertIsNotNone(self.inner_sources[0].observer)
+        self.assertIsNotNone(self.inner_sources[1].observer)
+        self.assertIsNone(self.inner_sources[2].observer)
+        self.assertFalse(ack.has_value)
+
+    def test_observe_next_after_inner_completed(self):
+        self.observe(max_concurrent=2, ordered=True)
+
+        ack = self.source.on_next_list(self.inner_sources)
+        self.scheduler.advance_by(1)
+        self.inner_sources[1].on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertIsNotNone(self.inner_sources[2].observer)
+        self.assertIsInstance(ack.value, ContinueAck)
+
+    def test_unordered(self):
+        self.observe(max_concurrent=2, ordered=False)
+        self.source.on_next_list(self.inner_sources[:2])
+        self.scheduler.advance_by(1)
+
+        ack2 = self.inner_sources[1].on_next_single(2)
+        ack1 = self.inner_sources[0].on_next_single(1)
+
+        self.assertEqual([2, 1], self.sink.received)
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2.value, ContinueAck)
+
+    def test_unordered_unbounded(self):
+        self.observe(max_concurrent=None, ordered=False)
+        ack = self.source.on_next_list(self.inner_sources)
+        self.scheduler.advance_by(1)
+
+        self.assertTrue(all(inner.observer is not None for inner in self.inner_sources))
+        self.assertIsInstance(ack.value, ContinueAck)
+
+        self.inner_sources[2].on_next_single(3)
+        self.inner_sources[0].on_next_single(1)
+
+        self.assertEqual([3, 1], self.sink.received)
+
+    def test_ordered(self):
+        self.observe(max_concurrent=2, ordered=True)
+        self.source.on_next_list(self.inner_sources[:2])
+        self.scheduler.advance_by(1)
+
+        ack2 = self.inner_sources[1].on_next_single(2)
+        ack1 = self.inner_sources[0].on_next_single(1)
+
+        self.assertEqual([1], self.sink.received)
+        self.assertFalse(ack2.has_value)
+
+        self.inner_sources[0].on_completed()
+
+        self.assertEqual([1, 2], self.sink.received)
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2.value, ContinueAck)
+
+    def test_wait_on_downstream_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        self.observe(max_concurrent=2, ordered=False, sink=sink)
+        self.source.on_next_list(self.inner_sources[:2])
+        self.scheduler.advance_by(1)
+
+        ack1 = self.inner_sources[0].on_next_single(1)
+        ack2 = self.inner_sources[1].on_next_single(2)
+
+        self.assertEqual([1], sink.received)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+    def test_stop_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        self.observe(max_concurrent=2, ordered=False, sink=sink)
+        ack = self.source.on_next_list(self.inner_sources)
+        self.scheduler.advance_by(1)
+
+        ack1 = self.inner_sources[0].on_next_single(1)
+        ack2 = self.inner_sources[1].on_next_single(2)
+        sink.ack.on_next(stop_ack)
+
+        self.assertIsInstance(ack1.value, StopAck)
+        self.assertIsInstance(ack2.value, StopAck)
+        self.assertIsInstance(ack.value, StopAck)
+
+    def test_on_completed(self):
+        self.observe(max_concurrent=2, ordered=True)
+        self.source.on_next_list(self.inner_sources[:2])
+        self.scheduler.advance_by(1)
+        self.source.on_completed()
+
+        self.inner_sources[0].on_completed()
+
+        self.assertFalse(self.sink.is_completed)
+
+        self.inner_sources[1].on_completed()
+
+        self.assertTrue(self.sink.is_completed)
+
+    def test_inner_on_error(self):
+        self.observe(max_concurrent=2, ordered=True)
+        self.source.on_next_list(self.inner_sources[:2])
+        self.scheduler.advance_by(1)
+
+        self.inner_sources[1].on_error(self.exc)
+        self.inner_sources[0].on_error(self.exc)
+
+        self.assertIs(self.exc, self.sink.exception)
+        self.assertIsInstance(self.inner_sources[0].on_next_single(1), StopAck)
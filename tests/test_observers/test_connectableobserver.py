@@ -98,3 +98,76 @@ class TestConnectableObserver(TestCaseBase):
         self.assertEqual([1], sink.received)
         self.assertEqual(self.exception, sink.exception)
         self.assertIsInstance(ack, StopAck)
+
+    def test_on_next_exceeding_buffer_size(self):
+        sink = TObserver()
+        observer = ConnectableObserver(
+            sink,
+            buffer_size=1,
+        )
+
+        ack1 = observer.on_next([1])
+        ack2 = observer.on_next([2])
+        ack3 = observer.on_next([3])
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+        self.assertIs(ack2, ack3)
+
+        observer.connect()
+
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertIsInstance(ack2.value, ContinueAck)
+
+    def test_connect_large_burst(self):
+        sink = TObserver()
+        observer = ConnectableObserver(
+            sink,
+        )
+        acks = [observer.on_next([i]) for i in range(10000)]
+        observer.on_completed()
+
+        observer.connect()
+
+        self.assertEqual(list(range(10000)), sink.received)
+        self.assertTrue(sink.is_completed)
+        self.assertIsInstance(acks[-1].value, ContinueAck)
+
+    def test_connect_wait_on_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        observer = ConnectableObserver(
+            sink,
+        )
+        ack = observer.on_next([1])
+        observer.on_next([2])
+        observer.on_completed()
+
+        observer.connect()
+
+        self.assertEqual([1], sink.received)
+        self.assertFalse(ack.has_value)
+
+        sink.ack.on_next(ContinueAck())
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertFalse(sink.is_completed)
+
+        sink.ack.on_next(ContinueAck())
+
+        self.assertTrue(sink.is_completed)
+        self.assertIsInstance(ack.value, ContinueAck)
+
+    def test_connect_stop_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        observer = ConnectableObserver(
+            sink,
+        )
+        ack = observer.on_next([1])
+        observer.on_next([2])
+
+        observer.connect()
+        sink.ack.on_next(StopAck())
+
+        self.assertEqual([1], sink.received)
+        self.assertIsInstance(ack.value, StopAck)
+        self.assertIsInstance(observer.on_next([3]), StopAck)
@@ -1,6 +1,6 @@
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.observers.evictingbufferedobserver import EvictingBufferedObserver
-from rxbp.overflowstrategy import DropOld
+from rxbp.overflowstrategy import DropOld, Drop, ClearBuffer
 from rxbp.testing.testcasebase import TestCaseBase
 from rxbp.testing.tobservable import TObservable
 from rxbp.testing.tobserver import TObserver
@@ -42,3 +42,91 @@ class TestEvictingBufferedObserver(TestCaseBase):
         self.scheduler.advance_by(1)
 
         self.assertEqual(self.sink.received, [2, 3])
+
+    def test_drop_new_batches(self):
+        s: TScheduler = self.scheduler
+
+        strategy = Drop(2)
+        evicting_obs = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs)
+
+        s1.on_next_single(1)
+        s1.on_next_single(2)
+        ack = s1.on_next_list([3, 4])
+        self.assertIsInstance(ack, ContinueAck)
+
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1], self.sink.received)
+
+        self.sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1, 2], self.sink.received)
+        self.assertEqual(1, evicting_obs.stats.dropped_batches)
+        self.assertEqual(2, evicting_obs.stats.dropped_elements)
+
+    def test_drop_old_stats(self):
+        s: TScheduler = self.scheduler
+
+        strategy = DropOld(2)
+        evicting_obs = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs)
+
+        s1.on_next_list([1, 2])
+        s1.on_next_single(3)
+        s1.on_next_single(4)
+
+        self.assertEqual(1, evicting_obs.stats.dropped_batches)
+        self.assertEqual(2, evicting_obs.stats.dropped_elements)
+        self.assertEqual(2, evicting_obs.stats.buffered_batches)
+        self.assertEqual(2, evicting_obs.stats.buffered_elements)
+
+    def test_clear_buffer_on_drop_callback(self):
+        s: TScheduler = self.scheduler
+        received_stats = []
+
+        strategy = ClearBuffer(2, on_drop=lambda stats: received_stats.append(stats.dropped_batches))
+        evicting_obs = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs)
+
+        s1.on_next_single(1)
+        s1.on_next_single(2)
+        s1.on_next_single(3)
+
+        self.assertEqual([2], received_stats)
+        self.assertEqual(1, evicting_obs.stats.buffered_batches)
+
+    def test_stats_per_subscription(self):
+        s: TScheduler = self.scheduler
+        received_stats = []
+
+        strategy = Drop(1, on_drop=received_stats.append)
+        evicting_obs1 = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        evicting_obs2 = EvictingBufferedObserver(TObserver(), scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs1)
+        s2 = TObservable(observer=evicting_obs2)
+
+        s1.on_next_single(1)
+        s1.on_next_single(2)
+        s2.on_next_single(1)
+
+        self.assertEqual([evicting_obs1.stats], received_stats)
+        self.assertEqual(1, evicting_obs1.stats.dropped_batches)
+        self.assertEqual(0, evicting_obs2.stats.dropped_batches)
+        self.assertEqual(1, evicting_obs2.stats.buffered_batches)
+
+    def test_stats_on_subscribe(self):
+        s: TScheduler = self.scheduler
+        received_stats = []
+
+        strategy = DropOld(2, on_subscribe=received_stats.append)
+        evicting_obs = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs)
+
+        s1.on_next_list([1, 2])
+
+        self.assertEqual([evicting_obs.stats], received_stats)
+        self.assertEqual(1, received_stats[0].buffered_batches)
+        self.assertEqual(2, received_stats[0].buffered_elements)
+        self.assertEqual(0, received_stats[0].dropped_batches)
@@ -0,0 +1,73 @@
+import unittest
+
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.filtermaskobserver import FilterMaskObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestFilterMaskObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = TObservable()
+        self.sink = TObserver()
+
+    def test_initialize(self):
+        FilterMaskObserver(
+            observer=self.sink,
+            predicate=lambda batch: [v % 2 == 0 for v in batch],
+        )
+
+    def test_single_batch(self):
+        obs = FilterMaskObserver(
+            observer=self.sink,
+            predicate=lambda batch: [v % 2 == 0 for v in batch],
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3, 4])
+
+        self.assertEqual([2, 4], self.sink.received)
+
+    def test_iterator_batch(self):
+        obs = FilterMaskObserver(
+            observer=self.sink,
+            predicate=lambda batch: [v % 2 == 0 for v in batch],
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_iter([1, 2, 3, 4])
+
+        self.assertEqual([2, 4], self.sink.received)
+
+    def test_predicate_called_once_per_batch(self):
+        calls = []
+
+        def predicate(batch):
+            calls.append(batch)
+            return [True for _ in batch]
+
+        obs = FilterMaskObserver(
+            observer=self.sink,
+            predicate=predicate,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+
+        self.assertEqual([[1, 2, 3]], calls)
+
+    def test_exception_in_predicate(self):
+        exc = Exception()
+
+        def predicate(batch):
+            raise exc
+
+        obs = FilterMaskObserver(
+            observer=self.sink,
+            predicate=predicate,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+
+        self.assertEqual(exc, self.sink.exception)
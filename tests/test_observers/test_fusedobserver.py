@@ -0,0 +1,75 @@
+import unittest
+
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.fusedobserver import FusedObserver, FusedStage
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestFusedObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = TObservable()
+        self.sink = TObserver()
+
+    def test_map_filter_map(self):
+        obs = FusedObserver(
+            observer=self.sink,
+            stages=(
+                FusedStage(kind=FusedStage.MAP, func=lambda v: v + 1),
+                FusedStage(kind=FusedStage.FILTER, func=lambda v: v % 2 == 0),
+                FusedStage(kind=FusedStage.MAP, func=lambda v: 10 * v),
+            ),
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3, 4])
+
+        self.assertEqual([20, 40], self.sink.received)
+
+    def test_zip_with_index_over_two_batches(self):
+        obs = FusedObserver(
+            observer=self.sink,
+            stages=(
+                FusedStage(kind=FusedStage.FILTER, func=lambda v: v != 'b'),
+                FusedStage(kind=FusedStage.ZIP_WITH_INDEX, func=lambda v, i: (v, i)),
+            ),
+        )
+        self.source.observe(init_observer_info(observer=obs))
+        self.source.on_next_list(['a', 'b'])
+
+        self.source.on_next_list(['c'])
+
+        self.assertEqual([('a', 0), ('c', 1)], self.sink.received)
+
+    def test_map_to_iterator_as_last_stage(self):
+        obs = FusedObserver(
+            observer=self.sink,
+            stages=(
+                FusedStage(kind=FusedStage.MAP, func=lambda v: v + 1),
+                FusedStage(kind=FusedStage.MAP_TO_ITERATOR, func=lambda v: [v, v]),
+            ),
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2])
+
+        self.assertEqual([2, 2, 3, 3], self.sink.received)
+
+    def test_exception_in_map_to_iterator(self):
+        exc = Exception()
+
+        def func(v):
+            raise exc
+
+        obs = FusedObserver(
+            observer=self.sink,
+            stages=(
+                FusedStage(kind=FusedStage.MAP, func=lambda v: v + 1),
+                FusedStage(kind=FusedStage.MAP_TO_ITERATOR, func=func),
+            ),
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2])
+
+        self.assertEqual(exc, self.sink.exception)
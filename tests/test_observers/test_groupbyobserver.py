@@ -0,0 +1,200 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.observers.groupbyobserver import GroupByObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestGroupByObserver(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+        self.sink = TObserver()
+        self.scheduler = TScheduler()
+        self.subscriber = init_subscriber(
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+        self.exception = Exception('dummy')
+
+    def observe(self, max_groups: int = None, group_buffer: int = None):
+        observer = GroupByObserver(
+            observer_info=init_observer_info(observer=self.sink),
+            key_func=lambda v: v % 2,
+            max_groups=max_groups,
+            group_buffer=group_buffer,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+        return observer
+
+    def observe_group(self, idx: int, sink: TObserver = None):
+        key, flowable = self.sink.received[idx]
+        sink = sink or TObserver()
+        subscription = flowable.unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+        return key, sink
+
+    def test_emit_new_groups(self):
+        self.observe()
+
+        self.source.on_next_list([1, 2, 3])
+
+        self.assertEqual([1, 0], [key for key, _ in self.sink.received])
+
+    def test_route_elements(self):
+        self.observe()
+        ack = self.source.on_next_list([1, 2, 3])
+
+        _, sink1 = self.observe_group(0)
+        _, sink0 = self.observe_group(1)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1, 3], sink1.received)
+        self.assertEqual([2], sink0.received)
+        self.assertIsInstance(ack, ContinueAck)
+
+    def test_existing_group(self):
+        self.observe()
+        self.source.on_next_list([1])
+        _, sink1 = self.observe_group(0)
+
+        ack = self.source.on_next_list([3, 5])
+        self.scheduler.advance_by(1)
+
+        self.assertEqual(1, len(self.sink.received))
+        self.assertEqual([1, 3, 5], sink1.received)
+        self.assertIsInstance(ack, ContinueAck)
+
+    def test_slow_group_without_group_buffer(self):
+        self.observe()
+        self.source.on_next_list([1, 2])
+        _, sink1 = self.observe_group(0, sink=TObserver(immediate_continue=0))
+        _, sink0 = self.observe_group(1)
+        self.scheduler.advance_by(1)
+
+        ack = self.source.on_next_list([3, 4])
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2, 4], sink0.received)
+        self.assertEqual([1], sink1.received)
+        self.assertIsInstance(ack, ContinueAck)
+
+        sink1.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1, 3], sink1.received)
+
+    def test_unobserved_groups(self):
+        self.observe()
+        ack1 = self.source.on_next_list([1, 2])
+        ack2 = self.source.on_next_list([3, 4])
+        self.source.on_completed()
+        self.scheduler.advance_by(1)
+
+        _, sink1 = self.observe_group(0)
+        _, sink0 = self.observe_group(1)
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertEqual([1, 3], sink1.received)
+        self.assertEqual([2, 4], sink0.received)
+        self.assertTrue(sink1.is_completed)
+        self.assertTrue(sink0.is_completed)
+
+    def test_new_groups_do_not_back_pressure(self):
+        self.sink = TObserver(immediate_continue=0)
+        self.observe()
+
+        ack1 = self.source.on_next_list([1])
+        ack2 = self.source.on_next_list([2])
+        self.source.on_completed()
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertEqual([1], [key for key, _ in self.sink.received])
+        self.assertFalse(self.sink.is_completed)
+
+        self.sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 0], [key for key, _ in self.sink.received])
+
+        self.sink.ack.on_next(continue_ack)
+
+        self.assertTrue(self.sink.is_completed)
+
+    def test_group_buffer(self):
+        self.observe(group_buffer=2)
+        self.source.on_next_list([1, 2])
+        self.observe_group(0, sink=TObserver(immediate_continue=0))
+        self.observe_group(1)
+
+        ack1 = self.source.on_next_list([3, 4])
+        self.scheduler.advance_by(1)
+        ack2 = self.source.on_next_list([5, 7])
+        self.scheduler.advance_by(1)
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+    def test_max_groups(self):
+        self.sink = TObserver()
+        observer = GroupByObserver(
+            observer_info=init_observer_info(observer=self.sink),
+            key_func=lambda v: v,
+            max_groups=2,
+            group_buffer=None,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+        self.source.on_next_list([1, 2])
+        _, sink1 = self.observe_group(0)
+        _, sink2 = self.observe_group(1)
+        self.source.on_next_list([1])
+
+        self.source.on_next_list([3])
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1, 2, 3], [key for key, _ in self.sink.received])
+        self.assertTrue(sink2.is_completed)
+        self.assertFalse(sink1.is_completed)
+
+    def test_on_completed(self):
+        self.observe()
+        self.source.on_next_list([1, 2])
+        _, sink1 = self.observe_group(0)
+
+        self.source.on_completed()
+        self.scheduler.advance_by(1)
+
+        self.assertTrue(sink1.is_completed)
+        self.assertTrue(self.sink.is_completed)
+
+    def test_on_error(self):
+        self.observe()
+        self.source.on_next_list([1, 2])
+        _, sink1 = self.observe_group(0)
+
+        self.source.on_error(self.exception)
+
+        self.assertIs(self.exception, sink1.exception)
+        self.assertIs(self.exception, self.sink.exception)
+
+    def test_stopped_group_is_replaced(self):
+        self.observe()
+        self.source.on_next_list([1])
+        sink1 = TObserver(immediate_continue=0)
+        self.observe_group(0, sink=sink1)
+        self.scheduler.advance_by(1)
+        sink1.ack.on_next(StopAck())
+
+        self.source.on_next_list([3])
+
+        self.assertEqual([1, 1], [key for key, _ in self.sink.received])
@@ -0,0 +1,74 @@
+import unittest
+
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.mapbatchobserver import MapBatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestMapBatchObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = TObservable()
+        self.sink = TObserver()
+
+    def test_initialize(self):
+        MapBatchObserver(
+            observer=self.sink,
+            func=lambda batch: [v + 1 for v in batch],
+        )
+
+    def test_single_batch(self):
+        obs = MapBatchObserver(
+            observer=self.sink,
+            func=lambda batch: [v + 1 for v in batch],
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+
+        self.assertEqual([2, 3, 4], self.sink.received)
+
+    def test_iterator_batch(self):
+        obs = MapBatchObserver(
+            observer=self.sink,
+            func=lambda batch: [v + 1 for v in batch],
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_iter([1, 2, 3])
+
+        self.assertEqual([2, 3, 4], self.sink.received)
+
+    def test_func_called_once_per_batch(self):
+        calls = []
+
+        def func(batch):
+            calls.append(batch)
+            return batch
+
+        obs = MapBatchObserver(
+            observer=self.sink,
+            func=func,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+        self.source.on_next_iter([4, 5])
+
+        self.assertEqual([[1, 2, 3], [4, 5]], calls)
+
+    def test_exception_in_func(self):
+        exc = Exception()
+
+        def func(batch):
+            raise exc
+
+        obs = MapBatchObserver(
+            observer=self.sink,
+            func=func,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+
+        self.assertEqual(exc, self.sink.exception)
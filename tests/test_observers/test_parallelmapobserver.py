@@ -0,0 +1,102 @@
+import unittest
+from concurrent.futures import Executor, Future
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.parallelmapobserver import ParallelMapObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TExecutor(Executor):
+    """ executes the submitted functions only when `run` is called
+    """
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.tasks.append((future, fn, args))
+        return future
+
+    def run(self, idx: int):
+        future, fn, args = self.tasks[idx]
+        future.set_result(fn(*args))
+
+
+class TestParallelMapObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.executor = TExecutor()
+        self.source = TObservable()
+        self.sink = TObserver()
+
+    def create_observer(self, ordered: bool, max_in_flight: int = 4):
+        observer = ParallelMapObserver(
+            observer=self.sink,
+            func=lambda v: v + 1,
+            executor=self.executor,
+            scheduler=self.scheduler,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            shutdown_executor=False,
+        )
+        self.source.observe(init_observer_info(observer=observer))
+        return observer
+
+    def test_ordered(self):
+        self.create_observer(ordered=True)
+
+        self.source.on_next_list([1, 2])
+        self.source.on_next_list([3])
+
+        self.executor.run(1)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([], self.sink.received)
+
+        self.executor.run(0)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2, 3, 4], self.sink.received)
+
+    def test_unordered(self):
+        self.create_observer(ordered=False)
+
+        self.source.on_next_list([1, 2])
+        self.source.on_next_list([3])
+
+        self.executor.run(1)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([4], self.sink.received)
+
+    def test_back_pressure(self):
+        self.create_observer(ordered=True, max_in_flight=2)
+
+        ack1 = self.source.on_next_list([1])
+        ack2 = self.source.on_next_list([2])
+
+        self.assertIs(continue_ack, ack1)
+        self.assertIsNot(continue_ack, ack2)
+
+        self.executor.run(0)
+        self.scheduler.advance_by(1)
+
+        self.assertIs(continue_ack, ack2.value)
+
+    def test_on_completed_after_mapped(self):
+        self.create_observer(ordered=True)
+
+        self.source.on_next_list([1])
+        self.source.on_completed()
+
+        self.assertFalse(self.sink.is_completed)
+
+        self.executor.run(0)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2], self.sink.received)
+        self.assertTrue(self.sink.is_completed)
@@ -0,0 +1,148 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.internal.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.observers.rebatchobserver import RebatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestRebatchObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = TObservable()
+
+    def test_merge_batches(self):
+        sink = TObserver()
+        obs = RebatchObserver(observer=sink, batch_size=3, adaptive_batch_size=None)
+        self.source.observe(init_observer_info(observer=obs))
+
+        ack1 = self.source.on_next_list([1, 2])
+        ack2 = self.source.on_next_list([3, 4])
+
+        self.assertIs(continue_ack, ack1)
+        self.assertIs(continue_ack, ack2)
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertEqual(1, sink.on_next_counter)
+
+    def test_split_batch(self):
+        sink = TObserver()
+        obs = RebatchObserver(observer=sink, batch_size=2, adaptive_batch_size=None)
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3, 4, 5])
+
+        self.assertEqual([1, 2, 3, 4], sink.received)
+        self.assertEqual(2, sink.on_next_counter)
+
+    def test_emit_remaining_on_completed(self):
+        sink = TObserver()
+        obs = RebatchObserver(observer=sink, batch_size=2, adaptive_batch_size=None)
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+        self.source.on_completed()
+
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_split_batch_asynchronously(self):
+        sink = TObserver(immediate_continue=0)
+        obs = RebatchObserver(observer=sink, batch_size=2, adaptive_batch_size=None)
+        self.source.observe(init_observer_info(observer=obs))
+
+        ack = self.source.on_next_list([1, 2, 3, 4])
+        self.source.on_completed()
+
+        self.assertIsNot(continue_ack, ack)
+        self.assertEqual([1, 2], sink.received)
+        self.assertFalse(sink.is_completed)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2, 3, 4], sink.received)
+        self.assertFalse(sink.is_completed)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertTrue(sink.is_completed)
+
+    def test_adaptive_batch_size_grows(self):
+        sink = TObserver()
+        adaptive_batch_size = AdaptiveBatchSize(target_latency=1.0, initial_size=1)
+        obs = RebatchObserver(observer=sink, batch_size=None, adaptive_batch_size=adaptive_batch_size)
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list(list(range(15)))
+
+        self.assertEqual(4, sink.on_next_counter)
+        self.assertEqual(16, adaptive_batch_size.batch_size)
+
+
+class TestAdaptiveBatchSize(unittest.TestCase):
+    def test_shrink_on_late_ack(self):
+        batch_size = AdaptiveBatchSize(target_latency=0.1, initial_size=100)
+
+        batch_size.update(n_elements=100, latency=0.4)
+
+        self.assertEqual(50, batch_size.batch_size)
+
+    def test_adapt_to_target_latency(self):
+        batch_size = AdaptiveBatchSize(target_latency=0.1, initial_size=100)
+
+        batch_size.update(n_elements=100, latency=0.08)
+
+        self.assertEqual(125, batch_size.batch_size)
+
+
+class TestRebatchObserverTimespan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.source = TObservable()
+
+    def test_emit_on_timeout(self):
+        sink = TObserver()
+        obs = RebatchObserver(
+            observer=sink,
+            batch_size=10,
+            adaptive_batch_size=None,
+            timespan=1.0,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1])
+        self.scheduler.advance_by(0.5)
+        self.source.on_next_list([2])
+
+        self.assertEqual([], sink.received)
+
+        # the timer is started with the first buffered element
+        self.scheduler.advance_by(0.5)
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertEqual(1, sink.on_next_counter)
+
+    def test_back_pressure_while_emitting_on_timeout(self):
+        sink = TObserver(immediate_continue=0)
+        obs = RebatchObserver(
+            observer=sink,
+            batch_size=10,
+            adaptive_batch_size=None,
+            timespan=1.0,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1])
+        self.scheduler.advance_by(1.0)
+
+        ack = self.source.on_next_list([2])
+
+        self.assertIsNot(continue_ack, ack)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIs(continue_ack, ack.value)
+        self.assertEqual([1], sink.received)
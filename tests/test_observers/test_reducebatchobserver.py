@@ -0,0 +1,86 @@
+import unittest
+
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.reducebatchobserver import ReduceBatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestReduceBatchObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = TObservable()
+        self.sink = TObserver()
+
+    def test_initialize(self):
+        ReduceBatchObserver(
+            observer=self.sink,
+            func=lambda acc, batch: acc + sum(batch),
+            initial=0,
+        )
+
+    def test_multiple_batches(self):
+        obs = ReduceBatchObserver(
+            observer=self.sink,
+            func=lambda acc, batch: acc + sum(batch),
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+        self.source.on_next_iter([4, 5])
+
+        self.assertEqual([], self.sink.received)
+
+        self.source.on_completed()
+
+        self.assertEqual([15], self.sink.received)
+        self.assertTrue(self.sink.is_completed)
+
+    def test_no_batch(self):
+        obs = ReduceBatchObserver(
+            observer=self.sink,
+            func=lambda acc, batch: acc + sum(batch),
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_completed()
+
+        self.assertEqual([0], self.sink.received)
+        self.assertTrue(self.sink.is_completed)
+
+    def test_func_called_once_per_batch(self):
+        calls = []
+
+        def func(acc, batch):
+            calls.append(batch)
+            return acc
+
+        obs = ReduceBatchObserver(
+            observer=self.sink,
+            func=func,
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+        self.source.on_next_iter([4, 5])
+
+        self.assertEqual([[1, 2, 3], [4, 5]], calls)
+
+    def test_exception_in_func(self):
+        exc = Exception()
+
+        def func(acc, batch):
+            raise exc
+
+        obs = ReduceBatchObserver(
+            observer=self.sink,
+            func=func,
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+
+        self.assertEqual(exc, self.sink.exception)
@@ -0,0 +1,73 @@
+import unittest
+
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.scancumulativeobserver import ScanCumulativeObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+def cumsum(acc, batch):
+    def gen():
+        result = acc
+        for v in batch:
+            result = result + v
+            yield result
+
+    return list(gen())
+
+
+class TestScanCumulativeObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = TObservable()
+        self.sink = TObserver()
+
+    def test_on_completed(self):
+        obs = ScanCumulativeObserver(
+            observer=self.sink,
+            func=cumsum,
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_completed()
+
+        self.assertTrue(self.sink.is_completed)
+
+    def test_single_batch(self):
+        obs = ScanCumulativeObserver(
+            observer=self.sink,
+            func=cumsum,
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2, 3])
+
+        self.assertEqual([1, 3, 6], self.sink.received)
+
+    def test_two_batches(self):
+        obs = ScanCumulativeObserver(
+            observer=self.sink,
+            func=cumsum,
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+        self.source.on_next_list([1, 2])
+
+        self.source.on_next_list([3, 4])
+
+        self.assertEqual([1, 3, 6, 10], self.sink.received)
+
+    def test_empty_batch(self):
+        obs = ScanCumulativeObserver(
+            observer=self.sink,
+            func=cumsum,
+            initial=0,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+        self.source.on_next_list([1, 2])
+        self.source.on_next_list([])
+
+        self.source.on_next_list([3])
+
+        self.assertEqual([1, 3, 6], self.sink.received)
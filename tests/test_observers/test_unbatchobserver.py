@@ -0,0 +1,54 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.unbatchobserver import UnbatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestUnbatchObserver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = TObservable()
+
+    def test_small_batch(self):
+        sink = TObserver()
+        obs = UnbatchObserver(observer=sink, batch_size=2)
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next_list([1, 2])
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertEqual(1, sink.on_next_counter)
+
+    def test_split_batch(self):
+        sink = TObserver()
+        obs = UnbatchObserver(observer=sink, batch_size=2)
+        self.source.observe(init_observer_info(observer=obs))
+
+        ack = self.source.on_next_list([1, 2, 3, 4, 5])
+
+        self.assertIs(continue_ack, ack)
+        self.assertEqual([1, 2, 3, 4, 5], sink.received)
+        self.assertEqual(3, sink.on_next_counter)
+
+    def test_split_batch_asynchronously(self):
+        sink = TObserver(immediate_continue=0)
+        obs = UnbatchObserver(observer=sink, batch_size=2)
+        self.source.observe(init_observer_info(observer=obs))
+
+        ack = self.source.on_next_list([1, 2, 3])
+        self.source.on_completed()
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertFalse(sink.is_completed)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertTrue(sink.is_completed)
+        self.assertFalse(ack.has_value)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIs(continue_ack, ack.value)
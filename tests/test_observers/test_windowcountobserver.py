@@ -0,0 +1,114 @@
+import statistics
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.internal.accumulators import to_accumulator_factory
+from rxbp.observers.windowcountobserver import WindowCountObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestWindowCountObserver(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+        self.sink = TObserver()
+        self.exception = Exception('dummy')
+
+    def observe(self, n: int, step: int, agg=None, value=None):
+        observer = WindowCountObserver(
+            next_observer=self.sink,
+            n=n,
+            step=step,
+            accumulator_factory=to_accumulator_factory(agg) if agg is not None else None,
+            value_selector=value,
+        )
+        self.source.observe(init_observer_info(observer))
+
+    def test_tumbling_windows(self):
+        self.observe(n=2, step=2)
+
+        self.source.on_next_list([1, 2, 3])
+        self.source.on_next_list([4, 5])
+
+        self.assertEqual([[1, 2], [3, 4]], self.sink.received)
+
+    def test_sliding_windows(self):
+        self.observe(n=3, step=1)
+
+        self.source.on_next_list([1, 2, 3, 4])
+
+        self.assertEqual([[1, 2, 3], [2, 3, 4]], self.sink.received)
+
+    def test_step_larger_than_window(self):
+        self.observe(n=2, step=3)
+
+        self.source.on_next_list(list(range(8)))
+
+        self.assertEqual([[0, 1], [3, 4], [6, 7]], self.sink.received)
+
+    def test_no_window(self):
+        self.observe(n=3, step=1)
+
+        ack = self.source.on_next_list([1, 2])
+
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual(0, self.sink.on_next_counter)
+
+    def test_accumulators(self):
+        values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0]
+        windows = [values[i:i + 4] for i in range(len(values) - 3)]
+
+        for agg, func in [
+            ('sum', sum),
+            ('mean', statistics.mean),
+            ('min', min),
+            ('max', max),
+            ('var', statistics.variance),
+            ('std', statistics.stdev),
+        ]:
+            with self.subTest(agg=agg):
+                self.setUp()
+                self.observe(n=4, step=1, agg=agg)
+
+                self.source.on_next_list(values[:5])
+                self.source.on_next_list(values[5:])
+
+                for actual, window in zip(self.sink.received, windows):
+                    self.assertAlmostEqual(func(window), actual)
+                self.assertEqual(len(windows), len(self.sink.received))
+
+    def test_constant_window(self):
+        values = [97.3, 41.9, 55.2] + 4 * [0.3]
+
+        for agg in ['var', 'std']:
+            with self.subTest(agg=agg):
+                self.setUp()
+                self.observe(n=4, step=1, agg=agg)
+
+                self.source.on_next_list(values)
+
+                self.assertEqual(0.0, self.sink.received[-1])
+
+    def test_value_selector(self):
+        self.observe(n=2, step=1, agg='sum', value=lambda r: r[1])
+
+        self.source.on_next_list([('a', 1), ('b', 2), ('c', 4)])
+
+        self.assertEqual([3, 6], self.sink.received)
+
+    def test_on_completed(self):
+        self.observe(n=2, step=2)
+        self.source.on_next_list([1])
+
+        self.source.on_completed()
+
+        self.assertEqual([], self.sink.received)
+        self.assertTrue(self.sink.is_completed)
+
+    def test_on_error(self):
+        self.observe(n=2, step=2)
+
+        self.source.on_error(self.exception)
+
+        self.assertIs(self.exception, self.sink.exception)
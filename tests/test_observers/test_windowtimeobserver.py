@@ -0,0 +1,109 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.internal.accumulators import to_accumulator_factory
+from rxbp.observers.windowtimeobserver import WindowTimeObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestWindowTimeObserver(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+        self.sink = TObserver()
+        self.scheduler = TScheduler()
+        self.exception = Exception('dummy')
+
+    def observe(self, span: float, step: float, agg=None, timestamp=lambda v: v, value=None):
+        observer = WindowTimeObserver(
+            next_observer=self.sink,
+            span=span,
+            step=step,
+            timestamp=timestamp,
+            accumulator_factory=to_accumulator_factory(agg) if agg is not None else None,
+            scheduler=self.scheduler,
+            value_selector=value,
+        )
+        self.source.observe(init_observer_info(observer))
+
+    def test_tumbling_windows(self):
+        self.observe(span=2, step=2)
+
+        self.source.on_next_list([0, 1, 2])
+
+        self.assertEqual([[0, 1]], self.sink.received)
+
+        self.source.on_next_list([3, 4])
+
+        self.assertEqual([[0, 1], [2, 3]], self.sink.received)
+
+    def test_sliding_windows(self):
+        self.observe(span=2, step=1)
+
+        self.source.on_next_list([0, 1, 2, 3])
+
+        self.assertEqual([[0], [0, 1], [1, 2]], self.sink.received)
+
+    def test_skip_empty_windows(self):
+        self.observe(span=2, step=2, agg='sum')
+
+        self.source.on_next_list([0, 1, 7, 8, 20])
+
+        self.assertEqual([1, 7, 8], self.sink.received)
+
+    def test_drop_elements_between_windows(self):
+        self.observe(span=1, step=3)
+
+        self.source.on_next_list(list(range(7)))
+
+        self.assertEqual([[0], [3]], self.sink.received)
+
+    def test_no_window(self):
+        self.observe(span=2, step=2)
+
+        ack = self.source.on_next_list([0, 1])
+
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual(0, self.sink.on_next_counter)
+
+    def test_received_time(self):
+        self.observe(span=1, step=1, timestamp=None)
+
+        self.source.on_next_list([1, 2])
+        self.scheduler.advance_by(1)
+        self.source.on_next_list([3])
+
+        self.assertEqual([[1, 2]], self.sink.received)
+
+    def test_value_selector(self):
+        self.observe(span=2, step=2, agg='mean', timestamp=lambda r: r[0], value=lambda r: r[1])
+
+        self.source.on_next_list([(0, 1.0), (1, 3.0), (2, 5.0)])
+        self.source.on_next_list([(3, 5.0), (4, 2.0)])
+
+        self.assertEqual([2.0, 5.0], self.sink.received)
+
+    def test_value_selector_without_accumulator(self):
+        self.observe(span=2, step=2, timestamp=lambda r: r[0], value=lambda r: r[1])
+
+        self.source.on_next_list([(0, 'a'), (1, 'b'), (2, 'c')])
+
+        self.assertEqual([['a', 'b']], self.sink.received)
+
+    def test_on_completed(self):
+        self.observe(span=2, step=1, agg='max')
+        self.source.on_next_list([0, 1, 2])
+
+        self.source.on_completed()
+
+        self.assertEqual([0, 1, 2, 2], self.sink.received)
+        self.assertTrue(self.sink.is_completed)
+
+    def test_on_error(self):
+        self.observe(span=2, step=2)
+
+        self.source.on_error(self.exception)
+
+        self.assertIs(self.exception, self.sink.exception)
@@ -1,5 +1,9 @@
 import unittest
 
+import rx
+import rx.operators
+from rx.subject import Subject
+
 import rxbp
 from rxbp.init.initflowable import init_flowable
 from rxbp.init.initsubscriber import init_subscriber
@@ -33,6 +37,53 @@ class TestOperators(unittest.TestCase):
 
         # self.assertEqual(self.left_base, subscription.info.base)
 
+    def test_concat_hot_source(self):
+        subject = Subject()
+        received = []
+
+        rxbp.concat(
+            rxbp.from_rx(rx.interval(1.0, scheduler=self.scheduler).pipe(rx.operators.take(2))),
+            rxbp.from_rx(subject),
+        ).subscribe(on_next=received.append, scheduler=self.scheduler, subscribe_scheduler=self.scheduler)
+
+        self.scheduler.advance_by(1.5)
+        subject.on_next('hot-during-first')
+        self.scheduler.advance_by(1.0)
+        subject.on_next('hot-after')
+        self.scheduler.advance_by(1.0)
+
+        self.assertEqual([0, 1, 'hot-during-first', 'hot-after'], received)
+
+    def test_concat_cold_sources_lazily(self):
+        flowable = rxbp.concat(rxbp.range(2), rxbp.from_list([2, 3]), rxbp.return_value(4))
+
+        self.assertTrue(flowable.underlying._lazy)
+        self.assertEqual([0, 1, 2, 3, 4], flowable.run())
+
+    def test_concat_piped_cold_sources_lazily(self):
+        flowable = rxbp.concat(
+            rxbp.range(2),
+            rxbp.range(3).pipe(
+                rxbp.op.map(lambda v: v + 2),
+                rxbp.op.filter(lambda v: v != 3),
+            ),
+        )
+
+        self.assertTrue(flowable.underlying._lazy)
+        self.assertEqual([0, 1, 2, 4], flowable.run())
+
+    def test_concat_hot_source_eagerly(self):
+        flowable = rxbp.concat(rxbp.range(2), rxbp.from_rx(Subject()))
+
+        self.assertFalse(flowable.underlying._lazy)
+
+    def test_concat_piped_hot_source_eagerly(self):
+        flowable = rxbp.concat(rxbp.range(2), rxbp.from_rx(Subject()).pipe(
+            rxbp.op.map(lambda v: v + 1),
+        ))
+
+        self.assertFalse(flowable.underlying._lazy)
+
     def test_controlled_zip(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.controlled_zip(
@@ -80,6 +131,70 @@ class TestOperators(unittest.TestCase):
             rxbp.op.flat_map(lambda _: init_flowable(self.right))
         ).unsafe_subscribe(self.subscriber)
 
+    def test_flat_map_unordered(self):
+        flowable = rxbp.range(3).pipe(
+            rxbp.op.flat_map(lambda v: rxbp.range(v), ordered=False),
+        )
+
+        self.assertEqual([0, 0, 1], sorted(flowable.run()))
+
+    def test_group_by_flat_map(self):
+        flowable = rxbp.range(0, 20, batch_size=3).pipe(
+            rxbp.op.group_by(lambda v: v % 3, max_groups=3),
+            rxbp.op.flat_map(lambda kv: kv[1].pipe(
+                rxbp.op.map(lambda v, key=kv[0]: (key, v)),
+            ), max_concurrent=3, ordered=False),
+        )
+
+        result = flowable.run()
+
+        self.assertEqual(sorted((v % 3, v) for v in range(20)), sorted(result))
+
+    def test_group_by_ordered_flat_map(self):
+        flowable = rxbp.range(0, 20, batch_size=3).pipe(
+            rxbp.op.group_by(lambda v: v % 3),
+            rxbp.op.flat_map(lambda kv: kv[1].pipe(
+                rxbp.op.map(lambda v, key=kv[0]: (key, v)),
+            )),
+        )
+
+        result = flowable.run()
+
+        self.assertEqual(sorted(((v % 3, v) for v in range(20)), key=lambda t: t[0]), result)
+
+    def test_group_by_evict_within_batch(self):
+        flowable = rxbp.range(0, 20, batch_size=3).pipe(
+            rxbp.op.group_by(lambda v: v % 3, max_groups=2),
+            rxbp.op.flat_map(lambda kv: kv[1].pipe(
+                rxbp.op.map(lambda v, key=kv[0]: (key, v)),
+            ), max_concurrent=2, ordered=False),
+        )
+
+        result = flowable.run()
+
+        self.assertEqual(sorted((v % 3, v) for v in range(20)), sorted(result))
+
+    def test_window_time_records(self):
+        records = [(0.0, 1.0), (0.5, 3.0), (1.0, 5.0), (1.5, 5.0), (2.5, 2.0)]
+
+        flowable = rxbp.from_list(records).pipe(
+            rxbp.op.window_time(span=1.0, agg='mean', timestamp=lambda r: r[0], value=lambda r: r[1]),
+        )
+
+        self.assertEqual([2.0, 5.0, 2.0], flowable.run())
+
+    def test_rolling_records(self):
+        records = [('a', 2.0), ('b', 2.0), ('c', 2.0), ('d', 6.0)]
+
+        flowable = rxbp.from_list(records).pipe(
+            rxbp.op.rolling('std', n=3, value=lambda r: r[1]),
+        )
+
+        result = flowable.run()
+
+        self.assertEqual(0.0, result[0])
+        self.assertAlmostEqual(2.3094010767585, result[1])
+
     def test_map_to_iterator(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.map_to_iterator(lambda _: [1, 2, 3])
@@ -96,4 +211,11 @@ class TestOperators(unittest.TestCase):
     def test_merge(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.merge(init_flowable(self.right))
-        ).unsafe_subscribe(self.subscriber)
\ No newline at end of file
+        ).unsafe_subscribe(self.subscriber)
+
+    def test_share_buffer_size(self):
+        subscription = init_flowable(self.left).share(
+            buffer_size=2,
+        ).unsafe_subscribe(self.subscriber)
+
+        self.assertEqual(2, subscription.observable.subject.buffer_size)
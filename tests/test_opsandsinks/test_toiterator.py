@@ -1,5 +1,10 @@
+import asyncio
 import unittest
 
+import rx
+import rx.operators
+
+import rxbp
 from rxbp.acknowledgement.continueack import ContinueAck
 from rxbp.init.initflowable import init_flowable
 from rxbp.testing.testflowable import TestFlowable
@@ -41,3 +46,56 @@ class TestToIterator(unittest.TestCase):
         val = next(iterator)
 
         self.assertEqual(1, val)
+
+    def test_prefetch_back_pressure(self):
+        iterator = to_iterator(
+            source=init_flowable(self.source),
+            scheduler=self.scheduler,
+            prefetch=2,
+        )
+
+        ack1 = self.source.on_next_single(1)
+        ack2 = self.source.on_next_single(2)
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertNotIsInstance(ack2, ContinueAck)
+
+        val1 = next(iterator)
+        val2 = next(iterator)
+
+        self.assertEqual(1, val1)
+        self.assertEqual(2, val2)
+        self.assertIsInstance(ack2.value, ContinueAck)
+
+    def test_error(self):
+        iterator = to_iterator(
+            source=init_flowable(self.source),
+            scheduler=self.scheduler,
+        )
+
+        exc = Exception()
+        self.source.on_error(exc)
+
+        with self.assertRaises(Exception):
+            next(iterator)
+
+    def test_virtual_time_scheduler(self):
+        source = rxbp.from_rx(rx.interval(1, scheduler=self.scheduler).pipe(
+            rx.operators.take(3),
+        ))
+
+        result = source.run(scheduler=self.scheduler)
+
+        self.assertEqual([0, 1, 2], result)
+
+    def test_to_async_iterator(self):
+        async def consume():
+            return [elem async for elem in rxbp.range(4).to_async_iterator()]
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(consume())
+        finally:
+            loop.close()
+
+        self.assertEqual([0, 1, 2, 3], result)
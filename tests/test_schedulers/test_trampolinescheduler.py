@@ -0,0 +1,57 @@
+import unittest
+
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+class TestTrampolineScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TrampolineScheduler()
+        self.received = []
+
+    def test_run_immediately_when_idle(self):
+        self.scheduler.schedule(lambda _, __: self.received.append(1))
+
+        self.assertEqual([1], self.received)
+        self.assertTrue(self.scheduler.idle)
+
+    def test_nested_actions_in_fifo_order(self):
+        def action(_, __):
+            self.assertFalse(self.scheduler.idle)
+            self.scheduler.schedule(lambda _, v: self.received.append(v), 1)
+            self.scheduler.schedule(lambda _, v: self.received.append(v), 2)
+            self.received.append(0)
+
+        self.scheduler.schedule(action)
+
+        self.assertEqual([0, 1, 2], self.received)
+
+    def test_dispose_scheduled_action(self):
+        def action(_, __):
+            disposable = self.scheduler.schedule(lambda _, __: self.received.append(1))
+            disposable.dispose()
+
+        self.scheduler.schedule(action)
+
+        self.assertEqual([], self.received)
+
+    def test_relative_action_after_immediate_actions(self):
+        def action(_, __):
+            self.scheduler.schedule_relative(0.001, lambda _, __: self.received.append(2))
+            self.scheduler.schedule(lambda _, __: self.received.append(1))
+
+        self.scheduler.schedule(action)
+
+        self.assertEqual([1, 2], self.received)
+        self.assertTrue(self.scheduler.idle)
+
+    def test_continue_after_exception(self):
+        def failing_action(_, __):
+            raise Exception()
+
+        def action(_, __):
+            self.scheduler.schedule(failing_action)
+            self.scheduler.schedule(lambda _, __: self.received.append(1))
+
+        self.scheduler.schedule(action)
+
+        self.assertEqual([1], self.received)
@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+
+import rxbp
+from rxbp.acknowledgement.continueack import continue_ack, ContinueAck
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.schedulers.asyncioscheduler import AsyncIOScheduler
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+async def gen_elements(n: int):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield i
+
+
+class TestFromAsyncIterable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.scheduler = AsyncIOScheduler(loop=self.loop, new_thread=False)
+        self.subscriber = init_subscriber(
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+
+    def tearDown(self) -> None:
+        # cancel the iterations waiting on an acknowledgment
+        tasks = asyncio.all_tasks(self.loop)
+        if tasks:
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.wait(tasks))
+        self.loop.close()
+
+    def run_until(self, predicate):
+        async def wait():
+            while not predicate():
+                await asyncio.sleep(0)
+
+        self.loop.run_until_complete(asyncio.wait_for(wait(), timeout=1))
+
+    def test_from_async_iterable(self):
+        sink = TObserver()
+        subscription = rxbp.from_async_iterable(gen_elements(3)).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self.run_until(lambda: sink.is_completed)
+
+        self.assertEqual([0, 1, 2], sink.received)
+
+    def test_batch_size(self):
+        sink = TObserver()
+        subscription = rxbp.from_async_iterable(gen_elements(5), batch_size=2).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self.run_until(lambda: sink.is_completed)
+
+        self.assertEqual([0, 1, 2, 3, 4], sink.received)
+        self.assertEqual(3, sink.on_next_counter)
+
+    def test_wait_on_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        subscription = rxbp.from_async_iterable(gen_elements(3)).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self.run_until(lambda: sink.received)
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual([0], sink.received)
+
+        sink.ack.on_next(continue_ack)
+        self.run_until(lambda: 1 < len(sink.received))
+
+        self.assertEqual([0, 1], sink.received)
+
+    def test_stop_on_stop_ack(self):
+        sink = TObserver(immediate_continue=0)
+        subscription = rxbp.from_async_iterable(gen_elements(3)).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self.run_until(lambda: sink.received)
+        sink.ack.on_next(stop_ack)
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual([0], sink.received)
+        self.assertFalse(sink.is_completed)
+
+    def test_exception(self):
+        exception = Exception()
+
+        async def gen_failing():
+            yield 1
+            raise exception
+
+        sink = TObserver()
+        subscription = rxbp.from_async_iterable(gen_failing()).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self.run_until(lambda: sink.exception is not None)
+
+        self.assertEqual([1], sink.received)
+        self.assertIs(exception, sink.exception)
+
+    def test_no_event_loop(self):
+        subscriber = init_subscriber(
+            scheduler=TScheduler(),
+            subscribe_scheduler=TScheduler(),
+        )
+        subscription = rxbp.from_async_iterable(gen_elements(3)).unsafe_subscribe(subscriber)
+
+        with self.assertRaises(Exception):
+            subscription.observable.observe(init_observer_info(observer=TObserver()))
+
+    def test_scheduler_without_thread_on_running_loop(self):
+        async def create_scheduler():
+            return AsyncIOScheduler(new_thread=False)
+
+        scheduler = self.loop.run_until_complete(create_scheduler())
+
+        self.assertIs(self.loop, scheduler.loop)
+
+    def test_scheduler_without_thread_and_without_running_loop(self):
+        with self.assertRaises(Exception):
+            AsyncIOScheduler(new_thread=False)
+
+    def test_await_acknowledgment(self):
+        async def await_ack():
+            return await continue_ack
+
+        ack = self.loop.run_until_complete(await_ack())
+
+        self.assertIsInstance(ack, ContinueAck)
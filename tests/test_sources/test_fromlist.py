@@ -1,13 +1,29 @@
 import unittest
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 import rxbp
 from rxbp.acknowledgement.continueack import continue_ack
 from rxbp.init.initobserverinfo import init_observer_info
 from rxbp.init.initsubscriber import init_subscriber
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
 from rxbp.testing.tobserver import TObserver
 from rxbp.testing.tscheduler import TScheduler
 
 
+class BatchObserver(TObserver):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def on_next(self, elem):
+        self.batches.append(elem)
+        return super().on_next(elem)
+
+
 class TestFromList(unittest.TestCase):
     def setUp(self) -> None:
         self.scheduler = TScheduler()
@@ -60,4 +76,39 @@ class TestFromList(unittest.TestCase):
         self.scheduler.advance_by(1)
 
         self.assertEqual(test_list, sink.received)
-        self.assertTrue(sink.is_completed)
\ No newline at end of file
+        self.assertTrue(sink.is_completed)
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_as_array(self):
+        sink = BatchObserver()
+        subscription = rxbp.from_list([1, 2, 3, 4, 5], batch_size=2, as_array=True).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self.scheduler.advance_by(1)
+
+        self.assertTrue(all(isinstance(batch, np.ndarray) for batch in sink.batches))
+        self.assertEqual([[1, 2], [3, 4], [5]], [batch.tolist() for batch in sink.batches])
+        self.assertTrue(sink.is_completed)
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_as_array_share(self):
+        # a shared Flowable needs to be observed on a non-idle subscribe scheduler
+        scheduler = TrampolineScheduler()
+        subscriber = init_subscriber(
+            scheduler=scheduler,
+            subscribe_scheduler=scheduler,
+        )
+        sink1 = BatchObserver()
+        sink2 = BatchObserver()
+        subscription = rxbp.from_list([1, 2, 3, 4, 5], batch_size=2, as_array=True).share().unsafe_subscribe(subscriber)
+
+        def action(_, __):
+            subscription.observable.observe(init_observer_info(observer=sink1))
+            subscription.observable.observe(init_observer_info(observer=sink2))
+
+        scheduler.schedule(action)
+
+        self.assertTrue(all(isinstance(batch, np.ndarray) for batch in sink1.batches))
+        self.assertEqual([[1, 2], [3, 4], [5]], [batch.tolist() for batch in sink1.batches])
+        self.assertEqual(len(sink1.batches), len(sink2.batches))
+        self.assertTrue(all(b1 is b2 for b1, b2 in zip(sink1.batches, sink2.batches)))
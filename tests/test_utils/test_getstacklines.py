@@ -0,0 +1,86 @@
+import unittest
+
+from rxbp import config
+from rxbp.utils.getstacklines import get_stack_lines
+from rxbp.utils.tooperatorexception import to_operator_exception
+
+
+def create_operator():
+    # like an operator function, captures the stack of its caller
+    return get_stack_lines()
+
+
+class TestGetStackLines(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mode = config.get_stack_capture()
+
+    def tearDown(self) -> None:
+        config.set_stack_capture(self.mode)
+
+    def test_lazy(self):
+        config.set_stack_capture(config.STACK_CAPTURE_LAZY)
+
+        stack = create_operator()
+
+        self.assertLess(1, len(stack))
+        self.assertEqual(__file__, stack[-1].filename)
+        self.assertEqual('test_lazy', stack[-1].name)
+        self.assertEqual('stack = create_operator()', stack[-1].line)
+
+    def test_caller(self):
+        config.set_stack_capture(config.STACK_CAPTURE_CALLER)
+
+        stack = create_operator()
+
+        self.assertEqual(1, len(stack))
+        self.assertEqual('test_caller', stack[0].name)
+        self.assertEqual('stack = create_operator()', stack[0].line)
+
+    def test_full(self):
+        config.set_stack_capture(config.STACK_CAPTURE_FULL)
+
+        stack = create_operator()
+
+        self.assertEqual('test_full', stack[-1].name)
+        self.assertEqual('stack = create_operator()', stack[-1].line)
+
+    def test_lazy_matches_full(self):
+        config.set_stack_capture(config.STACK_CAPTURE_LAZY)
+        lazy_stack = create_operator()
+        config.set_stack_capture(config.STACK_CAPTURE_FULL)
+        full_stack = create_operator()
+
+        self.assertEqual(len(full_stack), len(lazy_stack))
+        self.assertEqual(
+            [(line.filename, line.name) for line in full_stack],
+            [(line.filename, line.name) for line in lazy_stack],
+        )
+
+    def test_off(self):
+        config.set_stack_capture(config.STACK_CAPTURE_OFF)
+
+        stack = create_operator()
+
+        self.assertIsNone(stack)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(AssertionError):
+            config.set_stack_capture('unknown')
+
+    def test_operator_exception_lazy(self):
+        config.set_stack_capture(config.STACK_CAPTURE_LAZY)
+        stack = create_operator()
+
+        message = to_operator_exception(message='failure', stack=stack)
+
+        self.assertTrue(message.startswith('failure\n  Traceback rxbp (most recent call last):'))
+        self.assertIn(f'File "{__file__}", line {stack[-1].lineno}', message)
+        self.assertTrue(message.endswith('stack = create_operator()'))
+
+    def test_operator_exception_off(self):
+        config.set_stack_capture(config.STACK_CAPTURE_OFF)
+        stack = create_operator()
+
+        message = to_operator_exception(message='failure', stack=stack)
+
+        self.assertEqual('failure', message)